@@ -733,10 +733,14 @@ def etl_scrape(
             scraper = BhavcopyScraper()
             scraper.scrape(target_date, dry_run=dry_run)
         elif scraper_type == "symbol-master":
-            from champion.scrapers.symbol_master import SymbolMasterScraper
+            from champion.orchestration.tasks.symbol_master_tasks import (
+                scrape_symbol_master,
+                write_symbol_master,
+            )
 
-            scraper = SymbolMasterScraper()  # type: ignore[assignment]
-            scraper.scrape(dry_run=dry_run)  # type: ignore[call-arg]
+            csv_path = scrape_symbol_master()
+            if not dry_run:
+                write_symbol_master(csv_path)
         elif scraper_type == "corporate-actions":
             from champion.scrapers.corporate_actions import CorporateActionsScraper
 
@@ -979,6 +983,76 @@ def validate_file(
         raise typer.Exit(1) from e
 
 
+@validate_app.command("parquet")
+def validate_parquet(
+    path: Path = typer.Argument(..., help="Parquet file, or directory searched recursively"),
+    schema_name: str = typer.Option(..., "--schema", "-s", help="Schema to validate against"),
+    schema_dir: Path = typer.Option(
+        Path("schemas/parquet"), "--schema-dir", help="Directory containing JSON schemas"
+    ),
+    ledger_path: Path = typer.Option(
+        Path("data/validation/ledger.sqlite"),
+        "--ledger",
+        help="Validation ledger; files unchanged since their last validation are skipped",
+    ),
+    force: bool = typer.Option(False, "--force", help="Revalidate files already in the ledger"),
+    since: str | None = typer.Option(
+        None, "--since", help="Only reuse ledger results recorded on or after this date"
+    ),
+    quarantine_dir: Path | None = typer.Option(
+        None, "--quarantine", help="Directory to write quarantined records"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
+) -> None:
+    """Validate Parquet files, skipping those already validated unchanged.
+
+    [bold]Examples:[/bold]
+        champion validate parquet data/lake/normalized --schema normalized_equity_ohlc
+        champion validate parquet data/lake/normalized -s normalized_equity_ohlc --force
+        champion validate parquet data/lake/normalized -s normalized_equity_ohlc --since 2024-06-01
+    """
+    from champion.validation.ledger import ValidationLedger
+    from champion.validation.registry import validator_registry
+
+    since_dt = (
+        datetime.combine(validate_date_format(since, allow_future=True), datetime.min.time())
+        if since
+        else None
+    )
+    files = sorted(path.rglob("*.parquet")) if path.is_dir() else [path]
+    if not files or not files[0].exists():
+        console.print(f"[red]No Parquet files found: {path}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        validator = validator_registry.get(schema_dir)
+        ledger = ValidationLedger(ledger_path)
+        failed = 0
+        for file_path in files:
+            result = validator.validate_file(
+                file_path,
+                schema_name,
+                quarantine_dir=quarantine_dir,
+                ledger=ledger,
+                force=force,
+                since=since_dt,
+            )
+            if verbose or result.critical_failures:
+                console.print(
+                    f"{file_path}: {result.valid_rows}/{result.total_rows} valid rows, "
+                    f"{result.critical_failures} critical failures"
+                )
+            failed += result.critical_failures > 0
+    except ValueError as e:
+        console.print(f"[red]✗ Validation failed: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    if failed:
+        console.print(f"[red]✗ {failed} of {len(files)} files failed validation[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] {len(files)} files validated successfully")
+
+
 @admin_app.command("config")
 def show_config(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
@@ -180,6 +180,26 @@ class StorageConfig(BaseSettings):
         default="snappy",
         description="Parquet compression codec (snappy, gzip, lz4, zstd)",
     )
+    parse_cache_enabled: bool = Field(
+        default=False,
+        description="Cache parsed raw files as Arrow IPC under <data_dir>/cache/parsed",
+    )
+    parse_cache_max_mb: int = Field(
+        default=2048,
+        ge=1,
+        description="Maximum parse cache size in MB before LRU eviction",
+    )
+    archive_raw_bhavcopy: bool = Field(
+        default=False,
+        description="Store downloaded bhavcopy ZIP archives as-is for audit",
+    )
+    symbol_state_enabled: bool = Field(
+        default=True,
+        description=(
+            "Keep each instrument's last close under <lake>/state so price rules "
+            "can compare a day with the previous one"
+        ),
+    )
 
     @field_validator("data_dir", mode="before")
     @classmethod
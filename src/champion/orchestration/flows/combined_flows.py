@@ -193,7 +193,7 @@ def combined_equity_etl_flow(
             nse_df = parse_polars_raw(nse_csv_path, trade_date)
 
             # Step 3: Normalize NSE data
-            nse_normalized = normalize_polars(nse_df)
+            nse_normalized = normalize_polars(nse_df, nse_csv_path, trade_date)
 
             # Step 4: Scrape and parse BSE data (if enabled)
             bse_normalized = None
@@ -161,6 +161,7 @@ def write_ca_parquet_task(parse_result: dict, output_base_path: str | None = Non
     import polars as pl
 
     from champion.storage.parquet_io import write_df_safe
+    from champion.storage.temporal import to_warehouse_primitives
 
     events = parse_result["events"]
     if not events:
@@ -233,34 +234,12 @@ def write_ca_parquet_task(parse_result: dict, output_base_path: str | None = Non
 
     df = pl.DataFrame(normalized)
 
-    # Normalize types and compute derived fields using the dedicated parser
-
-    # Local helper functions (avoid instantiating abstract parser)
-    import re
+    # Normalize types and compute derived fields
     from datetime import datetime as _dt
 
-    action_type_patterns = {
-        "SPLIT": [r"split", r"sub-division", r"subdivision"],
-        "BONUS": [r"bonus", r"capitalisation"],
-        "DIVIDEND": [r"dividend", r"div"],
-        "RIGHTS": [r"rights"],
-        "INTEREST_PAYMENT": [r"interest"],
-        "EGMMEETING": [r"egm", r"agm", r"meeting"],
-        "DEMERGER": [r"demerger", r"de-merger"],
-        "MERGER": [r"merger", r"amalgamation"],
-        "BUYBACK": [r"buy-back", r"buyback"],
-    }
-
-    def _parse_action_type(purpose: str | None) -> str | None:
-        if not purpose:
-            return None
-        p = purpose.lower()
-        for action, patterns in action_type_patterns.items():
-            for pat in patterns:
-                if re.search(pat, p):
-                    return action
-        return "OTHER"
+    from champion.parsers.ca_parser import classify_purposes
 
+    # Local helper functions
     def _parse_date(s: str | None):
         if not s or s.strip() in ("", "-"):
             return None
@@ -272,42 +251,6 @@ def write_ca_parquet_task(parse_result: dict, output_base_path: str | None = Non
                 continue
         return None
 
-    def _parse_split_ratio(purpose: str | None):
-        if not purpose:
-            return None
-        m = re.search(
-            r"rs\.?\s*(\d+(?:\.\d+)?)\s*/?\-?\s*to\s*rs\.?\s*(\d+(?:\.\d+)?)", purpose.lower()
-        )
-        if m:
-            old_fv = float(m.group(1))
-            new_fv = float(m.group(2))
-            ratio = old_fv / new_fv if new_fv != 0 else None
-            if ratio:
-                return {"old_shares": 1, "new_shares": int(ratio)}
-        return None
-
-    def _parse_bonus_ratio(purpose: str | None):
-        if not purpose:
-            return None
-        m = re.search(r"(\d+)\s*(?:[:]\s*|for\s+)(\d+)", purpose.lower())
-        if m:
-            return {"new_shares": int(m.group(1)), "existing_shares": int(m.group(2))}
-        return None
-
-    def _compute_adjustment(action_type: str | None, purpose: str | None) -> float | None:
-        try:
-            if action_type == "SPLIT":
-                r = _parse_split_ratio(purpose or "")
-                if r:
-                    return r["new_shares"] / r["old_shares"]
-            if action_type == "BONUS":
-                r = _parse_bonus_ratio(purpose or "")
-                if r:
-                    return (r["existing_shares"] + r["new_shares"]) / r["existing_shares"]
-        except Exception:
-            return None
-        return None
-
     # Parse and coerce fields
     df = df.with_columns(
         [
@@ -325,19 +268,11 @@ def write_ca_parquet_task(parse_result: dict, output_base_path: str | None = Non
         ]
     )
 
-    df = df.with_columns(
-        pl.col("purpose")
-        .map_elements(_parse_action_type, return_dtype=pl.Utf8)
-        .alias("action_type")
-    )
-    df = df.with_columns(
-        pl.struct(["action_type", "purpose"])
-        .map_elements(
-            lambda r: _compute_adjustment(r.get("action_type"), r.get("purpose")),
-            return_dtype=pl.Float64,
-        )
-        .alias("adjustment_factor")
-    )
+    # Classify purposes and compute adjustment factors (vectorized)
+    classified = classify_purposes(
+        df.select(pl.col("purpose").cast(pl.Utf8)), purpose_col="purpose", default_factor=None
+    ).df
+    df = df.with_columns(classified["action_type"], classified["adjustment_factor"])
 
     df = df.with_columns(
         [
@@ -354,6 +289,9 @@ def write_ca_parquet_task(parse_result: dict, output_base_path: str | None = Non
     if "record_date_parsed" in df.columns:
         df = df.drop("record_date_parsed")
 
+    # Envelope timestamps as epoch ms; the schema keeps CA dates as ISO strings
+    df = to_warehouse_primitives(df, epoch_day_columns=())
+
     # Use validated writer to ensure produced Parquet conforms to schema
     output_path = write_df_safe(
         df=df,
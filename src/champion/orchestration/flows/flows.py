@@ -63,6 +63,8 @@ except Exception:  # pragma: no cover - provide lightweight fallbacks for testin
 
 
 from champion.config import config
+from champion.parsers.archive import CsvSource, describe_source, is_zip
+from champion.parsers.parse_cache import ParseCache, restamp_ingest_time
 from champion.parsers.polars_bhavcopy_parser import PolarsBhavcopyParser
 from champion.scrapers.nse.bhavcopy import BhavcopyScraper
 from champion.utils import metrics
@@ -81,6 +83,36 @@ mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
 logger.info("mlflow_configured", tracking_uri=MLFLOW_TRACKING_URI)
 
 
+def _parse_cache() -> ParseCache | None:
+    """Return the parse cache if enabled in config, else None."""
+    if not config.storage.parse_cache_enabled:
+        return None
+    return ParseCache(
+        config.storage.data_dir / "cache" / "parsed",
+        max_bytes=config.storage.parse_cache_max_mb * 1024 * 1024,
+    )
+
+
+def _symbol_state_path(base_path: Path) -> Path | None:
+    """Return the equity OHLC symbol state file if enabled in config, else None."""
+    if not config.storage.symbol_state_enabled:
+        return None
+    return base_path / "state" / "normalized_equity_ohlc.parquet"
+
+
+def _fetch_bhavcopy(scraper: BhavcopyScraper, trade_date: date) -> Path | bytes:
+    """Return the local lake bhavcopy for a date, else download it into memory."""
+    local_path = scraper.local_file(trade_date)
+    if local_path is not None:
+        return local_path
+
+    content = scraper.fetch(trade_date)
+    if config.storage.archive_raw_bhavcopy:
+        scraper.archive(trade_date, content)
+    metrics.files_downloaded.labels(scraper=scraper.name).inc()
+    return content
+
+
 @task(
     name="scrape-bhavcopy",
     retries=3,
@@ -88,14 +120,18 @@ logger.info("mlflow_configured", tracking_uri=MLFLOW_TRACKING_URI)
     cache_key_fn=task_input_hash,
     cache_expiration=timedelta(hours=24),
 )
-def scrape_bhavcopy(trade_date: date) -> str:
+def scrape_bhavcopy(trade_date: date) -> str | bytes:
     """Scrape NSE bhavcopy for a given date.
 
+    The ZIP archive is downloaded into memory and returned as bytes, which
+    ``parse_polars_raw`` reads without an extracted CSV on disk. The archive is
+    also stored for audit when ``storage.archive_raw_bhavcopy`` is enabled.
+
     Args:
         trade_date: Trading date to scrape
 
     Returns:
-        Path to downloaded CSV file
+        Path to a bhavcopy already in the local data lake, else the raw ZIP bytes
 
     Raises:
         RuntimeError: If download fails after retries
@@ -104,236 +140,41 @@ def scrape_bhavcopy(trade_date: date) -> str:
     logger.info("starting_bhavcopy_scrape", trade_date=str(trade_date))
 
     try:
-        # Format date for NSE URL (YYYYMMDD)
-        date_str = trade_date.strftime("%Y%m%d")
-        url = config.nse.bhavcopy_url.format(date=date_str)
-
-        # Target file path
-        local_path = config.storage.data_dir / f"BhavCopy_NSE_CM_{date_str}.csv"
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Fast path: if file already exists locally, we still attempt
-        # to call the scraper so tests and callers receive any
-        # upstream exceptions (e.g., network errors). If the scraper
-        # returns a fresh path, prefer it; otherwise fall back to the
-        # existing local file.
         scraper = BhavcopyScraper()
         from champion.utils.circuit_breaker_registry import nse_breaker
 
         try:
-            csv_path = nse_breaker.call(scraper.scrape, target_date=trade_date, dry_run=False)
-            local_path = csv_path
+            source = nse_breaker.call(_fetch_bhavcopy, scraper, trade_date)
         except Exception as e:
             # If circuit breaker is open, attempt to call the scraper
-            # directly so tests that mock scraper.scrape raise their
+            # directly so tests that mock the scraper raise their
             # intended exceptions instead of CircuitBreakerOpen.
             from champion.utils.circuit_breaker import CircuitBreakerOpen
 
             if isinstance(e, CircuitBreakerOpen):
-                try:
-                    csv_path = scraper.scrape(target_date=trade_date, dry_run=False)
-                    local_path = csv_path
-                except Exception:
-                    # Propagate underlying scraper exceptions to callers/tests
-                    raise
+                source = _fetch_bhavcopy(scraper, trade_date)
             else:
                 # Propagate other exceptions from the scraper so callers/tests
                 # can handle them as expected.
                 raise
 
-        if local_path.exists():
-            # Detect if the existing file is actually a ZIP (misnamed as .csv)
-            try:
-                with open(local_path, "rb") as f:
-                    signature = f.read(2)
-                if signature == b"PK":
-                    # Extract CSV from the ZIP content
-                    import zipfile
-                    from io import BytesIO
-
-                    logger.info("detected_zip_content_in_csv", file_path=str(local_path))
-                    with open(local_path, "rb") as f:
-                        zip_bytes = f.read()
-                    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zip_file:
-                        extracted_path = local_path.parent / f"{local_path.stem}_extracted.csv"
-                        for name in zip_file.namelist():
-                            if name.endswith(".csv"):
-                                with open(extracted_path, "wb") as out_f:
-                                    out_f.write(zip_file.read(name))
-                                local_path = extracted_path
-                                logger.info(
-                                    "extracted_csv_from_existing_zip", extracted=str(local_path)
-                                )
-                                break
-                else:
-                    logger.info(
-                        "bhavcopy_file_exists_skipping_download",
-                        trade_date=str(trade_date),
-                        file_path=str(local_path),
-                    )
-            except OSError as e:
-                logger.error("bhavcopy_existing_file_check_failed", error=str(e), retryable=True)
-            except Exception as e:
-                logger.warning(
-                    "bhavcopy_existing_file_check_unexpected_error", error=str(e), retryable=False
-                )
-        else:
-            # Use scraper to download (ZIP extract via scraper implementation)
-            from champion.utils.circuit_breaker_registry import nse_breaker
-
-            scraper = BhavcopyScraper()
-            # Prefer scraper.scrape if available, else fallback to direct download
-            try:
-                # Wrap scraper call with circuit breaker
-                csv_path = nse_breaker.call(scraper.scrape, target_date=trade_date, dry_run=False)
-                local_path = csv_path
-            except Exception as e:
-                from champion.utils.circuit_breaker import CircuitBreakerOpen
-
-                if isinstance(e, CircuitBreakerOpen):
-                    try:
-                        csv_path = scraper.scrape(target_date=trade_date, dry_run=False)
-                        local_path = csv_path
-                    except (ConnectionError, TimeoutError) as e:
-                        # Network-related errors are retryable, fallback to direct download
-                        logger.warning(
-                            "scraper_network_error_fallback_to_direct", error=str(e), retryable=True
-                        )
-                        if not scraper.download_file(url, str(local_path)):
-                            # Treat download failures (e.g., 404) as non-fatal: create idempotency marker and continue
-                            try:
-                                resolved_base_path = (
-                                    Path(os.getenv("PYTEST_TEMP_DIR"))
-                                    if os.getenv("PYTEST_RUNNING")
-                                    else config.storage.data_dir
-                                ) / "lake"
-                                year = trade_date.year
-                                month = trade_date.month
-                                day = trade_date.day
-                                partition_path = (
-                                    resolved_base_path
-                                    / "normalized"
-                                    / "equity_ohlc"
-                                    / f"year={year}"
-                                    / f"month={month:02d}"
-                                    / f"day={day:02d}"
-                                )
-                                expected_output_file = (
-                                    partition_path
-                                    / f"bhavcopy_{trade_date.strftime('%Y%m%d')}.parquet"
-                                )
-                                partition_path.mkdir(parents=True, exist_ok=True)
-                                create_idempotency_marker(
-                                    output_file=expected_output_file,
-                                    trade_date=trade_date.isoformat(),
-                                    rows=0,
-                                    metadata={"skipped": "download_failed", "url": url},
-                                )
-                                mlflow.log_param("download_skipped", True)
-                                logger.warning(
-                                    "bhavcopy_download_skipped_created_idempotency",
-                                    trade_date=str(trade_date),
-                                    url=url,
-                                )
-                            except Exception as ie:
-                                logger.error("failed_creating_idempotency_marker", error=str(ie))
-                            return str(local_path)
-                    except Exception:
-                        # Propagate underlying scraper exceptions to callers/tests
-                        raise
-                elif isinstance(e, ConnectionError | TimeoutError):
-                    # Network-related errors are retryable, fallback to direct download
-                    logger.warning(
-                        "scraper_network_error_fallback_to_direct", error=str(e), retryable=True
-                    )
-                    if not scraper.download_file(url, str(local_path)):
-                        # Treat download failures (e.g., 404) as non-fatal: create idempotency marker and continue
-                        try:
-                            resolved_base_path = (
-                                Path(os.getenv("PYTEST_TEMP_DIR"))
-                                if os.getenv("PYTEST_RUNNING")
-                                else config.storage.data_dir
-                            ) / "lake"
-                            year = trade_date.year
-                            month = trade_date.month
-                            day = trade_date.day
-                            partition_path = (
-                                resolved_base_path
-                                / "normalized"
-                                / "equity_ohlc"
-                                / f"year={year}"
-                                / f"month={month:02d}"
-                                / f"day={day:02d}"
-                            )
-                            expected_output_file = (
-                                partition_path / f"bhavcopy_{trade_date.strftime('%Y%m%d')}.parquet"
-                            )
-                            partition_path.mkdir(parents=True, exist_ok=True)
-                            create_idempotency_marker(
-                                output_file=expected_output_file,
-                                trade_date=trade_date.isoformat(),
-                                rows=0,
-                                metadata={"skipped": "download_failed", "url": url},
-                            )
-                            mlflow.log_param("download_skipped", True)
-                            logger.warning(
-                                "bhavcopy_download_skipped_created_idempotency",
-                                trade_date=str(trade_date),
-                                url=url,
-                            )
-                        except Exception as ie:
-                            logger.error("failed_creating_idempotency_marker", error=str(ie))
-                        return str(local_path)
-                else:
-                    # Other errors, fallback to direct file download (older interface)
-                    logger.warning(
-                        "scraper_error_fallback_to_direct", error=str(e), retryable=False
-                    )
-                    if not scraper.download_file(url, str(local_path)):
-                        # Treat download failures (e.g., 404) as non-fatal: create idempotency marker and continue
-                        try:
-                            resolved_base_path = (
-                                Path(os.getenv("PYTEST_TEMP_DIR"))
-                                if os.getenv("PYTEST_RUNNING")
-                                else config.storage.data_dir
-                            ) / "lake"
-                            year = trade_date.year
-                            month = trade_date.month
-                            day = trade_date.day
-                            partition_path = (
-                                resolved_base_path
-                                / "normalized"
-                                / "equity_ohlc"
-                                / f"year={year}"
-                                / f"month={month:02d}"
-                                / f"day={day:02d}"
-                            )
-                            expected_output_file = (
-                                partition_path / f"bhavcopy_{trade_date.strftime('%Y%m%d')}.parquet"
-                            )
-                            partition_path.mkdir(parents=True, exist_ok=True)
-                            create_idempotency_marker(
-                                output_file=expected_output_file,
-                                trade_date=trade_date.isoformat(),
-                                rows=0,
-                                metadata={"skipped": "download_failed", "url": url},
-                            )
-                            mlflow.log_param("download_skipped", True)
-                            logger.warning(
-                                "bhavcopy_download_skipped_created_idempotency",
-                                trade_date=str(trade_date),
-                                url=url,
-                            )
-                        except Exception as ie:
-                            logger.error("failed_creating_idempotency_marker", error=str(ie))
-                        return str(local_path)
+        if isinstance(source, Path):
+            # ZIP archives (including ZIP content misnamed as .csv) are passed on
+            # as-is; the parser decompresses the CSV member in memory
+            logger.info(
+                "bhavcopy_file_exists_skipping_download",
+                trade_date=str(trade_date),
+                file_path=str(source),
+                is_zip=is_zip(source),
+            )
+            source = str(source)
 
         duration = time.time() - start_time
 
         logger.info(
             "bhavcopy_scrape_complete",
             trade_date=str(trade_date),
-            file_path=str(local_path),
+            source=describe_source(source),
             duration_seconds=duration,
         )
 
@@ -341,7 +182,7 @@ def scrape_bhavcopy(trade_date: date) -> str:
         mlflow.log_metric("scrape_duration_seconds", duration)
         mlflow.log_param("trade_date", str(trade_date))
 
-        return str(local_path)
+        return source
 
     except (ConnectionError, TimeoutError) as e:
         logger.error(
@@ -396,11 +237,11 @@ def scrape_bhavcopy(trade_date: date) -> str:
     retries=2,
     retry_delay_seconds=30,
 )
-def parse_polars_raw(csv_file_path: str, trade_date: date) -> pl.DataFrame:
+def parse_polars_raw(csv_file_path: CsvSource, trade_date: date) -> pl.DataFrame:
     """Parse raw bhavcopy CSV to Polars DataFrame.
 
     Args:
-        csv_file_path: Path to CSV file
+        csv_file_path: Path to CSV or ZIP file, or the raw ZIP bytes from ``scrape_bhavcopy``
         trade_date: Trading date
 
     Returns:
@@ -411,12 +252,14 @@ def parse_polars_raw(csv_file_path: str, trade_date: date) -> pl.DataFrame:
         Exception: If parsing fails
     """
     start_time = time.time()
-    logger.info("starting_polars_parse", csv_file_path=csv_file_path)
+    source_name = describe_source(csv_file_path)
+    logger.info("starting_polars_parse", csv_file_path=source_name)
 
     try:
-        parser = PolarsBhavcopyParser()
+        # Re-runs and retries of the same file read the cached frame instead of re-parsing
+        parser = PolarsBhavcopyParser(cache=_parse_cache())
         df = parser.parse_to_dataframe(
-            file_path=Path(csv_file_path),
+            file_path=csv_file_path,
             trade_date=trade_date,
         )
 
@@ -425,7 +268,7 @@ def parse_polars_raw(csv_file_path: str, trade_date: date) -> pl.DataFrame:
 
         logger.info(
             "polars_parse_complete",
-            csv_file_path=csv_file_path,
+            csv_file_path=source_name,
             rows=rows,
             duration_seconds=duration,
         )
@@ -439,48 +282,182 @@ def parse_polars_raw(csv_file_path: str, trade_date: date) -> pl.DataFrame:
     except (FileNotFoundError, OSError) as e:
         logger.error(
             "polars_parse_file_failed",
-            csv_file_path=csv_file_path,
+            csv_file_path=source_name,
             error=str(e),
             retryable=True,
         )
         import logging
 
         logging.getLogger(__name__).error(
-            f"polars_parse_file_failed retryable=True csv_file_path={csv_file_path} error={e}"
+            f"polars_parse_file_failed retryable=True csv_file_path={source_name} error={e}"
         )
         # Propagate file I/O errors so callers/tests can handle retries.
         raise
     except ValueError as e:
         logger.error(
             "polars_parse_validation_failed",
-            csv_file_path=csv_file_path,
+            csv_file_path=source_name,
             error=str(e),
             retryable=False,
         )
         import logging
 
         logging.getLogger(__name__).error(
-            f"polars_parse_validation_failed retryable=False csv_file_path={csv_file_path} error={e}"
+            f"polars_parse_validation_failed retryable=False csv_file_path={source_name} error={e}"
         )
         raise
     except Exception as e:
         logger.critical(
-            "polars_parse_fatal_error", csv_file_path=csv_file_path, error=str(e), retryable=False
+            "polars_parse_fatal_error", csv_file_path=source_name, error=str(e), retryable=False
         )
         import logging
 
         logging.getLogger(__name__).error(
-            f"polars_parse_fatal_error retryable=False csv_file_path={csv_file_path} error={e}"
+            f"polars_parse_fatal_error retryable=False csv_file_path={source_name} error={e}"
         )
         raise RuntimeError(f"Fatal error during CSV parsing: {e}") from e
 
 
+def _normalize_bhavcopy(df: pl.DataFrame) -> pl.DataFrame:
+    """Map a parsed bhavcopy frame to the normalized_equity_ohlc columns.
+
+    Args:
+        df: Raw Polars DataFrame
+
+    Returns:
+        Normalized Polars DataFrame
+
+    Raises:
+        ValueError: If no rows are left after filtering
+    """
+    # Basic filtering: require a symbol and a positive close price
+    df = df.filter(
+        pl.col("TckrSymb").is_not_null()
+        & (pl.col("TckrSymb") != "")
+        & pl.col("ClsPric").is_not_null()
+        & (pl.col("ClsPric") > 0)
+    )
+
+    if len(df) == 0:
+        raise ValueError("No valid rows after normalization")
+
+    # Map bhavcopy columns to the canonical normalized_equity_ohlc schema
+    # - trade_date: TradDt (pl.Date from the parser, or a YYYY-MM-DD string) as YYYYMMDD
+    # - instrument_id: use symbol:exchange
+    trade_date = pl.col("TradDt")
+    if df.schema["TradDt"] != pl.Date:
+        trade_date = trade_date.str.strptime(pl.Date, "%Y-%m-%d")
+    mapped = df.with_columns(
+        [
+            # Ensure TradDt is an integer in YYYYMMDD format (schema expects integer)
+            trade_date.dt.strftime("%Y%m%d").cast(pl.Int64).alias("trade_date"),
+            # Canonical identifiers
+            (pl.col("TckrSymb") + pl.lit(":") + pl.lit("NSE")).alias("instrument_id"),
+            pl.col("TckrSymb").alias("symbol"),
+            pl.lit("NSE").alias("exchange"),
+            pl.col("ISIN").alias("isin"),
+            pl.col("FinInstrmTp").alias("instrument_type"),
+            pl.col("SctySrs").alias("series"),
+            # Price fields
+            pl.col("PrvsClsgPric").alias("prev_close"),
+            pl.col("OpnPric").alias("open"),
+            pl.col("HghPric").alias("high"),
+            pl.col("LwPric").alias("low"),
+            pl.col("ClsPric").alias("close"),
+            pl.col("LastPric").alias("last_price"),
+            pl.col("SttlmPric").alias("settlement_price"),
+            # Volume / turnover
+            pl.col("TtlTradgVol").alias("volume"),
+            pl.col("TtlTrfVal").alias("turnover"),
+            pl.col("TtlNbOfTxsExctd").alias("trades"),
+            # Defaults
+            pl.lit(1.0).alias("adjustment_factor"),
+            pl.lit(None).cast(pl.Int64).alias("adjustment_date"),
+            pl.lit(True).alias("is_trading_day"),
+        ]
+    )
+
+    # Preserve required metadata columns (event_id, event_time, ingest_time, source, schema_version, entity_id)
+    cols_to_select = [
+        "event_id",
+        "event_time",
+        "ingest_time",
+        "source",
+        "schema_version",
+        "entity_id",
+        "instrument_id",
+        "symbol",
+        "exchange",
+        "isin",
+        "instrument_type",
+        "series",
+        "trade_date",
+        "prev_close",
+        "open",
+        "high",
+        "low",
+        "close",
+        "last_price",
+        "settlement_price",
+        "volume",
+        "turnover",
+        "trades",
+        "adjustment_factor",
+        "adjustment_date",
+        "is_trading_day",
+    ]
+
+    # Some bhavcopy inputs might be missing optional columns; select only existing columns and fill missing with nulls
+    existing = [c for c in cols_to_select if c in mapped.columns]
+    normalized_df = mapped.select(existing)
+
+    # Ensure all required properties exist; for missing non-present columns add null/defaults
+    required_cols = [
+        "event_id",
+        "event_time",
+        "ingest_time",
+        "source",
+        "schema_version",
+        "entity_id",
+        "instrument_id",
+        "symbol",
+        "exchange",
+        "trade_date",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "turnover",
+        "adjustment_factor",
+        "is_trading_day",
+    ]
+
+    for c in required_cols:
+        if c not in normalized_df.columns:
+            # infer type for default: numeric -> 0/0.0, string -> empty, boolean -> False
+            if c in ("open", "high", "low", "close", "turnover", "adjustment_factor"):
+                normalized_df = normalized_df.with_column(pl.lit(0.0).alias(c))
+            elif c in ("volume",):
+                normalized_df = normalized_df.with_column(pl.lit(0).alias(c))
+            elif c in ("is_trading_day",):
+                normalized_df = normalized_df.with_column(pl.lit(False).alias(c))
+            else:
+                normalized_df = normalized_df.with_column(pl.lit("").alias(c))
+
+    return normalized_df
+
+
 @task(
     name="normalize-polars",
     retries=2,
     retry_delay_seconds=30,
 )
-def normalize_polars(df: pl.DataFrame) -> pl.DataFrame:
+def normalize_polars(
+    df: pl.DataFrame,
+    csv_file_path: CsvSource | None = None,
+    trade_date: date | None = None,
+) -> pl.DataFrame:
     """Normalize and validate Polars DataFrame.
 
     This task performs data quality checks and normalization:
@@ -488,8 +465,14 @@ def normalize_polars(df: pl.DataFrame) -> pl.DataFrame:
     - Validate data types
     - Add derived columns if needed
 
+    With the parse cache enabled and the source file given, the normalized
+    frame of a re-run is read from the cache; its ``ingest_time`` is re-stamped
+    from ``df`` so the reprocessed rows supersede the earlier ones.
+
     Args:
         df: Raw Polars DataFrame
+        csv_file_path: Source file or bytes of ``df`` (optional; enables the parse cache)
+        trade_date: Trading date of ``df`` (required with ``csv_file_path``)
 
     Returns:
         Normalized Polars DataFrame
@@ -509,121 +492,20 @@ def normalize_polars(df: pl.DataFrame) -> pl.DataFrame:
 
         initial_rows = len(df)
 
-        # Basic filtering: require a symbol and a positive close price
-        df = df.filter(
-            pl.col("TckrSymb").is_not_null()
-            & (pl.col("TckrSymb") != "")
-            & pl.col("ClsPric").is_not_null()
-            & (pl.col("ClsPric") > 0)
-        )
-
-        if len(df) == 0:
-            raise ValueError("No valid rows after normalization")
-
-        # Map bhavcopy columns to the canonical normalized_equity_ohlc schema
-        # - trade_date: parse TradDt (YYYY-MM-DD) into Polars Date (days since epoch)
-        # - instrument_id: use symbol:exchange
-        mapped = df.with_columns(
-            [
-                # Ensure TradDt is an integer in YYYYMMDD format (schema expects integer)
-                pl.col("TradDt")
-                .str.strptime(pl.Date, "%Y-%m-%d")
-                .dt.strftime("%Y%m%d")
-                .cast(pl.Int64)
-                .alias("trade_date"),
-                # Canonical identifiers
-                (pl.col("TckrSymb") + pl.lit(":") + pl.lit("NSE")).alias("instrument_id"),
-                pl.col("TckrSymb").alias("symbol"),
-                pl.lit("NSE").alias("exchange"),
-                pl.col("ISIN").alias("isin"),
-                pl.col("FinInstrmTp").alias("instrument_type"),
-                pl.col("SctySrs").alias("series"),
-                # Price fields
-                pl.col("PrvsClsgPric").alias("prev_close"),
-                pl.col("OpnPric").alias("open"),
-                pl.col("HghPric").alias("high"),
-                pl.col("LwPric").alias("low"),
-                pl.col("ClsPric").alias("close"),
-                pl.col("LastPric").alias("last_price"),
-                pl.col("SttlmPric").alias("settlement_price"),
-                # Volume / turnover
-                pl.col("TtlTradgVol").alias("volume"),
-                pl.col("TtlTrfVal").alias("turnover"),
-                pl.col("TtlNbOfTxsExctd").alias("trades"),
-                # Defaults
-                pl.lit(1.0).alias("adjustment_factor"),
-                pl.lit(None).cast(pl.Int64).alias("adjustment_date"),
-                pl.lit(True).alias("is_trading_day"),
-            ]
-        )
-
-        # Preserve required metadata columns (event_id, event_time, ingest_time, source, schema_version, entity_id)
-        cols_to_select = [
-            "event_id",
-            "event_time",
-            "ingest_time",
-            "source",
-            "schema_version",
-            "entity_id",
-            "instrument_id",
-            "symbol",
-            "exchange",
-            "isin",
-            "instrument_type",
-            "series",
-            "trade_date",
-            "prev_close",
-            "open",
-            "high",
-            "low",
-            "close",
-            "last_price",
-            "settlement_price",
-            "volume",
-            "turnover",
-            "trades",
-            "adjustment_factor",
-            "adjustment_date",
-            "is_trading_day",
-        ]
-
-        # Some bhavcopy inputs might be missing optional columns; select only existing columns and fill missing with nulls
-        existing = [c for c in cols_to_select if c in mapped.columns]
-        normalized_df = mapped.select(existing)
-
-        # Ensure all required properties exist; for missing non-present columns add null/defaults
-        required_cols = [
-            "event_id",
-            "event_time",
-            "ingest_time",
-            "source",
-            "schema_version",
-            "entity_id",
-            "instrument_id",
-            "symbol",
-            "exchange",
-            "trade_date",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "turnover",
-            "adjustment_factor",
-            "is_trading_day",
-        ]
-
-        for c in required_cols:
-            if c not in normalized_df.columns:
-                # infer type for default: numeric -> 0/0.0, string -> empty, boolean -> False
-                if c in ("open", "high", "low", "close", "turnover", "adjustment_factor"):
-                    normalized_df = normalized_df.with_column(pl.lit(0.0).alias(c))
-                elif c in ("volume",):
-                    normalized_df = normalized_df.with_column(pl.lit(0).alias(c))
-                elif c in ("is_trading_day",):
-                    normalized_df = normalized_df.with_column(pl.lit(False).alias(c))
-                else:
-                    normalized_df = normalized_df.with_column(pl.lit("").alias(c))
+        cache = _parse_cache() if csv_file_path and trade_date else None
+        if cache is None:
+            normalized_df = _normalize_bhavcopy(df)
+        else:
+            key = cache.key(
+                csv_file_path,
+                PolarsBhavcopyParser.SCHEMA_VERSION,
+                "normalize_polars",
+                trade_date,
+            )
+            normalized_df = restamp_ingest_time(
+                cache.get_or_parse(key, lambda: _normalize_bhavcopy(df), parser="normalize_polars"),
+                df["ingest_time"][0] if "ingest_time" in df.columns else None,
+            )
 
         filtered_rows = initial_rows - len(normalized_df)
         duration = time.time() - start_time
@@ -751,6 +633,7 @@ def write_parquet(
             trade_date=trade_date,
             base_path=resolved_base_path,
             validate=True,  # Enable validation
+            state_path=_symbol_state_path(resolved_base_path),
         )
 
         # Create idempotency marker
@@ -1073,7 +956,7 @@ def nse_bhavcopy_etl_flow(
                     except Exception:
                         pass
             # Step 3: Normalize data
-            normalized_df = normalize_polars(raw_df)
+            normalized_df = normalize_polars(raw_df, csv_file, trade_date)
 
             # Step 4: Write to Parquet
             parquet_file = write_parquet(
@@ -1101,7 +984,7 @@ def nse_bhavcopy_etl_flow(
             # Prepare result
             result = {
                 "trade_date": str(trade_date),
-                "csv_file": csv_file,
+                "csv_file": describe_source(csv_file),
                 "parquet_file": parquet_file,
                 "rows_processed": len(normalized_df),
                 "flow_duration_seconds": flow_duration,
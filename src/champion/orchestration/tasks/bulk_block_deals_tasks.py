@@ -8,8 +8,10 @@ from typing import Any
 import polars as pl
 import structlog
 
+from champion.parsers.bulk_block_deals_parser import build_deal_events
 from champion.scrapers.nse.bulk_block_deals import BulkBlockDealsScraper
 from champion.storage.parquet_io import write_df_safe
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.idempotency import (
     check_idempotency_marker,
     create_idempotency_marker,
@@ -53,111 +55,44 @@ def parse_bulk_block_deals(
         try_parse_dates=False,
     )
 
-    def _to_int(val: Any) -> int:
-        if val is None or val == "":
-            return 0
-        if isinstance(val, int):
-            return val
-        try:
-            return int(float(str(val).replace(",", "").strip()))
-        except (ValueError, TypeError) as e:
-            logger.debug("int_conversion_failed", value=val, error=str(e))
-            return 0
-        except Exception as e:
-            logger.critical("unexpected_int_conversion_error", value=val, error=str(e))
-            return 0
-
-    def _to_float(val: Any) -> float:
-        if val is None or val == "":
-            return 0.0
-        if isinstance(val, int | float):
-            return float(val)
-        try:
-            return float(str(val).replace(",", "").strip())
-        except (ValueError, TypeError) as e:
-            logger.debug("float_conversion_failed", value=val, error=str(e))
-            return 0.0
-        except Exception as e:
-            logger.critical("unexpected_float_conversion_error", value=val, error=str(e))
-            return 0.0
-
-    events: list[dict[str, Any]] = []
-    for row in df.iter_rows(named=True):
-        symbol = str(row.get("Symbol") or row.get("SYMBOL") or "").strip()
-        client = str(row.get("ClientName") or row.get("CLIENT_NAME") or "").strip()
-        security_name = str(row.get("SecurityName") or row.get("SECURITY_NAME") or "").strip()
-        buy_sell_raw = str(
-            row.get("Buy/Sell") or row.get("BuySell") or row.get("BUY_SELL") or ""
-        ).strip()
-        transaction_type = buy_sell_raw.upper() if buy_sell_raw else ""
-        quantity = _to_int(row.get("QuantityTraded") or row.get("Qty") or row.get("QTY"))
-        price = _to_float(
-            row.get("TradePrice/Wght.Avg.Price")
-            or row.get("TradePriceWght.Avg.Price")
-            or row.get("TradePrice")
-            or row.get("PRICE")
+    def first(*names: str) -> pl.Expr:
+        # First non-empty value among the candidate columns (empty CSV fields are null)
+        present = [pl.col(n) for n in names if n in df.columns]
+        return pl.coalesce(present).fill_null("") if present else pl.lit("")
+
+    def number(*names: str) -> pl.Expr:
+        text = first(*names).str.replace_all(",", "").str.strip_chars()
+        return text.cast(pl.Float64, strict=False)
+
+    parsed = df.select(
+        first("Symbol", "SYMBOL").str.strip_chars().alias("symbol"),
+        first("ClientName", "CLIENT_NAME").str.strip_chars().alias("client_name"),
+        number("QuantityTraded", "Qty", "QTY").alias("quantity"),
+        number(
+            "TradePrice/Wght.Avg.Price", "TradePriceWght.Avg.Price", "TradePrice", "PRICE"
+        ).alias("avg_price"),
+        first("Buy/Sell", "BuySell", "BUY_SELL").str.strip_chars().alias("raw_buy_sell"),
+        first("SecurityName", "SECURITY_NAME").str.strip_chars().alias("security_name"),
+        first("Remarks", "REMARKS").str.strip_chars().alias("remarks"),
+    )
+
+    unparsed = parsed.select(pl.col("quantity", "avg_price").is_null().sum()).row(0)
+    if any(unparsed):
+        logger.debug(
+            "numeric_conversion_failed", quantity=unparsed[0], avg_price=unparsed[1], path=str(path)
         )
-        remarks = str(row.get("Remarks") or row.get("REMARKS") or "").strip()
-
-        if symbol and transaction_type and quantity > 0:
-            events.append(
-                _event(
-                    deal_date=d,
-                    symbol=symbol,
-                    client_name=client,
-                    quantity=quantity,
-                    avg_price=price,
-                    deal_type=deal_type.upper(),
-                    transaction_type=transaction_type,
-                    security_name=security_name,
-                    remarks=remarks,
-                    raw_buy_sell=buy_sell_raw,
-                )
-            )
-
-    return events
-
-
-def _event(
-    deal_date: date,
-    symbol: str,
-    client_name: str,
-    quantity: int,
-    avg_price: float,
-    deal_type: str,
-    transaction_type: str,
-    security_name: str,
-    remarks: str,
-    raw_buy_sell: str,
-) -> dict[str, Any]:
-    import uuid
-    from datetime import UTC, datetime
-
-    now = datetime.now(UTC)
-    event_id = str(uuid.uuid4())
-    entity_id = f"{symbol}:{deal_type}:{transaction_type}:{deal_date.strftime('%Y%m%d')}"
-    return {
-        "event_id": event_id,
-        "event_time": now,
-        "ingest_time": now,
-        "source": "nse.bulk_block_deals",
-        "schema_version": "1.0.0",
-        "entity_id": entity_id,
-        "deal_date": deal_date,
-        "symbol": symbol.upper(),
-        "client_name": client_name,
-        "quantity": int(quantity),
-        "avg_price": float(avg_price),
-        "deal_type": deal_type.upper(),
-        "transaction_type": transaction_type.upper(),
-        "exchange": "NSE",
-        "security_name": security_name,
-        "remarks": remarks,
-        "raw_buy_sell": raw_buy_sell,
-        "year": deal_date.year,
-        "month": deal_date.month,
-        "day": deal_date.day,
-    }
+
+    deals = parsed.with_columns(
+        pl.col("quantity").cast(pl.Int64, strict=False).fill_null(0),
+        pl.col("avg_price").fill_null(0.0),
+        pl.col("raw_buy_sell").str.to_uppercase().alias("transaction_type"),
+    ).filter(
+        (pl.col("symbol") != "") & (pl.col("transaction_type") != "") & (pl.col("quantity") > 0)
+    )
+
+    return build_deal_events(
+        deals, d, deal_type.upper(), payload_columns=("security_name", "remarks", "raw_buy_sell")
+    ).to_dicts()
 
 
 def write_bulk_block_deals_parquet(
@@ -242,10 +177,9 @@ def write_bulk_block_deals_parquet(
         [
             pl.col("deal_date").dt.strftime("%Y-%m-%d").alias("trade_date"),
             pl.col("avg_price").alias("price"),
-            pl.col("event_time").dt.timestamp("ms").cast(pl.Int64),
-            pl.col("ingest_time").dt.timestamp("ms").cast(pl.Int64),
         ]
     )
+    df = to_warehouse_primitives(df, epoch_day_columns=())
 
     try:
         # Use write_df_safe with validation
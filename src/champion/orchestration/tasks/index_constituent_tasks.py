@@ -9,6 +9,7 @@ import structlog
 
 from champion.parsers.index_constituent_parser import IndexConstituentParser
 from champion.scrapers.nse.index_constituent import IndexConstituentScraper
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.idempotency import (
     check_idempotency_marker,
     create_idempotency_marker,
@@ -35,19 +36,23 @@ def parse_index_constituents(
     index_name: str,
     effective_date: str | date,
     action: str = "ADD",
-) -> list[dict[str, Any]]:
-    """Parse index constituent JSON into event dictionaries."""
+) -> pl.DataFrame:
+    """Parse index constituent JSON into a flat event frame.
+
+    A file without a ``symbol`` column parses to an empty frame, which
+    ``write_index_constituents_parquet`` skips.
+    """
     eff_date = (
         effective_date if isinstance(effective_date, date) else date.fromisoformat(effective_date)
     )
     parser = IndexConstituentParser()
-    return parser.parse(
+    return parser.parse_to_dataframe(
         file_path=Path(file_path), index_name=index_name, effective_date=eff_date, action=action
     )
 
 
 def write_index_constituents_parquet(
-    events: list[dict[str, Any]],
+    events: pl.DataFrame | list[dict[str, Any]],
     index_name: str,
     effective_date: str | date,
     output_base_path: str | Path = "data/lake",
@@ -59,7 +64,8 @@ def write_index_constituents_parquet(
     it returns the path to the existing file without rewriting.
 
     Args:
-        events: List of event dictionaries to write
+        events: Flat frame from ``parse_index_constituents()``, or a list of
+            event dictionaries
         index_name: Name of the index
         effective_date: Effective date of constituents
         output_base_path: Base path for data lake
@@ -67,7 +73,9 @@ def write_index_constituents_parquet(
     Returns:
         Path to written Parquet file
     """
-    if not events:
+    if isinstance(events, list):
+        events = IndexConstituentParser.events_from_dicts(events)
+    if events.is_empty():
         return ""
 
     eff_date = (
@@ -100,14 +108,8 @@ def write_index_constituents_parquet(
         )
         return str(out_file)
 
-    df = pl.DataFrame(events)
-    # Cast common types
-    to_write = df.with_columns(
-        [
-            pl.col("event_time").cast(pl.Datetime, strict=False),
-            pl.col("ingest_time").cast(pl.Datetime, strict=False),
-        ]
-    )
+    df = events.unnest("payload") if "payload" in events.columns else events
+    to_write = to_warehouse_primitives(df)
     to_write = to_write.drop(
         [c for c in ("index", "year", "month", "day") if c in to_write.columns]
     )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import structlog
+
+from champion.config import config
+from champion.parsers.symbol_enrichment import SymbolEnrichment
+from champion.parsers.symbol_master_parser import SymbolMasterParser
+from champion.scrapers.nse.symbol_master import SymbolMasterScraper
+
+logger = structlog.get_logger()
+
+
+def symbol_master_path() -> Path:
+    """Return the Arrow file the parsed EQUITY_L master is kept in."""
+    return config.storage.data_dir / "cache" / "symbol_master" / "EQUITY_L.arrow"
+
+
+def scrape_symbol_master() -> Path:
+    """Download NSE EQUITY_L and return the CSV path."""
+    SymbolMasterScraper().scrape()
+    return config.storage.data_dir / "EQUITY_L.csv"
+
+
+def write_symbol_master(csv_path: str | Path, master_path: str | Path | None = None) -> Path:
+    """Parse EQUITY_L and keep it as a memory-mapped Arrow master.
+
+    Args:
+        csv_path: Downloaded EQUITY_L.csv
+        master_path: Destination Arrow file (defaults to ``symbol_master_path()``)
+
+    Returns:
+        Path of the written master
+    """
+    parser = SymbolMasterParser()
+    master = parser.read_master(Path(csv_path))
+    return parser.write_master(master, Path(master_path or symbol_master_path()))
+
+
+def enrich_symbol_master(
+    bhavcopy_paths: list[str | Path],
+    master_path: str | Path | None = None,
+) -> pl.DataFrame:
+    """Enrich the stored master with FinInstrmId and series from bhavcopy files.
+
+    Args:
+        bhavcopy_paths: Bhavcopy Parquet files to take instruments from
+        master_path: Master written by ``write_symbol_master`` (defaults to
+            ``symbol_master_path()``)
+
+    Returns:
+        Enriched DataFrame with canonical instrument IDs
+
+    Raises:
+        FileNotFoundError: If no master has been written yet
+    """
+    path = Path(master_path or symbol_master_path())
+    logger.info("enriching_symbol_master", master_path=str(path), files=len(bhavcopy_paths))
+    return SymbolEnrichment().enrich_from_bhavcopy(path, [Path(p) for p in bhavcopy_paths])
@@ -1,5 +1,5 @@
 """Parsers package."""
 
-from champion.parsers.base_parser import Parser
+from champion.parsers.base_parser import ENVELOPE_COLUMNS, Parser
 
-__all__ = ["Parser"]
+__all__ = ["ENVELOPE_COLUMNS", "Parser"]
@@ -0,0 +1,84 @@
+"""In-memory access to CSV files shipped inside ZIP archives.
+
+NSE and BSE publish bhavcopies as ``.csv.zip`` (and some mirrors serve ZIP
+content under a ``.csv`` name). Instead of extracting the member to disk and
+reading it back, parsers pass the decompressed member bytes straight to
+``pl.read_csv`` via ``open_csv_source``. Sources are detected by content (the
+ZIP local file header signature), not by file name.
+"""
+
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+# Local file header signature at the start of every ZIP archive
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+# A parser input: path to a CSV/ZIP file, or the raw file contents
+CsvSource = str | Path | bytes
+
+
+def is_zip(source: CsvSource) -> bool:
+    """Check whether a source holds a ZIP archive.
+
+    Args:
+        source: File path or raw file contents
+
+    Returns:
+        True if the content starts with the ZIP signature
+    """
+    if isinstance(source, bytes):
+        return source[:4] == ZIP_SIGNATURE
+    try:
+        with open(source, "rb") as f:
+            return f.read(4) == ZIP_SIGNATURE
+    except OSError:
+        return False
+
+
+def read_zip_member(archive: CsvSource, suffix: str = ".csv") -> bytes:
+    """Decompress the first archive member with the given suffix into memory.
+
+    Args:
+        archive: ZIP file path or raw ZIP bytes
+        suffix: File name suffix of the member to read (case-insensitive)
+
+    Returns:
+        Decompressed member contents
+
+    Raises:
+        ValueError: If the archive has no matching member
+    """
+    fileobj = BytesIO(archive) if isinstance(archive, bytes) else archive
+    with zipfile.ZipFile(fileobj, "r") as zf:
+        for name in zf.namelist():
+            if name.lower().endswith(suffix):
+                return zf.read(name)
+    raise ValueError(f"No {suffix} member found in ZIP archive")
+
+
+def open_csv_source(source: CsvSource) -> Path | BytesIO:
+    """Return something ``pl.read_csv`` can read for a CSV or ZIP source.
+
+    Plain CSV files are returned as paths so Polars can memory-map them; ZIP
+    archives (by path or bytes) and raw CSV bytes are returned as an in-memory
+    buffer without touching the disk.
+
+    Args:
+        source: Path to a CSV or ZIP file, or raw file contents
+
+    Returns:
+        Path or BytesIO for ``pl.read_csv``
+    """
+    if is_zip(source):
+        return BytesIO(read_zip_member(source))
+    if isinstance(source, bytes):
+        return BytesIO(source)
+    return Path(source)
+
+
+def describe_source(source: CsvSource) -> str:
+    """Short description of a source for log messages."""
+    if isinstance(source, bytes):
+        return f"<{len(source)} bytes>"
+    return str(source)
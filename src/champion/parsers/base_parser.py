@@ -6,12 +6,23 @@ shared functionality like metadata handling.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+# Envelope columns shared by every event; all other columns belong in the payload
+ENVELOPE_COLUMNS = [
+    "event_id",
+    "event_time",
+    "ingest_time",
+    "source",
+    "schema_version",
+    "entity_id",
+]
+
 
 class Parser(ABC):
     """Base class for all data parsers.
@@ -52,6 +63,95 @@ class Parser(ABC):
         """
         pass
 
+    def parse_events(self, file_path: Path, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Parse file into a columnar batch of events.
+
+        This is the preferred entry point for bulk consumers. Instead of one
+        envelope+payload dict per row, the result is a single DataFrame with the
+        envelope columns (see ``ENVELOPE_COLUMNS``) and a ``payload`` struct column.
+        Use ``iter_events()`` when individual event dicts are really needed.
+
+        Args:
+            file_path: Path to the file to parse
+            *args: Additional positional arguments specific to the parser
+            **kwargs: Additional keyword arguments specific to the parser
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+
+        Raises:
+            NotImplementedError: If the subclass doesn't provide columnar events
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement parse_events")
+
+    @staticmethod
+    def to_event_frame(df: pl.DataFrame, envelope_columns: list[str] | None = None) -> pl.DataFrame:
+        """Pack a flat DataFrame into envelope columns plus a ``payload`` struct.
+
+        Args:
+            df: Flat DataFrame containing envelope and payload columns
+            envelope_columns: Envelope column names (default: ``ENVELOPE_COLUMNS``)
+
+        Returns:
+            DataFrame with envelope columns followed by a ``payload`` struct column
+            holding every remaining column in its original order
+        """
+        envelope = envelope_columns or ENVELOPE_COLUMNS
+        payload_cols = [c for c in df.columns if c not in envelope]
+        return df.select([*envelope, pl.struct(payload_cols).alias("payload")])
+
+    @classmethod
+    def events_from_dicts(cls, events: list[dict[str, Any]]) -> pl.DataFrame:
+        """Build a columnar event batch from event dicts.
+
+        Accepts both nested events (with a ``payload`` dict) and flat events
+        whose payload fields sit alongside the envelope.
+
+        Args:
+            events: List of event dictionaries
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+        """
+        if not events:
+            return pl.DataFrame()
+
+        df = pl.DataFrame(events, infer_schema_length=None)
+        if "payload" in df.columns:
+            return df.select([*ENVELOPE_COLUMNS, "payload"])
+        return cls.to_event_frame(df)
+
+    @staticmethod
+    def iter_events(events: pl.DataFrame, batch_size: int = 10000) -> Iterator[dict[str, Any]]:
+        """Lazily yield event dicts from a columnar event batch.
+
+        Rows are materialized one slice at a time, so callers that stream events
+        (e.g. to Kafka) never hold more than ``batch_size`` dicts in memory.
+
+        Args:
+            events: Event batch as returned by ``parse_events()``
+            batch_size: Number of rows to materialize per slice
+
+        Yields:
+            Event dictionaries with a nested ``payload`` dict
+        """
+        for batch in events.iter_slices(batch_size):
+            yield from batch.to_dicts()
+
+    @classmethod
+    def events_to_dicts(cls, events: pl.DataFrame) -> list[dict[str, Any]]:
+        """Materialize a columnar event batch as a list of event dicts.
+
+        Compatibility adapter for callers of the list-of-dicts ``parse()`` API.
+
+        Args:
+            events: Event batch as returned by ``parse_events()``
+
+        Returns:
+            List of event dictionaries
+        """
+        return list(cls.iter_events(events))
+
     def validate_schema(self, df: pl.DataFrame) -> None:
         """Validate DataFrame schema matches expected format.
 
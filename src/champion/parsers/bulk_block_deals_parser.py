@@ -12,7 +12,7 @@ Schema:
 - exchange: Exchange name (NSE)
 """
 
-import uuid
+from collections.abc import Sequence
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
@@ -20,11 +20,68 @@ from typing import Any
 import polars as pl
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.event_ids import uuid4_series
 from champion.utils.logger import get_logger
 from champion.utils.metrics import rows_parsed
 
 logger = get_logger(__name__)
 
+# Source identifier and schema version stamped on every deal event
+DEALS_SOURCE = "nse.bulk_block_deals"
+DEALS_SCHEMA_VERSION = "1.0.0"
+
+
+def build_deal_events(
+    deals: pl.DataFrame,
+    deal_date: date,
+    deal_type: str,
+    payload_columns: Sequence[str] = (),
+) -> pl.DataFrame:
+    """Add envelope and partition columns to a frame of deals.
+
+    Args:
+        deals: One row per event with ``symbol``, ``client_name``, ``quantity``,
+            ``avg_price`` and ``transaction_type`` columns
+        deal_date: Date of the deals
+        deal_type: 'BULK' or 'BLOCK' (used verbatim in ``entity_id``)
+        payload_columns: Extra columns from ``deals`` appended to the payload
+            after ``exchange``
+
+    Returns:
+        Flat event DataFrame with envelope, payload and partition columns
+    """
+    now = datetime.now(UTC)
+    date_key = deal_date.strftime("%Y%m%d")
+
+    return deals.select(
+        uuid4_series(len(deals)),
+        pl.lit(now).alias("event_time"),
+        pl.lit(now).alias("ingest_time"),
+        pl.lit(DEALS_SOURCE).alias("source"),
+        pl.lit(DEALS_SCHEMA_VERSION).alias("schema_version"),
+        pl.concat_str(
+            [
+                pl.col("symbol"),
+                pl.lit(deal_type),
+                pl.col("transaction_type"),
+                pl.lit(date_key),
+            ],
+            separator=":",
+        ).alias("entity_id"),
+        pl.lit(deal_date).alias("deal_date"),
+        pl.col("symbol").str.to_uppercase(),
+        pl.col("client_name"),
+        pl.col("quantity").cast(pl.Int64),
+        pl.col("avg_price").cast(pl.Float64),
+        pl.lit(deal_type.upper()).alias("deal_type"),
+        pl.col("transaction_type").str.to_uppercase(),
+        pl.lit("NSE").alias("exchange"),
+        *payload_columns,
+        pl.lit(deal_date.year, dtype=pl.Int64).alias("year"),
+        pl.lit(deal_date.month, dtype=pl.Int64).alias("month"),
+        pl.lit(deal_date.day, dtype=pl.Int64).alias("day"),
+    )
+
 
 class BulkBlockDealsParser(Parser):
     """High-performance parser for NSE bulk and block deals data using Polars.
@@ -55,6 +112,45 @@ class BulkBlockDealsParser(Parser):
         Returns:
             List of event dictionaries ready for downstream processing
 
+        Raises:
+            FileNotFoundError: If JSON file doesn't exist
+            Exception: If parsing fails
+        """
+        return self.parse_to_dataframe(file_path, deal_date, deal_type).to_dicts()
+
+    def parse_events(self, file_path: Path, deal_date: date, deal_type: str) -> pl.DataFrame:
+        """Parse bulk or block deals JSON file into a columnar event batch.
+
+        Args:
+            file_path: Path to JSON file with deals data
+            deal_date: Date of the deals
+            deal_type: 'BULK' or 'BLOCK'
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+        """
+        events = self.parse_to_dataframe(file_path, deal_date, deal_type)
+        if events.is_empty():
+            return pl.DataFrame()
+        return self.to_event_frame(events)
+
+    def parse_to_dataframe(
+        self,
+        file_path: Path,
+        deal_date: date,
+        deal_type: str,
+    ) -> pl.DataFrame:
+        """Parse bulk or block deals JSON file into a flat event DataFrame.
+
+        Args:
+            file_path: Path to JSON file with deals data
+            deal_date: Date of the deals
+            deal_type: 'BULK' or 'BLOCK'
+
+        Returns:
+            One row per BUY/SELL event with envelope, payload and partition
+            columns (empty DataFrame if the file holds no deals)
+
         Raises:
             FileNotFoundError: If JSON file doesn't exist
             Exception: If parsing fails
@@ -79,7 +175,7 @@ class BulkBlockDealsParser(Parser):
             # Handle empty data
             if not data or (isinstance(data, list) and len(data) == 0):
                 self.logger.warning("No deals found in file", path=str(file_path))
-                return []
+                return pl.DataFrame()
 
             # Convert to Polars DataFrame based on NSE data structure
             # NSE bulk deals format (typical structure):
@@ -99,7 +195,7 @@ class BulkBlockDealsParser(Parser):
             else:
                 # If data is wrapped in another structure, extract it
                 self.logger.error("Unexpected data format", data_type=type(data).__name__)
-                return []
+                return pl.DataFrame()
 
             # Normalize column names (handle variations in NSE API response)
             column_mapping = {
@@ -129,51 +225,10 @@ class BulkBlockDealsParser(Parser):
             # Check for required columns
             if "symbol" not in df.columns:
                 self.logger.error("Missing required column: symbol", columns=df.columns)
-                return []
-
-            # Process deals - create separate rows for buy and sell
-            events = []
-
-            for row in df.iter_rows(named=True):
-                symbol = row.get("symbol", "").strip()
-                client_name = row.get("client_name", "").strip()
-
-                if not symbol:
-                    continue
-
-                # Process buy transaction if quantity > 0
-                buy_qty = row.get("buy_quantity", 0) or 0
-                buy_price = row.get("buy_avg_price", 0.0) or 0.0
-
-                if buy_qty > 0:
-                    events.append(
-                        self._create_event(
-                            deal_date=deal_date,
-                            symbol=symbol,
-                            client_name=client_name,
-                            quantity=buy_qty,
-                            avg_price=buy_price,
-                            deal_type=deal_type,
-                            transaction_type="BUY",
-                        )
-                    )
-
-                # Process sell transaction if quantity > 0
-                sell_qty = row.get("sell_quantity", 0) or 0
-                sell_price = row.get("sell_avg_price", 0.0) or 0.0
-
-                if sell_qty > 0:
-                    events.append(
-                        self._create_event(
-                            deal_date=deal_date,
-                            symbol=symbol,
-                            client_name=client_name,
-                            quantity=sell_qty,
-                            avg_price=sell_price,
-                            deal_type=deal_type,
-                            transaction_type="SELL",
-                        )
-                    )
+                return pl.DataFrame()
+
+            # Unpivot each deal row into separate BUY and SELL events
+            events = self._deals_frame(df, deal_date, deal_type)
 
             rows_parsed.labels(scraper="bulk_block_deals", status="success").inc(len(events))
 
@@ -190,56 +245,61 @@ class BulkBlockDealsParser(Parser):
             self.logger.error("Failed to parse bulk/block deals", error=str(e), path=str(file_path))
             raise
 
-    def _create_event(
-        self,
-        deal_date: date,
-        symbol: str,
-        client_name: str,
-        quantity: int | float,
-        avg_price: float,
-        deal_type: str,
-        transaction_type: str,
-    ) -> dict[str, Any]:
-        """Create a standardized event dictionary for a deal.
+    def _deals_frame(self, df: pl.DataFrame, deal_date: date, deal_type: str) -> pl.DataFrame:
+        """Expand normalized deal rows into one event row per non-zero side.
+
+        Each input row with ``buy_quantity > 0`` yields a BUY event and each row
+        with ``sell_quantity > 0`` a SELL event; events keep the input row order
+        (BUY before SELL for the same row).
 
         Args:
-            deal_date: Date of the deal
-            symbol: Trading symbol
-            client_name: Client name
-            quantity: Quantity traded
-            avg_price: Average price
+            df: Deals with normalized column names (``symbol``, ``client_name``,
+                ``buy_quantity``, ``sell_quantity``, ``buy_avg_price``, ``sell_avg_price``)
+            deal_date: Date of the deals
             deal_type: 'BULK' or 'BLOCK'
-            transaction_type: 'BUY' or 'SELL'
 
         Returns:
-            Event dictionary
+            Flat event DataFrame (envelope, payload and partition columns)
         """
-        now = datetime.now(UTC)
-        event_id = str(uuid.uuid4())
-        entity_id = f"{symbol}:{deal_type}:{transaction_type}:{deal_date.strftime('%Y%m%d')}"
-
-        return {
-            # Envelope fields (metadata)
-            "event_id": event_id,
-            "event_time": now,
-            "ingest_time": now,
-            "source": "nse.bulk_block_deals",
-            "schema_version": "1.0.0",
-            "entity_id": entity_id,
-            # Deal payload
-            "deal_date": deal_date,
-            "symbol": symbol.upper(),
-            "client_name": client_name,
-            "quantity": int(quantity) if isinstance(quantity, int | float) else 0,
-            "avg_price": float(avg_price) if avg_price else 0.0,
-            "deal_type": deal_type.upper(),
-            "transaction_type": transaction_type.upper(),
-            "exchange": "NSE",
-            # Partition columns
-            "year": deal_date.year,
-            "month": deal_date.month,
-            "day": deal_date.day,
-        }
+
+        def text(name: str) -> pl.Expr:
+            if name not in df.columns:
+                return pl.lit("")
+            return pl.col(name).cast(pl.Utf8).fill_null("").str.strip_chars()
+
+        def number(name: str) -> pl.Expr:
+            if name not in df.columns:
+                return pl.lit(0.0)
+            return pl.col(name).cast(pl.Float64, strict=False).fill_null(0.0)
+
+        base = (
+            df.with_row_index("_row")
+            .select(
+                "_row",
+                text("symbol").alias("symbol"),
+                text("client_name").alias("client_name"),
+                number("buy_quantity").alias("BUY_quantity"),
+                number("buy_avg_price").alias("BUY_avg_price"),
+                number("sell_quantity").alias("SELL_quantity"),
+                number("sell_avg_price").alias("SELL_avg_price"),
+            )
+            .filter(pl.col("symbol") != "")
+        )
+
+        sides = [
+            base.filter(pl.col(f"{side}_quantity") > 0).select(
+                "_row",
+                "symbol",
+                "client_name",
+                pl.col(f"{side}_quantity").cast(pl.Int64).alias("quantity"),
+                pl.col(f"{side}_avg_price").alias("avg_price"),
+                pl.lit(side).alias("transaction_type"),
+            )
+            for side in ("BUY", "SELL")
+        ]
+        deals = pl.concat(sides).sort("_row", maintain_order=True).drop("_row")
+
+        return build_deal_events(deals, deal_date, deal_type)
 
     def write_parquet(
         self,
@@ -4,9 +4,15 @@ NSE provides corporate actions data in CSV format with columns like:
 - SYMBOL, COMPANY, SERIES, FACE VALUE, PURPOSE, EX-DATE, RECORD DATE, etc.
 
 This parser handles the NSE CA format and produces structured events.
+
+PURPOSE strings are classified column-at-a-time by ``classify_purposes``: the
+action type, split/bonus ratios, dividend amount and adjustment factor are all
+Polars expressions over the whole column, and purposes that could not be fully
+interpreted are reported in a separate frame.
 """
 
 import re
+from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -14,6 +20,8 @@ from uuid import uuid4
 import polars as pl
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.date_formats import date_format_inferrer
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,6 +42,168 @@ CA_SCHEMA = {
     "ACTUAL PAYMENT DATE": pl.Utf8,
 }
 
+# Date columns parsed by parse_to_dataframe (source column -> output column)
+CA_DATE_COLUMNS = {
+    "EX-DATE": "ex_date",
+    "RECORD DATE": "record_date",
+    "BC START DATE": "bc_start_date",
+    "BC END DATE": "bc_end_date",
+}
+
+# Date formats used in NSE CA files
+CA_DATE_FORMATS = ["%d-%b-%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y"]
+
+# Action type -> patterns searched in the lower-cased PURPOSE, in priority order
+ACTION_TYPE_PATTERNS = {
+    "SPLIT": [r"split", r"sub-division", r"subdivision"],
+    "BONUS": [r"bonus", r"capitalisation"],
+    "DIVIDEND": [r"dividend", r"div"],
+    "RIGHTS": [r"rights"],
+    "INTEREST_PAYMENT": [r"interest"],
+    "EGMMEETING": [r"egm", r"agm", r"meeting"],
+    "DEMERGER": [r"demerger", r"de-merger"],
+    "MERGER": [r"merger", r"amalgamation"],
+    "BUYBACK": [r"buy-back", r"buyback"],
+}
+
+# One alternation per action type, compiled once
+ACTION_TYPE_REGEXES = {
+    action_type: re.compile("|".join(f"(?:{p})" for p in patterns))
+    for action_type, patterns in ACTION_TYPE_PATTERNS.items()
+}
+
+# "Rs 10/- to Rs 2/-" (old and new face value)
+SPLIT_RATIO_RE = re.compile(r"rs\.?\s*(\d+(?:\.\d+)?)\s*/?\-?\s*to\s*rs\.?\s*(\d+(?:\.\d+)?)")
+# "1:2" or "1 for 2" (new shares for existing shares)
+BONUS_RATIO_RE = re.compile(r"(\d+)\s*(?:[:]\s*|for\s+)(\d+)")
+# "Rs. 15/- Per Share"
+DIVIDEND_AMOUNT_RE = re.compile(r"rs\.?\s*(\d+(?:\.\d+)?)\s*/?\-?\s*per\s*share")
+
+
+@dataclass
+class PurposeClassification:
+    """Result of ``classify_purposes``.
+
+    Attributes:
+        df: Input frame with ``action_type``, ``split_ratio``, ``bonus_ratio``,
+            ``dividend_amount`` and ``adjustment_factor`` columns added
+        unparsed: Distinct purposes that could not be fully interpreted, with
+            ``action_type``, ``reason`` and the number of ``rows`` affected
+    """
+
+    df: pl.DataFrame
+    unparsed: pl.DataFrame
+
+
+def action_type_expr(purpose: pl.Expr) -> pl.Expr:
+    """Build an expression classifying PURPOSE strings into action types.
+
+    Args:
+        purpose: PURPOSE column expression
+
+    Returns:
+        Utf8 expression: the first matching type of ``ACTION_TYPE_PATTERNS``,
+        "OTHER" if none matches, or null if the purpose is null
+    """
+    lowered = purpose.str.to_lowercase()
+    expr = pl.when(purpose.is_null()).then(pl.lit(None, dtype=pl.Utf8))
+    for action_type, regex in ACTION_TYPE_REGEXES.items():
+        expr = expr.when(lowered.str.contains(regex.pattern)).then(pl.lit(action_type))
+    return expr.otherwise(pl.lit("OTHER"))
+
+
+def classify_purposes(
+    df: pl.DataFrame, purpose_col: str = "PURPOSE", default_factor: float | None = 1.0
+) -> PurposeClassification:
+    """Classify corporate actions and compute adjustment factors column-wise.
+
+    Split factors are ``floor(old_fv / new_fv)`` and bonus factors
+    ``(existing + new) / existing``; dividends need a close price, so they (and
+    anything else without a factor) get ``default_factor``.
+
+    PURPOSE strings repeat heavily across years of history, so each distinct
+    purpose is classified once and the result joined back onto the rows.
+
+    Args:
+        df: Frame with a PURPOSE column
+        purpose_col: Name of the PURPOSE column
+        default_factor: Adjustment factor for rows without a computable factor
+
+    Returns:
+        PurposeClassification with the enriched frame and the unparsed purposes
+    """
+    purpose = pl.col(purpose_col)
+    lowered = purpose.str.to_lowercase()
+    action_type = pl.col("action_type")
+
+    split = lowered.str.extract_groups(SPLIT_RATIO_RE.pattern)
+    old_fv = split.struct.field("1").cast(pl.Float64)
+    new_fv = split.struct.field("2").cast(pl.Float64)
+    bonus = lowered.str.extract_groups(BONUS_RATIO_RE.pattern)
+    bonus_new = bonus.struct.field("1").cast(pl.Int64)
+    bonus_existing = bonus.struct.field("2").cast(pl.Int64)
+
+    classes = df.group_by(purpose_col, maintain_order=True).agg(pl.len().alias("rows"))
+    classes = classes.with_columns(action_type_expr(purpose).alias("action_type")).with_columns(
+        pl.when((action_type == "SPLIT") & (new_fv > 0))
+        .then(
+            pl.struct(
+                pl.lit(1, dtype=pl.Int64).alias("old_shares"),
+                (old_fv / new_fv).floor().cast(pl.Int64, strict=False).alias("new_shares"),
+            )
+        )
+        .alias("split_ratio"),
+        pl.when((action_type == "BONUS") & (bonus_existing > 0))
+        .then(
+            pl.struct(
+                bonus_new.alias("new_shares"),
+                bonus_existing.alias("existing_shares"),
+            )
+        )
+        .alias("bonus_ratio"),
+        pl.when(action_type == "DIVIDEND")
+        .then(lowered.str.extract(DIVIDEND_AMOUNT_RE.pattern, 1).cast(pl.Float64))
+        .alias("dividend_amount"),
+    )
+
+    split_ratio = pl.col("split_ratio").struct
+    bonus_ratio = pl.col("bonus_ratio").struct
+    classes = classes.with_columns(
+        pl.when(pl.col("split_ratio").is_not_null())
+        .then(split_ratio.field("new_shares") / split_ratio.field("old_shares"))
+        .when(pl.col("bonus_ratio").is_not_null())
+        .then(
+            (bonus_ratio.field("existing_shares") + bonus_ratio.field("new_shares"))
+            / bonus_ratio.field("existing_shares")
+        )
+        .otherwise(pl.lit(default_factor, dtype=pl.Float64))
+        .alias("adjustment_factor")
+    )
+
+    reason = (
+        pl.when(action_type.is_null())
+        .then(pl.lit("MISSING_PURPOSE"))
+        .when(action_type == "OTHER")
+        .then(pl.lit("UNKNOWN_ACTION"))
+        .when((action_type == "SPLIT") & pl.col("split_ratio").is_null())
+        .then(pl.lit("NO_SPLIT_RATIO"))
+        .when((action_type == "BONUS") & pl.col("bonus_ratio").is_null())
+        .then(pl.lit("NO_BONUS_RATIO"))
+        .when((action_type == "DIVIDEND") & pl.col("dividend_amount").is_null())
+        .then(pl.lit("NO_DIVIDEND_AMOUNT"))
+    )
+    unparsed = (
+        classes.select(purpose.alias("purpose"), action_type, reason.alias("reason"), "rows")
+        .filter(pl.col("reason").is_not_null())
+        .sort(["rows", "purpose"], descending=[True, False], nulls_last=True)
+    )
+
+    derived = [c for c in classes.columns if c in df.columns and c != purpose_col]
+    df = df.drop(derived).join(
+        classes.drop("rows"), on=purpose_col, how="left", join_nulls=True, coalesce=True
+    )
+    return PurposeClassification(df=df, unparsed=unparsed)
+
 
 class CorporateActionsParser(Parser):
     """Parser for NSE Corporate Actions CSV files.
@@ -46,17 +216,21 @@ class CorporateActionsParser(Parser):
 
     def __init__(self):
         """Initialize parser."""
-        self.action_type_patterns = {
-            "SPLIT": [r"split", r"sub-division", r"subdivision"],
-            "BONUS": [r"bonus", r"capitalisation"],
-            "DIVIDEND": [r"dividend", r"div"],
-            "RIGHTS": [r"rights"],
-            "INTEREST_PAYMENT": [r"interest"],
-            "EGMMEETING": [r"egm", r"agm", r"meeting"],
-            "DEMERGER": [r"demerger", r"de-merger"],
-            "MERGER": [r"merger", r"amalgamation"],
-            "BUYBACK": [r"buy-back", r"buyback"],
-        }
+        self.action_type_patterns = ACTION_TYPE_PATTERNS
+        # Purposes from the last parse that could not be fully interpreted
+        self.unparsed_purposes = pl.DataFrame()
+
+    def parse(self, file_path: Path, source: str = "nse_corporate_actions") -> pl.DataFrame:
+        """Parse NSE CA CSV file.
+
+        Args:
+            file_path: Path to CSV file
+            source: Source identifier
+
+        Returns:
+            DataFrame with parsed CA events
+        """
+        return self.parse_to_dataframe(file_path, source)
 
     def parse_action_type(self, purpose: str) -> str:
         """Determine action type from PURPOSE field.
@@ -69,10 +243,9 @@ class CorporateActionsParser(Parser):
         """
         purpose_lower = purpose.lower()
 
-        for action_type, patterns in self.action_type_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, purpose_lower):
-                    return action_type
+        for action_type, regex in ACTION_TYPE_REGEXES.items():
+            if regex.search(purpose_lower):
+                return action_type
 
         return "OTHER"
 
@@ -90,10 +263,7 @@ class CorporateActionsParser(Parser):
             Dict with old_shares and new_shares, or None
         """
         # Pattern: "Rs X to Rs Y" or "Rs. X/- to Rs. Y/-"
-        match = re.search(
-            r"rs\.?\s*(\d+(?:\.\d+)?)\s*/?\-?\s*to\s*rs\.?\s*(\d+(?:\.\d+)?)",
-            purpose.lower(),
-        )
+        match = SPLIT_RATIO_RE.search(purpose.lower())
         if match:
             old_fv = float(match.group(1))
             new_fv = float(match.group(2))
@@ -119,7 +289,7 @@ class CorporateActionsParser(Parser):
             Dict with new_shares and existing_shares, or None
         """
         # Pattern: "X:Y" or "X for Y"
-        match = re.search(r"(\d+)\s*(?:[:]\s*|for\s+)(\d+)", purpose.lower())
+        match = BONUS_RATIO_RE.search(purpose.lower())
         if match:
             new_shares = int(match.group(1))
             existing_shares = int(match.group(2))
@@ -144,7 +314,7 @@ class CorporateActionsParser(Parser):
             Dividend amount, or None
         """
         # Pattern: "Rs. X" or "Rs X"
-        match = re.search(r"rs\.?\s*(\d+(?:\.\d+)?)\s*/?\-?\s*per\s*share", purpose.lower())
+        match = DIVIDEND_AMOUNT_RE.search(purpose.lower())
         if match:
             return float(match.group(1))
 
@@ -162,16 +332,10 @@ class CorporateActionsParser(Parser):
         if not date_str or date_str.strip() == "" or date_str.strip() == "-":
             return None
 
-        # Try common date formats
-        formats = ["%d-%b-%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt).date()
-            except ValueError:
-                continue
-
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
+        parsed = date_format_inferrer.parse_value(date_str, formats=CA_DATE_FORMATS)
+        if parsed is None:
+            logger.warning(f"Could not parse date: {date_str}")
+        return parsed
 
     def compute_adjustment_factor(self, action_type: str, purpose: str) -> float:
         """Compute adjustment factor from CA details.
@@ -221,44 +385,25 @@ class CorporateActionsParser(Parser):
             logger.error(f"Failed to read CSV: {e}")
             raise
 
-        # Parse dates
-        df = df.with_columns(
-            [
-                pl.col("EX-DATE")
-                .map_elements(self.parse_date, return_dtype=pl.Date)
-                .alias("ex_date"),
-                pl.col("RECORD DATE")
-                .map_elements(self.parse_date, return_dtype=pl.Date)
-                .alias("record_date"),
-                pl.col("BC START DATE")
-                .map_elements(self.parse_date, return_dtype=pl.Date)
-                .alias("bc_start_date"),
-                pl.col("BC END DATE")
-                .map_elements(self.parse_date, return_dtype=pl.Date)
-                .alias("bc_end_date"),
-            ]
-        )
-
-        # Parse action type
-        df = df.with_columns(
-            [
-                pl.col("PURPOSE")
-                .map_elements(self.parse_action_type, return_dtype=pl.Utf8)
-                .alias("action_type"),
-            ]
+        # Parse dates (format inferred once per column, vectorized parse)
+        df = date_format_inferrer.parse_columns(
+            df,
+            list(CA_DATE_COLUMNS),
+            source=source,
+            formats=CA_DATE_FORMATS,
+            aliases=CA_DATE_COLUMNS,
         )
 
-        # Compute adjustment factors
-        df = df.with_columns(
-            [
-                pl.struct(["action_type", "PURPOSE"])
-                .map_elements(
-                    lambda row: self.compute_adjustment_factor(row["action_type"], row["PURPOSE"]),
-                    return_dtype=pl.Float64,
-                )
-                .alias("adjustment_factor"),
-            ]
-        )
+        # Classify purposes and compute adjustment factors over the whole column
+        classification = classify_purposes(df)
+        df = classification.df
+        self.unparsed_purposes = classification.unparsed
+        if len(classification.unparsed) > 0:
+            logger.warning(
+                "Unparsed CA purposes",
+                purposes=len(classification.unparsed),
+                rows=classification.unparsed["rows"].sum(),
+            )
 
         # Add metadata
         ingest_time = datetime.now()
@@ -289,6 +434,8 @@ class CorporateActionsParser(Parser):
         Returns:
             Path to written file(s)
         """
+        # Envelope timestamps as epoch ms; ex_date stays a date for partitioning
+        df = to_warehouse_primitives(df, epoch_day_columns=())
         if partition_by_year:
             # Partition by year
             for year in df["ex_date"].dt.year().unique().sort():
@@ -0,0 +1,210 @@
+"""Vectorized date parsing with per-column format inference.
+
+NSE files use several date layouts (``20240102``, ``2024-01-02``, ``02-Jan-2024``,
+``02/01/2024``...). Trying each format with a strict full-column ``strptime``
+costs a full scan plus exception overhead per wrong guess, and per-value Python
+helpers are slower still.
+
+``DateFormatInferrer`` instead:
+
+- Samples a few non-null values of a column and picks the format that parses
+  the most of them
+- Caches that choice per ``(source, column)`` so later files in a backfill skip
+  inference entirely
+- Parses with one non-strict expression: the inferred format first, then the
+  remaining candidates via ``pl.coalesce`` for stray values in other layouts
+"""
+
+import threading
+from collections.abc import Sequence
+from datetime import date
+
+import polars as pl
+
+from champion.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Formats seen across NSE/BSE files, most common first
+DEFAULT_DATE_FORMATS = [
+    "%Y%m%d",  # 20240102
+    "%Y-%m-%d",  # 2024-01-02
+    "%d-%b-%Y",  # 02-Jan-2024
+    "%d-%B-%Y",  # 02-January-2024
+    "%d-%m-%Y",  # 02-01-2024
+    "%d/%m/%Y",  # 02/01/2024
+]
+
+
+class DateFormatInferrer:
+    """Infers, caches and applies date formats for string columns.
+
+    Thread-safe; a single process-wide instance (``date_format_inferrer``) is
+    shared by the parsers so inference results carry across files.
+
+    Attributes:
+        formats: Candidate formats, in priority order
+        sample_size: Number of non-null values sampled per column
+    """
+
+    def __init__(
+        self, formats: Sequence[str] = DEFAULT_DATE_FORMATS, sample_size: int = 20
+    ) -> None:
+        """Initialize the inferrer.
+
+        Args:
+            formats: Candidate formats, in priority order
+            sample_size: Number of non-null values sampled per column
+        """
+        self.formats = list(formats)
+        self.sample_size = sample_size
+        self._cache: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def infer(
+        self,
+        values: pl.Series,
+        source: str | None = None,
+        formats: Sequence[str] | None = None,
+    ) -> str | None:
+        """Pick the format that parses the most sampled values.
+
+        Args:
+            values: Column values (any dtype; cast to string)
+            source: Data source name; when given, the result is cached per
+                (source, column name) and reused on later calls
+            formats: Candidate formats (default: the inferrer's formats)
+
+        Returns:
+            Best matching format, or None if no candidate parses any sample
+        """
+        key = (source, values.name) if source else None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        candidates = list(formats) if formats is not None else self.formats
+        sample = values.cast(pl.Utf8).str.strip_chars().drop_nulls()
+        sample = sample.filter(sample != "").head(self.sample_size)
+        if sample.is_empty():
+            return None
+
+        best_format = None
+        best_hits = 0
+        for fmt in candidates:
+            hits = len(sample) - sample.str.strptime(pl.Date, fmt, strict=False).null_count()
+            if hits > best_hits:
+                best_format, best_hits = fmt, hits
+            if hits == len(sample):
+                break
+
+        if best_format is not None and key is not None:
+            with self._lock:
+                self._cache[key] = best_format
+            logger.debug(
+                "Inferred date format", source=source, column=values.name, format=best_format
+            )
+
+        return best_format
+
+    def expr(
+        self,
+        col: str | pl.Expr,
+        fmt: str | None = None,
+        formats: Sequence[str] | None = None,
+    ) -> pl.Expr:
+        """Build a single non-strict expression parsing a string column to pl.Date.
+
+        Args:
+            col: Column name or string expression
+            fmt: Preferred (inferred) format, tried first
+            formats: Fallback candidates (default: the inferrer's formats)
+
+        Returns:
+            Date expression; values matching no format become null
+        """
+        text = (pl.col(col) if isinstance(col, str) else col).cast(pl.Utf8).str.strip_chars()
+        candidates = list(formats) if formats is not None else self.formats
+        ordered = [fmt] if fmt else []
+        ordered += [f for f in candidates if f != fmt]
+
+        parsed = [text.str.strptime(pl.Date, f, strict=False) for f in ordered]
+        result = parsed[0] if len(parsed) == 1 else pl.coalesce(parsed)
+        return result.alias(col) if isinstance(col, str) else result
+
+    def parse_columns(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        columns: Sequence[str],
+        source: str | None = None,
+        formats: Sequence[str] | None = None,
+        aliases: dict[str, str] | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Parse several date columns in one ``with_columns`` call.
+
+        Columns that are already ``pl.Date`` are left untouched, integer columns
+        (e.g. ``20240102``) are parsed as ``%Y%m%d``. For a LazyFrame only a
+        bounded head of the plan is collected for inference.
+
+        Args:
+            df: Input frame
+            columns: Columns to parse (missing columns are skipped)
+            source: Data source name used as the cache key
+            formats: Candidate formats (default: the inferrer's formats)
+            aliases: Optional mapping of input column -> output column name
+
+        Returns:
+            Frame of the same kind with parsed date columns
+        """
+        schema = df.schema
+        present = [c for c in columns if c in schema]
+        aliases = aliases or {}
+
+        sample = self._sample(df, present)
+
+        exprs = []
+        for col in present:
+            dtype = schema[col]
+            out = aliases.get(col, col)
+            if dtype == pl.Date:
+                exprs.append(pl.col(col).alias(out))
+            elif dtype in (pl.Int64, pl.Int32):
+                exprs.append(self.expr(col, "%Y%m%d", ["%Y%m%d"]).alias(out))
+            else:
+                fmt = self.infer(sample[col], source=source, formats=formats)
+                exprs.append(self.expr(col, fmt, formats).alias(out))
+
+        return df.with_columns(exprs) if exprs else df
+
+    def parse_value(self, value: str | None, formats: Sequence[str] | None = None) -> date | None:
+        """Parse a single date string with the candidate formats.
+
+        Args:
+            value: Date string
+            formats: Candidate formats (default: the inferrer's formats)
+
+        Returns:
+            Parsed date, or None if empty or unparseable
+        """
+        return pl.select(self.expr(pl.lit(value, dtype=pl.Utf8), formats=formats)).item()
+
+    def clear_cache(self) -> None:
+        """Forget all inferred formats."""
+        with self._lock:
+            self._cache.clear()
+
+    def _sample(self, df: pl.DataFrame | pl.LazyFrame, columns: list[str]) -> pl.DataFrame:
+        """Return the rows used for format inference.
+
+        Eager frames are used as-is (``infer`` only looks at the first non-null
+        values); lazy frames collect a bounded head so nothing else is read.
+        """
+        if isinstance(df, pl.LazyFrame):
+            return df.select(columns).head(max(self.sample_size * 5, 100)).collect()
+        return df
+
+
+# Process-wide instance so inferred formats are reused across files in a backfill
+date_format_inferrer = DateFormatInferrer()
@@ -0,0 +1,213 @@
+"""Parallel batch parsing for document parsers.
+
+HTML table extraction in ``ShareholdingPatternParser`` and
+``QuarterlyFinancialsParser`` is pure Python and CPU-bound, so threads do not
+help. ``parse_documents`` fans the files out over a process pool in chunks and
+collects the per-file frames back in input order, so the combined frame is the
+same whatever the worker count.
+
+Files whose content was already parsed are not parsed again: with a
+``ParseCache`` the frame is served from the cache (keyed by the SHA-256 of the
+file, the parser's ``SCHEMA_VERSION`` and the per-file arguments) with a fresh
+``ingest_time``, and byte-identical files within one batch are parsed once.
+
+Example:
+    >>> result = parse_documents(
+    ...     ShareholdingPatternParser,
+    ...     [(path, (symbol, scrip_code)) for path, symbol, scrip_code in jobs],
+    ...     workers=8,
+    ... )
+    >>> result.df, result.failures
+"""
+
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from champion.parsers.base_parser import Parser
+from champion.parsers.parse_cache import ParseCache, file_digest, restamp_ingest_time
+from champion.utils.logger import get_logger
+from champion.utils.metrics import rows_parsed
+
+logger = get_logger(__name__)
+
+# One unit of work: the file and the extra positional arguments for ``parse``
+DocumentJob = tuple[Path, tuple[Any, ...]]
+
+
+@dataclass
+class DocumentParseResult:
+    """Outcome of parsing one document in a batch.
+
+    Attributes:
+        path: Input file
+        df: Parsed frame (None if parsing failed)
+        error: Error message if parsing failed
+        cached: True if the frame came from the parse cache or a duplicate file
+    """
+
+    path: Path
+    df: pl.DataFrame | None = None
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document parsed successfully."""
+        return self.error is None
+
+
+@dataclass
+class DocumentBatchResult:
+    """Combined result of ``parse_documents``.
+
+    Attributes:
+        df: Concatenated frames of all successfully parsed documents, in input order
+        files_parsed: Number of documents parsed in this run
+        skipped: Number of documents served from the cache or deduplicated
+        failures: Per-file results of documents that failed
+    """
+
+    df: pl.DataFrame
+    files_parsed: int = 0
+    skipped: int = 0
+    failures: list[DocumentParseResult] = field(default_factory=list)
+
+
+def _parse_document(
+    parser_cls: type[Parser], path: Path, args: tuple[Any, ...]
+) -> tuple[pl.DataFrame | None, str | None]:
+    """Process-pool worker: parse one document, returning the error instead of raising."""
+    try:
+        return parser_cls().parse(path, *args), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _default_chunksize(jobs: int, workers: int) -> int:
+    # Several chunks per worker keeps the pool balanced when file sizes vary
+    return max(1, jobs // (workers * 4))
+
+
+def parse_documents(
+    parser_cls: type[Parser],
+    jobs: Sequence[DocumentJob],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    cache: ParseCache | None = None,
+) -> DocumentBatchResult:
+    """Parse many documents with ``parser_cls().parse`` on a process pool.
+
+    Args:
+        parser_cls: Parser class; instantiated with no arguments in each worker
+        jobs: ``(path, args)`` pairs; ``args`` are passed to ``parse`` after the path
+        workers: Number of worker processes (default: CPU count). With 1 the
+            documents are parsed in-process.
+        chunksize: Documents sent to a worker at a time (default: derived from
+            the batch size)
+        cache: Optional parse cache; documents already in it are not parsed again
+
+    Returns:
+        DocumentBatchResult with the combined frame and per-file failures
+    """
+    workers = workers or os.cpu_count() or 1
+    parser_name = parser_cls.__name__
+    results: list[DocumentParseResult] = [DocumentParseResult(Path(p)) for p, _ in jobs]
+
+    # Resolve cache hits and in-batch duplicates before starting any workers
+    pending: dict[str, list[int]] = {}
+    keys: dict[str, tuple[Path, tuple[Any, ...]]] = {}
+    for i, (path, args) in enumerate(jobs):
+        path = Path(path)
+        try:
+            key = (
+                cache.key(path, parser_cls.SCHEMA_VERSION, parser_name, *args)
+                if cache
+                else f"{file_digest(path)}:{args!r}"
+            )
+        except OSError as e:
+            results[i].error = str(e)
+            continue
+
+        if key in pending:
+            pending[key].append(i)
+            continue
+        cached = cache.get(key, parser=parser_name) if cache else None
+        if cached is not None:
+            # The cached frame carries the ingest_time of the run that parsed it
+            results[i].df = restamp_ingest_time(cached)
+            results[i].cached = True
+            continue
+        pending[key] = [i]
+        keys[key] = (path, tuple(args))
+
+    logger.info(
+        "Parsing document batch",
+        parser=parser_name,
+        files=len(jobs),
+        to_parse=len(keys),
+        workers=workers,
+    )
+
+    work = list(keys.items())
+    if workers == 1 or len(work) <= 1:
+        outcomes = [_parse_document(parser_cls, path, args) for _, (path, args) in work]
+    else:
+        # Spawn rather than fork: forking after Polars has started its thread pool can deadlock
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            outcomes = list(
+                pool.map(
+                    _parse_document,
+                    [parser_cls] * len(work),
+                    [path for _, (path, _) in work],
+                    [args for _, (_, args) in work],
+                    chunksize=chunksize or _default_chunksize(len(work), workers),
+                )
+            )
+
+    files_parsed = 0
+    for (key, _), (df, error) in zip(work, outcomes, strict=True):
+        first, *duplicates = pending[key]
+        if error is not None:
+            for i in (first, *duplicates):
+                results[i].error = error
+            continue
+
+        files_parsed += 1
+        results[first].df = df
+        for i in duplicates:
+            results[i].df = df
+            results[i].cached = True
+
+        if cache is not None and df is not None:
+            try:
+                cache.put(key, df)
+            except OSError as e:
+                logger.warning("Failed to write parse cache entry", key=key, error=str(e))
+
+    failures = [r for r in results if not r.ok]
+    for failure in failures:
+        logger.error("Failed to parse file", file_path=str(failure.path), error=failure.error)
+        rows_parsed.labels(scraper=parser_name, status="failed").inc()
+
+    frames = [r.df for r in results if r.ok and r.df is not None and len(r.df) > 0]
+    df = pl.concat(frames, how="diagonal_relaxed") if frames else pl.DataFrame()
+
+    skipped = sum(1 for r in results if r.cached)
+    logger.info(
+        "Document batch complete",
+        parser=parser_name,
+        files=len(jobs),
+        parsed=files_parsed,
+        skipped=skipped,
+        failed=len(failures),
+        rows=len(df),
+    )
+    return DocumentBatchResult(df=df, files_parsed=files_parsed, skipped=skipped, failures=failures)
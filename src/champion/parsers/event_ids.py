@@ -0,0 +1,137 @@
+"""Batch generation of event IDs.
+
+Parsers derive ``event_id`` as ``uuid5(NAMESPACE_DNS, "<source>:<date>:<key>")``
+so that re-ingesting the same file produces the same IDs and ClickHouse can
+deduplicate on them. Calling :func:`uuid.uuid5` once per row builds a ``UUID``
+object and formats it in Python, which dominates parse time on large files.
+
+This module produces byte-identical IDs for a whole column at once:
+
+- The SHA-1 state for ``namespace + prefix`` is computed once and copied per row
+- Version/variant bits are applied to all digests with a single NumPy operation
+- Hex formatting is done with a lookup table into one contiguous buffer that is
+  wrapped as an Arrow string array without copying
+
+Parsers that use random IDs get the same batch formatting via :func:`uuid4_series`.
+"""
+
+import hashlib
+import os
+import uuid
+from collections.abc import Iterable
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+# Two lowercase hex characters per byte value
+_HEX_LUT = np.array([list(f"{i:02x}".encode()) for i in range(256)], dtype=np.uint8)
+
+# Byte offsets (within the 32-char hex digest) where the canonical form inserts dashes
+_DASH_POSITIONS = (8, 12, 16, 20)
+_UUID_STR_LEN = 36
+
+
+def _sha1_digests(namespace: uuid.UUID, prefix: str, keys: Iterable[str]) -> bytes:
+    """Return the concatenated first 16 bytes of SHA-1(namespace + prefix + key)."""
+    seed = hashlib.sha1(namespace.bytes + prefix.encode("utf-8"), usedforsecurity=False)
+
+    def _digest(key: str) -> bytes:
+        h = seed.copy()
+        h.update(key.encode("utf-8"))
+        return h.digest()[:16]
+
+    return b"".join(_digest(key) for key in keys)
+
+
+def _format_uuids(raw: np.ndarray, version: int = 5) -> pa.StringArray:
+    """Format an ``(n, 16)`` uint8 array of UUID bytes as canonical UUID strings."""
+    n = raw.shape[0]
+
+    # Set version and RFC 4122 variant bits, as uuid.UUID(version=...) does
+    raw[:, 6] = (raw[:, 6] & 0x0F) | (version << 4)
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+    hex_chars = _HEX_LUT[raw].reshape(n, 32)
+
+    out = np.full((n, _UUID_STR_LEN), ord("-"), dtype=np.uint8)
+    src = 0
+    dst = 0
+    for pos in (*_DASH_POSITIONS, 32):
+        width = pos - src
+        out[:, dst : dst + width] = hex_chars[:, src:pos]
+        src = pos
+        dst += width + 1
+
+    offsets = np.arange(0, (n + 1) * _UUID_STR_LEN, _UUID_STR_LEN, dtype=np.int32)
+    return pa.StringArray.from_buffers(n, pa.py_buffer(offsets), pa.py_buffer(out.tobytes()))
+
+
+def uuid5_series(
+    keys: pl.Series | Iterable[str],
+    prefix: str = "",
+    name: str = "event_id",
+    namespace: uuid.UUID = uuid.NAMESPACE_DNS,
+) -> pl.Series:
+    """Generate UUIDv5 strings for a column of keys.
+
+    The result for each element equals ``str(uuid.uuid5(namespace, prefix + key))``.
+
+    Args:
+        keys: Per-row name suffixes (a Utf8 Series or any iterable of strings)
+        prefix: Shared name prefix, e.g. ``"nse_cm_bhavcopy:2024-01-02:"``
+        name: Name of the returned Series
+        namespace: UUID namespace (default: ``uuid.NAMESPACE_DNS``)
+
+    Returns:
+        Utf8 Series of canonical UUID strings
+
+    Example:
+        >>> ids = uuid5_series(pl.Series(["RELIANCE:2885"]), prefix="nse_cm_bhavcopy:2024-01-02:")
+        >>> ids[0] == str(uuid.uuid5(uuid.NAMESPACE_DNS, "nse_cm_bhavcopy:2024-01-02:RELIANCE:2885"))
+        True
+    """
+    values = keys.to_list() if isinstance(keys, pl.Series) else list(keys)
+    if not values:
+        return pl.Series(name, [], dtype=pl.Utf8)
+
+    digests = _sha1_digests(namespace, prefix, values)
+    raw = np.frombuffer(digests, dtype=np.uint8).reshape(len(values), 16).copy()
+    return pl.Series(name, _format_uuids(raw))
+
+
+def uuid4_series(n: int, name: str = "event_id") -> pl.Series:
+    """Generate ``n`` random UUIDv4 strings in one batch.
+
+    Equivalent to ``[str(uuid.uuid4()) for _ in range(n)]`` (same randomness
+    source, ``os.urandom``) without building a ``UUID`` object per row.
+
+    Args:
+        n: Number of IDs
+        name: Name of the returned Series
+
+    Returns:
+        Utf8 Series of canonical UUID strings
+    """
+    if n == 0:
+        return pl.Series(name, [], dtype=pl.Utf8)
+
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    return pl.Series(name, _format_uuids(raw, version=4))
+
+
+def key_expr(*columns: str, separator: str = ":") -> pl.Expr:
+    """Build the per-row key used in event ID names from one or more columns.
+
+    Null values are rendered as ``"None"`` to match the f-string formatting the
+    row-by-row implementation used, so existing IDs stay stable.
+
+    Args:
+        *columns: Column names joined in order
+        separator: Separator between column values
+
+    Returns:
+        Utf8 expression
+    """
+    parts = [pl.col(c).cast(pl.Utf8).fill_null("None") for c in columns]
+    return pl.concat_str(parts, separator=separator)
@@ -8,7 +8,6 @@ This parser provides:
 """
 
 import json
-import uuid
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -16,6 +15,8 @@ from typing import Any
 import polars as pl
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.event_ids import uuid5_series
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.logger import get_logger
 from champion.utils.metrics import rows_parsed
 
@@ -56,6 +57,59 @@ class IndexConstituentParser(Parser):
         Returns:
             List of event dictionaries ready for Kafka/Parquet
 
+        Raises:
+            FileNotFoundError: If JSON file doesn't exist
+            Exception: If parsing fails
+        """
+        events = self.parse_events(file_path, index_name, effective_date, action)
+        return self.events_to_dicts(events)
+
+    def parse_events(
+        self,
+        file_path: Path,
+        index_name: str,
+        effective_date: date | None = None,
+        action: str = "ADD",
+    ) -> pl.DataFrame:
+        """Parse index constituent JSON file into a columnar event batch.
+
+        Args:
+            file_path: Path to JSON file with index constituent data
+            index_name: Name of the index (e.g., 'NIFTY50')
+            effective_date: Date when constituents are effective (defaults to today)
+            action: Default action type ('ADD', 'REMOVE', or 'REBALANCE')
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+        """
+        df = self.parse_to_dataframe(file_path, index_name, effective_date, action)
+        if df.is_empty():
+            return pl.DataFrame()
+        return self.to_event_frame(df)
+
+    def parse_to_dataframe(
+        self,
+        file_path: Path,
+        index_name: str,
+        effective_date: date | None = None,
+        action: str = "ADD",
+    ) -> pl.DataFrame:
+        """Parse index constituent JSON file into a flat DataFrame.
+
+        Columns are the event envelope followed by the payload fields, so the
+        frame can be written to Parquet directly.
+
+        Args:
+            file_path: Path to JSON file with index constituent data
+            index_name: Name of the index (e.g., 'NIFTY50')
+            effective_date: Date when constituents are effective (defaults to today)
+            action: Default action type ('ADD', 'REMOVE', or 'REBALANCE')
+
+        Returns:
+            One row per constituent. The DataFrame is empty if the file has no
+            data or its rows carry no ``symbol`` field, since such a batch has
+            nothing to key events on.
+
         Raises:
             FileNotFoundError: If JSON file doesn't exist
             Exception: If parsing fails
@@ -77,40 +131,32 @@ class IndexConstituentParser(Parser):
 
             if not constituents:
                 self.logger.warning("No constituent data found in file", path=str(file_path))
-                return []
+                return pl.DataFrame()
 
             # Convert to Polars DataFrame for efficient processing
             df = pl.DataFrame(constituents)
+            if "symbol" not in df.columns:
+                self.logger.warning(
+                    "No symbol column in constituent data",
+                    path=str(file_path),
+                    columns=df.columns,
+                )
+                return pl.DataFrame()
 
             # Filter for equity series (exclude indices and other instruments)
             if "series" in df.columns:
                 df = df.filter(pl.col("series").is_in(["EQ", "BE"]))
 
-            # Generate event metadata
-            event_time = int(datetime.now().timestamp() * 1000)
-            ingest_time = event_time
-
-            # Convert to list of event dictionaries
-            events = []
-            for row in df.iter_rows(named=True):
-                try:
-                    event = self._row_to_event(
-                        row, index_name, effective_date, action, event_time, ingest_time
-                    )
-                    if event:
-                        events.append(event)
-                        rows_parsed.labels(scraper="index_constituent", status="success").inc()
-                except Exception as e:
-                    self.logger.error("Failed to parse row", row=row, error=str(e))
-                    rows_parsed.labels(scraper="index_constituent", status="failed").inc()
+            df = self._normalize(df, index_name, effective_date, action)
+            rows_parsed.labels(scraper="index_constituent", status="success").inc(len(df))
 
             self.logger.info(
                 "Parsed index constituent file",
                 path=str(file_path),
                 index_name=index_name,
-                events=len(events),
+                events=len(df),
             )
-            return events
+            return df
 
         except Exception as e:
             self.logger.error(
@@ -118,133 +164,99 @@ class IndexConstituentParser(Parser):
             )
             raise
 
-    def _row_to_event(
+    def _normalize(
         self,
-        row: dict[str, Any],
+        df: pl.DataFrame,
         index_name: str,
         effective_date: date,
         action: str,
-        event_time: int,
-        ingest_time: int,
-    ) -> dict[str, Any] | None:
-        """Convert constituent row to event structure.
-
-        Args:
-            row: Constituent row as dictionary
-            index_name: Name of the index
-            effective_date: Date when constituent is effective
-            action: Action type (ADD, REMOVE, REBALANCE)
-            event_time: Event timestamp in milliseconds
-            ingest_time: Ingestion timestamp in milliseconds
-
-        Returns:
-            Event dictionary with envelope and payload, or None if row should be skipped
-        """
-        # Extract symbol - NSE API uses 'symbol' field
-        symbol = row.get("symbol", "").strip()
-        if not symbol:
-            return None
-
-        # Create entity_id (index_name:symbol)
-        entity_id = f"{index_name}:{symbol}"
-
-        # Generate deterministic event_id
-        event_id = str(
-            uuid.uuid5(
-                uuid.NAMESPACE_DNS,
-                f"nse_index_constituent:{entity_id}:{effective_date.isoformat()}",
-            )
-        )
-
-        # Build event envelope
-        event = {
-            "event_id": event_id,
-            "event_time": event_time,
-            "ingest_time": ingest_time,
-            "source": "nse_index_constituents",
-            "schema_version": "v1",
-            "entity_id": entity_id,
-            "payload": self._build_payload(row, index_name, symbol, effective_date, action),
-        }
-
-        return event
+    ) -> pl.DataFrame:
+        """Cast and rename raw constituent columns into envelope and payload columns.
 
-    def _build_payload(
-        self,
-        row: dict[str, Any],
-        index_name: str,
-        symbol: str,
-        effective_date: date,
-        action: str,
-    ) -> dict[str, Any]:
-        """Build payload from constituent row.
+        Rows without a symbol are dropped. String fields holding one of
+        ``MISSING_DATA_VALUES`` become null, as do zero or unparsable numbers.
 
         Args:
-            row: Constituent row as dictionary
+            df: Raw constituent rows from the NSE API
             index_name: Name of the index
-            symbol: Trading symbol
-            effective_date: Date when constituent is effective
+            effective_date: Date when constituents are effective
             action: Action type (ADD, REMOVE, REBALANCE)
 
         Returns:
-            Payload dictionary matching Avro schema
+            Flat DataFrame with envelope and payload columns
         """
+        schema = df.schema
+        meta_fields = (
+            {f.name for f in schema["meta"].fields}
+            if isinstance(schema.get("meta"), pl.Struct)
+            else set()
+        )
 
-        def safe_str(value: Any) -> str | None:
-            """Get string value or None."""
-            if value is None:
-                return None
-            val = str(value).strip() if value else None
-            return val if val and val not in MISSING_DATA_VALUES else None
-
-        def safe_float(value: Any) -> float | None:
-            """Get float value or None."""
-            if value is None:
-                return None
-            try:
-                return float(value) if value else None
-            except (ValueError, TypeError):
-                return None
-
-        def safe_int(value: Any) -> int | None:
-            """Get int value or None."""
-            if value is None:
-                return None
-            try:
-                return int(float(value)) if value else None
-            except (ValueError, TypeError):
-                return None
-
-        # Convert effective_date to days since epoch
-        epoch = date(1970, 1, 1)
-        effective_date_days = (effective_date - epoch).days
-
-        # Extract index weight (percentage)
-        # NSE API may provide this in different fields depending on the index
-        weight = None
-        if "indexWeight" in row:
-            weight = safe_float(row.get("indexWeight"))
-        elif "weightage" in row:
-            weight = safe_float(row.get("weightage"))
-
-        return {
-            "index_name": index_name,
-            "symbol": symbol,
-            "isin": safe_str(row.get("meta", {}).get("isin")) or safe_str(row.get("isin")),
-            "company_name": safe_str(row.get("meta", {}).get("companyName"))
-            or safe_str(row.get("companyName")),
-            "effective_date": effective_date_days,
-            "action": action,
-            "weight": weight,
-            "free_float_market_cap": safe_float(row.get("ffmc")),
-            "shares_for_index": safe_int(row.get("sharesForIndex")),
-            "announcement_date": None,  # Not available in current API
-            "index_category": self._get_index_category(index_name),
-            "sector": safe_str(row.get("meta", {}).get("sector")) or safe_str(row.get("sector")),
-            "industry": safe_str(row.get("meta", {}).get("industry"))
-            or safe_str(row.get("industry")),
-            "metadata": None,  # Can be populated with additional data if needed
-        }
+        def text(name: str) -> pl.Expr:
+            """Top-level string field, or null."""
+            if name not in schema:
+                return pl.lit(None, dtype=pl.Utf8)
+            value = pl.col(name).cast(pl.Utf8).str.strip_chars()
+            return pl.when(value.is_in(MISSING_DATA_VALUES)).then(None).otherwise(value)
+
+        def meta_text(name: str) -> pl.Expr:
+            """String field from the nested ``meta`` object, else the top-level field."""
+            if name not in meta_fields:
+                return text(name)
+            value = pl.col("meta").struct.field(name).cast(pl.Utf8).str.strip_chars()
+            nested = pl.when(value.is_in(MISSING_DATA_VALUES)).then(None).otherwise(value)
+            return pl.coalesce(nested, text(name))
+
+        def number(name: str | None, dtype: type[pl.DataType]) -> pl.Expr:
+            """Numeric field; zero, blank or unparsable values become null."""
+            if name is None or name not in schema:
+                return pl.lit(None, dtype=dtype)
+            if schema[name] == pl.Utf8:
+                value = pl.col(name).str.strip_chars().cast(pl.Float64, strict=False)
+            else:
+                # Non-string zeros are falsy in the source data, so they mean "missing"
+                value = pl.col(name).cast(pl.Float64, strict=False)
+                value = pl.when(value == 0).then(None).otherwise(value)
+            return value.cast(dtype, strict=False)
+
+        # NSE API may provide the weight in different fields depending on the index
+        weight_col = next((c for c in ("indexWeight", "weightage") if c in schema), None)
+
+        # Same clock for every event, in milliseconds
+        event_time = int(datetime.now().timestamp() * 1000)
+        effective_date_days = (effective_date - date(1970, 1, 1)).days
+        iso_date = effective_date.isoformat()
+
+        df = df.with_columns(
+            pl.col("symbol").cast(pl.Utf8).str.strip_chars().alias("symbol")
+        ).filter(pl.col("symbol").is_not_null() & (pl.col("symbol") != ""))
+
+        event_keys = df.select(
+            pl.concat_str([pl.col("symbol"), pl.lit(iso_date)], separator=":")
+        ).to_series()
+
+        return df.select(
+            uuid5_series(event_keys, prefix=f"nse_index_constituent:{index_name}:"),
+            pl.lit(event_time, dtype=pl.Int64).alias("event_time"),
+            pl.lit(event_time, dtype=pl.Int64).alias("ingest_time"),
+            pl.lit("nse_index_constituents").alias("source"),
+            pl.lit("v1").alias("schema_version"),
+            (pl.lit(f"{index_name}:") + pl.col("symbol")).alias("entity_id"),
+            pl.lit(index_name).alias("index_name"),
+            pl.col("symbol"),
+            meta_text("isin").alias("isin"),
+            meta_text("companyName").alias("company_name"),
+            pl.lit(effective_date_days, dtype=pl.Int64).alias("effective_date"),
+            pl.lit(action).alias("action"),
+            number(weight_col, pl.Float64).alias("weight"),
+            number("ffmc", pl.Float64).alias("free_float_market_cap"),
+            number("sharesForIndex", pl.Int64).alias("shares_for_index"),
+            pl.lit(None).alias("announcement_date"),  # Not available in current API
+            pl.lit(self._get_index_category(index_name), dtype=pl.Utf8).alias("index_category"),
+            meta_text("sector").alias("sector"),
+            meta_text("industry").alias("industry"),
+            pl.lit(None).alias("metadata"),  # Can be populated with additional data if needed
+        )
 
     def _get_index_category(self, index_name: str) -> str | None:
         """Determine index category based on index name.
@@ -266,15 +278,16 @@ class IndexConstituentParser(Parser):
 
     def write_parquet(
         self,
-        events: list[dict[str, Any]],
+        events: pl.DataFrame | list[dict[str, Any]],
         output_base_path: Path,
         index_name: str,
         effective_date: date,
     ) -> Path:
-        """Write parsed events to partitioned Parquet files.
+        """Write parsed constituents to partitioned Parquet files.
 
         Args:
-            events: List of event dictionaries
+            events: Flat frame from ``parse_to_dataframe()``, an event batch from
+                ``parse_events()``, or a list of event dictionaries
             output_base_path: Base path for Parquet output
             index_name: Name of the index (for partitioning)
             effective_date: Effective date (for partitioning)
@@ -285,26 +298,15 @@ class IndexConstituentParser(Parser):
         Raises:
             Exception: If write fails
         """
-        if not events:
+        if isinstance(events, list):
+            events = self.events_from_dicts(events)
+        if events.is_empty():
             raise ValueError("No events to write")
 
         # Flatten events for Parquet (envelope + payload fields)
-        flattened = []
-        for event in events:
-            flat = {
-                "event_id": event["event_id"],
-                "event_time": event["event_time"],
-                "ingest_time": event["ingest_time"],
-                "source": event["source"],
-                "schema_version": event["schema_version"],
-                "entity_id": event["entity_id"],
-            }
-            # Add payload fields
-            flat.update(event["payload"])
-            flattened.append(flat)
-
-        # Create DataFrame
-        df = pl.DataFrame(flattened)
+        df = to_warehouse_primitives(
+            events.unnest("payload") if "payload" in events.columns else events
+        )
 
         # Create partitioned output path
         year = effective_date.year
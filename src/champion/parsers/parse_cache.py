@@ -0,0 +1,255 @@
+"""Content-addressed cache of parsed DataFrames.
+
+Reprocessing a trading day (re-runs, backfills, Prefect retries) used to
+re-read and re-parse the same raw CSV every time. ``ParseCache`` stores the
+parsed frame as an uncompressed Arrow IPC file keyed by the SHA-256 of the
+input file plus the parser's ``SCHEMA_VERSION`` (and any other inputs that
+affect the output, such as the trade date). Hits are memory-mapped, so
+reading them back is zero-copy.
+
+Cached frames never carry a per-run ``ingest_time``: parsers either cache
+the payload and add the event envelope after reading it back, or re-stamp
+``ingest_time`` on a hit with ``restamp_ingest_time``. ClickHouse tables keep
+the row with the newest ``ingest_time``, so a replayed time would make a
+reprocessed day lose to the version it is meant to replace.
+
+The cache is bounded by total size; when it grows past ``max_bytes`` the
+least recently used entries (by file mtime, refreshed on every hit) are
+evicted.
+
+Example:
+    >>> cache = ParseCache(Path("data/cache/parsed"))
+    >>> parser = PolarsBhavcopyParser(cache=cache)
+    >>> df = parser.parse_to_dataframe(csv_path, trade_date)  # miss: parse + store
+    >>> df = parser.parse_to_dataframe(csv_path, trade_date)  # hit: mmap read
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+
+from champion.utils.logger import get_logger
+from champion.utils.metrics import (
+    parse_cache_evictions,
+    parse_cache_hits,
+    parse_cache_misses,
+    parse_cache_size_bytes,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path("data/cache/parsed")
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+# Read size when hashing input files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def restamp_ingest_time(df: pl.DataFrame, ingest_time: datetime | None = None) -> pl.DataFrame:
+    """Replace the ``ingest_time`` of a cached frame with the current run's.
+
+    Args:
+        df: Frame read from the cache
+        ingest_time: Time to stamp (default: now, UTC)
+
+    Returns:
+        Frame with ``ingest_time`` set in the column's existing type (datetime,
+        epoch milliseconds or ISO string); unchanged if it has no such column
+    """
+    if "ingest_time" not in df.columns:
+        return df
+
+    dtype = df.schema["ingest_time"]
+    if dtype.is_integer():
+        epoch = ingest_time.timestamp() if ingest_time else time.time()
+        return df.with_columns(pl.lit(int(epoch * 1000)).cast(dtype).alias("ingest_time"))
+
+    ingest_time = ingest_time or datetime.utcnow()
+    if dtype == pl.Utf8:
+        value = pl.lit(ingest_time.isoformat())
+    else:
+        value = pl.lit(ingest_time).cast(dtype)
+    return df.with_columns(value.alias("ingest_time"))
+
+
+class ParseCache:
+    """Size-bounded LRU cache of parsed frames stored as Arrow IPC files.
+
+    Attributes:
+        cache_dir: Directory holding the ``.arrow`` entries
+        max_bytes: Total size above which least recently used entries are evicted
+    """
+
+    SUFFIX = ".arrow"
+
+    def __init__(
+        self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries (created if missing)
+            max_bytes: Maximum total size of the cache in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def key(self, file_path: str | Path | bytes, schema_version: str, *parts: object) -> str:
+        """Build the cache key for an input file.
+
+        Args:
+            file_path: Raw input file, or its contents
+            schema_version: Parser ``SCHEMA_VERSION``
+            *parts: Other inputs that affect the parsed output
+
+        Returns:
+            Hex key
+        """
+        digest = (
+            hashlib.sha256(file_path).hexdigest()
+            if isinstance(file_path, bytes)
+            else file_digest(Path(file_path))
+        )
+        material = ":".join([digest, schema_version, *map(str, parts)])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return the entry path for a key."""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str, parser: str = "unknown") -> pl.DataFrame | None:
+        """Read a cached frame.
+
+        Args:
+            key: Cache key from ``key()``
+            parser: Parser name used as the metrics label
+
+        Returns:
+            Memory-mapped DataFrame, or None on a miss
+        """
+        entry = self.path(key)
+        try:
+            df = pl.read_ipc(entry, memory_map=True)
+            os.utime(entry)  # refresh LRU position
+        except (FileNotFoundError, OSError, pl.ComputeError):
+            parse_cache_misses.labels(parser=parser).inc()
+            return None
+
+        parse_cache_hits.labels(parser=parser).inc()
+        logger.debug("Parse cache hit", key=key, parser=parser, rows=len(df))
+        return df
+
+    def put(self, key: str, df: pl.DataFrame) -> Path:
+        """Store a frame and evict old entries if the cache is over budget.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file.
+
+        Args:
+            key: Cache key from ``key()``
+            df: Parsed frame
+
+        Returns:
+            Path of the cache entry
+        """
+        entry = self.path(key)
+        tmp = entry.with_name(f".{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        # Uncompressed so the entry can be memory-mapped on read
+        df.write_ipc(tmp, compression="uncompressed")
+        os.replace(tmp, entry)
+
+        self.evict()
+        return entry
+
+    def get_or_parse(
+        self,
+        key: str,
+        parse_fn: Callable[[], pl.DataFrame],
+        parser: str = "unknown",
+    ) -> pl.DataFrame:
+        """Return the cached frame for ``key``, parsing and storing it on a miss.
+
+        Args:
+            key: Cache key from ``key()``
+            parse_fn: Zero-argument callable producing the frame
+            parser: Parser name used as the metrics label
+
+        Returns:
+            Parsed DataFrame
+        """
+        df = self.get(key, parser=parser)
+        if df is not None:
+            return df
+
+        df = parse_fn()
+        try:
+            self.put(key, df)
+        except OSError as e:
+            # A full or read-only cache must never fail the parse itself
+            logger.warning("Failed to write parse cache entry", key=key, error=str(e))
+        return df
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = []
+            for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        parse_cache_size_bytes.set(total)
+        if removed:
+            parse_cache_evictions.inc(removed)
+            logger.info("Evicted parse cache entries", removed=removed, size_bytes=total)
+        return removed
+
+    def size_bytes(self) -> int:
+        """Return the total size of all cache entries in bytes."""
+        return sum(e.stat().st_size for e in self.cache_dir.glob(f"*{self.SUFFIX}"))
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+                entry.unlink(missing_ok=True)
+        parse_cache_size_bytes.set(0)
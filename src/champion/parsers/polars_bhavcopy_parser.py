@@ -5,23 +5,36 @@ This parser provides:
 - Fast parsing using Polars
 - Parquet output with partitioned layout
 - Type consistency for ClickHouse compatibility
+- Concurrent multi-file parsing for backfills (``parse_many``)
 """
 
-import uuid
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import polars as pl
 import pyarrow.parquet as pq
 
-from champion.parsers.base_parser import Parser
+from champion.parsers.archive import CsvSource, describe_source, open_csv_source
+from champion.parsers.base_parser import ENVELOPE_COLUMNS, Parser
+from champion.parsers.date_formats import date_format_inferrer
+from champion.parsers.event_ids import key_expr, uuid5_series
+from champion.parsers.parse_cache import ParseCache
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.logger import get_logger
 from champion.utils.metrics import rows_parsed
-from champion.validation.validator import ParquetValidator
+from champion.validation.registry import validator_registry
+from champion.validation.state import SymbolStateStore
 
 logger = get_logger(__name__)
 
+# Helpers shared by the eager and lazy parse paths accept either frame type
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 # Define explicit schema matching NSE CM Bhavcopy format
 BHAVCOPY_SCHEMA = {
     "TradDt": pl.Utf8,
@@ -62,6 +75,53 @@ BHAVCOPY_SCHEMA = {
 }
 
 
+# Tokens NSE uses for missing values in bhavcopy CSVs
+CSV_NULL_VALUES = ["-", "", "null", "NULL", "N/A"]
+
+# Payload columns holding dates; parsed to pl.Date during normalization
+DATE_COLUMNS = ["TradDt", "BizDt", "XpryDt", "FininstrmActlXpryDt"]
+
+# Date formats seen in bhavcopy files, in the order they are tried
+DATE_FORMATS = ["%Y%m%d", "%Y-%m-%d", "%d-%b-%Y"]
+
+
+@dataclass
+class FileParseResult:
+    """Outcome of parsing one file in a ``parse_many`` batch.
+
+    Attributes:
+        path: Input CSV file
+        trade_date: Trading date of the file
+        df: Parsed frame (with a ``trade_date`` column), or None on failure
+        error: Error message if parsing failed
+    """
+
+    path: Path
+    trade_date: date
+    df: pl.DataFrame | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file parsed successfully."""
+        return self.error is None
+
+
+@dataclass
+class BatchParseResult:
+    """Result of ``parse_many``.
+
+    Attributes:
+        df: Concatenated frame of all successfully parsed files, sorted by trade date
+        files_parsed: Number of files parsed successfully
+        failures: Per-file results for files that failed
+    """
+
+    df: pl.DataFrame
+    files_parsed: int = 0
+    failures: list[FileParseResult] = field(default_factory=list)
+
+
 class PolarsBhavcopyParser(Parser):
     """High-performance parser for NSE CM Bhavcopy CSV files using Polars.
 
@@ -71,16 +131,27 @@ class PolarsBhavcopyParser(Parser):
 
     SCHEMA_VERSION = "v1.0"
 
-    def __init__(self) -> None:
-        """Initialize the parser."""
+    def __init__(self, cache: ParseCache | None = None) -> None:
+        """Initialize the parser.
+
+        Args:
+            cache: Optional parse cache; when set, parsed frames are stored keyed by
+                input file content and reused on re-runs instead of re-parsing
+        """
+        self.cache = cache
 
     def parse(
-        self, file_path: Path, trade_date: date, output_parquet: bool = False
+        self, file_path: CsvSource, trade_date: date, output_parquet: bool = False
     ) -> list[dict[str, Any]]:
         """Parse bhavcopy CSV file into event structures using Polars.
 
+        Compatibility wrapper around ``parse_events()`` for callers that need
+        a list of dicts. Date fields (``TradDt``, ``BizDt``, ...) are ISO
+        ``YYYY-MM-DD`` strings, as in ``raw_equity_ohlc.avsc``; the columnar
+        APIs return them as ``pl.Date``.
+
         Args:
-            file_path: Path to CSV file
+            file_path: Path to CSV or ZIP file, or raw file bytes
             trade_date: Trading date
             output_parquet: If True, also write output to Parquet format
 
@@ -91,42 +162,41 @@ class PolarsBhavcopyParser(Parser):
             FileNotFoundError: If CSV file doesn't exist
             Exception: If parsing fails
         """
-        logger.info("Parsing bhavcopy file with Polars", path=str(file_path))
-
-        try:
-            # Read CSV with explicit schema and robust null handling
-            df = pl.read_csv(
-                file_path,
-                schema_overrides=BHAVCOPY_SCHEMA,
-                null_values=["-", "", "null", "NULL", "N/A"],
-                ignore_errors=False,
-            )
+        events = self.parse_events(file_path, trade_date, output_parquet=output_parquet)
+        flat = events.unnest("payload").with_columns(pl.col(DATE_COLUMNS).dt.strftime("%Y-%m-%d"))
+        return self.events_to_dicts(self.to_event_frame(flat))
 
-            # Sanitize column names: strip whitespace and drop empty-name columns often present in NSE CSVs
-            col_map = {c: c.strip() for c in df.columns}
-            if any(old != new for old, new in col_map.items()):
-                df = df.rename(col_map)
-            if "" in df.columns:
-                df = df.drop("")
+    def parse_events(
+        self, file_path: CsvSource, trade_date: date, output_parquet: bool = False
+    ) -> pl.DataFrame:
+        """Parse bhavcopy CSV file into a columnar event batch.
 
-            # Validate schema version - check for column mismatches
-            self._validate_schema(df, BHAVCOPY_SCHEMA)
+        Args:
+            file_path: Path to CSV or ZIP file, or raw file bytes
+            trade_date: Trading date
+            output_parquet: If True, also write output to Parquet format
 
-            # Filter out rows with empty symbols
-            df = df.filter(pl.col("TckrSymb").is_not_null() & (pl.col("TckrSymb") != ""))
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
 
-            # Add event metadata columns
-            df = self._add_event_metadata(df, trade_date)
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            Exception: If parsing fails
+        """
+        logger.info("Parsing bhavcopy file with Polars", path=describe_source(file_path))
 
-            # Normalize and validate
-            df = self._normalize_schema(df)
+        try:
+            df = self._read_normalized(file_path, trade_date, validate_schema=True)
 
             logger.info(
-                "Parsed bhavcopy file", path=str(file_path), rows=len(df), columns=len(df.columns)
+                "Parsed bhavcopy file",
+                path=describe_source(file_path),
+                rows=len(df),
+                columns=len(df.columns),
             )
 
-            # Convert to list of event dictionaries
-            events = self._dataframe_to_events(df)
+            # Pack payload columns into a struct alongside the envelope
+            events = self.to_event_frame(df)
 
             # Update metrics
             rows_parsed.labels(scraper="polars_bhavcopy", status="success").inc(len(events))
@@ -138,15 +208,105 @@ class PolarsBhavcopyParser(Parser):
             return events
 
         except Exception as e:
-            logger.error("Failed to parse CSV file", path=str(file_path), error=str(e))
+            logger.error("Failed to parse CSV file", path=describe_source(file_path), error=str(e))
             rows_parsed.labels(scraper="polars_bhavcopy", status="failed").inc()
             raise
 
-    def _validate_schema(self, df: pl.DataFrame, expected_schema: dict[str, Any]) -> None:
+    def _read_normalized(
+        self, file_path: CsvSource, trade_date: date, validate_schema: bool
+    ) -> pl.DataFrame:
+        """Read a bhavcopy CSV and return the normalized frame with event metadata.
+
+        Only the payload goes through the parse cache; the envelope is added on
+        every call, so each run stamps its own ``ingest_time``.
+
+        Args:
+            file_path: Path to CSV or ZIP file, or raw file bytes
+            trade_date: Trading date
+            validate_schema: Whether to check the CSV columns against BHAVCOPY_SCHEMA
+
+        Returns:
+            Normalized DataFrame
+        """
+        payload = self._cached(
+            file_path,
+            "payload" if validate_schema else "payload-unvalidated",
+            lambda: self._read_payload(file_path, validate_schema),
+        )
+        return self._add_event_metadata(payload, trade_date).select(
+            [*ENVELOPE_COLUMNS, *payload.columns]
+        )
+
+    def _read_payload(self, file_path: CsvSource, validate_schema: bool) -> pl.DataFrame:
+        """Read a bhavcopy CSV into the normalized payload columns.
+
+        Args:
+            file_path: Path to CSV or ZIP file, or raw file bytes
+            validate_schema: Whether to check the CSV columns against BHAVCOPY_SCHEMA
+
+        Returns:
+            Payload columns in BHAVCOPY_SCHEMA order with parsed dates
+        """
+        # Read CSV with explicit schema and robust null handling; ZIP members are
+        # decompressed in memory rather than extracted to disk
+        df = pl.read_csv(
+            open_csv_source(file_path),
+            schema_overrides=BHAVCOPY_SCHEMA,
+            null_values=CSV_NULL_VALUES,
+            ignore_errors=False,
+        )
+
+        # Sanitize column names: strip whitespace and drop empty-name columns often present in NSE CSVs
+        col_map = {c: c.strip() for c in df.columns}
+        if any(old != new for old, new in col_map.items()):
+            df = df.rename(col_map)
+        if "" in df.columns:
+            df = df.drop("")
+
+        # Validate schema version - check for column mismatches
+        if validate_schema:
+            self._validate_schema(df, BHAVCOPY_SCHEMA)
+
+        # Filter out rows with empty symbols
+        df = df.filter(pl.col("TckrSymb").is_not_null() & (pl.col("TckrSymb") != ""))
+
+        # Ensure date columns are of Date type; the format is inferred once per column
+        # and cached for later files, with the other formats as a per-value fallback
+        return date_format_inferrer.parse_columns(
+            df.select(list(BHAVCOPY_SCHEMA)),
+            DATE_COLUMNS,
+            source="nse_cm_bhavcopy",
+            formats=DATE_FORMATS,
+        )
+
+    def _cached(
+        self,
+        file_path: CsvSource,
+        variant: str,
+        parse_fn: Callable[[], pl.DataFrame],
+    ) -> pl.DataFrame:
+        """Run ``parse_fn`` through the parse cache, if one is configured.
+
+        Args:
+            file_path: Raw input file or bytes (its content is part of the key)
+            variant: Distinguishes parse paths whose outputs differ
+            parse_fn: Zero-argument callable doing the actual parse
+
+        Returns:
+            Parsed DataFrame
+        """
+        if self.cache is None:
+            return parse_fn()
+        key = self.cache.key(file_path, self.SCHEMA_VERSION, type(self).__name__, variant)
+        return self.cache.get_or_parse(key, parse_fn, parser="polars_bhavcopy")
+
+    def _validate_schema(
+        self, df: pl.DataFrame | pl.LazyFrame, expected_schema: dict[str, Any]
+    ) -> None:
         """Validate that DataFrame columns match expected schema.
 
         Args:
-            df: DataFrame to validate
+            df: DataFrame or LazyFrame to validate
             expected_schema: Expected schema dictionary (column_name -> polars type)
 
         Raises:
@@ -175,28 +335,32 @@ class PolarsBhavcopyParser(Parser):
             )
             raise ValueError(error_msg)
 
-    def _add_event_metadata(self, df: pl.DataFrame, trade_date: date) -> pl.DataFrame:
+    def _add_event_metadata(self, df: FrameT, trade_date: date) -> FrameT:
         """Add event envelope metadata columns.
 
+        Works on both eager and lazy frames so the same logic backs ``parse()``
+        and the streaming ``scan_normalized()`` plan.
+
         Args:
-            df: Input DataFrame
+            df: Input DataFrame or LazyFrame
             trade_date: Trading date
 
         Returns:
-            DataFrame with added metadata columns
+            Frame with added metadata columns
         """
         # Generate deterministic event_id for each row (including FinInstrmId for uniqueness)
-        event_ids = [
-            str(
-                uuid.uuid5(
-                    uuid.NAMESPACE_DNS,
-                    f"nse_cm_bhavcopy:{trade_date}:{symbol}:{fin_instrm_id}",
-                )
-            )
-            for symbol, fin_instrm_id in zip(
-                df["TckrSymb"].to_list(), df["FinInstrmId"].to_list(), strict=False
+        # uuid5("nse_cm_bhavcopy:{trade_date}:{symbol}:{fin_instrm_id}"), computed per batch.
+        # Marked elementwise so the streaming engine can run it chunk by chunk.
+        prefix = f"nse_cm_bhavcopy:{trade_date}:"
+        event_ids = (
+            key_expr("TckrSymb", "FinInstrmId")
+            .map_batches(
+                lambda keys: uuid5_series(keys, prefix=prefix),
+                return_dtype=pl.Utf8,
+                is_elementwise=True,
             )
-        ]
+            .alias("event_id")
+        )
 
         # Calculate timestamps as datetime objects (ClickHouse expects DateTime64)
         event_time = datetime.combine(trade_date, datetime.min.time())
@@ -205,7 +369,7 @@ class PolarsBhavcopyParser(Parser):
         # Add metadata columns (entity_id also includes FinInstrmId)
         df = df.with_columns(
             [
-                pl.Series("event_id", event_ids),
+                event_ids,
                 pl.lit(event_time).alias("event_time"),
                 pl.lit(ingest_time).alias("ingest_time"),
                 pl.lit("nse_cm_bhavcopy").alias("source"),
@@ -221,64 +385,27 @@ class PolarsBhavcopyParser(Parser):
 
         return df
 
-    def _normalize_schema(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _normalize_schema(self, df: FrameT) -> FrameT:
         """Normalize column names and enforce nullability.
 
         Args:
-            df: Input DataFrame
+            df: Input DataFrame or LazyFrame
 
         Returns:
-            Normalized DataFrame with consistent schema
+            Normalized frame with consistent schema
         """
         # Ensure all expected columns exist
         # Reorder columns to match canonical schema
-        metadata_cols = [
-            "event_id",
-            "event_time",
-            "ingest_time",
-            "source",
-            "schema_version",
-            "entity_id",
-        ]
-
         payload_cols = list(BHAVCOPY_SCHEMA.keys())
 
         # Select and reorder columns
-        df = df.select(metadata_cols + payload_cols)
-
-        # Ensure date columns are of Date type where possible (handle multiple input formats)
-        date_cols = ["TradDt", "BizDt", "XpryDt", "FininstrmActlXpryDt"]
-        for col in date_cols:
-            if col in df.columns:
-                try:
-                    # Try common formats: YYYYMMDD, YYYY-MM-DD, DD-MMM-YYYY
-                    if df[col].dtype == pl.Utf8:
-                        try:
-                            df = df.with_columns(
-                                pl.col(col).str.strptime(pl.Date, fmt="%Y%m%d").alias(col)
-                            )
-                        except Exception:
-                            try:
-                                df = df.with_columns(
-                                    pl.col(col).str.strptime(pl.Date, fmt="%Y-%m-%d").alias(col)
-                                )
-                            except Exception:
-                                try:
-                                    df = df.with_columns(
-                                        pl.col(col).str.strptime(pl.Date, fmt="%d-%b-%Y").alias(col)
-                                    )
-                                except Exception:
-                                    # leave as-is if parsing fails
-                                    pass
-                    elif df[col].dtype in [pl.Int64, pl.Int32]:
-                        # integers like 20240103 -> cast via string parse
-                        df = df.with_columns(
-                            pl.col(col).cast(pl.Utf8).str.strptime(pl.Date, fmt="%Y%m%d").alias(col)
-                        )
-                except Exception:
-                    pass
+        df = df.select(ENVELOPE_COLUMNS + payload_cols)
 
-        return df
+        # Ensure date columns are of Date type; the format is inferred once per column
+        # and cached for later files, with the other formats as a per-value fallback
+        return date_format_inferrer.parse_columns(
+            df, DATE_COLUMNS, source="nse_cm_bhavcopy", formats=DATE_FORMATS
+        )
 
     def _dataframe_to_events(self, df: pl.DataFrame) -> list[dict[str, Any]]:
         """Convert DataFrame to list of event dictionaries.
@@ -289,30 +416,7 @@ class PolarsBhavcopyParser(Parser):
         Returns:
             List of event dictionaries
         """
-        events = []
-
-        # Extract metadata columns
-        metadata_cols = [
-            "event_id",
-            "event_time",
-            "ingest_time",
-            "source",
-            "schema_version",
-            "entity_id",
-        ]
-
-        # Convert DataFrame to list of dictionaries
-        for row in df.iter_rows(named=True):
-            # Build event with envelope and payload
-            event = {col: row[col] for col in metadata_cols}
-
-            # Build payload with remaining columns
-            payload = {k: v for k, v in row.items() if k not in metadata_cols}
-
-            event["payload"] = payload
-            events.append(event)
-
-        return events
+        return self.events_to_dicts(self.to_event_frame(df))
 
     def write_parquet(
         self,
@@ -320,6 +424,7 @@ class PolarsBhavcopyParser(Parser):
         trade_date: date,
         base_path: Path = Path("data/lake"),
         validate: bool = True,
+        state_path: Path | None = None,
     ) -> Path:
         """Write DataFrame to Parquet with validation and partitioned layout.
 
@@ -328,6 +433,8 @@ class PolarsBhavcopyParser(Parser):
             trade_date: Trading date for partitioning
             base_path: Base path for data lake
             validate: Whether to validate data before writing (default: True)
+            state_path: Per-symbol last known state file (optional); price
+                rules compare the day with it and it is updated after the write
 
         Returns:
             Path to written Parquet file
@@ -336,80 +443,11 @@ class PolarsBhavcopyParser(Parser):
             ValueError: If validation fails
         """
 
-        # Convert high-level temporal types to primitive integers expected by Parquet JSON schema
-        # - `event_time` / `ingest_time` -> milliseconds since epoch (int)
-        # - `trade_date`, `adjustment_date` -> days since epoch (int) or null
-        def _to_epoch_ms(val):
-            if val is None:
-                return None
-            if isinstance(val, int | float):
-                # assume already epoch-ms
-                return int(val)
-            try:
-                # handle date or datetime
-                if isinstance(val, date) and not isinstance(val, datetime):
-                    dt = datetime.combine(val, datetime.min.time())
-                else:
-                    dt = val
-                return int(dt.timestamp() * 1000)
-            except Exception:
-                return None
-
-        def _to_days_since_epoch(val):
-            if val is None:
-                return None
-            try:
-                if isinstance(val, int):
-                    # Common formats: YYYYMMDD (e.g., 20240103) -> parse
-                    if val > 10000000:
-                        s = str(val)
-                        d = datetime.strptime(s, "%Y%m%d").date()
-                        return (d - date(1970, 1, 1)).days
-                    # otherwise assume already days-since-epoch
-                    return int(val)
-                if isinstance(val, str):
-                    # Try parsing common formats
-                    try:
-                        d = datetime.strptime(val, "%Y%m%d").date()
-                    except Exception:
-                        try:
-                            d = datetime.strptime(val, "%Y-%m-%d").date()
-                        except Exception:
-                            return None
-                    return (d - date(1970, 1, 1)).days
-                if isinstance(val, date):
-                    return (val - date(1970, 1, 1)).days
-            except Exception:
-                return None
-
-        # Create a copy of the dataframe with converted temporal fields for validation/write
-        df_for_write = df.with_columns(
-            [
-                pl.col("event_time").apply(_to_epoch_ms, return_dtype=pl.Int64).alias("event_time"),
-                pl.col("ingest_time")
-                .apply(_to_epoch_ms, return_dtype=pl.Int64)
-                .alias("ingest_time"),
-            ]
-        )
-
-        # trade_date may be present either as `trade_date` or `TradDt` depending on earlier normalization
-        if "trade_date" in df_for_write.columns:
-            df_for_write = df_for_write.with_columns(
-                pl.col("trade_date")
-                .apply(_to_days_since_epoch, return_dtype=pl.Int64)
-                .alias("trade_date")
-            )
-        elif "TradDt" in df_for_write.columns:
-            df_for_write = df_for_write.with_columns(
-                pl.col("TradDt").apply(_to_days_since_epoch, return_dtype=pl.Int64).alias("TradDt")
-            )
-
-        if "adjustment_date" in df_for_write.columns:
-            df_for_write = df_for_write.with_columns(
-                pl.col("adjustment_date")
-                .apply(_to_days_since_epoch, return_dtype=pl.Int64)
-                .alias("adjustment_date")
-            )
+        # Convert temporal types to the primitive integers expected by the Parquet JSON schema:
+        # `event_time` / `ingest_time` -> epoch ms, `trade_date` / `TradDt` / `adjustment_date`
+        # -> days since epoch (native casts, no per-row Python)
+        df_for_write = to_warehouse_primitives(df)
+        state = SymbolStateStore(state_path) if state_path else None
 
         # Validate data before writing if enabled (validate the converted dataframe)
         if validate:
@@ -420,9 +458,9 @@ class PolarsBhavcopyParser(Parser):
             )
 
             try:
-                validator = ParquetValidator(schema_dir=Path("schemas/parquet"))
+                validator = validator_registry.get(Path("schemas/parquet"))
                 result = validator.validate_dataframe(
-                    df_for_write, schema_name="normalized_equity_ohlc"
+                    df_for_write, schema_name="normalized_equity_ohlc", state=state
                 )
 
                 if result.critical_failures > 0:
@@ -484,6 +522,9 @@ class PolarsBhavcopyParser(Parser):
             write_statistics=True,
         )
 
+        if state is not None:
+            state.update(df_for_write)
+
         logger.info(
             "Wrote Parquet file",
             path=str(output_file),
@@ -493,64 +534,281 @@ class PolarsBhavcopyParser(Parser):
 
         return output_file
 
-    def parse_to_dataframe(self, file_path: Path, trade_date: date) -> pl.DataFrame:
-        """Parse bhavcopy CSV file directly to Polars DataFrame.
+    def scan(self, file_path: str | Path) -> pl.LazyFrame:
+        """Lazily scan a raw bhavcopy CSV.
 
-        This is useful for bulk processing and benchmarking.
+        Uses the same explicit schema and null handling as ``parse_raw_csv`` but
+        materializes nothing, so callers can push filters and projections down
+        into the CSV reader before collecting.
 
         Args:
-            file_path: Path to CSV file
-            trade_date: Trading date
+            file_path: Path to CSV file (string or Path)
 
         Returns:
-            Parsed and normalized DataFrame
-        """
-        logger.info("Parsing bhavcopy to DataFrame", path=str(file_path))
+            LazyFrame with NSE column names and empty symbols filtered out
 
-        # Read and parse
-        df = pl.read_csv(
+        Example:
+            >>> lf = parser.scan(path).filter(pl.col("SctySrs") == "EQ")
+            >>> df = lf.select(["TckrSymb", "ClsPric"]).collect()
+        """
+        lf = pl.scan_csv(
             file_path,
             schema_overrides=BHAVCOPY_SCHEMA,
-            null_values=["-", "", "null", "NULL", "N/A"],
+            null_values=CSV_NULL_VALUES,
             ignore_errors=False,
         )
 
         # Sanitize column names and drop empty-name columns
-        col_map = {c: c.strip() for c in df.columns}
+        col_map = {c: c.strip() for c in lf.columns}
         if any(old != new for old, new in col_map.items()):
-            df = df.rename(col_map)
-        if "" in df.columns:
-            df = df.drop("")
+            lf = lf.rename(col_map)
+        if "" in lf.columns:
+            lf = lf.drop("")
 
-        # Filter out empty symbols
-        df = df.filter(pl.col("TckrSymb").is_not_null() & (pl.col("TckrSymb") != ""))
+        return lf.filter(pl.col("TckrSymb").is_not_null() & (pl.col("TckrSymb") != ""))
 
-        # Add metadata
-        df = self._add_event_metadata(df, trade_date)
+    def scan_normalized(
+        self,
+        file_path: str | Path,
+        trade_date: date,
+        predicate: pl.Expr | None = None,
+    ) -> pl.LazyFrame:
+        """Build a lazy plan that parses, adds metadata and normalizes a bhavcopy.
 
-        # Normalize
-        df = self._normalize_schema(df)
+        Produces the same columns as ``parse_to_dataframe``. ``predicate`` is
+        applied to the raw columns before metadata is added, so it is pushed down
+        into the scan (e.g. ``pl.col("SctySrs") == "EQ"``).
 
-        return df
+        Args:
+            file_path: Path to CSV file (string or Path)
+            trade_date: Trading date
+            predicate: Optional filter on raw NSE columns
 
-    def parse_raw_csv(self, file_path: str | Path) -> pl.DataFrame:
-        """Parse raw CSV file without normalization (for step-by-step ETL).
+        Returns:
+            LazyFrame with envelope metadata and normalized payload columns
+
+        Raises:
+            ValueError: If CSV columns don't match the expected schema
+        """
+        lf = self.scan(file_path)
+        self._validate_schema(lf, BHAVCOPY_SCHEMA)
+
+        if predicate is not None:
+            lf = lf.filter(predicate)
+
+        lf = self._add_event_metadata(lf, trade_date)
+        return self._normalize_schema(lf)
+
+    def sink_parquet(
+        self,
+        file_path: str | Path,
+        trade_date: date,
+        base_path: Path = Path("data/lake"),
+        predicate: pl.Expr | None = None,
+        columns: list[str] | None = None,
+    ) -> Path:
+        """Stream a bhavcopy CSV straight to the partitioned Parquet layout.
+
+        The whole scan -> metadata -> normalize -> write pipeline runs as one
+        lazy plan on the streaming engine, so memory stays bounded regardless
+        of file size. Unlike ``write_parquet`` no pre-write validation is done,
+        since that would require materializing the frame.
 
         Args:
             file_path: Path to CSV file (string or Path)
+            trade_date: Trading date for partitioning
+            base_path: Base path for data lake
+            predicate: Optional filter on raw NSE columns (pushed down into the scan)
+            columns: Optional subset of output columns to write
+
+        Returns:
+            Path to written Parquet file
+        """
+        lf = self.scan_normalized(file_path, trade_date, predicate=predicate)
+        if columns is not None:
+            lf = lf.select(columns)
+
+        partition_path = (
+            base_path
+            / "normalized"
+            / "equity_ohlc"
+            / f"year={trade_date.year}"
+            / f"month={trade_date.month:02d}"
+            / f"day={trade_date.day:02d}"
+        )
+        partition_path.mkdir(parents=True, exist_ok=True)
+        output_file = partition_path / f"bhavcopy_{trade_date.strftime('%Y%m%d')}.parquet"
+
+        # Snappy compression for ClickHouse compatibility, matching write_parquet
+        lf.sink_parquet(output_file, compression="snappy", statistics=True)
+
+        logger.info(
+            "Streamed bhavcopy to Parquet",
+            source=str(file_path),
+            path=str(output_file),
+            size_mb=output_file.stat().st_size / (1024 * 1024),
+        )
+
+        return output_file
+
+    def parse_to_dataframe(self, file_path: CsvSource, trade_date: date) -> pl.DataFrame:
+        """Parse bhavcopy CSV file directly to Polars DataFrame.
+
+        This is useful for bulk processing and benchmarking.
+
+        Args:
+            file_path: Path to CSV or ZIP file, or raw file bytes
+            trade_date: Trading date
+
+        Returns:
+            Parsed and normalized DataFrame
+        """
+        logger.info("Parsing bhavcopy to DataFrame", path=describe_source(file_path))
+
+        return self._read_normalized(file_path, trade_date, validate_schema=False)
+
+    def iter_parse_many(
+        self,
+        paths: Sequence[str | Path],
+        trade_dates: Sequence[date],
+        max_workers: int | None = None,
+    ) -> Iterator[FileParseResult]:
+        """Parse many bhavcopy CSVs concurrently, yielding one result per file.
+
+        Files are parsed with ``parse_to_dataframe`` on a thread pool (the Polars
+        CSV reader releases the GIL). Results are yielded in completion order and
+        at most ``2 * max_workers`` files are in flight, so memory stays bounded
+        for long backfills. A failing file yields a result with ``error`` set
+        instead of aborting the batch.
+
+        Args:
+            paths: CSV files to parse
+            trade_dates: Trading date of each file (same length as ``paths``)
+            max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+        Yields:
+            FileParseResult per input file
+
+        Raises:
+            ValueError: If ``paths`` and ``trade_dates`` differ in length
+        """
+        if len(paths) != len(trade_dates):
+            raise ValueError(
+                f"paths and trade_dates differ in length: {len(paths)} != {len(trade_dates)}"
+            )
+
+        total = len(paths)
+        jobs = iter(zip(map(Path, paths), trade_dates, strict=True))
+        completed = 0
+        # Same default as ThreadPoolExecutor
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        window = 2 * workers
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: dict[Future, tuple[Path, date]] = {}
+
+            def submit_next() -> None:
+                for path, trade_date in jobs:
+                    pending[executor.submit(self._parse_one, path, trade_date)] = (
+                        path,
+                        trade_date,
+                    )
+                    if len(pending) >= window:
+                        return
+
+            submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, trade_date = pending.pop(future)
+                    try:
+                        result = FileParseResult(path, trade_date, df=future.result())
+                    except Exception as e:
+                        logger.error(
+                            "Failed to parse file in batch",
+                            path=str(path),
+                            trade_date=str(trade_date),
+                            error=str(e),
+                        )
+                        rows_parsed.labels(scraper="polars_bhavcopy", status="failed").inc()
+                        result = FileParseResult(path, trade_date, error=str(e))
+
+                    completed += 1
+                    logger.info(
+                        "Batch parse progress",
+                        completed=completed,
+                        total=total,
+                        path=str(path),
+                        ok=result.ok,
+                    )
+                    yield result
+                submit_next()
+
+    def parse_many(
+        self,
+        paths: Sequence[str | Path],
+        trade_dates: Sequence[date],
+        max_workers: int | None = None,
+    ) -> BatchParseResult:
+        """Parse many bhavcopy CSVs concurrently into one frame.
+
+        Args:
+            paths: CSV files to parse
+            trade_dates: Trading date of each file (same length as ``paths``)
+            max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+        Returns:
+            BatchParseResult with the concatenated frame (``trade_date`` column
+            added) and the files that failed
+
+        Raises:
+            ValueError: If ``paths`` and ``trade_dates`` differ in length
+        """
+        frames: list[pl.DataFrame] = []
+        failures: list[FileParseResult] = []
+        for result in self.iter_parse_many(paths, trade_dates, max_workers=max_workers):
+            if result.ok:
+                frames.append(result.df)
+            else:
+                failures.append(result)
+
+        df = (
+            pl.concat(frames, how="vertical_relaxed").sort("trade_date", maintain_order=True)
+            if frames
+            else pl.DataFrame()
+        )
+
+        logger.info(
+            "Batch parse complete",
+            files=len(paths),
+            files_parsed=len(frames),
+            files_failed=len(failures),
+            rows=len(df),
+        )
+        return BatchParseResult(df=df, files_parsed=len(frames), failures=failures)
+
+    def _parse_one(self, path: Path, trade_date: date) -> pl.DataFrame:
+        """Parse one file of a batch and tag it with its trade date."""
+        df = self.parse_to_dataframe(path, trade_date)
+        rows_parsed.labels(scraper="polars_bhavcopy", status="success").inc(len(df))
+        return df.with_columns(pl.lit(trade_date).alias("trade_date"))
+
+    def parse_raw_csv(self, file_path: CsvSource) -> pl.DataFrame:
+        """Parse raw CSV file without normalization (for step-by-step ETL).
+
+        Args:
+            file_path: Path to CSV or ZIP file (string or Path), or raw file bytes
 
         Returns:
             Raw DataFrame with NSE column names
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-        logger.info("Parsing raw CSV", path=str(file_path))
+        logger.info("Parsing raw CSV", path=describe_source(file_path))
 
-        # Read CSV with explicit schema
+        # Read CSV with explicit schema (ZIP members are decompressed in memory)
         df = pl.read_csv(
-            file_path,
+            open_csv_source(file_path),
             schema_overrides=BHAVCOPY_SCHEMA,
-            null_values=["-", "", "null", "NULL", "N/A"],
+            null_values=CSV_NULL_VALUES,
             ignore_errors=False,
         )
 
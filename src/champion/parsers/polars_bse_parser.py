@@ -13,7 +13,6 @@ BSE Bhavcopy CSV Format:
 - Example: 500325,RELIANCE,A,R,2750.00,2780.50,2740.00,2765.25,2765.00,2750.00,50000,5000000,13826250000.00,IEP,INE002A01018
 """
 
-import uuid
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -22,6 +21,8 @@ import polars as pl
 import pyarrow.parquet as pq
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.event_ids import key_expr, uuid5_series
+from champion.storage.temporal import to_warehouse_primitives
 from champion.utils.logger import get_logger
 from champion.utils.metrics import rows_parsed
 
@@ -65,6 +66,9 @@ class PolarsBseParser(Parser):
     ) -> list[dict[str, Any]]:
         """Parse BSE bhavcopy CSV file into event structures using Polars.
 
+        Compatibility wrapper around ``parse_events()`` for callers that need
+        a list of dicts.
+
         Args:
             file_path: Path to CSV file
             trade_date: Trading date
@@ -73,6 +77,26 @@ class PolarsBseParser(Parser):
         Returns:
             List of event dictionaries ready for Kafka
 
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            Exception: If parsing fails
+        """
+        events = self.parse_events(file_path, trade_date, output_parquet=output_parquet)
+        return self.events_to_dicts(events)
+
+    def parse_events(
+        self, file_path: Path, trade_date: date, output_parquet: bool = False
+    ) -> pl.DataFrame:
+        """Parse BSE bhavcopy CSV file into a columnar event batch.
+
+        Args:
+            file_path: Path to CSV file
+            trade_date: Trading date
+            output_parquet: If True, also write output to Parquet format
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+
         Raises:
             FileNotFoundError: If CSV file doesn't exist
             Exception: If parsing fails
@@ -108,8 +132,8 @@ class PolarsBseParser(Parser):
                 columns=len(df.columns),
             )
 
-            # Convert to list of event dictionaries
-            events = self._dataframe_to_events(df)
+            # Pack payload columns into a struct alongside the envelope
+            events = self.to_event_frame(df)
 
             # Update metrics
             rows_parsed.labels(scraper="polars_bse", status="success").inc(len(events))
@@ -169,15 +193,11 @@ class PolarsBseParser(Parser):
             DataFrame with added metadata columns
         """
         # Generate deterministic event_id for each row (using SC_CODE for uniqueness)
-        event_ids = [
-            str(
-                uuid.uuid5(
-                    uuid.NAMESPACE_DNS,
-                    f"bse_eq_bhavcopy:{trade_date}:{sc_code}",
-                )
-            )
-            for sc_code in df["SC_CODE"].to_list()
-        ]
+        # uuid5("bse_eq_bhavcopy:{trade_date}:{sc_code}"), computed per column
+        event_ids = uuid5_series(
+            df.select(key_expr("SC_CODE")).to_series(),
+            prefix=f"bse_eq_bhavcopy:{trade_date}:",
+        )
 
         # Calculate timestamps
         event_time = int(datetime.combine(trade_date, datetime.min.time()).timestamp() * 1000)
@@ -186,7 +206,7 @@ class PolarsBseParser(Parser):
         # Add metadata columns
         df = df.with_columns(
             [
-                pl.Series("event_id", event_ids),
+                event_ids,
                 pl.lit(event_time).alias("event_time"),
                 pl.lit(ingest_time).alias("ingest_time"),
                 pl.lit("bse_eq_bhavcopy").alias("source"),
@@ -318,30 +338,7 @@ class PolarsBseParser(Parser):
         Returns:
             List of event dictionaries
         """
-        events = []
-
-        # Extract metadata columns
-        metadata_cols = [
-            "event_id",
-            "event_time",
-            "ingest_time",
-            "source",
-            "schema_version",
-            "entity_id",
-        ]
-
-        # Convert DataFrame to list of dictionaries
-        for row in df.iter_rows(named=True):
-            # Build event with envelope and payload
-            event = {col: row[col] for col in metadata_cols}
-
-            # Build payload with remaining columns
-            payload = {k: v for k, v in row.items() if k not in metadata_cols}
-
-            event["payload"] = payload
-            events.append(event)
-
-        return events
+        return self.events_to_dicts(self.to_event_frame(df))
 
     def write_parquet(
         self,
@@ -378,8 +375,8 @@ class PolarsBseParser(Parser):
         # Write to Parquet with compression
         output_file = partition_path / f"bhavcopy_bse_{trade_date.strftime('%Y%m%d')}.parquet"
 
-        # Convert to PyArrow table
-        arrow_table = df.to_arrow()
+        # Same temporal encodings as the NSE rows of this table (TradDt as days since epoch)
+        arrow_table = to_warehouse_primitives(df).to_arrow()
 
         # Write with Snappy compression for ClickHouse compatibility
         pq.write_table(
@@ -13,6 +13,8 @@ import polars as pl
 from bs4 import BeautifulSoup
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.document_batch import parse_documents
+from champion.parsers.parse_cache import ParseCache
 from champion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -218,38 +220,36 @@ class QuarterlyFinancialsParser(Parser):
             self.logger.warning("Error computing ratios", error=str(e))
 
     def parse_batch(
-        self, file_paths: list[Path], symbols: list[str], cins: list[str | None] | None = None
+        self,
+        file_paths: list[Path],
+        symbols: list[str],
+        cins: list[str | None] | None = None,
+        workers: int | None = None,
+        cache: ParseCache | None = None,
     ) -> pl.DataFrame:
-        """Parse multiple financial statement files.
+        """Parse multiple financial statement files on a process pool.
+
+        Files that fail are logged and left out; use ``parse_documents`` directly
+        to get the per-file errors.
 
         Args:
             file_paths: List of file paths
             symbols: List of trading symbols (must match file_paths length)
             cins: Optional list of CINs (must match file_paths length)
+            workers: Number of worker processes (default: CPU count)
+            cache: Optional parse cache; files already parsed are not parsed again
 
         Returns:
-            Combined DataFrame
+            Combined DataFrame, in input order
         """
         if cins is None:
             cins = [None] * len(file_paths)
 
-        dfs = []
-        for file_path, symbol, cin in zip(file_paths, symbols, cins, strict=False):
-            try:
-                df = self.parse(file_path, symbol, cin)
-                if len(df) > 0:
-                    dfs.append(df)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to parse file",
-                    file_path=str(file_path),
-                    error=str(e),
-                )
-
-        if not dfs:
-            return pl.DataFrame()
-
-        return pl.concat(dfs)
+        jobs = [
+            (file_path, (symbol, cin))
+            for file_path, symbol, cin in zip(file_paths, symbols, cins, strict=False)
+        ]
+        return parse_documents(type(self), jobs, workers=workers, cache=cache).df
 
 
 def compute_pe_ratio(
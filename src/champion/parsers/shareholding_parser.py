@@ -12,6 +12,8 @@ import polars as pl
 from bs4 import BeautifulSoup
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.document_batch import parse_documents
+from champion.parsers.parse_cache import ParseCache
 from champion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -204,32 +206,30 @@ class ShareholdingPatternParser(Parser):
         return consolidated
 
     def parse_batch(
-        self, file_paths: list[Path], symbols: list[str], scrip_codes: list[str]
+        self,
+        file_paths: list[Path],
+        symbols: list[str],
+        scrip_codes: list[str],
+        workers: int | None = None,
+        cache: ParseCache | None = None,
     ) -> pl.DataFrame:
-        """Parse multiple shareholding files.
+        """Parse multiple shareholding files on a process pool.
+
+        Files that fail are logged and left out; use ``parse_documents`` directly
+        to get the per-file errors.
 
         Args:
             file_paths: List of file paths
             symbols: List of trading symbols (must match file_paths length)
             scrip_codes: List of BSE scrip codes (must match file_paths length)
+            workers: Number of worker processes (default: CPU count)
+            cache: Optional parse cache; files already parsed are not parsed again
 
         Returns:
-            Combined DataFrame
+            Combined DataFrame, in input order
         """
-        dfs = []
-        for file_path, symbol, scrip_code in zip(file_paths, symbols, scrip_codes, strict=False):
-            try:
-                df = self.parse(file_path, symbol, scrip_code)
-                if len(df) > 0:
-                    dfs.append(df)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to parse file",
-                    file_path=str(file_path),
-                    error=str(e),
-                )
-
-        if not dfs:
-            return pl.DataFrame()
-
-        return pl.concat(dfs)
+        jobs = [
+            (file_path, (symbol, scrip_code))
+            for file_path, symbol, scrip_code in zip(file_paths, symbols, scrip_codes, strict=False)
+        ]
+        return parse_documents(type(self), jobs, workers=workers, cache=cache).df
@@ -16,6 +16,7 @@ from pathlib import Path
 
 import polars as pl
 
+from champion.parsers.symbol_master_parser import load_master
 from champion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,12 +36,13 @@ class SymbolEnrichment:
         self.logger = get_logger(__name__)
 
     def enrich_from_bhavcopy(
-        self, symbol_master_df: pl.DataFrame, bhavcopy_paths: list[Path]
+        self, symbol_master_df: pl.DataFrame | Path, bhavcopy_paths: list[Path]
     ) -> pl.DataFrame:
         """Enrich symbol master with FinInstrmId from bhavcopy data.
 
         Args:
-            symbol_master_df: Symbol master DataFrame (from EQUITY_L)
+            symbol_master_df: Symbol master DataFrame (from EQUITY_L), or the path of
+                an Arrow master written by ``SymbolMasterParser.write_master``
             bhavcopy_paths: List of paths to bhavcopy Parquet files
 
         Returns:
@@ -52,6 +54,9 @@ class SymbolEnrichment:
         3. Creates canonical instrument IDs: symbol:fiid:exchange
         4. Handles one-to-many cases where one ticker has multiple instruments
         """
+        if isinstance(symbol_master_df, Path):
+            symbol_master_df = load_master(symbol_master_df)
+
         self.logger.info(
             "Starting symbol master enrichment",
             bhavcopy_files=len(bhavcopy_paths),
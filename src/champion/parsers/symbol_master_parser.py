@@ -6,16 +6,18 @@ This parser provides:
 - Handles one-to-many ticker cases (e.g., IBULHSGFIN with multiple instruments)
 - Creates canonical instrument IDs (symbol:fiid:exchange)
 - Parquet output with proper schema
+- Memory-mapped Arrow copy of the parsed master for fast lookups (``load_master``)
 """
 
-import uuid
-from datetime import datetime
+import os
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.event_ids import uuid5_series
 from champion.utils.logger import get_logger
 from champion.utils.metrics import rows_parsed
 
@@ -35,6 +37,27 @@ SYMBOL_MASTER_SCHEMA = {
 }
 
 
+# Parsed EQUITY_L master, kept as an uncompressed Arrow IPC file for mmap reads
+DEFAULT_MASTER_PATH = Path("data/cache/symbol_master/EQUITY_L.arrow")
+
+
+def load_master(path: Path = DEFAULT_MASTER_PATH) -> pl.DataFrame:
+    """Load a symbol master written by ``SymbolMasterParser.write_master``.
+
+    The file is memory-mapped, so loading is near-instant regardless of size.
+
+    Args:
+        path: Arrow IPC file path
+
+    Returns:
+        Symbol master DataFrame with the EQUITY_L columns
+
+    Raises:
+        FileNotFoundError: If the master file doesn't exist
+    """
+    return pl.read_ipc(path, memory_map=True)
+
+
 class SymbolMasterParser(Parser):
     """High-performance parser for NSE EQUITY_L symbol master file using Polars.
 
@@ -65,8 +88,44 @@ class SymbolMasterParser(Parser):
             FileNotFoundError: If CSV file doesn't exist
             Exception: If parsing fails
         """
+        return self.events_to_dicts(self.parse_events(file_path, exchange, output_parquet))
+
+    def parse_events(
+        self, file_path: Path, exchange: str = "NSE", output_parquet: bool = False
+    ) -> pl.DataFrame:
+        """Parse EQUITY_L CSV file into a columnar event batch.
+
+        Args:
+            file_path: Path to EQUITY_L.csv file
+            exchange: Exchange code (default: NSE)
+            output_parquet: If True, also write output to Parquet format
+
+        Returns:
+            DataFrame with envelope columns and a ``payload`` struct column
+        """
         self.logger.info("Parsing symbol master file with Polars", path=str(file_path))
 
+        master = self.read_master(file_path)
+        events = self.to_event_frame(self._normalize(master, exchange))
+        rows_parsed.labels(scraper="symbol_master", status="success").inc(len(events))
+
+        self.logger.info("Parsed symbol master file", path=str(file_path), events=len(events))
+        return events
+
+    def read_master(self, file_path: Path) -> pl.DataFrame:
+        """Read and validate an EQUITY_L CSV file.
+
+        Args:
+            file_path: Path to EQUITY_L.csv file
+
+        Returns:
+            DataFrame with the ``SYMBOL_MASTER_SCHEMA`` columns, one row per symbol
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            pl.ComputeError: If the CSV cannot be parsed
+            ValueError: If the columns don't match ``SYMBOL_MASTER_SCHEMA``
+        """
         try:
             # Read CSV with explicit schema and robust null handling
             df = pl.read_csv(
@@ -79,52 +138,6 @@ class SymbolMasterParser(Parser):
             # Validate schema version - check for column mismatches
             self._validate_schema(df, SYMBOL_MASTER_SCHEMA)
 
-            # Filter out rows with empty symbols or invalid data
-            df = df.filter(
-                pl.col("SYMBOL").is_not_null()
-                & (pl.col("SYMBOL") != "")
-                & (pl.col("SYMBOL") != "SYMBOL")  # Skip header if repeated
-            )
-
-            # Parse listing date to proper date format
-            df = df.with_columns(
-                [
-                    pl.col("DATE OF LISTING")
-                    .str.strptime(pl.Date, "%d-%b-%Y", strict=False)
-                    .alias("listing_date_parsed")
-                ]
-            )
-
-            # Create canonical instrument_id: symbol:exchange (for EQUITY_L we don't have FinInstrmId)
-            # We'll use a placeholder approach where FinInstrmId will be matched later from bhavcopy
-            df = df.with_columns(
-                [
-                    (pl.col("SYMBOL") + ":" + pl.lit(exchange)).alias("instrument_id"),
-                ]
-            )
-
-            # Generate event metadata
-            event_time = int(datetime.now().timestamp() * 1000)
-            ingest_time = event_time
-
-            # Convert to list of event dictionaries
-            events = []
-            for row in df.iter_rows(named=True):
-                try:
-                    event = self._row_to_event(row, exchange, event_time, ingest_time)
-                    if event:
-                        events.append(event)
-                        rows_parsed.labels(scraper="symbol_master", status="success").inc()
-                except (KeyError, ValueError, TypeError) as e:
-                    # KeyError: missing expected field in row
-                    # ValueError: invalid value format
-                    # TypeError: unexpected data type
-                    self.logger.error("Failed to parse row", row=row, error=str(e))
-                    rows_parsed.labels(scraper="symbol_master", status="failed").inc()
-
-            self.logger.info("Parsed symbol master file", path=str(file_path), events=len(events))
-            return events
-
         except (FileNotFoundError, pl.ComputeError, ValueError) as e:
             # FileNotFoundError: CSV file missing
             # pl.ComputeError: Polars parsing/computation error
@@ -134,6 +147,35 @@ class SymbolMasterParser(Parser):
             )
             raise
 
+        # Filter out rows with empty symbols or invalid data
+        return df.filter(
+            pl.col("SYMBOL").is_not_null()
+            & (pl.col("SYMBOL") != "")
+            & (pl.col("SYMBOL") != "SYMBOL")  # Skip header if repeated
+        )
+
+    def write_master(self, master: pl.DataFrame, path: Path = DEFAULT_MASTER_PATH) -> Path:
+        """Persist a parsed master as an Arrow IPC file for ``load_master``.
+
+        The file is written uncompressed so it can be memory-mapped, and is
+        renamed into place so concurrent readers never see a partial file.
+
+        Args:
+            master: DataFrame from ``read_master``
+            path: Destination Arrow IPC file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        master.write_ipc(tmp, compression="uncompressed")
+        os.replace(tmp, path)
+
+        self.logger.info("Wrote symbol master", path=str(path), rows=len(master))
+        return path
+
     def _validate_schema(self, df: pl.DataFrame, expected_schema: dict[str, Any]) -> None:
         """Validate that DataFrame columns match expected schema.
 
@@ -167,131 +209,75 @@ class SymbolMasterParser(Parser):
             )
             raise ValueError(error_msg)
 
-    def _row_to_event(
-        self, row: dict[str, Any], exchange: str, event_time: int, ingest_time: int
-    ) -> dict[str, Any] | None:
-        """Convert CSV row to event structure.
+    def _normalize(self, master: pl.DataFrame, exchange: str) -> pl.DataFrame:
+        """Cast and rename master columns into flat envelope and payload columns.
 
-        Args:
-            row: CSV row as dictionary
-            exchange: Exchange code
-            event_time: Event timestamp in milliseconds
-            ingest_time: Ingestion timestamp in milliseconds
-
-        Returns:
-            Event dictionary with envelope and payload, or None if row should be skipped
-        """
-        # Get symbol
-        symbol = row.get("SYMBOL", "").strip() if row.get("SYMBOL") else ""
-        if not symbol:
-            return None
-
-        # Create instrument_id (symbol:exchange)
-        instrument_id = f"{symbol}:{exchange}"
-
-        # Generate deterministic event_id
-        event_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"nse_symbol_master:{instrument_id}"))
-
-        # Build event envelope
-        event = {
-            "event_id": event_id,
-            "event_time": event_time,
-            "ingest_time": ingest_time,
-            "source": "nse_symbol_master",
-            "schema_version": "v1",
-            "entity_id": instrument_id,
-            "payload": self._build_payload(row, symbol, exchange, instrument_id),
-        }
-
-        return event
-
-    def _build_payload(
-        self, row: dict[str, Any], symbol: str, exchange: str, instrument_id: str
-    ) -> dict[str, Any]:
-        """Build payload from CSV row.
+        Blank strings and ``-`` become null, as do zero face value, paid up
+        value and lot size. Unparsable listing dates are null.
 
         Args:
-            row: CSV row as dictionary
-            symbol: Trading symbol
+            master: DataFrame from ``read_master``
             exchange: Exchange code
-            instrument_id: Canonical instrument identifier
 
         Returns:
-            Payload dictionary matching Avro schema
+            Flat DataFrame with envelope columns followed by payload columns
         """
 
-        def safe_str(value: Any) -> str | None:
-            """Get string value or None."""
-            if value is None:
-                return None
-            val = str(value).strip() if value else None
-            return val if val and val != "-" else None
-
-        def safe_float(value: Any) -> float | None:
-            """Get float value or None."""
-            if value is None:
-                return None
-            try:
-                return float(value) if value else None
-            except (ValueError, TypeError):
-                return None
-
-        def safe_int(value: Any) -> int | None:
-            """Get int value or None."""
-            if value is None:
-                return None
-            try:
-                return int(float(value)) if value else None
-            except (ValueError, TypeError):
-                return None
-
-        def safe_date(value: Any) -> int | None:
-            """Get date as days since epoch or None."""
-            if value is None:
-                return None
-            # If it's already an integer (days since epoch), return it
-            if isinstance(value, int):
-                return value
-            # If it's a date object, convert to days since epoch
-            try:
-                from datetime import date
-
-                if isinstance(value, date):
-                    epoch = date(1970, 1, 1)
-                    return (value - epoch).days
-            except (TypeError, AttributeError, OverflowError):
-                # TypeError: invalid type for date operations
-                # AttributeError: value doesn't have expected date attributes
-                # OverflowError: date calculation overflow
-                pass
-            return None
+        def text(name: str) -> pl.Expr:
+            value = pl.col(name).cast(pl.Utf8, strict=False).str.strip_chars()
+            return pl.when(value.is_in(["", "-"])).then(None).otherwise(value).alias(name)
+
+        def number(name: str, dtype: type[pl.DataType]) -> pl.Expr:
+            value = pl.col(name).cast(dtype, strict=False)
+            # Zero means "not provided" in EQUITY_L
+            return pl.when(value == 0).then(None).otherwise(value)
 
         # Get current date in days since epoch for valid_from
-        from datetime import date
-
-        epoch = date(1970, 1, 1)
-        valid_from_days = (date.today() - epoch).days
-
-        return {
-            "instrument_id": instrument_id,
-            "symbol": symbol,
-            "exchange": exchange,
-            "company_name": safe_str(row.get("NAME OF COMPANY")),
-            "isin": safe_str(row.get("ISIN NUMBER")),
-            "series": safe_str(row.get("SERIES")),
-            "listing_date": safe_date(row.get("listing_date_parsed")),
-            "face_value": safe_float(row.get("FACE VALUE")),
-            "paid_up_value": safe_float(row.get("PAID UP VALUE")),
-            "lot_size": safe_int(row.get("MARKET LOT")),
-            "sector": None,  # Not available in EQUITY_L, needs external enrichment
-            "industry": None,  # Not available in EQUITY_L, needs external enrichment
-            "market_cap_category": None,  # Not available in EQUITY_L, needs external enrichment
-            "tick_size": None,  # Not available in EQUITY_L
-            "is_index_constituent": None,  # Not available in EQUITY_L
-            "indices": None,  # Not available in EQUITY_L
-            "status": "ACTIVE",  # Default status, can be updated later
-            "delisting_date": None,  # Not available in EQUITY_L
-            "metadata": None,  # Additional metadata can be added later
-            "valid_from": valid_from_days,
-            "valid_to": None,  # Current version (no expiry)
-        }
+        valid_from_days = (date.today() - date(1970, 1, 1)).days
+
+        # Generate event metadata
+        event_time = int(datetime.now().timestamp() * 1000)
+
+        df = master.with_columns(text("SYMBOL")).filter(pl.col("SYMBOL").is_not_null())
+
+        # Canonical instrument_id: symbol:exchange (EQUITY_L has no FinInstrmId;
+        # that is matched later from bhavcopy by SymbolEnrichment)
+        instrument_id = pl.col("SYMBOL") + pl.lit(f":{exchange}")
+        event_ids = uuid5_series(df.select(instrument_id).to_series(), prefix="nse_symbol_master:")
+
+        null_str = pl.lit(None, dtype=pl.Utf8)
+        null_date = pl.lit(None, dtype=pl.Int64)
+
+        return df.select(
+            event_ids,
+            pl.lit(event_time, dtype=pl.Int64).alias("event_time"),
+            pl.lit(event_time, dtype=pl.Int64).alias("ingest_time"),
+            pl.lit("nse_symbol_master").alias("source"),
+            pl.lit("v1").alias("schema_version"),
+            instrument_id.alias("entity_id"),
+            instrument_id.alias("instrument_id"),
+            pl.col("SYMBOL").alias("symbol"),
+            pl.lit(exchange).alias("exchange"),
+            text("NAME OF COMPANY").alias("company_name"),
+            text("ISIN NUMBER").alias("isin"),
+            text("SERIES").alias("series"),
+            pl.col("DATE OF LISTING")
+            .cast(pl.Utf8, strict=False)
+            .str.strptime(pl.Date, "%d-%b-%Y", strict=False)
+            .cast(pl.Int64)
+            .alias("listing_date"),
+            number("FACE VALUE", pl.Float64).alias("face_value"),
+            number("PAID UP VALUE", pl.Float64).alias("paid_up_value"),
+            number("MARKET LOT", pl.Int64).alias("lot_size"),
+            null_str.alias("sector"),  # Not available in EQUITY_L, needs external enrichment
+            null_str.alias("industry"),  # Not available in EQUITY_L, needs external enrichment
+            null_str.alias("market_cap_category"),  # Not available in EQUITY_L
+            pl.lit(None, dtype=pl.Float64).alias("tick_size"),  # Not available in EQUITY_L
+            pl.lit(None, dtype=pl.Boolean).alias("is_index_constituent"),
+            pl.lit(None, dtype=pl.List(pl.Utf8)).alias("indices"),
+            pl.lit("ACTIVE").alias("status"),  # Default status, can be updated later
+            null_date.alias("delisting_date"),  # Not available in EQUITY_L
+            pl.lit(None).alias("metadata"),  # Additional metadata can be added later
+            pl.lit(valid_from_days, dtype=pl.Int64).alias("valid_from"),
+            null_date.alias("valid_to"),  # Current version (no expiry)
+        )
@@ -9,18 +9,21 @@ NSE provides trading calendar/holiday data in JSON format with structure like:
   "CD": [...]
 }
 
-This parser generates a complete calendar for the year with trading/non-trading days.
+This parser generates a complete calendar for one or more years with
+trading/non-trading days and a trading-day ordinal for integer date arithmetic.
 """
 
 import json
 from calendar import Calendar
-from datetime import date, datetime
+from collections.abc import Sequence
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
 from champion.parsers.base_parser import Parser
+from champion.parsers.date_formats import date_format_inferrer
 from champion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +34,23 @@ SATURDAY = 5
 SUNDAY = 6
 WEEKEND_DAYS = {SATURDAY, SUNDAY}
 
+# Polars ``dt.weekday()`` is ISO 8601 (Monday=1, Sunday=7)
+ISO_SATURDAY = 6
+
+# Market segments in the NSE holiday JSON; CM decides the primary calendar
+SEGMENTS = ["CM", "FO", "CD"]
+PRIMARY_SEGMENT = "CM"
+
+# Fixed origin of ``trading_day_ordinal`` so calendars generated separately
+# (e.g. one year at a time) share one ordinal sequence
+ORDINAL_EPOCH = date(2000, 1, 1)
+
+# Holiday date formats NSE has used, e.g. 26-Jan-2026, 26-January-2026, 2026-01-26
+CALENDAR_DATE_FORMATS = ["%d-%b-%Y", "%d-%B-%Y", "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"]
+
+# Formats without a year; the calendar year is appended before parsing
+YEARLESS_DATE_FORMATS = ["%d-%b", "%d-%B", "%d/%m", "%d-%m"]
+
 
 class TradingCalendarParser(Parser):
     """Parser for NSE Trading Calendar JSON files.
@@ -47,12 +67,13 @@ class TradingCalendarParser(Parser):
         # Store holiday details for lookup
         self.holiday_details: dict[date, str] = {}
 
-    def parse(self, json_file_path: Path, year: int) -> pl.DataFrame:
+    def parse(self, json_file_path: Path, year: int | Sequence[int]) -> pl.DataFrame:
         """Parse NSE trading calendar JSON and generate complete year calendar.
 
         Args:
             json_file_path: Path to NSE holiday JSON file
-            year: Year for calendar generation
+            year: Year for calendar generation, or several years to generate one
+                continuous calendar (and trading-day ordinal) across them
 
         Returns:
             Polars DataFrame with complete trading calendar
@@ -63,23 +84,21 @@ class TradingCalendarParser(Parser):
         with open(json_file_path) as f:
             data = json.load(f)
 
-        # Extract holidays by segment
-        holidays_by_segment = self._extract_holidays(data, year)
+        # Extract holidays by segment (dates without a year apply to every year)
+        years = [year] if isinstance(year, int) else sorted(year)
+        holidays_by_segment: dict[str, set[date]] = {segment: set() for segment in SEGMENTS}
+        for y in years:
+            for segment, dates in self._extract_holidays(data, y).items():
+                holidays_by_segment[segment] |= dates
 
         # Generate complete calendar
-        calendar_df = self._generate_calendar(year, holidays_by_segment)
+        calendar_df = self._generate_calendar(years, holidays_by_segment)
 
         logger.info(
             "Trading calendar parsed",
             total_days=len(calendar_df),
-            trading_days=calendar_df.filter(pl.col("is_trading_day"))["is_trading_day"].sum(),
-            holidays=calendar_df.filter(~pl.col("is_trading_day"))["is_trading_day"]
-            .count()
-            .__sub__(
-                calendar_df.filter(pl.col("day_type").is_in(["WEEKEND", "NORMAL_TRADING"]))[
-                    "day_type"
-                ].count()
-            ),
+            trading_days=calendar_df["is_trading_day"].sum(),
+            holidays=calendar_df.filter(pl.col("day_type") == "MARKET_HOLIDAY").height,
         )
 
         return calendar_df
@@ -96,180 +115,212 @@ class TradingCalendarParser(Parser):
         """
         holidays = {}
 
-        for segment in ["CM", "FO", "CD"]:
-            segment_holidays = set()
-
-            if segment in data and isinstance(data[segment], list):
-                for holiday in data[segment]:
-                    try:
-                        # Parse various date formats NSE might use
-                        trading_date = holiday.get("tradingDate", "")
-
-                        # Try multiple date formats
-                        holiday_date = self._parse_date(trading_date, year)
-
-                        if holiday_date:
-                            segment_holidays.add(holiday_date)
-
-                            # Store holiday name for later lookup
-                            holiday_name = holiday.get("description", "Holiday")
-                            self.holiday_details[holiday_date] = holiday_name
-
-                            logger.debug(
-                                "Parsed holiday",
-                                segment=segment,
-                                date=str(holiday_date),
-                                description=holiday_name,
-                            )
-
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to parse holiday",
-                            segment=segment,
-                            holiday=holiday,
-                            error=str(e),
-                        )
+        for segment in SEGMENTS:
+            segment_holidays: set[date] = set()
+            entries = data.get(segment)
+
+            if isinstance(entries, list):
+                entries = [h for h in entries if isinstance(h, dict)]
+                frame = pl.DataFrame(
+                    {
+                        "tradingDate": [str(h.get("tradingDate") or "") for h in entries],
+                        "description": [h.get("description", "Holiday") for h in entries],
+                    },
+                    schema={"tradingDate": pl.Utf8, "description": pl.Utf8},
+                )
+
+                # Parse all dates for the segment in one vectorized expression
+                frame = frame.with_columns(
+                    self._holiday_date_expr(frame["tradingDate"], year).alias("holiday_date")
+                )
+
+                unparsed = frame.filter(
+                    pl.col("holiday_date").is_null() & (pl.col("tradingDate") != "")
+                )
+                for date_str in unparsed["tradingDate"].to_list():
+                    logger.warning("Could not parse date", date_str=date_str)
+
+                parsed = frame.filter(pl.col("holiday_date").is_not_null())
+                segment_holidays = set(parsed["holiday_date"].to_list())
+
+                # Store holiday names for later lookup
+                self.holiday_details.update(
+                    zip(
+                        parsed["holiday_date"].to_list(),
+                        parsed["description"].to_list(),
+                        strict=True,
+                    )
+                )
 
             holidays[segment] = segment_holidays
             logger.info(f"Extracted {len(segment_holidays)} holidays for {segment}")
 
         return holidays
 
-    def _parse_date(self, date_str: str, year: int) -> date | None:
-        """Parse date string in various formats.
+    def _holiday_date_expr(self, values: pl.Series, year: int) -> pl.Expr:
+        """Build an expression parsing NSE holiday date strings.
+
+        Full dates use the format inferred for this source (cached across years);
+        dates without a year (e.g. ``26-Jan``) are completed with ``year``.
 
         Args:
-            date_str: Date string from NSE
-            year: Year for context
+            values: Raw ``tradingDate`` values, used to infer the format
+            year: Year for dates that omit it
 
         Returns:
-            Parsed date or None if parsing fails
+            Date expression over the ``tradingDate`` column
         """
-        if not date_str:
-            return None
-
-        # Try different formats
-        formats = [
-            "%d-%b-%Y",  # 26-Jan-2026
-            "%d-%B-%Y",  # 26-January-2026
-            "%Y-%m-%d",  # 2026-01-26
-            "%d/%m/%Y",  # 26/01/2026
-            "%d-%m-%Y",  # 26-01-2026
-        ]
-
-        for fmt in formats:
-            try:
-                parsed = datetime.strptime(date_str, fmt).date()
-                return parsed
-            except ValueError:
-                continue
-
-        # If no format worked, try adding year for formats without year
-        for fmt in ["%d-%b", "%d-%B", "%d/%m", "%d-%m"]:
-            try:
-                parsed = datetime.strptime(f"{date_str}-{year}", f"{fmt}-%Y").date()
-                return parsed
-            except ValueError:
-                continue
-
-        logger.warning("Could not parse date", date_str=date_str)
-        return None
+        fmt = date_format_inferrer.infer(
+            values, source="nse_trading_calendar", formats=CALENDAR_DATE_FORMATS
+        )
+        full_date = date_format_inferrer.expr(
+            pl.col("tradingDate"), fmt=fmt, formats=CALENDAR_DATE_FORMATS
+        )
+        yearless_date = date_format_inferrer.expr(
+            pl.col("tradingDate") + pl.lit(f"-{year}"),
+            formats=[f"{fmt}-%Y" for fmt in YEARLESS_DATE_FORMATS],
+        )
+        return pl.coalesce([full_date, yearless_date])
 
     def _generate_calendar(
-        self, year: int, holidays_by_segment: dict[str, set[date]]
+        self, year: int | Sequence[int], holidays_by_segment: dict[str, set[date]]
     ) -> pl.DataFrame:
-        """Generate complete trading calendar for the year.
+        """Generate the complete trading calendar for one or more years.
+
+        The primary (CM) segment decides ``is_trading_day`` and ``day_type``.
 
         Args:
-            year: Year for calendar
+            year: Year, or years, for the calendar; the calendar spans from
+                1 January of the earliest to 31 December of the latest year
             holidays_by_segment: Holiday dates by market segment
 
         Returns:
-            DataFrame with trading calendar entries
+            DataFrame with one row per calendar day
         """
-        calendar_entries = []
-
-        # Use CM (Capital Market) segment as the primary segment
-        cm_holidays = holidays_by_segment.get("CM", set())
-
-        # Generate entry for each day of the year
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-
-        current_date = start_date
-        while current_date <= end_date:
-            # Check if weekend using Python's weekday() method (0=Monday, 6=Sunday)
-            python_weekday = current_date.weekday()
-            is_weekend = python_weekday in WEEKEND_DAYS
-            is_holiday = current_date in cm_holidays
-
-            is_trading_day = not (is_weekend or is_holiday)
-
-            # Determine day type
-            if is_holiday:
-                day_type = "MARKET_HOLIDAY"
-            elif is_weekend:
-                day_type = "WEEKEND"
-            else:
-                day_type = "NORMAL_TRADING"
-
-            # Get holiday name if applicable
-            holiday_name = None
-            if is_holiday:
-                holiday_name = self._get_holiday_name(current_date)
-
-            # Determine segments status
-            segments = [
-                {
-                    "segment": "CM",
-                    "is_open": is_trading_day,
-                },
-                {
-                    "segment": "FO",
-                    "is_open": is_trading_day,
-                },
-                {
-                    "segment": "CD",
-                    "is_open": is_trading_day,
-                },
-            ]
-
-            # Convert to ISO 8601 weekday for storage (1=Monday, 7=Sunday)
-            # This matches ClickHouse's toDayOfWeek() function
-            iso_weekday = current_date.isoweekday()
-
-            entry = {
-                "trade_date": current_date,
-                "is_trading_day": is_trading_day,
-                "day_type": day_type,
-                "holiday_name": holiday_name,
-                "exchange": "NSE",
-                "year": current_date.year,
-                "month": current_date.month,
-                "day": current_date.day,
-                "weekday": iso_weekday,  # Stored in ISO 8601 format for consistency
-                "segments": segments,
-            }
+        return (
+            self.generate_segment_calendars(year, holidays_by_segment)
+            .filter(pl.col("segment") == PRIMARY_SEGMENT)
+            .drop("segment")
+        )
+
+    def generate_segment_calendars(
+        self, year: int | Sequence[int], holidays_by_segment: dict[str, set[date]]
+    ) -> pl.DataFrame:
+        """Generate trading calendars for all segments in one vectorized pass.
 
-            calendar_entries.append(entry)
-            current_date = date.fromordinal(current_date.toordinal() + 1)
+        Every day in the range is crossed with ``SEGMENTS`` and joined against
+        the holidays of each segment. ``trading_day_ordinal`` counts trading days
+        per segment since ``ORDINAL_EPOCH`` (non-trading days carry the ordinal
+        of the preceding trading day), so the number of trading days between two
+        dates is the difference of their ordinals. Days before the range count
+        as trading days unless they are weekends or in ``holidays_by_segment``,
+        so calendars generated one year at a time continue each other's
+        ordinals when the holiday file covers the earlier years.
 
-        # Convert to DataFrame
-        df = pl.DataFrame(
+        Args:
+            year: Year, or years, for the calendar
+            holidays_by_segment: Holiday dates by market segment
+
+        Returns:
+            DataFrame with a ``segment`` column and one row per segment and day,
+            sorted by segment and date
+        """
+        years = [year] if isinstance(year, int) else sorted(year)
+        days = pl.DataFrame(
             {
-                "trade_date": [e["trade_date"] for e in calendar_entries],
-                "is_trading_day": [e["is_trading_day"] for e in calendar_entries],
-                "day_type": [e["day_type"] for e in calendar_entries],
-                "holiday_name": [e["holiday_name"] for e in calendar_entries],
-                "exchange": [e["exchange"] for e in calendar_entries],
-                "year": [e["year"] for e in calendar_entries],
-                "month": [e["month"] for e in calendar_entries],
-                "day": [e["day"] for e in calendar_entries],
-                "weekday": [e["weekday"] for e in calendar_entries],
+                "trade_date": pl.date_range(
+                    date(years[0], 1, 1), date(years[-1], 12, 31), interval="1d", eager=True
+                )
             }
         )
+        start = date(years[0], 1, 1)
+        segments = pl.DataFrame(
+            {
+                "segment": SEGMENTS,
+                "ordinal_offset": [
+                    self._trading_days_before(start, holidays_by_segment.get(segment, set()))
+                    for segment in SEGMENTS
+                ],
+            },
+            schema={"segment": pl.Utf8, "ordinal_offset": pl.Int32},
+        )
+        holidays = pl.DataFrame(
+            [
+                {"segment": segment, "trade_date": holiday}
+                for segment, dates in holidays_by_segment.items()
+                for holiday in dates
+            ],
+            schema={"segment": pl.Utf8, "trade_date": pl.Date},
+        ).with_columns(pl.lit(True).alias("is_holiday"))
+        holiday_names = pl.DataFrame(
+            {
+                "trade_date": list(self.holiday_details.keys()),
+                "holiday_name": list(self.holiday_details.values()),
+            },
+            schema={"trade_date": pl.Date, "holiday_name": pl.Utf8},
+        )
 
-        return df
+        # ISO 8601 weekday (1=Monday, 7=Sunday), matching ClickHouse's toDayOfWeek()
+        weekday = pl.col("trade_date").dt.weekday()
+        is_weekend = weekday >= ISO_SATURDAY
+        is_holiday = pl.col("is_holiday").fill_null(False)
+
+        return (
+            segments.join(days, how="cross")
+            .join(holidays.unique(), on=["segment", "trade_date"], how="left")
+            .join(holiday_names, on="trade_date", how="left")
+            .with_columns((~(is_weekend | is_holiday)).alias("is_trading_day"))
+            .sort(["segment", "trade_date"])
+            .select(
+                "segment",
+                "trade_date",
+                "is_trading_day",
+                pl.when(is_holiday)
+                .then(pl.lit("MARKET_HOLIDAY"))
+                .when(is_weekend)
+                .then(pl.lit("WEEKEND"))
+                .otherwise(pl.lit("NORMAL_TRADING"))
+                .alias("day_type"),
+                pl.when(is_holiday).then(pl.col("holiday_name")).alias("holiday_name"),
+                pl.lit("NSE").alias("exchange"),
+                pl.col("trade_date").dt.year().cast(pl.Int64).alias("year"),
+                pl.col("trade_date").dt.month().cast(pl.Int64).alias("month"),
+                pl.col("trade_date").dt.day().cast(pl.Int64).alias("day"),
+                weekday.cast(pl.Int64).alias("weekday"),
+                pl.col("is_trading_day")
+                .cast(pl.Int32)
+                .cum_sum()
+                .over("segment")
+                .add(pl.col("ordinal_offset"))
+                .alias("trading_day_ordinal"),
+            )
+        )
+
+    @staticmethod
+    def _trading_days_before(start: date, holidays: set[date]) -> int:
+        """Count trading days from ``ORDINAL_EPOCH`` up to (excluding) ``start``.
+
+        Args:
+            start: First day of the generated range
+            holidays: Known holidays of the segment (any year)
+
+        Returns:
+            Weekdays in ``[ORDINAL_EPOCH, start)`` minus the known holidays among
+            them; negative when ``start`` precedes the epoch
+        """
+        first, last, sign = (ORDINAL_EPOCH, start, 1)
+        if start < ORDINAL_EPOCH:
+            first, last, sign = (start, ORDINAL_EPOCH, -1)
+
+        full_weeks, remainder = divmod((last - first).days, 7)
+        weekdays = full_weeks * 5 + sum(
+            (first + timedelta(days=i)).weekday() not in WEEKEND_DAYS for i in range(remainder)
+        )
+        holidays_before = sum(
+            first <= holiday < last and holiday.weekday() not in WEEKEND_DAYS
+            for holiday in holidays
+        )
+        return sign * (weekdays - holidays_before)
 
     def _get_holiday_name(self, target_date: date) -> str | None:
         """Get holiday name for a date from stored holiday details.
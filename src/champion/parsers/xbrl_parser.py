@@ -7,16 +7,141 @@ instance documents and returns a normalized dict suitable for the
 The implementation is intentionally conservative: it extracts a fixed set
 of commonly-used tags (Revenue, Profit, EPS, Assets, Liabilities etc.) and
 stores any unmapped facts into `metadata` to avoid data loss.
+
+Documents are read in a single streaming pass (``iterparse``): contexts and
+units are resolved as they are encountered and each top-level element is
+cleared once processed, so memory does not grow with the size of the filing.
+``parse_xbrl_batch`` parses many filings on a process pool into one columnar
+facts table.
 """
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import uuid
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
+import polars as pl
+
+from champion.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+XBRLI_NS = "{http://www.xbrl.org/2003/instance}"
+
+# Columns of the facts table produced by ``parse_xbrl_facts``/``parse_xbrl_batch``
+FACTS_SCHEMA = {
+    "symbol": pl.Utf8,
+    "period": pl.Date,
+    "concept": pl.Utf8,
+    "value": pl.Float64,
+    "unit": pl.Utf8,
+}
+
+# Mapping heuristics: local tag -> target field name
+FIELD_MAP = {
+    "RevenueFromOperations": "revenue",
+    "SegmentRevenueFromOperations": "revenue",
+    "Income": "income",
+    "OtherIncome": "other_income",
+    "EmployeeBenefitExpense": "employee_benefit_expense",
+    "FinanceCosts": "interest_expense",
+    "SegmentFinanceCosts": "interest_expense",
+    "DepreciationDepletionAndAmortisationExpense": "depreciation",
+    "OtherExpenses": "other_expenses",
+    "DescriptionOfOtherExpenses": "other_expenses_description",
+    "Expenses": "expenses",
+    "ProfitBeforeExceptionalItemsAndTax": "operating_profit",
+    "ProfitBeforeTax": "profit_before_tax",
+    "ProfitLossForPeriodFromContinuingOperations": "net_profit",
+    "ProfitLossForPeriod": "net_profit",
+    "ProfitOrLossAttributableToOwnersOfParent": "profit_or_loss_attributable_to_parent",
+    "ProfitOrLossAttributableToNonControllingInterests": "profit_or_loss_attributable_to_non_controlling",
+    "TaxExpense": "tax_expense",
+    "CurrentTax": "current_tax",
+    "DeferredTax": "deferred_tax",
+    "NetMovementInRegulatoryDeferralAccountBalancesRelatedToProfitOrLossAndTheRelatedDeferredTaxMovement": "regulatory_deferral_movement",
+    "PaidUpValueOfEquityShareCapital": "paid_up_value_of_equity_share_capital",
+    "FaceValueOfEquityShareCapital": "face_value_of_equity_share_capital",
+    "BasicEarningsLossPerShareFromContinuingOperations": "eps",
+    "DilutedEarningsLossPerShareFromContinuingOperations": "diluted_eps",
+    "BasicEarningsLossPerShareFromContinuingAndDiscontinuedOperations": "eps",
+    "DilutedEarningsLossPerShareFromContinuingAndDiscontinuedOperations": "diluted_eps",
+    "TotalAssets": "total_assets",
+    "SegmentAssets": "total_assets",
+    "TotalLiabilities": "total_liabilities",
+    "SegmentLiabilities": "total_liabilities",
+    "Equity": "equity",
+    "TotalDebt": "total_debt",
+    "CurrentAssets": "current_assets",
+    "CurrentLiabilities": "current_liabilities",
+    "CashAndCashEquivalents": "cash_and_equivalents",
+    "Inventories": "inventories",
+    "InterSegmentRevenue": "inter_segment_revenue",
+    "SegmentProfitLossBeforeTaxAndFinanceCosts": "segment_profit_before_tax_and_finance_costs",
+    "SegmentProfitBeforeTax": "segment_profit_before_tax",
+    "OtherUnallocableExpenditureNetOffUnAllocableIncome": "other_unallocable_expenditure",
+    "ComprehensiveIncomeForThePeriod": "comprehensive_income_for_the_period",
+    "ComprehensiveIncomeForThePeriodAttributableToOwnersOfParent": "comprehensive_income_attributable_to_parent",
+    "ComprehensiveIncomeForThePeriodAttributableToOwnersOfParentNonControllingInterests": "comprehensive_income_attributable_to_non_controlling",
+    "SegmentRevenue": "segment_revenue",
+}
+
+
+@dataclass
+class XbrlFact:
+    """A top-level fact from an XBRL instance document."""
+
+    concept: str
+    context_ref: str | None
+    unit_ref: str | None
+    decimals: str | None
+    text: str | None
+
+
+@dataclass
+class XbrlDocument:
+    """Contexts, units and facts collected from one streaming pass over a filing."""
+
+    contexts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    units: dict[str, str] = field(default_factory=dict)
+    level_rounding: str | None = None
+    facts: list[XbrlFact] = field(default_factory=list)
+
+    @property
+    def rounding_divisor(self) -> float:
+        """Scaling divisor derived from the declared level of rounding."""
+        level = self.level_rounding
+        if level:
+            if "crore" in level:
+                return 1e7
+            if "lakh" in level:
+                return 1e5
+            if "thousand" in level:
+                return 1e3
+        return 1.0
+
+    @property
+    def entity_id(self) -> str | None:
+        """Entity identifier of the first fact whose context carries one."""
+        for fact in self.facts:
+            ctx = self.contexts.get(fact.context_ref) if fact.context_ref else None
+            if ctx and ctx.get("entity_identifier"):
+                return ctx["entity_identifier"]
+        return None
+
+    @property
+    def symbol(self) -> str | None:
+        """Trading symbol derived from the entity identifier."""
+        return _symbol_from_entity(self.entity_id)
+
 
 def _local_name(tag: str) -> str:
     if "}" in tag:
@@ -38,6 +163,148 @@ def _to_float(text: str | None) -> float | None:
         return None
 
 
+def _to_date(elem: ET.Element | None) -> date | None:
+    if elem is None or not elem.text:
+        return None
+    try:
+        return datetime.fromisoformat(elem.text.strip()).date()
+    except Exception:
+        return None
+
+
+def _symbol_from_entity(entity_id: str | None) -> str | None:
+    # entity id may include scheme; try extracting last segment
+    if isinstance(entity_id, str) and "/" in entity_id:
+        return entity_id.rsplit("/", 1)[-1]
+    return entity_id
+
+
+def _read_context(ctx: ET.Element) -> dict[str, Any]:
+    """Extract entity identifier and period dates from a ``context`` element."""
+    ident = None
+    ent = ctx.find(f"{XBRLI_NS}entity")
+    if ent is not None:
+        idn = ent.find(f"{XBRLI_NS}identifier")
+        if idn is not None:
+            ident = idn.text
+
+    pstart = pend = instant = None
+    period = ctx.find(f"{XBRLI_NS}period")
+    if period is not None:
+        pstart = _to_date(period.find(f"{XBRLI_NS}startDate"))
+        pend = _to_date(period.find(f"{XBRLI_NS}endDate"))
+        instant = _to_date(period.find(f"{XBRLI_NS}instant"))
+
+    return {
+        "entity_identifier": ident,
+        "period_start": pstart,
+        "period_end": pend,
+        "instant": instant,
+    }
+
+
+def scan_xbrl(path: Path) -> XbrlDocument:
+    """Collect contexts, units and facts from an XBRL file in one streaming pass.
+
+    Only the element currently being read is kept in memory: every top-level
+    element is cleared once it has been processed.
+
+    Args:
+        path: Path to XBRL/XML file
+
+    Returns:
+        XbrlDocument with contexts, units, rounding level and top-level facts
+    """
+    doc = XbrlDocument()
+    depth = 0
+    root: ET.Element | None = None
+
+    for event, elem in ET.iterparse(str(path), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        tag = elem.tag
+        if tag == f"{XBRLI_NS}context":
+            cid = elem.get("id")
+            if cid:
+                doc.contexts[cid] = _read_context(elem)
+        elif tag == f"{XBRLI_NS}unit":
+            uid = elem.get("id")
+            measure = elem.find(f"{XBRLI_NS}measure")
+            if uid and measure is not None and measure.text:
+                doc.units[uid] = measure.text.strip()
+
+        tag_local = _local_name(tag)
+        if (
+            doc.level_rounding is None
+            and tag_local == "LevelOfRoundingUsedInFinancialStatements"
+            and elem.text
+        ):
+            doc.level_rounding = elem.text.strip().lower()
+
+        if depth == 1 and root is not None:
+            # facts are top-level children (excluding contexts/units/schemaRef)
+            if tag_local not in ("context", "unit", "schemaRef") and "contextRef" in elem.attrib:
+                doc.facts.append(
+                    XbrlFact(
+                        concept=tag_local,
+                        context_ref=elem.attrib.get("contextRef"),
+                        unit_ref=elem.attrib.get("unitRef"),
+                        decimals=elem.attrib.get("decimals"),
+                        text=elem.text.strip() if elem.text else None,
+                    )
+                )
+            # Processed: drop the subtree so memory stays flat
+            root.clear()
+
+    return doc
+
+
+def _scale_value(doc: XbrlDocument, fact: XbrlFact, raw_val: float | None) -> float | None:
+    """Apply ``decimals`` or the document rounding level to a raw fact value."""
+    rounding_divisor = doc.rounding_divisor
+    scaled_val = None
+    try:
+        # decide whether to apply monetary rounding scaling for this fact
+        should_scale = True
+        if fact.unit_ref:
+            unit_text = doc.units.get(fact.unit_ref, str(fact.unit_ref)).lower()
+            # don't scale per-share or pure/unitless measures
+            if (
+                "share" in unit_text
+                or "per" in unit_text
+                and "share" in unit_text
+                or "xbrli:shares" in unit_text
+                or "pure" in unit_text
+            ):
+                should_scale = False
+
+        # if decimals attribute present and numeric and negative, prefer that
+        decimals = fact.decimals
+        if decimals and decimals.upper() != "INF":
+            try:
+                dec_i = int(decimals)
+                if dec_i < 0 and raw_val is not None:
+                    divisor = 10 ** (-dec_i)
+                    scaled_val = raw_val / divisor
+            except Exception:
+                scaled_val = None
+
+        # fallback to rounding divisor inferred from file (Crores/Lakhs)
+        if scaled_val is None and raw_val is not None:
+            if should_scale and rounding_divisor != 1.0:
+                scaled_val = raw_val / rounding_divisor
+            else:
+                scaled_val = raw_val
+    except Exception:
+        scaled_val = raw_val
+    return scaled_val
+
+
 def parse_xbrl_file(path: Path) -> dict[str, Any]:
     """Parse an XBRL/XML file and return a normalized dict.
 
@@ -48,108 +315,7 @@ def parse_xbrl_file(path: Path) -> dict[str, Any]:
         dict with keys matching `quarterly_financials` where available and
         `metadata` containing unmapped facts.
     """
-    tree = ET.parse(str(path))
-    root = tree.getroot()
-
-    # collect contexts: id -> {entity_identifier, period_start, period_end, instant}
-    contexts: dict[str, dict[str, Any]] = {}
-    for ctx in root.findall(".//{http://www.xbrl.org/2003/instance}context"):
-        cid = ctx.get("id")
-        if not cid:
-            continue
-        ent = ctx.find("{http://www.xbrl.org/2003/instance}entity")
-        ident = None
-        if ent is not None:
-            idn = ent.find("{http://www.xbrl.org/2003/instance}identifier")
-            if idn is not None:
-                ident = idn.text
-        period = ctx.find("{http://www.xbrl.org/2003/instance}period")
-        pstart = pend = instant = None
-        if period is not None:
-            sd = period.find("{http://www.xbrl.org/2003/instance}startDate")
-            ed = period.find("{http://www.xbrl.org/2003/instance}endDate")
-            ins = period.find("{http://www.xbrl.org/2003/instance}instant")
-            if sd is not None and sd.text:
-                try:
-                    pstart = datetime.fromisoformat(sd.text.strip()).date()
-                except Exception:
-                    pstart = None
-            if ed is not None and ed.text:
-                try:
-                    pend = datetime.fromisoformat(ed.text.strip()).date()
-                except Exception:
-                    pend = None
-            if ins is not None and ins.text:
-                try:
-                    instant = datetime.fromisoformat(ins.text.strip()).date()
-                except Exception:
-                    instant = None
-
-        contexts[cid] = {
-            "entity_identifier": ident,
-            "period_start": pstart,
-            "period_end": pend,
-            "instant": instant,
-        }
-
-    # units mapping (id -> measure text)
-    units: dict[str, str] = {}
-    for unit in root.findall(".//{http://www.xbrl.org/2003/instance}unit"):
-        uid = unit.get("id")
-        if not uid:
-            continue
-        measure = unit.find("{http://www.xbrl.org/2003/instance}measure")
-        if measure is not None and measure.text:
-            units[uid] = measure.text.strip()
-
-    # mapping heuristics: local tag -> target field name
-    field_map = {
-        "RevenueFromOperations": "revenue",
-        "SegmentRevenueFromOperations": "revenue",
-        "Income": "income",
-        "OtherIncome": "other_income",
-        "EmployeeBenefitExpense": "employee_benefit_expense",
-        "FinanceCosts": "interest_expense",
-        "SegmentFinanceCosts": "interest_expense",
-        "DepreciationDepletionAndAmortisationExpense": "depreciation",
-        "OtherExpenses": "other_expenses",
-        "DescriptionOfOtherExpenses": "other_expenses_description",
-        "Expenses": "expenses",
-        "ProfitBeforeExceptionalItemsAndTax": "operating_profit",
-        "ProfitBeforeTax": "profit_before_tax",
-        "ProfitLossForPeriodFromContinuingOperations": "net_profit",
-        "ProfitLossForPeriod": "net_profit",
-        "ProfitOrLossAttributableToOwnersOfParent": "profit_or_loss_attributable_to_parent",
-        "ProfitOrLossAttributableToNonControllingInterests": "profit_or_loss_attributable_to_non_controlling",
-        "TaxExpense": "tax_expense",
-        "CurrentTax": "current_tax",
-        "DeferredTax": "deferred_tax",
-        "NetMovementInRegulatoryDeferralAccountBalancesRelatedToProfitOrLossAndTheRelatedDeferredTaxMovement": "regulatory_deferral_movement",
-        "PaidUpValueOfEquityShareCapital": "paid_up_value_of_equity_share_capital",
-        "FaceValueOfEquityShareCapital": "face_value_of_equity_share_capital",
-        "BasicEarningsLossPerShareFromContinuingOperations": "eps",
-        "DilutedEarningsLossPerShareFromContinuingOperations": "diluted_eps",
-        "BasicEarningsLossPerShareFromContinuingAndDiscontinuedOperations": "eps",
-        "DilutedEarningsLossPerShareFromContinuingAndDiscontinuedOperations": "diluted_eps",
-        "TotalAssets": "total_assets",
-        "SegmentAssets": "total_assets",
-        "TotalLiabilities": "total_liabilities",
-        "SegmentLiabilities": "total_liabilities",
-        "Equity": "equity",
-        "TotalDebt": "total_debt",
-        "CurrentAssets": "current_assets",
-        "CurrentLiabilities": "current_liabilities",
-        "CashAndCashEquivalents": "cash_and_equivalents",
-        "Inventories": "inventories",
-        "InterSegmentRevenue": "inter_segment_revenue",
-        "SegmentProfitLossBeforeTaxAndFinanceCosts": "segment_profit_before_tax_and_finance_costs",
-        "SegmentProfitBeforeTax": "segment_profit_before_tax",
-        "OtherUnallocableExpenditureNetOffUnAllocableIncome": "other_unallocable_expenditure",
-        "ComprehensiveIncomeForThePeriod": "comprehensive_income_for_the_period",
-        "ComprehensiveIncomeForThePeriodAttributableToOwnersOfParent": "comprehensive_income_attributable_to_parent",
-        "ComprehensiveIncomeForThePeriodAttributableToOwnersOfParentNonControllingInterests": "comprehensive_income_attributable_to_non_controlling",
-        "SegmentRevenue": "segment_revenue",
-    }
+    doc = scan_xbrl(path)
 
     record: dict[str, Any] = {
         "event_id": str(uuid.uuid4()),
@@ -186,132 +352,161 @@ def parse_xbrl_file(path: Path) -> dict[str, Any]:
         "_xbrl_raw_values": {},
     }
 
-    # detect level of rounding (Crores, Lakhs, Thousands) to derive scaling
-    level_rounding = None
-    for el in root.iter():
-        if _local_name(el.tag) == "LevelOfRoundingUsedInFinancialStatements" and el.text:
-            level_rounding = el.text.strip().lower()
-            break
-    rounding_divisor = 1.0
-    if level_rounding:
-        if "crore" in level_rounding:
-            rounding_divisor = 1e7
-        elif "lakh" in level_rounding or "lakhs" in level_rounding:
-            rounding_divisor = 1e5
-        elif "thousand" in level_rounding or "thousands" in level_rounding:
-            rounding_divisor = 1e3
-
-    # iterate over facts (top-level children excluding contexts/units/schemaRef)
-    for elem in list(root):
-        tag_local = _local_name(elem.tag)
-        # Skip structural elements
-        if tag_local in ("context", "unit", "schemaRef"):
-            continue
-        # facts may be deeply namespaced; also allow nested
-        if elem.attrib and "contextRef" in elem.attrib:
-            ctxt = elem.attrib.get("contextRef")
-            unit_ref = elem.attrib.get("unitRef")
-            decimals = elem.attrib.get("decimals")
-            value_text = elem.text.strip() if elem.text else None
-
-            mapped = None
-            # direct mapping by exact name
-            if tag_local in field_map:
-                mapped = field_map[tag_local]
-            else:
-                # fallback: match common keywords
-                tl = tag_local.lower()
-                if "revenue" in tl and record.get("revenue") is None:
-                    mapped = "revenue"
-                elif "profit" in tl and ("loss" not in tl or "net" in tl or "profitbefore" in tl):
-                    # try to detect operating vs net
-                    if "beforetax" in tl or "profitbefore" in tl:
-                        mapped = "operating_profit"
-                    elif "net" in tl or "forperiod" in tl or "profitlossforperiod" in tl:
-                        mapped = "net_profit"
-                elif "eps" in tl or "earnings" in tl:
-                    mapped = "eps"
-                elif "asset" in tl and record.get("total_assets") is None:
-                    mapped = "total_assets"
-                elif "liabil" in tl and record.get("total_liabilities") is None:
-                    mapped = "total_liabilities"
-                elif "equity" in tl and record.get("equity") is None:
-                    mapped = "equity"
-
-            # assign value (apply scaling using decimals or detected rounding)
-            raw_val = _to_float(value_text)
-            scaled_val = None
-            try:
-                # decide whether to apply monetary rounding scaling for this fact
-                should_scale = True
-                if unit_ref:
-                    unit_text = units.get(unit_ref, str(unit_ref)).lower()
-                    # don't scale per-share or pure/unitless measures
-                    if (
-                        "share" in unit_text
-                        or "per" in unit_text
-                        and "share" in unit_text
-                        or "xbrli:shares" in unit_text
-                        or "pure" in unit_text
-                    ):
-                        should_scale = False
-
-                # if decimals attribute present and numeric and negative, prefer that
-                if decimals and decimals.upper() != "INF":
-                    try:
-                        dec_i = int(decimals)
-                        if dec_i < 0 and raw_val is not None:
-                            divisor = 10 ** (-dec_i)
-                            scaled_val = raw_val / divisor
-                    except Exception:
-                        scaled_val = None
-
-                # fallback to rounding divisor inferred from file (Crores/Lakhs)
-                if scaled_val is None and raw_val is not None:
-                    if should_scale and rounding_divisor != 1.0:
-                        scaled_val = raw_val / rounding_divisor
-                    else:
-                        scaled_val = raw_val
-            except Exception:
-                scaled_val = raw_val
+    # iterate over facts in document order
+    for fact in doc.facts:
+        tag_local = fact.concept
+        ctxt = fact.context_ref
+        value_text = fact.text
 
-            if mapped:
-                record[mapped] = scaled_val
-            else:
-                # not mapped: push to metadata
-                k = tag_local
-                # if duplicate key, append index
-                if k in record["metadata"]:
-                    i = 1
-                    while f"{k}_{i}" in record["metadata"]:
-                        i += 1
-                    k = f"{k}_{i}"
-                record["metadata"][k] = value_text
-
-            # always store raw original numeric in a raw map for auditing
-            if raw_val is not None:
-                record["_xbrl_raw_values"][tag_local] = raw_val
-
-            # attach entity/context info if available
-            if ctxt and ctxt in contexts:
-                ctx = contexts[ctxt]
-                # prefer period_end if present
-                if ctx.get("period_end") and record.get("period_end_date") is None:
-                    record["period_end_date"] = ctx.get("period_end")
-                if ctx.get("entity_identifier") and record.get("entity_id") is None:
-                    record["entity_id"] = ctx.get("entity_identifier")
+        mapped = None
+        # direct mapping by exact name
+        if tag_local in FIELD_MAP:
+            mapped = FIELD_MAP[tag_local]
+        else:
+            # fallback: match common keywords
+            tl = tag_local.lower()
+            if "revenue" in tl and record.get("revenue") is None:
+                mapped = "revenue"
+            elif "profit" in tl and ("loss" not in tl or "net" in tl or "profitbefore" in tl):
+                # try to detect operating vs net
+                if "beforetax" in tl or "profitbefore" in tl:
+                    mapped = "operating_profit"
+                elif "net" in tl or "forperiod" in tl or "profitlossforperiod" in tl:
+                    mapped = "net_profit"
+            elif "eps" in tl or "earnings" in tl:
+                mapped = "eps"
+            elif "asset" in tl and record.get("total_assets") is None:
+                mapped = "total_assets"
+            elif "liabil" in tl and record.get("total_liabilities") is None:
+                mapped = "total_liabilities"
+            elif "equity" in tl and record.get("equity") is None:
+                mapped = "equity"
+
+        # assign value (apply scaling using decimals or detected rounding)
+        raw_val = _to_float(value_text)
+        scaled_val = _scale_value(doc, fact, raw_val)
+
+        if mapped:
+            record[mapped] = scaled_val
+        else:
+            # not mapped: push to metadata
+            k = tag_local
+            # if duplicate key, append index
+            if k in record["metadata"]:
+                i = 1
+                while f"{k}_{i}" in record["metadata"]:
+                    i += 1
+                k = f"{k}_{i}"
+            record["metadata"][k] = value_text
+
+        # always store raw original numeric in a raw map for auditing
+        if raw_val is not None:
+            record["_xbrl_raw_values"][tag_local] = raw_val
+
+        # attach entity/context info if available
+        if ctxt and ctxt in doc.contexts:
+            ctx = doc.contexts[ctxt]
+            # prefer period_end if present
+            if ctx.get("period_end") and record.get("period_end_date") is None:
+                record["period_end_date"] = ctx.get("period_end")
+            if ctx.get("entity_identifier") and record.get("entity_id") is None:
+                record["entity_id"] = ctx.get("entity_identifier")
 
     # fill symbol from entity_id when possible (NSESymbol scheme sometimes present)
     if record.get("entity_id"):
-        # entity id may include scheme; try extracting last segment
-        ent = record["entity_id"]
-        if isinstance(ent, str) and "/" in ent:
-            record["symbol"] = ent.rsplit("/", 1)[-1]
-        else:
-            record["symbol"] = ent
+        record["symbol"] = _symbol_from_entity(record["entity_id"])
 
     # ensure period_end_date is a date
     if isinstance(record.get("period_end_date"), datetime):
         record["period_end_date"] = record["period_end_date"].date()
 
     return record
+
+
+def parse_xbrl_facts(path: Path) -> pl.DataFrame:
+    """Parse an XBRL/XML file into a columnar table of numeric facts.
+
+    Values are scaled the same way as in ``parse_xbrl_file``. The period is the
+    context end date, or its instant for point-in-time facts.
+
+    Args:
+        path: Path to XBRL/XML file
+
+    Returns:
+        DataFrame with ``FACTS_SCHEMA`` columns, one row per numeric fact
+    """
+    doc = scan_xbrl(path)
+    symbol = doc.symbol
+
+    rows: dict[str, list[Any]] = {name: [] for name in FACTS_SCHEMA}
+    for fact in doc.facts:
+        raw_val = _to_float(fact.text)
+        if raw_val is None:
+            continue
+        ctx = doc.contexts.get(fact.context_ref or "", {})
+        rows["symbol"].append(symbol)
+        rows["period"].append(ctx.get("period_end") or ctx.get("instant"))
+        rows["concept"].append(fact.concept)
+        rows["value"].append(_scale_value(doc, fact, raw_val))
+        rows["unit"].append(doc.units.get(fact.unit_ref, fact.unit_ref) if fact.unit_ref else None)
+
+    return pl.DataFrame(rows, schema=FACTS_SCHEMA)
+
+
+def _parse_facts_or_none(path: Path) -> tuple[Path, pl.DataFrame | None, str | None]:
+    """Process-pool worker: parse one filing, returning the error instead of raising."""
+    try:
+        return path, parse_xbrl_facts(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def parse_xbrl_batch(
+    paths: Sequence[Path],
+    workers: int | None = None,
+    output_path: Path | None = None,
+) -> pl.DataFrame:
+    """Parse many XBRL filings on a process pool into one facts table.
+
+    Filings that fail to parse are logged and skipped.
+
+    Args:
+        paths: XBRL/XML files to parse
+        workers: Number of worker processes (default: CPU count)
+        output_path: If given, also write the facts table to this Parquet file
+
+    Returns:
+        DataFrame with ``FACTS_SCHEMA`` columns for all filings, in input order
+    """
+    paths = [Path(p) for p in paths]
+    workers = workers or os.cpu_count() or 1
+    frames: list[pl.DataFrame] = []
+    failed = 0
+
+    logger.info("Parsing XBRL batch", files=len(paths), workers=workers)
+
+    # Spawn rather than fork: forking after Polars has started its thread pool can deadlock
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        chunksize = max(1, len(paths) // (workers * 4))
+        for path, df, error in pool.map(_parse_facts_or_none, paths, chunksize=chunksize):
+            if df is None:
+                failed += 1
+                logger.warning("Failed to parse XBRL file", path=str(path), error=error)
+            else:
+                frames.append(df)
+
+    facts = pl.concat(frames) if frames else pl.DataFrame(schema=FACTS_SCHEMA)
+
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        facts.write_parquet(output_path, compression="snappy")
+
+    logger.info(
+        "XBRL batch complete",
+        files=len(paths),
+        failed=failed,
+        facts=len(facts),
+        output=str(output_path) if output_path else None,
+    )
+    return facts
@@ -23,76 +23,107 @@ class BhavcopyScraper(BaseScraper):
     def scrape(self, target_date: date, dry_run: bool = False) -> Path:  # type: ignore[override]
         """Scrape bhavcopy for a specific date.
 
+        The downloaded ZIP archive is stored as-is and returned without
+        extracting the CSV; ``PolarsBhavcopyParser`` decompresses the member in
+        memory when parsing. Use ``fetch`` to skip the disk entirely.
+
         Args:
             target_date: Date to scrape
             dry_run: If True, parse without producing to Kafka
 
         Returns:
-            Path to extracted CSV file
+            Path to the bhavcopy file (local CSV if present, else the downloaded ZIP)
         """
         with scrape_duration.labels(scraper=self.name).time():
             self.logger.info("Starting bhavcopy scrape", date=str(target_date), dry_run=dry_run)
 
-            # Prefer organized local data lake path if present
-            date_str = target_date.strftime("%Y-%m-%d")
-            lake_dir = (
-                config.storage.data_dir
-                / "lake"
-                / "intraday"
-                / "bhavcopy"
-                / f"trade_date={date_str}"
-            )
-            if lake_dir.exists() and lake_dir.is_dir():
-                # Find CSV file inside
-                for p in sorted(lake_dir.iterdir()):
-                    if p.is_file() and p.name.lower().endswith(".csv"):
-                        self.logger.info(
-                            "Using local bhavcopy CSV", path=str(p), trade_date=str(target_date)
-                        )
-                        return p
-
-            # Fallback to download into storage root (preserve previous behavior)
-            # Format date for NSE URL (YYYYMMDD)
-            date_compact = target_date.strftime("%Y%m%d")
-            url = config.nse.bhavcopy_url.format(date=date_compact)
-
-            # Download ZIP file into lake_dir if possible
-            zip_path = (
-                (lake_dir / f"BhavCopy_NSE_CM_{date_compact}.csv.zip")
-                if lake_dir.exists()
-                else config.storage.data_dir / f"BhavCopy_NSE_CM_{date_compact}.csv.zip"
-            )
-            csv_path = (
-                (lake_dir / f"BhavCopy_NSE_CM_{date_compact}.csv")
-                if lake_dir.exists()
-                else config.storage.data_dir / f"BhavCopy_NSE_CM_{date_compact}.csv"
-            )
-
-            # Ensure target dir exists when writing
-            if lake_dir and not lake_dir.exists():
-                try:
-                    lake_dir.mkdir(parents=True, exist_ok=True)
-                except Exception:
-                    pass
+            local_path = self.local_file(target_date)
+            if local_path is not None:
+                return local_path
 
-            if not self._download_and_extract_zip(url, str(zip_path), str(csv_path)):
-                raise RuntimeError(f"Failed to download bhavcopy for {target_date}")
+            zip_path = self.archive(target_date, self.fetch(target_date))
 
             # Only increment metrics for real downloads (not dry runs)
             if not dry_run:
                 files_downloaded.labels(scraper=self.name).inc()
-            return csv_path
+            return zip_path
+
+    def local_file(self, target_date: date) -> Path | None:
+        """Return a bhavcopy already in the local data lake, if any.
+
+        Args:
+            target_date: Trading date
+
+        Returns:
+            Path to a CSV (or archived CSV) under ``lake/intraday/bhavcopy``, else None
+        """
+        lake_dir = self._lake_dir(target_date)
+        if lake_dir.is_dir():
+            for p in sorted(lake_dir.iterdir()):
+                if p.is_file() and p.name.lower().endswith((".csv", ".csv.zip")):
+                    self.logger.info(
+                        "Using local bhavcopy file", path=str(p), trade_date=str(target_date)
+                    )
+                    return p
+        return None
+
+    def archive(self, target_date: date, content: bytes) -> Path:
+        """Store a downloaded ZIP archive as-is for audit.
+
+        Args:
+            target_date: Trading date of the archive
+            content: ZIP archive bytes from ``fetch``
+
+        Returns:
+            Path of the stored archive
+        """
+        lake_dir = self._lake_dir(target_date)
+        zip_path = (
+            lake_dir if lake_dir.exists() else config.storage.data_dir
+        ) / f"BhavCopy_NSE_CM_{target_date.strftime('%Y%m%d')}.csv.zip"
+        zip_path.write_bytes(content)
+        self.logger.info("Saved bhavcopy archive", path=str(zip_path))
+        return zip_path
+
+    def _lake_dir(self, target_date: date) -> Path:
+        """Organized local data lake directory for a trading date."""
+        return (
+            config.storage.data_dir
+            / "lake"
+            / "intraday"
+            / "bhavcopy"
+            / f"trade_date={target_date.strftime('%Y-%m-%d')}"
+        )
+
+    def fetch(self, target_date: date) -> bytes:
+        """Download the bhavcopy ZIP archive for a date into memory.
+
+        The bytes can be passed straight to ``PolarsBhavcopyParser`` without
+        touching the disk.
+
+        Args:
+            target_date: Date to fetch
+
+        Returns:
+            Raw ZIP archive bytes
+
+        Raises:
+            RuntimeError: If the download fails or the archive holds no CSV
+        """
+        url = config.nse.bhavcopy_url.format(date=target_date.strftime("%Y%m%d"))
+        content = self._download_zip(url)
+        if content is None:
+            raise RuntimeError(f"Failed to download bhavcopy for {target_date}")
+        return content
 
-    def _download_and_extract_zip(self, url: str, zip_path: str, csv_path: str) -> bool:
-        """Download ZIP file from URL and extract CSV.
+    def _download_zip(self, url: str) -> bytes | None:
+        """Download a ZIP file from URL and check it contains a CSV.
 
         Args:
             url: Source URL
-            zip_path: Path to save ZIP file
-            csv_path: Path to extract CSV to
 
         Returns:
-            True if successful, False otherwise
+            ZIP archive bytes if successful, None otherwise
         """
         import httpx
 
@@ -111,19 +142,14 @@ class BhavcopyScraper(BaseScraper):
             )
             response.raise_for_status()
 
-            # Extract CSV from ZIP
+            # Check the archive holds a CSV without decompressing it
             with zipfile.ZipFile(BytesIO(response.content), "r") as zip_file:
-                # Find CSV file in ZIP
-                for file_name in zip_file.namelist():
-                    if file_name.endswith(".csv"):
-                        with open(csv_path, "wb") as f:
-                            f.write(zip_file.read(file_name))
-                        self.logger.info("Extracted CSV from ZIP", csv_path=csv_path)
-                        return True
+                if not any(name.lower().endswith(".csv") for name in zip_file.namelist()):
+                    self.logger.error("No CSV file found in ZIP archive")
+                    return None
 
-            self.logger.error("No CSV file found in ZIP archive")
-            return False
+            return response.content
 
         except Exception as e:
-            self.logger.error("Failed to download and extract ZIP", url=url, error=str(e))
-            return False
+            self.logger.error("Failed to download ZIP", url=url, error=str(e))
+            return None
@@ -8,11 +8,18 @@ All storage operations implement champion.core.DataSource/DataSink interfaces.
 - `adapters.py`: Storage backend adapters (Parquet, CSV, etc)
 - `parquet_io.py`: Parquet I/O utilities
 - `retention.py`: Data retention and cleanup policies
+- `temporal.py`: Native conversion of temporal columns to warehouse primitives
 """
 
 from .adapters import CSVDataSink, CSVDataSource, ParquetDataSink, ParquetDataSource
-from .parquet_io import coalesce_small_files, generate_dataset_metadata, write_df
+from .parquet_io import (
+    ParquetDatasetWriter,
+    coalesce_small_files,
+    generate_dataset_metadata,
+    write_df,
+)
 from .retention import calculate_partition_age, cleanup_old_partitions, get_dataset_statistics
+from .temporal import to_warehouse_primitives
 
 __all__ = [
     # Adapters
@@ -22,9 +29,11 @@ __all__ = [
     "CSVDataSink",
     # Utilities
     "write_df",
+    "ParquetDatasetWriter",
     "coalesce_small_files",
     "generate_dataset_metadata",
     "cleanup_old_partitions",
     "calculate_partition_age",
     "get_dataset_statistics",
+    "to_warehouse_primitives",
 ]
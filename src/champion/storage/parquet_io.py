@@ -1,35 +1,295 @@
 """Parquet I/O utilities for data lake operations."""
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+from urllib.parse import quote
 
 import polars as pl
 import pyarrow as pa
 import pyarrow.parquet as pq
 import structlog
 
-from champion.validation.validator import ParquetValidator
+from champion.validation.registry import validator_registry
+from champion.validation.state import SymbolStateStore
 
 logger = structlog.get_logger()
 
 
+# Rows per row group: large enough for efficient column scans, small enough
+# for engines to skip row groups using their min/max statistics
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+# Files are rolled over once their estimated (uncompressed Arrow) size
+# reaches this many bytes
+DEFAULT_MAX_BYTES_PER_FILE = 512 * 1024 * 1024
+
+# Chunks accepted by write_df and ParquetDatasetWriter.write
+Chunk = pl.DataFrame | pa.Table | pa.RecordBatch
+
+# Directory name pyarrow and Hive use for null partition values
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+@dataclass
+class _PartitionFiles:
+    """Files being written to one partition directory."""
+
+    directory: Path
+    schema: pa.Schema
+    buffer: list[pa.Table] = field(default_factory=list)
+    buffered_rows: int = 0
+    writer: pq.ParquetWriter | None = None
+    file_rows: int = 0
+    file_bytes: int = 0
+    files: list[Path] = field(default_factory=list)
+    temp_files: list[Path] = field(default_factory=list)
+
+
+class ParquetDatasetWriter:
+    """Chunked writer of a (Hive-partitioned) Parquet dataset.
+
+    Chunks are split by partition values, buffered into row groups of
+    ``row_group_size`` rows and streamed through ``pq.ParquetWriter``, so
+    only one row group per partition is held in memory. A file is closed once
+    it holds ``max_rows_per_file`` rows or about ``max_bytes_per_file`` bytes.
+
+    File names are deterministic (``data.parquet``, ``data_00001.parquet``, ...
+    in each partition directory), so re-running a write replaces the same
+    files. Files are written under ``_``-prefixed temporary names and only
+    renamed by ``close``, once every partition is complete; ``close`` then
+    removes any other Parquet files (an earlier, larger run, or files written
+    by other tools) from the written directories. ``abort`` deletes the
+    temporary files, so a failed run leaves the previous files in place.
+
+    Example:
+        >>> with ParquetDatasetWriter(Path('data/lake/raw'), partitions=['date']) as writer:
+        ...     for batch in batches:
+        ...         writer.write(batch)
+    """
+
+    def __init__(
+        self,
+        dataset_path: Path,
+        partitions: list[str] | None = None,
+        max_rows_per_file: int = 1_000_000,
+        max_bytes_per_file: int = DEFAULT_MAX_BYTES_PER_FILE,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = "snappy",
+    ):
+        """Initialize the writer.
+
+        Args:
+            dataset_path: Dataset directory
+            partitions: Column names to partition by (not stored in the files)
+            max_rows_per_file: Maximum rows per file
+            max_bytes_per_file: Approximate maximum bytes per file, estimated
+                from the uncompressed Arrow size of the rows written
+            row_group_size: Rows per row group
+            compression: Compression codec ('snappy', 'gzip', 'zstd', 'none')
+        """
+        if max_rows_per_file <= 0 or row_group_size <= 0:
+            raise ValueError("max_rows_per_file and row_group_size must be positive")
+
+        self.dataset_path = Path(dataset_path)
+        self.partitions = partitions or []
+        self.max_rows_per_file = max_rows_per_file
+        self.max_bytes_per_file = max_bytes_per_file
+        self.row_group_size = min(row_group_size, max_rows_per_file)
+        self.compression = compression
+        self.rows_written = 0
+        self._open: dict[Path, _PartitionFiles] = {}
+
+    def __enter__(self) -> "ParquetDatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, chunk: Chunk) -> None:
+        """Write a chunk of rows.
+
+        Args:
+            chunk: Polars DataFrame, Arrow table or Arrow record batch
+        """
+        if isinstance(chunk, pa.RecordBatch):
+            chunk = pa.Table.from_batches([chunk])
+
+        if not self.partitions:
+            table = chunk.to_arrow() if isinstance(chunk, pl.DataFrame) else chunk
+            self._append(self.dataset_path, table)
+            return
+
+        df = chunk if isinstance(chunk, pl.DataFrame) else pl.from_arrow(chunk)
+        for part in df.partition_by(self.partitions, maintain_order=True):
+            values = part.select(self.partitions).row(0)
+            directory = self.dataset_path.joinpath(
+                *(
+                    f"{col}={self._partition_value(value)}"
+                    for col, value in zip(self.partitions, values, strict=True)
+                )
+            )
+            self._append(directory, part.drop(self.partitions).to_arrow())
+
+    def close(self) -> list[Path]:
+        """Flush buffered rows, publish all files and remove stale ones.
+
+        Returns:
+            Paths of the written files
+        """
+        try:
+            for files in self._open.values():
+                if files.buffered_rows or not files.files:
+                    # Also writes an empty file for a partition that only got empty chunks
+                    self._write_rows(files, self._take_buffer(files, files.buffered_rows))
+                self._finish_file(files)
+        except BaseException:
+            self.abort()
+            raise
+
+        written = []
+        for files in self._open.values():
+            for temp_file, path in zip(files.temp_files, files.files, strict=True):
+                temp_file.replace(path)
+            self._remove_stale_files(files)
+            written.extend(files.files)
+        self._open.clear()
+        return written
+
+    def abort(self) -> None:
+        """Discard the files of this run, keeping files from earlier runs."""
+        for files in self._open.values():
+            if files.writer is not None:
+                files.writer.close()
+            for temp_file in files.temp_files:
+                temp_file.unlink(missing_ok=True)
+        self._open.clear()
+
+    @staticmethod
+    def _partition_value(value: Any) -> str:
+        """Format a partition value as a directory name segment (as pyarrow does)."""
+        if value is None:
+            return HIVE_DEFAULT_PARTITION
+        return quote(str(value), safe="")
+
+    def _append(self, directory: Path, table: pa.Table) -> None:
+        """Buffer rows for a partition and write complete row groups."""
+        files = self._open.get(directory)
+        if files is None:
+            files = self._open[directory] = _PartitionFiles(directory, table.schema)
+        elif table.schema != files.schema:
+            table = table.cast(files.schema)
+
+        if table.num_rows:
+            files.buffer.append(table)
+            files.buffered_rows += table.num_rows
+        if files.buffered_rows >= self.row_group_size:
+            complete = files.buffered_rows // self.row_group_size * self.row_group_size
+            self._write_rows(files, self._take_buffer(files, complete))
+
+    @staticmethod
+    def _take_buffer(files: _PartitionFiles, rows: int) -> pa.Table:
+        """Remove the first ``rows`` buffered rows of a partition."""
+        buffered = pa.concat_tables(files.buffer) if files.buffer else files.schema.empty_table()
+        remainder = buffered.slice(rows)
+        files.buffer = [remainder] if remainder.num_rows else []
+        files.buffered_rows = remainder.num_rows
+        return buffered.slice(0, rows)
+
+    def _write_rows(self, files: _PartitionFiles, table: pa.Table) -> None:
+        """Write rows to a partition, rolling over to new files at the size limits."""
+        offset = 0
+        while True:
+            if files.writer is None:
+                self._start_file(files)
+            rows = min(table.num_rows - offset, self.max_rows_per_file - files.file_rows)
+            piece = table.slice(offset, rows)
+            files.writer.write_table(piece, row_group_size=self.row_group_size)
+            files.file_rows += rows
+            files.file_bytes += piece.nbytes
+            offset += rows
+            self.rows_written += rows
+            if (
+                files.file_rows >= self.max_rows_per_file
+                or files.file_bytes >= self.max_bytes_per_file
+            ):
+                self._finish_file(files)
+            if offset >= table.num_rows:
+                return
+
+    def _start_file(self, files: _PartitionFiles) -> None:
+        """Open the partition's next file under a temporary name."""
+        index = len(files.files)
+        name = "data.parquet" if index == 0 else f"data_{index:05d}.parquet"
+        files.directory.mkdir(parents=True, exist_ok=True)
+        files.files.append(files.directory / name)
+        files.temp_files.append(files.directory / f"_{name}.tmp")
+        files.writer = pq.ParquetWriter(
+            files.temp_files[-1],
+            files.schema,
+            compression=compression_codec(self.compression),
+            write_statistics=True,
+        )
+        files.file_rows = 0
+        files.file_bytes = 0
+
+    @staticmethod
+    def _finish_file(files: _PartitionFiles) -> None:
+        """Close the partition's current file (it keeps its temporary name)."""
+        if files.writer is None:
+            return
+        files.writer.close()
+        files.writer = None
+
+    @staticmethod
+    def _remove_stale_files(files: _PartitionFiles) -> None:
+        """Remove Parquet files this run did not write from a partition directory.
+
+        Covers files of an earlier, larger run as well as e.g. ``coalesced_*``
+        or uuid-named files; ``_``-prefixed (temporary or metadata) files are kept.
+        """
+        for path in files.directory.glob("[!_]*.parquet"):
+            if path not in files.files:
+                path.unlink()
+
+
+def compression_codec(compression: str) -> str | None:
+    """Map a compression name to the codec pyarrow expects ('none' -> None)."""
+    return None if compression.lower() == "none" else compression
+
+
 def write_df(
-    df: pl.DataFrame,
+    df: pl.DataFrame | Iterable[Chunk],
     dataset: str,
     base_path: str | Path,
     partitions: list[str] | None = None,
     max_rows_per_file: int = 1_000_000,
     compression: str = "snappy",
+    max_bytes_per_file: int = DEFAULT_MAX_BYTES_PER_FILE,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
 ) -> Path:
     """
     Write a Polars DataFrame to a Parquet dataset with optional partitioning.
 
+    Rows are streamed through ``ParquetDatasetWriter``: files are split at
+    ``max_rows_per_file`` rows or about ``max_bytes_per_file`` bytes, and file
+    names are deterministic, so re-running a write replaces the partitions it
+    writes instead of adding files to them.
+
     Args:
-        df: Polars DataFrame to write
+        df: Polars DataFrame to write, or an iterable of DataFrames / Arrow
+            tables / record batches sharing one schema (never fully in memory)
         dataset: Dataset name (e.g., 'raw', 'normalized', 'features')
         base_path: Base path for the data lake (e.g., 'data/lake')
         partitions: List of column names to partition by (e.g., ['year', 'month', 'day'])
         max_rows_per_file: Maximum rows per file (for splitting large datasets)
         compression: Compression codec ('snappy', 'gzip', 'zstd', 'none')
+        max_bytes_per_file: Approximate maximum bytes per file (uncompressed estimate)
+        row_group_size: Rows per row group
 
     Returns:
         Path to the written dataset directory
@@ -50,32 +310,29 @@ def write_df(
         "Writing DataFrame to Parquet dataset",
         dataset=dataset,
         path=str(dataset_path),
-        rows=len(df),
+        rows=len(df) if isinstance(df, pl.DataFrame) else None,
         partitions=partitions,
     )
 
-    # Convert Polars DataFrame to PyArrow Table
-    arrow_table = df.to_arrow()
-
-    # Write with partitioning if specified
-    if partitions:
-        pq.write_to_dataset(
-            arrow_table,
-            root_path=str(dataset_path),
-            partition_cols=partitions,
-            compression=compression,
-            existing_data_behavior="overwrite_or_ignore",
-        )
-    else:
-        # Write as a single file
-        output_file = dataset_path / "data.parquet"
-        pq.write_table(
-            arrow_table,
-            output_file,
-            compression=compression,
-        )
+    chunks = [df] if isinstance(df, pl.DataFrame) else df
+    with ParquetDatasetWriter(
+        dataset_path,
+        partitions=partitions,
+        max_rows_per_file=max_rows_per_file,
+        max_bytes_per_file=max_bytes_per_file,
+        row_group_size=row_group_size,
+        compression=compression,
+    ) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+        files = writer.close()
 
-    logger.info("Successfully wrote Parquet dataset", path=str(dataset_path))
+    logger.info(
+        "Successfully wrote Parquet dataset",
+        path=str(dataset_path),
+        rows=writer.rows_written,
+        files=len(files),
+    )
     return dataset_path
 
 
@@ -90,6 +347,7 @@ def write_df_safe(
     compression: str = "snappy",
     fail_on_validation_errors: bool = True,
     quarantine_dir: str | Path | None = None,
+    state_path: str | Path | None = None,
 ) -> Path:
     """
     Write a Polars DataFrame to Parquet with validation before writing.
@@ -109,6 +367,8 @@ def write_df_safe(
         compression: Compression codec ('snappy', 'gzip', 'zstd', 'none')
         fail_on_validation_errors: If True, raise error on validation failures
         quarantine_dir: Directory to write quarantined failed records (optional)
+        state_path: Per-symbol last known state file (optional); price rules
+            compare the frame with it and it is updated after the write
 
     Returns:
         Path to the written dataset directory
@@ -131,11 +391,13 @@ def write_df_safe(
         rows=len(df),
     )
 
-    # Initialize validator
-    validator = ParquetValidator(schema_dir=Path(schema_dir))
+    # Borrow the shared validator (schemas are loaded and compiled once per process)
+    validator = validator_registry.get(schema_dir)
+
+    state = SymbolStateStore(Path(state_path)) if state_path else None
 
     # Validate DataFrame
-    result = validator.validate_dataframe(df, schema_name)
+    result = validator.validate_dataframe(df, schema_name, state=state)
 
     # Log validation results
     logger.info(
@@ -144,6 +406,7 @@ def write_df_safe(
         total_rows=result.total_rows,
         valid_rows=result.valid_rows,
         critical_failures=result.critical_failures,
+        warnings=result.warnings,
     )
 
     # Handle validation failures
@@ -181,6 +444,9 @@ def write_df_safe(
         compression=compression,
     )
 
+    if state is not None:
+        state.update(df)
+
     logger.info(
         "Validated write complete",
         dataset=dataset,
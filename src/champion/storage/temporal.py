@@ -0,0 +1,123 @@
+"""Native conversion of temporal columns to warehouse primitives.
+
+The Parquet JSON schemas (and the ClickHouse tables loaded from them) store
+timestamps as integer milliseconds since the Unix epoch and dates as integer
+days since the epoch. Writers used to convert with per-row Python UDFs; the
+expressions here do the same conversion as native Polars casts, so they run
+in parallel and also work inside lazy/streaming plans.
+
+Conversion rules, by input dtype:
+
+- Timestamps (``epoch_ms_expr``): ``Datetime`` -> ``dt.epoch("ms")``
+  (naive values are taken as UTC), ``Date`` -> midnight UTC, integers and
+  floats are assumed to already be epoch-ms, strings are parsed as ISO 8601.
+- Dates (``days_since_epoch_expr``): ``Date``/``Datetime`` -> day number,
+  integers above ``YYYYMMDD_THRESHOLD`` are read as ``YYYYMMDD`` and smaller
+  ones are assumed to already be day numbers, strings are parsed as
+  ``YYYYMMDD`` or ``YYYY-MM-DD``.
+
+Values that cannot be converted become null.
+"""
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+import polars as pl
+
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# Envelope timestamps stored as epoch milliseconds
+EPOCH_MS_COLUMNS = ("event_time", "ingest_time")
+
+# Date columns stored as days since epoch
+EPOCH_DAY_COLUMNS = ("trade_date", "TradDt", "adjustment_date")
+
+# Integers above this are YYYYMMDD dates rather than day numbers
+YYYYMMDD_THRESHOLD = 10_000_000
+
+# String layouts accepted for date columns
+DATE_STRING_FORMATS = ("%Y%m%d", "%Y-%m-%d")
+
+
+def epoch_ms_expr(column: str, dtype: pl.DataType) -> pl.Expr:
+    """Build an expression converting a column to epoch milliseconds.
+
+    Args:
+        column: Column name
+        dtype: Current dtype of the column
+
+    Returns:
+        Int64 expression aliased to ``column``
+    """
+    col = pl.col(column)
+    if dtype == pl.Datetime:
+        result = col.dt.epoch("ms")
+    elif dtype == pl.Date:
+        result = col.cast(pl.Datetime("ms")).dt.epoch("ms")
+    elif dtype.is_numeric():
+        result = col
+    elif dtype == pl.Utf8:
+        result = col.str.to_datetime(time_unit="ms", strict=False).dt.epoch("ms")
+    else:
+        result = pl.lit(None)
+    return result.cast(pl.Int64, strict=False).alias(column)
+
+
+def days_since_epoch_expr(column: str, dtype: pl.DataType) -> pl.Expr:
+    """Build an expression converting a column to days since the epoch.
+
+    Args:
+        column: Column name
+        dtype: Current dtype of the column
+
+    Returns:
+        Int64 expression aliased to ``column``
+    """
+    col = pl.col(column)
+    if dtype == pl.Date:
+        result = col.cast(pl.Int32)
+    elif dtype == pl.Datetime:
+        result = col.cast(pl.Date).cast(pl.Int32)
+    elif dtype.is_integer():
+        yyyymmdd = col.cast(pl.Utf8).str.strptime(pl.Date, "%Y%m%d", strict=False)
+        result = (
+            pl.when(col > YYYYMMDD_THRESHOLD)
+            .then(yyyymmdd.cast(pl.Int32))
+            .otherwise(col.cast(pl.Int32, strict=False))
+        )
+    elif dtype == pl.Utf8:
+        result = pl.coalesce(
+            [col.str.strptime(pl.Date, fmt, strict=False) for fmt in DATE_STRING_FORMATS]
+        ).cast(pl.Int32)
+    else:
+        result = pl.lit(None)
+    return result.cast(pl.Int64).alias(column)
+
+
+def to_warehouse_primitives(
+    df: FrameT,
+    epoch_ms_columns: Sequence[str] = EPOCH_MS_COLUMNS,
+    epoch_day_columns: Sequence[str] = EPOCH_DAY_COLUMNS,
+) -> FrameT:
+    """Convert temporal columns to the integer encodings used in the lake.
+
+    Columns missing from the frame are skipped, so the defaults can be used for
+    any dataset carrying the standard event envelope.
+
+    Args:
+        df: DataFrame or LazyFrame to convert
+        epoch_ms_columns: Columns to store as milliseconds since epoch
+        epoch_day_columns: Columns to store as days since epoch
+
+    Returns:
+        Frame of the same kind with converted columns
+
+    Example:
+        >>> df = pl.DataFrame({"event_time": [datetime(2024, 1, 2)], "trade_date": [20240102]})
+        >>> to_warehouse_primitives(df).row(0)
+        (1704153600000, 19724)
+    """
+    schema = df.schema
+    exprs = [epoch_ms_expr(c, schema[c]) for c in epoch_ms_columns if c in schema]
+    exprs += [days_since_epoch_expr(c, schema[c]) for c in epoch_day_columns if c in schema]
+    return df.with_columns(exprs) if exprs else df
@@ -70,6 +70,29 @@ flow_duration = Histogram(
     ["flow_name", "status"],
 )
 
+# Parse cache metrics
+parse_cache_hits = Counter(
+    "champion_parse_cache_hits_total",
+    "Total number of parse cache hits",
+    ["parser"],
+)
+
+parse_cache_misses = Counter(
+    "champion_parse_cache_misses_total",
+    "Total number of parse cache misses",
+    ["parser"],
+)
+
+parse_cache_evictions = Counter(
+    "champion_parse_cache_evictions_total",
+    "Total number of parse cache entries evicted",
+)
+
+parse_cache_size_bytes = Gauge(
+    "champion_parse_cache_size_bytes",
+    "Current total size of the parse cache in bytes",
+)
+
 # Circuit breaker metrics
 circuit_breaker_state = Gauge(
     "circuit_breaker_state",
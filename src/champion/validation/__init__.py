@@ -22,7 +22,9 @@ All validators implement champion.core.Validator interface.
 - Daily validation reports with trend analysis
 """
 
+from .registry import ValidatorRegistry, validator_registry
 from .reporting import ValidationReport, ValidationReporter, ValidationTrend
+from .state import SymbolStateStore
 from .validator import ParquetValidator, ValidationResult
 
 __version__ = "2.0.0"
@@ -33,4 +35,7 @@ __all__ = [
     "ValidationReporter",
     "ValidationReport",
     "ValidationTrend",
+    "SymbolStateStore",
+    "ValidatorRegistry",
+    "validator_registry",
 ]
@@ -1,12 +1,19 @@
 """Prefect flow integration for data validation."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import structlog
 from prefect import flow, task
 from prefect.blocks.notifications import SlackWebhook
 
-from champion.validation.validator import ParquetValidator, ValidationResult
+from champion.validation.ledger import ValidationLedger
+from champion.validation.quarantine import QuarantineStore
+from champion.validation.registry import validator_registry
+from champion.validation.validator import ValidationResult
 
 logger = structlog.get_logger()
 
@@ -17,6 +24,9 @@ def validate_parquet_file(
     schema_name: str,
     schema_dir: str,
     quarantine_dir: str | None = None,
+    streaming: bool = False,
+    ledger_path: str | None = None,
+    force: bool = False,
 ) -> ValidationResult:
     """Validate a Parquet file against a JSON schema.
 
@@ -25,6 +35,9 @@ def validate_parquet_file(
         schema_name: Name of the schema to validate against
         schema_dir: Directory containing JSON schema files
         quarantine_dir: Directory to write quarantined records (optional)
+        streaming: Validate row group by row group with bounded memory
+        ledger_path: SQLite validation ledger; unchanged files are skipped (optional)
+        force: Validate even if the ledger has a result for the file
 
     Returns:
         ValidationResult with validation statistics
@@ -38,12 +51,15 @@ def validate_parquet_file(
         schema_name=schema_name,
     )
 
-    validator = ParquetValidator(schema_dir=Path(schema_dir))
+    validator = validator_registry.get(schema_dir)
 
     result = validator.validate_file(
         file_path=Path(file_path),
         schema_name=schema_name,
         quarantine_dir=Path(quarantine_dir) if quarantine_dir else None,
+        streaming=streaming,
+        ledger=ValidationLedger(Path(ledger_path)) if ledger_path else None,
+        force=force,
     )
 
     logger.info(
@@ -152,6 +168,55 @@ async def send_validation_alert(
 
     logger.warning("sending_validation_alert", message=message)
 
+    await _notify_slack(message, slack_webhook_block)
+
+
+@task(name="send-batch-validation-alert")
+async def send_batch_validation_alert(
+    results: list[ValidationResult],
+    file_paths: list[str],
+    schema_name: str,
+    slack_webhook_block: str | None = None,
+) -> None:
+    """Send one summary alert for all files of a batch with validation failures.
+
+    Args:
+        results: Validation results, one per file
+        file_paths: Paths of the validated files, in the same order
+        schema_name: Schema name used for validation
+        slack_webhook_block: Name of Prefect Slack webhook block (optional)
+    """
+    failed = [
+        (file_path, result)
+        for file_path, result in zip(file_paths, results, strict=True)
+        if result.critical_failures > 0
+    ]
+    if not failed:
+        return
+
+    total_rows = sum(r.total_rows for r in results)
+    total_failures = sum(r.critical_failures for r in results)
+    message = (
+        f"⚠️ *Batch Data Validation Alert*\n\n"
+        f"Schema: `{schema_name}`\n"
+        f"Files with failures: {len(failed)} of {len(results)}\n"
+        f"Total rows: {total_rows}\n"
+        f"Critical failures: {total_failures}\n\n"
+        f"Failed files:\n"
+    )
+    for file_path, result in failed:
+        message += (
+            f"- `{file_path}`: {result.critical_failures} critical failures "
+            f"({result.critical_failures / result.total_rows:.2%})\n"
+        )
+
+    logger.warning("sending_batch_validation_alert", failed_files=len(failed), message=message)
+
+    await _notify_slack(message, slack_webhook_block)
+
+
+async def _notify_slack(message: str, slack_webhook_block: str | None) -> None:
+    """Send a message through a Prefect Slack webhook block, if configured."""
     if slack_webhook_block:
         try:
             slack = await SlackWebhook.load(slack_webhook_block)
@@ -176,6 +241,9 @@ async def validate_parquet_dataset(
     fail_on_errors: bool = True,
     max_failure_rate: float = 0.05,
     slack_webhook_block: str | None = None,
+    streaming: bool = False,
+    ledger_path: str | None = None,
+    force: bool = False,
 ) -> ValidationResult:
     """Prefect flow for validating Parquet datasets.
 
@@ -193,6 +261,10 @@ async def validate_parquet_dataset(
         fail_on_errors: If True, fail flow on any critical errors
         max_failure_rate: Maximum acceptable failure rate (0.0-1.0)
         slack_webhook_block: Name of Prefect Slack webhook block (optional)
+        streaming: Validate row group by row group so memory tracks the row-group
+            size rather than the file size (for full-history files)
+        ledger_path: SQLite validation ledger; unchanged files are skipped (optional)
+        force: Validate even if the ledger has a result for the file
 
     Returns:
         ValidationResult with validation statistics
@@ -212,6 +284,9 @@ async def validate_parquet_dataset(
         schema_name=schema_name,
         schema_dir=schema_dir,
         quarantine_dir=quarantine_dir,
+        streaming=streaming,
+        ledger_path=ledger_path,
+        force=force,
     )
 
     # Step 2: Check validation result
@@ -249,8 +324,17 @@ async def validate_parquet_batch(
     fail_on_errors: bool = True,
     max_failure_rate: float = 0.05,
     slack_webhook_block: str | None = None,
+    streaming: bool = False,
+    max_workers: int | None = None,
+    ledger_path: str | None = None,
+    force: bool = False,
 ) -> list[ValidationResult]:
-    """Validate multiple Parquet files in batch.
+    """Validate multiple Parquet files concurrently.
+
+    Files are validated on a dedicated pool of ``max_workers`` threads
+    (Polars releases the GIL, so validations run in parallel across cores).
+    Every file is validated before results are checked, and failures are
+    reported in a single summary alert rather than one alert per file.
 
     Args:
         file_paths: List of paths to Parquet files to validate
@@ -260,28 +344,66 @@ async def validate_parquet_batch(
         fail_on_errors: If True, fail flow on any critical errors
         max_failure_rate: Maximum acceptable failure rate (0.0-1.0)
         slack_webhook_block: Name of Prefect Slack webhook block (optional)
+        streaming: Validate each file row group by row group
+        max_workers: Files validated concurrently (default: CPU count)
+        ledger_path: SQLite validation ledger; unchanged files are skipped (optional)
+        force: Validate even if the ledger has a result for the file
 
     Returns:
-        List of ValidationResult objects, one per file
+        List of ValidationResult objects, one per file, in input order
+
+    Raises:
+        ValueError: If any file fails the validation checks
     """
+    workers = max_workers or os.cpu_count() or 1
     logger.info(
         "starting_batch_validation",
         file_count=len(file_paths),
         schema_name=schema_name,
+        max_workers=workers,
     )
 
-    results = []
-    for file_path in file_paths:
-        result = await validate_parquet_dataset(
-            file_path=file_path,
-            schema_name=schema_name,
-            schema_dir=schema_dir,
-            quarantine_dir=quarantine_dir,
-            fail_on_errors=fail_on_errors,
-            max_failure_rate=max_failure_rate,
-            slack_webhook_block=slack_webhook_block,
+    validate_one = partial(
+        validate_parquet_file.fn,
+        schema_name=schema_name,
+        schema_dir=schema_dir,
+        quarantine_dir=quarantine_dir,
+        streaming=streaming,
+        ledger_path=ledger_path,
+        force=force,
+    )
+
+    # A pool of its own: asyncio.to_thread shares the loop's default executor,
+    # which is capped at min(32, CPU count + 4) threads and used by other tasks
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as executor:
+        # gather preserves input order
+        results = list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, partial(validate_one, file_path=path))
+                    for path in file_paths
+                )
+            )
         )
-        results.append(result)
+
+    check_failures = []
+    for file_path, result in zip(file_paths, results, strict=True):
+        try:
+            check_validation_result(
+                result=result,
+                fail_on_errors=fail_on_errors,
+                max_failure_rate=max_failure_rate,
+            )
+        except ValueError as e:
+            check_failures.append(f"{file_path}: {e}")
+
+    await send_batch_validation_alert(
+        results=results,
+        file_paths=file_paths,
+        schema_name=schema_name,
+        slack_webhook_block=slack_webhook_block,
+    )
 
     total_rows = sum(r.total_rows for r in results)
     total_failures = sum(r.critical_failures for r in results)
@@ -289,8 +411,37 @@ async def validate_parquet_batch(
     logger.info(
         "batch_validation_complete",
         file_count=len(file_paths),
+        failed_files=len(check_failures),
         total_rows=total_rows,
         total_failures=total_failures,
     )
 
+    if check_failures:
+        raise ValueError(
+            f"Validation failed for {len(check_failures)} of {len(file_paths)} files:\n"
+            + "\n".join(check_failures)
+        )
+
     return results
+
+
+@flow(name="compact-quarantine-store")
+def compact_quarantine_store(
+    quarantine_dir: str = "./data/lake/quarantine",
+    min_files: int = 2,
+) -> int:
+    """Merge the small part files of each quarantine partition.
+
+    Quarantine runs each add a records and an audit part file; run this flow
+    periodically (e.g. daily) so reports over long histories open few files.
+
+    Args:
+        quarantine_dir: Directory of the quarantine store
+        min_files: Partitions with fewer part files are left alone
+
+    Returns:
+        Number of part files merged
+    """
+    merged = QuarantineStore(Path(quarantine_dir)).compact(min_files=min_files)
+    logger.info("quarantine_store_compacted", quarantine_dir=quarantine_dir, files_merged=merged)
+    return merged
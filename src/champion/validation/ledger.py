@@ -0,0 +1,246 @@
+"""Validation ledger for incremental revalidation.
+
+Revalidating the lake after every schema or rule change used to re-read every
+partition, even those whose bytes, schema and rules were unchanged. The
+``ValidationLedger`` is a small local SQLite table recording the summary of
+each validation under a ``LedgerKey``:
+
+- SHA-256 of the Parquet file contents
+- SHA-256 of the canonical JSON schema
+- rule-set version (``RULES_VERSION`` plus the validator's rule settings)
+- names of the registered custom validators
+
+``ParquetValidator.validate_file`` returns the recorded summary instead of
+validating when the key is already in the ledger. Recorded summaries keep the
+counts, rule counts and sampled errors, but not the full violations table, so
+the ledger also records where failures were quarantined: a file with failures
+is only skipped if it was quarantined to the requested directory.
+
+Example:
+    >>> ledger = ValidationLedger(Path("data/validation/ledger.sqlite"))
+    >>> validator.validate_file(path, "normalized_equity_ohlc", ledger=ledger)  # validates
+    >>> validator.validate_file(path, "normalized_equity_ohlc", ledger=ledger)  # skipped
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from champion.validation.validator import ValidationResult
+
+logger = structlog.get_logger()
+
+DEFAULT_LEDGER_PATH = Path("data/validation/ledger.sqlite")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS validations (
+    file_hash TEXT NOT NULL,
+    schema_hash TEXT NOT NULL,
+    rules_version TEXT NOT NULL,
+    custom_validators TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    schema_name TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    total_rows INTEGER NOT NULL,
+    valid_rows INTEGER NOT NULL,
+    critical_failures INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    rules_applied TEXT NOT NULL,
+    rule_counts TEXT NOT NULL,
+    error_details TEXT NOT NULL,
+    validation_timestamp TEXT NOT NULL,
+    quarantine_dir TEXT,
+    PRIMARY KEY (file_hash, schema_hash, rules_version, custom_validators)
+)
+"""
+
+_COLUMNS = (
+    "file_hash",
+    "schema_hash",
+    "rules_version",
+    "custom_validators",
+    "file_path",
+    "schema_name",
+    "recorded_at",
+    "total_rows",
+    "valid_rows",
+    "critical_failures",
+    "warnings",
+    "rules_applied",
+    "rule_counts",
+    "error_details",
+    "validation_timestamp",
+    "quarantine_dir",
+)
+
+
+@dataclass(frozen=True)
+class LedgerKey:
+    """Inputs that determine a file's validation result.
+
+    Attributes:
+        file_hash: SHA-256 of the Parquet file contents
+        schema_hash: SHA-256 of the canonical JSON schema
+        rules_version: Business rule-set version and settings
+        custom_validators: Sorted, comma-separated custom validator names
+    """
+
+    file_hash: str
+    schema_hash: str
+    rules_version: str
+    custom_validators: str
+
+
+class ValidationLedger:
+    """SQLite table of validation summaries keyed by ``LedgerKey``.
+
+    Safe to share across threads and processes; each operation uses its own
+    connection.
+
+    Attributes:
+        db_path: SQLite database file
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_LEDGER_PATH) -> None:
+        """Initialize the ledger, creating the database if missing.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_CREATE_TABLE)
+            # Ledgers created before quarantine_dir was recorded
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(validations)")}
+            if "quarantine_dir" not in existing:
+                conn.execute("ALTER TABLE validations ADD COLUMN quarantine_dir TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(
+        self,
+        key: LedgerKey,
+        since: datetime | None = None,
+        quarantine_dir: Path | None = None,
+    ) -> "ValidationResult | None":
+        """Return the recorded result for a key.
+
+        Args:
+            key: Ledger key of the file
+            since: Ignore entries recorded before this time
+            quarantine_dir: Ignore entries with failures that were not
+                quarantined to this directory
+
+        Returns:
+            Recorded ValidationResult, or None if the key is not in the ledger
+        """
+        query = (
+            f"SELECT {', '.join(_COLUMNS)} FROM validations "
+            "WHERE file_hash = ? AND schema_hash = ? AND rules_version = ? "
+            "AND custom_validators = ?"
+        )
+        params: list[str] = [
+            key.file_hash,
+            key.schema_hash,
+            key.rules_version,
+            key.custom_validators,
+        ]
+        if since is not None:
+            query += " AND recorded_at >= ?"
+            params.append(since.isoformat())
+        if quarantine_dir is not None:
+            query += " AND (critical_failures = 0 OR quarantine_dir = ?)"
+            params.append(_dir_key(quarantine_dir))
+
+        with self._connect() as conn:
+            row = conn.execute(query, params).fetchone()
+        if row is None:
+            return None
+
+        # Imported here: validator.py imports this module
+        from champion.validation.validator import ValidationResult
+
+        entry = dict(zip(_COLUMNS, row, strict=True))
+        return ValidationResult(
+            total_rows=entry["total_rows"],
+            valid_rows=entry["valid_rows"],
+            critical_failures=entry["critical_failures"],
+            warnings=entry["warnings"],
+            error_details=json.loads(entry["error_details"]),
+            validation_rules_applied=json.loads(entry["rules_applied"]),
+            validation_timestamp=entry["validation_timestamp"],
+            rule_counts=json.loads(entry["rule_counts"]),
+        )
+
+    def record(
+        self,
+        key: LedgerKey,
+        file_path: Path,
+        schema_name: str,
+        result: "ValidationResult",
+        quarantine_dir: Path | None = None,
+    ) -> None:
+        """Record (or replace) the result for a key.
+
+        Args:
+            key: Ledger key of the file
+            file_path: Path of the validated file
+            schema_name: Schema the file was validated against
+            result: Validation result to record
+            quarantine_dir: Directory the failures were quarantined to, if any
+        """
+        values = (
+            key.file_hash,
+            key.schema_hash,
+            key.rules_version,
+            key.custom_validators,
+            str(file_path),
+            schema_name,
+            datetime.now().isoformat(),
+            result.total_rows,
+            result.valid_rows,
+            result.critical_failures,
+            result.warnings,
+            json.dumps(result.validation_rules_applied),
+            json.dumps(result.rule_counts),
+            # Records may hold dates and other non-JSON values
+            json.dumps(result.error_details, default=str),
+            result.validation_timestamp,
+            _dir_key(quarantine_dir) if quarantine_dir is not None else None,
+        )
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO validations ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                values,
+            )
+
+        logger.info(
+            "recorded_validation",
+            file_path=str(file_path),
+            schema_name=schema_name,
+            critical_failures=result.critical_failures,
+            quarantine_dir=str(quarantine_dir) if quarantine_dir is not None else None,
+        )
+
+
+def _dir_key(directory: Path) -> str:
+    """Normalize a directory so equivalent paths match in the ledger."""
+    return str(Path(directory).resolve())
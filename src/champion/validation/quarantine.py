@@ -0,0 +1,334 @@
+"""Date-partitioned Parquet store for quarantined records and their audit log.
+
+Quarantine runs used to write one top-level ``{schema}_failures_{timestamp}.parquet``
+each and append JSON lines to ``audit_log.jsonl``, which reports then had to
+parse in full. ``QuarantineStore`` lays both out as Parquet datasets
+partitioned by day::
+
+    <root>/records/schema_name=<schema>/date=<YYYY-MM-DD>/part-*.parquet
+    <root>/audit/date=<YYYY-MM-DD>/part-*.parquet
+
+Record files do not repeat the ``schema_name`` partition key, so both datasets
+also read as plain Hive-partitioned Parquet (e.g. ``pl.scan_parquet(root /
+"records" / "**" / "*.parquet")``); ``scan_records`` adds ``schema_name`` back
+as a column. Readers select partition directories by date before scanning and
+the remaining filters are pushed down into ``scan_parquet``, so queries over a
+few days read only those days however long the history is. Each run adds
+small part files; ``compact`` merges them per partition and migrates a
+legacy ``audit_log.jsonl`` into the audit dataset.
+"""
+
+import json
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import structlog
+
+logger = structlog.get_logger()
+
+RECORDS_DIR = "records"
+AUDIT_DIR = "audit"
+LEGACY_AUDIT_LOG = "audit_log.jsonl"
+
+# Partition key of the records dataset, kept out of the record files
+SCHEMA_PARTITION_KEY = "schema_name"
+
+# One row per quarantine run; rule_counts is a JSON object of rule -> errors
+AUDIT_SCHEMA = {
+    "timestamp": pl.Utf8,
+    "schema_name": pl.Utf8,
+    "quarantine_file": pl.Utf8,
+    "failed_rows": pl.Int64,
+    "total_rows": pl.Int64,
+    "rules_applied": pl.List(pl.Utf8),
+    "rule_counts": pl.Utf8,
+    "failure_rate": pl.Float64,
+}
+
+
+def read_legacy_audit_log(path: Path) -> pl.DataFrame:
+    """Read a JSON-lines audit log written before the Parquet store.
+
+    Args:
+        path: ``audit_log.jsonl`` file
+
+    Returns:
+        Entries in ``AUDIT_SCHEMA`` (invalid lines are skipped)
+    """
+    entries = []
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line.strip())
+                datetime.fromisoformat(entry["timestamp"])
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.warning("invalid_audit_entry", error=str(e), line=line[:100])
+                continue
+            entries.append(
+                {
+                    "timestamp": entry["timestamp"],
+                    "schema_name": entry.get("schema_name"),
+                    "quarantine_file": entry.get("quarantine_file"),
+                    "failed_rows": entry.get("failed_rows", 0),
+                    "total_rows": entry.get("total_rows", 0),
+                    "rules_applied": entry.get("rules_applied", []),
+                    "rule_counts": json.dumps(entry.get("rule_counts", {})),
+                    "failure_rate": float(entry.get("failure_rate", 0.0)),
+                }
+            )
+    return pl.DataFrame(entries, schema=AUDIT_SCHEMA)
+
+
+class QuarantineStore:
+    """Date-partitioned Parquet datasets of quarantined records and audit entries.
+
+    Attributes:
+        root: Quarantine directory
+    """
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Quarantine directory (created on first write)
+        """
+        self.root = Path(root)
+
+    @property
+    def legacy_audit_log(self) -> Path:
+        """JSON-lines audit log written before the Parquet store."""
+        return self.root / LEGACY_AUDIT_LOG
+
+    def write(
+        self,
+        records: pl.DataFrame,
+        schema_name: str,
+        audit_entry: dict[str, Any],
+        timestamp: datetime | None = None,
+    ) -> Path:
+        """Write one run's quarantined records and its audit entry.
+
+        Args:
+            records: Failed rows with their validation error columns; a
+                ``schema_name`` column is dropped, as it is the partition key
+            schema_name: Schema the rows failed
+            audit_entry: Audit fields other than ``timestamp`` and ``quarantine_file``
+            timestamp: Time of the run (default: now); selects the partitions
+
+        Returns:
+            Path of the written records file
+        """
+        timestamp = timestamp or datetime.now()
+        part = f"part-{timestamp:%H%M%S_%f}-{uuid.uuid4().hex[:8]}.parquet"
+        day = f"date={timestamp:%Y-%m-%d}"
+
+        records_file = (
+            self.root / RECORDS_DIR / f"{SCHEMA_PARTITION_KEY}={schema_name}" / day / part
+        )
+        records_file.parent.mkdir(parents=True, exist_ok=True)
+        records.drop(_partition_key_columns(records.columns)).write_parquet(records_file)
+
+        audit = pl.DataFrame(
+            [
+                {
+                    **audit_entry,
+                    "timestamp": timestamp.isoformat(),
+                    "schema_name": schema_name,
+                    "quarantine_file": str(records_file.relative_to(self.root)),
+                    "rule_counts": json.dumps(audit_entry.get("rule_counts", {})),
+                }
+            ],
+            schema=AUDIT_SCHEMA,
+        )
+        audit_file = self.root / AUDIT_DIR / day / part
+        audit_file.parent.mkdir(parents=True, exist_ok=True)
+        audit.write_parquet(audit_file)
+
+        return records_file
+
+    def scan_records(
+        self,
+        schema_name: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> pl.LazyFrame:
+        """Lazily scan the quarantined records of a schema.
+
+        Args:
+            schema_name: Schema whose records to scan
+            start: First day to include (default: all history)
+            end: Last day to include (default: all history)
+
+        Returns:
+            LazyFrame over the records of the selected days, with a
+            ``schema_name`` column
+        """
+        files = self._partition_files(
+            self.root / RECORDS_DIR / f"{SCHEMA_PARTITION_KEY}={schema_name}", start, end
+        )
+        if not files:
+            return pl.LazyFrame()
+        return pl.concat(
+            [
+                pl.scan_parquet(f, hive_partitioning=False).with_columns(
+                    pl.lit(schema_name).alias(SCHEMA_PARTITION_KEY)
+                )
+                for f in files
+            ],
+            how="diagonal_relaxed",
+        )
+
+    def scan_audit(self, start: date | None = None, end: date | None = None) -> pl.LazyFrame:
+        """Lazily scan audit entries, including a not yet migrated legacy log.
+
+        Args:
+            start: First day to include (default: all history)
+            end: Last day to include (default: all history)
+
+        Returns:
+            LazyFrame in ``AUDIT_SCHEMA`` over the entries of the selected days
+        """
+        files = self._partition_files(self.root / AUDIT_DIR, start, end)
+        frames = (
+            [pl.scan_parquet(files, hive_partitioning=False)]
+            if files
+            else [pl.LazyFrame(schema=AUDIT_SCHEMA)]
+        )
+        if self.legacy_audit_log.exists():
+            legacy = read_legacy_audit_log(self.legacy_audit_log).lazy()
+            day = pl.col("timestamp").str.slice(0, 10)
+            if start is not None:
+                legacy = legacy.filter(day >= start.isoformat())
+            if end is not None:
+                legacy = legacy.filter(day <= end.isoformat())
+            frames.append(legacy)
+        return pl.concat(frames)
+
+    def compact(self, min_files: int = 2) -> int:
+        """Merge each partition's part files into one file.
+
+        Also migrates a legacy ``audit_log.jsonl`` into the audit dataset and
+        drops the ``schema_name`` column that older record files stored.
+        Record partitions are compacted first; audit entries whose
+        ``quarantine_file`` names a merged part file are rewritten to name the
+        compacted file (their audit partition is rewritten even if it has fewer
+        than ``min_files`` files).
+
+        Args:
+            min_files: Partitions with fewer part files are left alone
+
+        Returns:
+            Number of part files merged or rewritten
+        """
+        self._migrate_legacy_audit_log()
+
+        min_files = max(min_files, 2)
+        partitions = sorted({f.parent for f in self.root.glob("*/**/date=*/[!_]*.parquet")})
+        records_root = self.root / RECORDS_DIR
+
+        merged = 0
+        renamed: dict[str, str] = {}
+        for partition in [p for p in partitions if p.is_relative_to(records_root)]:
+            files = sorted(partition.glob("[!_]*.parquet"))
+            if len(files) < min_files:
+                continue
+            compacted = self._rewrite_partition(
+                partition, files, lambda df: df.drop(_partition_key_columns(df.columns))
+            )
+            renamed.update(
+                {
+                    str(f.relative_to(self.root)): str(compacted.relative_to(self.root))
+                    for f in files
+                }
+            )
+            merged += len(files)
+
+        # Audit entries are written to the same day as their records file
+        renamed_days = {Path(path).parent.name for path in renamed}
+        for partition in [p for p in partitions if not p.is_relative_to(records_root)]:
+            files = sorted(partition.glob("[!_]*.parquet"))
+            if len(files) < min_files and partition.name not in renamed_days:
+                continue
+            self._rewrite_partition(
+                partition,
+                files,
+                lambda df: df.with_columns(pl.col("quarantine_file").replace(renamed)),
+            )
+            merged += len(files)
+
+        return merged
+
+    def _rewrite_partition(
+        self,
+        partition: Path,
+        files: list[Path],
+        transform: Callable[[pl.DataFrame], pl.DataFrame],
+    ) -> Path:
+        """Replace a partition's part files with one transformed, compacted file.
+
+        Args:
+            partition: Partition directory
+            files: Part files of the partition
+            transform: Applied to the combined rows before writing
+
+        Returns:
+            Path of the compacted file
+        """
+        combined = transform(
+            pl.concat(
+                [pl.read_parquet(f, hive_partitioning=False) for f in files], how="diagonal_relaxed"
+            )
+        )
+        compacted = partition / f"compacted-{uuid.uuid4().hex[:8]}.parquet"
+        temp_file = partition / f"_{compacted.name}"
+        combined.write_parquet(temp_file)
+        temp_file.rename(compacted)
+        for file in files:
+            file.unlink()
+
+        logger.info(
+            "compacted_quarantine_partition",
+            partition=str(partition.relative_to(self.root)),
+            input_files=len(files),
+            rows=len(combined),
+        )
+        return compacted
+
+    def _migrate_legacy_audit_log(self) -> None:
+        """Move legacy JSON-lines audit entries into the audit dataset."""
+        if not self.legacy_audit_log.exists():
+            return
+
+        legacy = read_legacy_audit_log(self.legacy_audit_log)
+        days = legacy.with_columns(pl.col("timestamp").str.slice(0, 10).alias("__date__"))
+        for part in days.partition_by("__date__", maintain_order=True):
+            partition = self.root / AUDIT_DIR / f"date={part['__date__'][0]}"
+            partition.mkdir(parents=True, exist_ok=True)
+            part.drop("__date__").write_parquet(
+                partition / f"legacy-{uuid.uuid4().hex[:8]}.parquet"
+            )
+
+        self.legacy_audit_log.rename(self.legacy_audit_log.with_suffix(".jsonl.migrated"))
+        logger.info("migrated_legacy_audit_log", entries=len(legacy))
+
+    @staticmethod
+    def _partition_files(dataset: Path, start: date | None, end: date | None) -> list[Path]:
+        """List the part files of the ``date=`` partitions between two days."""
+        files = []
+        for partition in sorted(dataset.glob("date=*")):
+            day = partition.name.removeprefix("date=")
+            if start is not None and day < start.isoformat():
+                continue
+            if end is not None and day > end.isoformat():
+                continue
+            files.extend(sorted(partition.glob("[!_]*.parquet")))
+        return files
+
+
+def _partition_key_columns(columns: list[str]) -> list[str]:
+    """Return the records partition key if it is among ``columns``."""
+    return [col for col in columns if col == SCHEMA_PARTITION_KEY]
@@ -0,0 +1,88 @@
+"""Process-wide registry of schema validators.
+
+Constructing a ``ParquetValidator`` globs and JSON-loads every schema in its
+directory, and each validator compiles its schemas again on first use. Writers
+and flow tasks that validate on every call borrow a shared validator from
+``validator_registry`` instead, so schemas are loaded and compiled once per
+process. Each borrow re-stats the schema files and reloads only the schemas
+whose modification time changed.
+
+Borrowed validators are shared between callers and threads: register custom
+validators on a dedicated ``ParquetValidator`` rather than a borrowed one.
+"""
+
+import threading
+from pathlib import Path
+
+import structlog
+
+from champion.validation.validator import ParquetValidator
+
+logger = structlog.get_logger()
+
+
+class ValidatorRegistry:
+    """Thread-safe cache of ``ParquetValidator`` instances.
+
+    Validators are keyed by resolved schema directory and rule configuration.
+    A single process-wide instance (``validator_registry``) is shared by the
+    storage writers, parsers and validation flows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._validators: dict[tuple, ParquetValidator] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        schema_dir: str | Path,
+        max_price_change_pct: float = 20.0,
+        max_freshness_hours: int = 48,
+        enable_all_rules: bool = True,
+    ) -> ParquetValidator:
+        """Borrow the shared validator for a schema directory.
+
+        Args:
+            schema_dir: Directory containing JSON schema files
+            max_price_change_pct: Maximum allowed price change percentage
+            max_freshness_hours: Maximum hours between event_time and ingest_time
+            enable_all_rules: Enable all business logic rules
+
+        Returns:
+            Shared ParquetValidator with schemas refreshed from disk
+
+        Raises:
+            ValueError: If the schema directory does not exist
+        """
+        key = (
+            Path(schema_dir).resolve(),
+            max_price_change_pct,
+            max_freshness_hours,
+            enable_all_rules,
+        )
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is None:
+                validator = ParquetValidator(
+                    schema_dir=key[0],
+                    max_price_change_pct=max_price_change_pct,
+                    max_freshness_hours=max_freshness_hours,
+                    enable_all_rules=enable_all_rules,
+                )
+                self._validators[key] = validator
+                logger.info("registered_validator", schema_dir=str(key[0]))
+                return validator
+
+        reloaded = validator.refresh_schemas()
+        if reloaded:
+            logger.info("reloaded_schemas", schema_dir=str(key[0]), schemas=reloaded)
+        return validator
+
+    def clear(self) -> None:
+        """Drop all cached validators."""
+        with self._lock:
+            self._validators.clear()
+
+
+validator_registry = ValidatorRegistry()
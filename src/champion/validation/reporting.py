@@ -5,17 +5,24 @@ Provides:
 - Trend analysis over time
 - Anomaly detection in validation metrics
 - Historical validation metrics
+
+Audit entries are read from the date-partitioned ``QuarantineStore``; each
+query only scans the partitions of the days it covers.
 """
 
 import json
 from collections import defaultdict
 from dataclasses import dataclass
+from datetime import date as date_type
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import polars as pl
 import structlog
 
+from champion.validation.quarantine import QuarantineStore
+
 logger = structlog.get_logger()
 
 
@@ -56,7 +63,23 @@ class ValidationReporter:
             quarantine_dir: Directory containing quarantine and audit logs
         """
         self.quarantine_dir = Path(quarantine_dir)
-        self.audit_log_file = self.quarantine_dir / "audit_log.jsonl"
+        self.store = QuarantineStore(self.quarantine_dir)
+        # Legacy JSON-lines log, read until QuarantineStore.compact migrates it
+        self.audit_log_file = self.store.legacy_audit_log
+
+    def scan_audit_log(
+        self, start: date_type | None = None, end: date_type | None = None
+    ) -> pl.LazyFrame:
+        """Lazily scan audit entries between two days.
+
+        Args:
+            start: First day to include (default: all history)
+            end: Last day to include (default: all history)
+
+        Returns:
+            LazyFrame of audit entries (see ``quarantine.AUDIT_SCHEMA``)
+        """
+        return self.store.scan_audit(start=start, end=end)
 
     def load_audit_log(self, days: int = 30) -> list[dict[str, Any]]:
         """Load audit log entries from the last N days.
@@ -67,27 +90,33 @@ class ValidationReporter:
         Returns:
             List of audit log entries
         """
-        if not self.audit_log_file.exists():
-            logger.warning("audit_log_not_found", file=str(self.audit_log_file))
-            return []
-
-        entries = []
         cutoff_date = datetime.now() - timedelta(days=days)
-
-        with open(self.audit_log_file) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    entry_date = datetime.fromisoformat(entry["timestamp"])
-                    if entry_date >= cutoff_date:
-                        entries.append(entry)
-                except (json.JSONDecodeError, KeyError, ValueError) as e:
-                    logger.warning("invalid_audit_entry", error=str(e), line=line[:100])
-                    continue
+        entries = self._collect_entries(
+            self.scan_audit_log(start=cutoff_date.date()).filter(
+                pl.col("timestamp") >= cutoff_date.isoformat()
+            )
+        )
 
         logger.info("loaded_audit_log", entries=len(entries), days=days)
         return entries
 
+    def _load_day(self, date: str) -> list[dict[str, Any]]:
+        """Load the audit entries of one day (YYYY-MM-DD)."""
+        day = date_type.fromisoformat(date)
+        return self._collect_entries(
+            self.scan_audit_log(start=day, end=day).filter(
+                pl.col("timestamp").str.starts_with(date)
+            )
+        )
+
+    @staticmethod
+    def _collect_entries(entries: pl.LazyFrame) -> list[dict[str, Any]]:
+        """Collect audit entries as dicts with decoded rule counts."""
+        rows = entries.collect().to_dicts()
+        for row in rows:
+            row["rule_counts"] = json.loads(row["rule_counts"] or "{}")
+        return rows
+
     def generate_daily_report(
         self, date: str | None = None, include_trends: bool = True
     ) -> ValidationReport:
@@ -103,9 +132,8 @@ class ValidationReporter:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        # Load audit log for the day
-        entries = self.load_audit_log(days=1)
-        date_entries = [e for e in entries if e["timestamp"].startswith(date)]
+        # Load audit log for the day (only that day's partition is read)
+        date_entries = self._load_day(date)
 
         if not date_entries:
             logger.warning("no_validation_data", date=date)
@@ -177,8 +205,6 @@ class ValidationReporter:
         if not current_entries:
             return trends
 
-        # Load previous period (same length as current)
-        all_entries = self.load_audit_log(days=60)
         current_date = current_entries[0]["timestamp"][:10]
 
         # Calculate metrics for current period
@@ -190,7 +216,7 @@ class ValidationReporter:
 
         # Find previous period entries (same duration before current period)
         prev_date = (datetime.fromisoformat(current_date) - timedelta(days=1)).strftime("%Y-%m-%d")
-        prev_entries = [e for e in all_entries if e["timestamp"].startswith(prev_date)]
+        prev_entries = self._load_day(prev_date)
 
         if not prev_entries:
             return trends
@@ -283,9 +309,16 @@ class ValidationReporter:
                 anomalies.append(f"High failure rate for schema '{schema}': {schema_rate:.2%}")
 
         # Anomaly 3: Sudden spike in validations
-        historical = self.load_audit_log(days=7)
-        if len(historical) > len(entries):
-            avg_daily = len(historical) / 7
+        cutoff = datetime.now() - timedelta(days=7)
+        historical = (
+            self.scan_audit_log(start=cutoff.date())
+            .filter(pl.col("timestamp") >= cutoff.isoformat())
+            .select(pl.len())
+            .collect()
+            .item()
+        )
+        if historical > len(entries):
+            avg_daily = historical / 7
             if len(entries) > avg_daily * 2:  # More than 2x average
                 anomalies.append(
                     f"Validation volume spike: {len(entries)} (7-day avg: {avg_daily:.0f})"
@@ -422,39 +455,24 @@ class ValidationReporter:
         Returns:
             Dictionary with dates and metrics for charting
         """
-        entries = self.load_audit_log(days=days)
-
-        if not entries:
-            return {"dates": [], "failure_rates": [], "volumes": []}
-
-        # Group by date
-        daily_metrics: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"total_rows": 0, "failed_rows": 0}
-        )
-
-        for entry in entries:
-            date = entry["timestamp"][:10]
-            daily_metrics[date]["total_rows"] += entry["total_rows"]
-            daily_metrics[date]["failed_rows"] += entry["failed_rows"]
-
-        # Sort by date
-        sorted_dates = sorted(daily_metrics.keys())
-
-        dates = []
-        failure_rates = []
-        volumes = []
-
-        for date in sorted_dates:
-            metrics = daily_metrics[date]
-            dates.append(date)
-            volumes.append(metrics["total_rows"])
-            failure_rate = (
-                metrics["failed_rows"] / metrics["total_rows"] if metrics["total_rows"] > 0 else 0.0
+        cutoff = datetime.now() - timedelta(days=days)
+        daily = (
+            self.scan_audit_log(start=cutoff.date())
+            .filter(pl.col("timestamp") >= cutoff.isoformat())
+            .group_by(pl.col("timestamp").str.slice(0, 10).alias("date"))
+            .agg(pl.col("total_rows").sum(), pl.col("failed_rows").sum())
+            .sort("date")
+            .with_columns(
+                pl.when(pl.col("total_rows") > 0)
+                .then(pl.col("failed_rows") / pl.col("total_rows"))
+                .otherwise(0.0)
+                .alias("failure_rate")
             )
-            failure_rates.append(failure_rate)
+            .collect()
+        )
 
         return {
-            "dates": dates,
-            "failure_rates": failure_rates,
-            "volumes": volumes,
+            "dates": daily["date"].to_list(),
+            "failure_rates": daily["failure_rate"].to_list(),
+            "volumes": daily["total_rows"].to_list(),
         }
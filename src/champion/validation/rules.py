@@ -0,0 +1,297 @@
+"""Single-pass business-rule engine.
+
+Each business rule is declared as a boolean Polars expression that is True for
+violating rows. ``RuleEngine`` evaluates every rule in one ``select`` over the
+frame and unpivots the masks into a compact violations table
+(``row_index``, ``rule``, ``field``). Rows are only materialized when error
+details are requested, and then only for violating rows.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import polars as pl
+
+from champion.validation.summary import ErrorSummary
+
+# How violations of a rule are reported as error details:
+# - "row": one error per violating row
+# - "column": one error for the whole rule (first violating row, violation count)
+# - "group": one error per distinct ``group_by`` key among violating rows
+Report = Literal["row", "column", "group"]
+
+ROW_INDEX = "row_index"
+RULE_ID = "rule_id"
+
+
+@dataclass(frozen=True)
+class BusinessRule:
+    """A business rule declared as a vectorized expression.
+
+    Attributes:
+        name: Rule name reported in the violations table
+        field: Field(s) reported for violations (comma separated)
+        fails: Boolean expression, True where a row violates the rule
+        message: Builds the error message from the report context: the violating
+            record for "row" rules, ``{"count": n}`` for "column" rules, and the
+            group key plus ``indices`` for "group" rules
+        error_type: "critical" or "warning"
+        report: How violations are turned into error details
+        group_by: Key columns for "group" rules
+    """
+
+    name: str
+    field: str
+    fails: pl.Expr
+    message: Callable[[dict[str, Any]], str]
+    error_type: str = "critical"
+    report: Report = "row"
+    group_by: tuple[str, ...] = ()
+
+
+class RuleEngine:
+    """Evaluates a set of business rules over a frame in a single pass."""
+
+    def __init__(self, rules: Sequence[BusinessRule]):
+        """Initialize the engine.
+
+        Args:
+            rules: Rules to evaluate, in reporting order
+        """
+        self.rules = list(rules)
+
+    def violations(self, df: pl.DataFrame, row_offset: int = 0) -> pl.DataFrame:
+        """Evaluate all rules in one pass.
+
+        Args:
+            df: Frame to check
+            row_offset: Index of the first row of ``df`` in the full dataset
+
+        Returns:
+            DataFrame with ``row_index``, ``rule`` and ``field`` columns, one row
+            per violation, ordered by rule then row
+        """
+        rule_table = pl.DataFrame(
+            {
+                RULE_ID: list(range(len(self.rules))),
+                "rule": [rule.name for rule in self.rules],
+                "field": [rule.field for rule in self.rules],
+            },
+            schema={RULE_ID: pl.UInt32, "rule": pl.Utf8, "field": pl.Utf8},
+        )
+        return (
+            self._violation_ids(df)
+            .join(rule_table, on=RULE_ID, how="left")
+            .select(
+                (pl.col(ROW_INDEX).cast(pl.Int64) + row_offset).alias(ROW_INDEX), "rule", "field"
+            )
+        )
+
+    def error_details(
+        self, df: pl.DataFrame, row_offset: int = 0, index: pl.Series | None = None
+    ) -> list[dict[str, Any]]:
+        """Evaluate all rules and build error dicts for their violations.
+
+        Args:
+            df: Frame to check
+            row_offset: Index of the first row of ``df`` in the full dataset
+            index: Full-dataset index of every row of ``df`` (overrides
+                ``row_offset`` for frames that are not contiguous slices)
+
+        Returns:
+            Error dicts (``row_index``, ``error_type``, ``field``, ``message``,
+            ``validator``, ``record``) ordered by rule, then row
+        """
+        return [
+            error
+            for rule_errors in self.errors_by_rule(df, row_offset, index)
+            for error in rule_errors
+        ]
+
+    def errors_by_rule(
+        self, df: pl.DataFrame, row_offset: int = 0, index: pl.Series | None = None
+    ) -> list[list[dict[str, Any]]]:
+        """Evaluate all rules and build error dicts, one list per rule.
+
+        Args:
+            df: Frame to check
+            row_offset: Index of the first row of ``df`` in the full dataset
+            index: Full-dataset index of every row of ``df`` (overrides ``row_offset``)
+
+        Returns:
+            Error dicts for each rule, in rule order
+        """
+        errors: list[list[dict[str, Any]]] = [[] for _ in self.rules]
+        violations = self._violation_ids(df)
+        if violations.is_empty():
+            return errors
+
+        # Materialize every violating row once, shared across "row" rules
+        row_rules = [i for i, rule in enumerate(self.rules) if rule.report == "row"]
+        row_positions = (
+            violations.filter(pl.col(RULE_ID).is_in(row_rules))[ROW_INDEX].unique().sort()
+        )
+        records = dict(
+            zip(row_positions.to_list(), df[row_positions.to_list()].to_dicts(), strict=True)
+        )
+
+        by_rule = violations.group_by(RULE_ID, maintain_order=True).agg(pl.col(ROW_INDEX))
+        for rule_id, positions in by_rule.iter_rows():
+            rule = self.rules[rule_id]
+            rows = (
+                index.gather(positions).to_list()
+                if index is not None
+                else [row_offset + pos for pos in positions]
+            )
+
+            if rule.report == "column":
+                errors[rule_id].append(self.summary_error(rule, rows[0], len(rows)))
+            elif rule.report == "group":
+                errors[rule_id].extend(self._group_errors(df, rule, positions, rows))
+            else:
+                for pos, row in zip(positions, rows, strict=True):
+                    record = records[pos]
+                    errors[rule_id].append(self._error(rule, row, rule.message(record), record))
+
+        return errors
+
+    def summarize(
+        self,
+        df: pl.DataFrame,
+        summary: ErrorSummary,
+        row_offset: int = 0,
+        index: pl.Series | None = None,
+    ) -> None:
+        """Evaluate all rules into a compact ``ErrorSummary``.
+
+        Only the rows sampled by ``summary`` are materialized as records; the
+        remaining violations are recorded as row indices.
+
+        Args:
+            df: Frame to check
+            summary: Summary receiving the violations, one rule per business rule
+            row_offset: Index of the first row of ``df`` in the full dataset
+            index: Full-dataset index of every row of ``df`` (overrides ``row_offset``)
+        """
+        violations = self._violation_ids(df)
+        if violations.is_empty():
+            return
+
+        violations = violations.with_columns(
+            (
+                index.gather(violations[ROW_INDEX])
+                if index is not None
+                else pl.col(ROW_INDEX).cast(pl.Int64) + row_offset
+            ).alias("global_index")
+        )
+        for part in violations.partition_by(RULE_ID, maintain_order=True):
+            rule = self.rules[part[RULE_ID][0]]
+            positions = part[ROW_INDEX]
+            rows = part["global_index"]
+
+            if rule.report == "column":
+                summary.add_errors(rule.name, [self.summary_error(rule, rows[0], len(rows))])
+            elif rule.report == "group":
+                summary.add_errors(
+                    rule.name,
+                    self._group_errors(df, rule, positions.to_list(), rows.to_list()),
+                )
+            else:
+                limit = summary.remaining(rule.name)
+                sampled = positions if limit is None else positions.head(limit)
+                records = df[sampled.to_list()].to_dicts() if len(sampled) else []
+                samples = [
+                    self._error(rule, row, rule.message(record), record)
+                    for row, record in zip(rows.head(len(sampled)).to_list(), records, strict=True)
+                ]
+                summary.add(rule.name, rows, samples, rule.error_type)
+
+    def violation_counts(
+        self, df: pl.DataFrame, row_offset: int = 0
+    ) -> list[tuple[int, int] | None]:
+        """Count violations per rule without building error details.
+
+        Args:
+            df: Frame to check
+            row_offset: Index of the first row of ``df`` in the full dataset
+
+        Returns:
+            ``(first_row_index, count)`` per rule in rule order, or None for rules
+            without violations
+        """
+        counts: list[tuple[int, int] | None] = [None] * len(self.rules)
+        summary = (
+            self._violation_ids(df)
+            .group_by(RULE_ID)
+            .agg(pl.col(ROW_INDEX).min().alias("first"), pl.len().alias("count"))
+        )
+        for rule_id, first, count in summary.iter_rows():
+            counts[rule_id] = (row_offset + first, count)
+        return counts
+
+    @classmethod
+    def summary_error(cls, rule: BusinessRule, first_row: int, count: int) -> dict[str, Any]:
+        """Build the single error reported for a "column" rule.
+
+        Args:
+            rule: Rule with ``report="column"``
+            first_row: Index of the first violating row
+            count: Number of violating rows
+
+        Returns:
+            Error dict with an empty record
+        """
+        return cls._error(rule, first_row, rule.message({"count": count}), {})
+
+    def _violation_ids(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Evaluate every rule mask in one select and unpivot the violations.
+
+        Returns:
+            DataFrame with ``row_index`` (position in ``df``) and ``rule_id``
+            columns, ordered by rule then row
+        """
+        empty = pl.DataFrame(schema={ROW_INDEX: pl.UInt32, RULE_ID: pl.UInt32})
+        if not self.rules or df.is_empty():
+            return empty
+
+        masks = df.select(
+            rule.fails.fill_null(False).alias(str(i)) for i, rule in enumerate(self.rules)
+        )
+        return (
+            masks.with_row_index(ROW_INDEX)
+            .melt(id_vars=ROW_INDEX, variable_name=RULE_ID, value_name="failed")
+            .filter(pl.col("failed"))
+            .select(ROW_INDEX, pl.col(RULE_ID).cast(pl.UInt32))
+        )
+
+    def _group_errors(
+        self, df: pl.DataFrame, rule: BusinessRule, positions: list[int], rows: list[int]
+    ) -> list[dict[str, Any]]:
+        """Build one error per distinct key among a rule's violating rows."""
+        keys = list(rule.group_by)
+        groups = (
+            df[positions]
+            .select(keys)
+            .with_columns(pl.Series("indices", rows, dtype=pl.Int64))
+            .group_by(keys, maintain_order=True)
+            .agg(pl.col("indices"))
+        )
+        errors = []
+        for group in groups.iter_rows(named=True):
+            indices = group["indices"]
+            errors.append(self._error(rule, indices[0], rule.message(group), group))
+        return errors
+
+    @staticmethod
+    def _error(
+        rule: BusinessRule, row_index: int, message: str, record: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "row_index": row_index,
+            "error_type": rule.error_type,
+            "field": rule.field,
+            "message": message,
+            "validator": "business_logic",
+            "record": record,
+        }
@@ -0,0 +1,546 @@
+"""Compile JSON schemas into vectorized Polars checks.
+
+``ParquetValidator`` used to convert every batch to dicts and run
+``Draft7Validator.iter_errors`` on each record. ``CompiledSchema`` translates the
+subset of JSON Schema used in ``schemas/parquet/*.json`` (``type``, ``required``,
+``enum``, ``minimum``/``maximum``, ``exclusiveMinimum``/``exclusiveMaximum``,
+``minLength``/``maxLength``, ``pattern`` and ``additionalProperties: false``)
+into boolean Polars expressions evaluated over whole columns. Records are only
+materialized for the rows that fail.
+
+Errors have the same shape, message text and per-row order as the ones produced
+by ``Draft7Validator``. Properties using any other keyword are validated per row
+with ``Draft7Validator`` for that column only; schemas whose top level cannot be
+compiled (e.g. not ``type: object``) fall back to per-row validation entirely.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import polars as pl
+import structlog
+from jsonschema import Draft7Validator
+
+from champion.validation.summary import ErrorSummary
+
+logger = structlog.get_logger()
+
+# Property keywords translated into Polars expressions
+COMPILED_KEYWORDS = {
+    "type",
+    "enum",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "pattern",
+}
+
+# Keywords Draft7Validator accepts but never reports (no format checker is configured)
+NOOP_KEYWORDS = {"format"}
+
+# Top-level keywords handled by CompiledSchema itself
+TOP_LEVEL_KEYWORDS = {"type", "required", "properties", "additionalProperties"}
+
+JSON_TYPES = {"string", "number", "integer", "boolean", "null", "object", "array"}
+
+_STRING_DTYPES = (pl.Utf8, pl.Categorical, pl.Enum)
+_BOOLEAN = "boolean"
+
+
+def _dtype_kind(dtype: pl.DataType) -> str:
+    """Map a Polars dtype to the JSON kind of its non-null Python values.
+
+    Returns one of "string", "integer", "float", "decimal", "boolean", "null",
+    "object", "array", or "other" for values that are no JSON type at all
+    (dates, datetimes, durations, bytes).
+    """
+    if isinstance(dtype, _STRING_DTYPES):
+        return "string"
+    if dtype.is_integer():
+        return "integer"
+    if dtype.is_float():
+        return "float"
+    if isinstance(dtype, pl.Decimal):
+        return "decimal"
+    if dtype == pl.Boolean:
+        return _BOOLEAN
+    if dtype == pl.Null:
+        return "null"
+    if isinstance(dtype, pl.Struct):
+        return "object"
+    if isinstance(dtype, (pl.List, pl.Array)):
+        return "array"
+    if dtype == pl.Object:
+        return "unknown"
+    return "other"
+
+
+@dataclass
+class _Check:
+    """One vectorized keyword check over a column.
+
+    Attributes:
+        order: Position of the keyword in Draft7's per-record error order
+        column: Column the check reads (None for record-level checks)
+        keyword: JSON Schema keyword reported as ``validator``
+        fails: Boolean expression, True where the row fails
+        message: Builds the error message from the failing value
+    """
+
+    order: tuple[int, ...]
+    column: str | None
+    keyword: str
+    fails: pl.Expr
+    message: Callable[[Any], str]
+
+
+def _is_number_value(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class CompiledSchema:
+    """A JSON schema compiled into vectorized Polars checks.
+
+    Schema analysis happens once in ``__init__``; expressions are built per
+    frame because they depend on the column dtypes.
+    """
+
+    def __init__(self, schema: dict[str, Any]):
+        """Analyze a schema.
+
+        Args:
+            schema: JSON Schema (Draft 7) for one record
+        """
+        self.schema = schema
+        self.validator = Draft7Validator(schema)
+        self.fully_compiled = self._top_level_compilable(schema)
+        self._fallback_validators: dict[str, Draft7Validator] = {}
+
+    @staticmethod
+    def _top_level_compilable(schema: dict[str, Any]) -> bool:
+        if not isinstance(schema, dict) or "$ref" in schema:
+            return False
+        if schema.get("type", "object") != "object":
+            return False
+        if not isinstance(schema.get("properties", {}), dict):
+            return False
+        if not isinstance(schema.get("additionalProperties", True), bool):
+            return False
+        keywords = set(schema) & set(Draft7Validator.VALIDATORS)
+        return keywords <= TOP_LEVEL_KEYWORDS
+
+    def validate(self, df: pl.DataFrame, row_offset: int = 0) -> list[dict[str, Any]]:
+        """Validate every row of a frame against the schema.
+
+        Args:
+            df: Frame (or batch of a larger frame) to validate
+            row_offset: Index of the first row of ``df`` in the full frame
+
+        Returns:
+            Error dicts (``row_index``, ``error_type``, ``field``, ``message``,
+            ``validator``, ``record``) ordered by row, then as Draft7 reports them
+        """
+        if not self.fully_compiled:
+            return self._validate_rows(df, self.validator, row_offset)
+
+        checks, masks, fallback_columns = self._evaluate(df)
+
+        # (local row, order, field, message, keyword)
+        failures: list[tuple[int, tuple[int, ...], str, str, str]] = []
+
+        for i, check in enumerate(checks):
+            mask = masks.to_series(i)
+            if not mask.any():
+                continue
+            rows = mask.arg_true()
+            for row, message in zip(rows.to_list(), self._messages(df, check, rows), strict=True):
+                failures.append((row, check.order, check.column or "root", message, check.keyword))
+
+        for order, column in fallback_columns:
+            for row, sub_pos, error in self._fallback_errors(df, column):
+                failures.append(
+                    (
+                        row,
+                        (*order, sub_pos),
+                        ".".join(str(p) for p in error.path) or "root",
+                        error.message,
+                        str(error.validator),
+                    )
+                )
+
+        if not failures:
+            return []
+
+        failures.sort(key=lambda f: (f[0], f[1]))
+        failed_rows = sorted({f[0] for f in failures})
+        records = dict(zip(failed_rows, df[failed_rows].to_dicts(), strict=True))
+        return [
+            {
+                "row_index": row_offset + row,
+                "error_type": "critical",
+                "field": field,
+                "message": message,
+                "validator": keyword,
+                "record": records[row],
+            }
+            for row, _, field, message, keyword in failures
+        ]
+
+    def summarize(self, df: pl.DataFrame, summary: ErrorSummary, row_offset: int = 0) -> None:
+        """Validate a frame into a compact ``ErrorSummary``.
+
+        Errors are grouped into rules named ``schema_<keyword>``. Only the rows
+        sampled by ``summary`` are materialized as records.
+
+        Args:
+            df: Frame (or batch of a larger frame) to validate
+            summary: Summary receiving the violations
+            row_offset: Index of the first row of ``df`` in the full frame
+        """
+        if not self.fully_compiled:
+            self._summarize_errors(self._validate_rows(df, self.validator, row_offset), summary)
+            return
+
+        checks, masks, fallback_columns = self._evaluate(df)
+
+        for i, check in enumerate(checks):
+            mask = masks.to_series(i)
+            if not mask.any():
+                continue
+            rule = f"schema_{check.keyword}"
+            rows = mask.arg_true()
+            limit = summary.remaining(rule)
+            sampled = rows if limit is None else rows.head(limit)
+            records = df[sampled.to_list()].to_dicts() if len(sampled) else []
+            samples = [
+                {
+                    "row_index": row_offset + row,
+                    "error_type": "critical",
+                    "field": check.column or "root",
+                    "message": message,
+                    "validator": check.keyword,
+                    "record": record,
+                }
+                for row, message, record in zip(
+                    sampled.to_list(), self._messages(df, check, sampled), records, strict=True
+                )
+            ]
+            summary.add(rule, rows.cast(pl.Int64) + row_offset, samples)
+
+        for _, column in fallback_columns:
+            errors = [
+                {
+                    "row_index": row_offset + row,
+                    "error_type": "critical",
+                    "field": ".".join(str(p) for p in error.path) or "root",
+                    "message": error.message,
+                    "validator": str(error.validator),
+                    "record": record,
+                }
+                for (row, _, error), record in self._fallback_errors_with_records(df, column)
+            ]
+            self._summarize_errors(errors, summary)
+
+    @staticmethod
+    def _summarize_errors(errors: list[dict[str, Any]], summary: ErrorSummary) -> None:
+        """Add fully built schema errors to a summary, one rule per keyword."""
+        by_rule: dict[str, list[dict[str, Any]]] = {}
+        for error in errors:
+            by_rule.setdefault(f"schema_{error['validator']}", []).append(error)
+        for rule, rule_errors in by_rule.items():
+            summary.add_errors(rule, rule_errors)
+
+    def _evaluate(
+        self, df: pl.DataFrame
+    ) -> tuple[list[_Check], pl.DataFrame, list[tuple[tuple[int, ...], str]]]:
+        """Build the checks for a frame and evaluate them in one select.
+
+        Returns:
+            Tuple of (checks, boolean mask per check, per-row fallback columns)
+        """
+        checks: list[_Check] = []
+        fallback_columns: list[tuple[tuple[int, ...], str]] = []
+        keyword_order = list(self.schema)
+
+        for kw_pos, keyword in enumerate(keyword_order):
+            if keyword == "required":
+                checks.extend(self._required_checks(df, kw_pos))
+            elif keyword == "additionalProperties":
+                checks.extend(self._additional_properties_checks(df, kw_pos))
+            elif keyword == "properties":
+                for prop_pos, (column, subschema) in enumerate(self.schema["properties"].items()):
+                    if column not in df.columns:
+                        continue
+                    prop_checks = self._property_checks(
+                        column, subschema, df.schema[column], (kw_pos, prop_pos)
+                    )
+                    if prop_checks is None:
+                        fallback_columns.append(((kw_pos, prop_pos), column))
+                    else:
+                        checks.extend(prop_checks)
+
+        masks = (
+            df.select(
+                check.fails.fill_null(False).alias(f"__check_{i}") for i, check in enumerate(checks)
+            )
+            if checks
+            else pl.DataFrame()
+        )
+        return checks, masks, fallback_columns
+
+    @staticmethod
+    def _messages(df: pl.DataFrame, check: _Check, rows: pl.Series) -> list[str]:
+        """Error messages of a check for the given (failing) rows."""
+        if check.column is None:
+            values: list[Any] = [None] * len(rows)
+        else:
+            values = df[check.column].gather(rows).to_list()
+        return [check.message(value) for value in values]
+
+    def _fallback_errors(self, df: pl.DataFrame, column: str) -> list[tuple[int, int, Any]]:
+        """Per-row Draft7 errors of one uncompiled column as (row, position, error)."""
+        validator = self._fallback_validator(column)
+        return [
+            (row, sub_pos, error)
+            for row, record in enumerate(df.select(column).iter_rows(named=True))
+            for sub_pos, error in enumerate(validator.iter_errors(record))
+        ]
+
+    def _fallback_errors_with_records(
+        self, df: pl.DataFrame, column: str
+    ) -> list[tuple[tuple[int, int, Any], dict[str, Any]]]:
+        """Fallback errors of one column paired with their full records."""
+        errors = self._fallback_errors(df, column)
+        failed_rows = sorted({row for row, _, _ in errors})
+        records = dict(zip(failed_rows, df[failed_rows].to_dicts(), strict=True))
+        return [(error, records[error[0]]) for error in errors]
+
+    def _validate_rows(
+        self, df: pl.DataFrame, validator: Draft7Validator, row_offset: int
+    ) -> list[dict[str, Any]]:
+        """Per-row Draft7 validation (used for schemas that cannot be compiled)."""
+        errors = []
+        for local_idx, record in enumerate(df.to_dicts()):
+            for error in validator.iter_errors(record):
+                errors.append(
+                    {
+                        "row_index": row_offset + local_idx,
+                        "error_type": "critical",
+                        "field": ".".join(str(p) for p in error.path) or "root",
+                        "message": error.message,
+                        "validator": error.validator,
+                        "record": record,
+                    }
+                )
+        return errors
+
+    def _fallback_validator(self, column: str) -> Draft7Validator:
+        if column not in self._fallback_validators:
+            subschema = self.schema["properties"][column]
+            self._fallback_validators[column] = Draft7Validator({"properties": {column: subschema}})
+        return self._fallback_validators[column]
+
+    def _required_checks(self, df: pl.DataFrame, kw_pos: int) -> list[_Check]:
+        return [
+            _Check(
+                order=(kw_pos, pos),
+                column=None,
+                keyword="required",
+                fails=pl.repeat(True, pl.len()),
+                message=lambda _, name=name: f"{name!r} is a required property",
+            )
+            for pos, name in enumerate(self.schema["required"])
+            if name not in df.columns
+        ]
+
+    def _additional_properties_checks(self, df: pl.DataFrame, kw_pos: int) -> list[_Check]:
+        if self.schema["additionalProperties"] is not False:
+            return []
+        properties = self.schema.get("properties", {})
+        extras = sorted((c for c in df.columns if c not in properties), key=str)
+        if not extras:
+            return []
+        verb = "was" if len(extras) == 1 else "were"
+        message = (
+            f"Additional properties are not allowed "
+            f"({', '.join(repr(e) for e in extras)} {verb} unexpected)"
+        )
+        return [
+            _Check(
+                order=(kw_pos,),
+                column=None,
+                keyword="additionalProperties",
+                fails=pl.repeat(True, pl.len()),
+                message=lambda _: message,
+            )
+        ]
+
+    def _property_checks(
+        self,
+        column: str,
+        subschema: Any,
+        dtype: pl.DataType,
+        order: tuple[int, ...],
+    ) -> list[_Check] | None:
+        """Build the checks for one property, or None if it must be validated per row."""
+        if not isinstance(subschema, dict) or "$ref" in subschema:
+            return None
+        keywords = [k for k in subschema if k in Draft7Validator.VALIDATORS]
+        if any(k not in COMPILED_KEYWORDS | NOOP_KEYWORDS for k in keywords):
+            return None
+
+        kind = _dtype_kind(dtype)
+        if kind == "unknown":
+            return None
+
+        col = pl.col(column)
+        if isinstance(dtype, (pl.Categorical, pl.Enum)):
+            col = col.cast(pl.Utf8)
+        elif kind == "decimal":
+            col = col.cast(pl.Float64)
+        # Python compares NaN as neither smaller nor larger than anything
+        number = col.is_not_null() & ~col.is_nan() if kind == "float" else col.is_not_null()
+
+        checks = []
+        for pos, keyword in enumerate(keywords):
+            value = subschema[keyword]
+            fails: pl.Expr | None
+            message: Callable[[Any], str]
+
+            if keyword in NOOP_KEYWORDS:
+                continue
+
+            if keyword == "type":
+                types = [value] if isinstance(value, str) else list(value)
+                if any(t not in JSON_TYPES for t in types):
+                    return None
+                fails = self._type_fails(col, kind, types)
+                reprs = ", ".join(repr(t) for t in types)
+                message = lambda v, reprs=reprs: f"{v!r} is not of type {reprs}"  # noqa: E731
+
+            elif keyword == "enum":
+                fails = self._enum_fails(col, kind, value)
+                if fails is None:
+                    return None
+                message = lambda v, enums=value: f"{v!r} is not one of {enums!r}"  # noqa: E731
+
+            elif keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+                if not _is_number_value(value):
+                    return None
+                if kind not in ("integer", "float", "decimal"):
+                    continue
+                fails, message = self._bound_check(col, number, keyword, value)
+
+            elif keyword in ("minLength", "maxLength"):
+                if kind != "string":
+                    continue
+                length = col.str.len_chars()
+                if keyword == "minLength":
+                    fails = length < value
+                    text = "should be non-empty" if value == 1 else "is too short"
+                else:
+                    fails = length > value
+                    text = "is expected to be empty" if value == 0 else "is too long"
+                message = lambda v, text=text: f"{v!r} {text}"  # noqa: E731
+
+            else:  # pattern
+                if not self._pattern_supported(value):
+                    return None
+                if kind != "string":
+                    continue
+                fails = ~col.str.contains(value)
+                message = lambda v, p=value: f"{v!r} does not match {p!r}"  # noqa: E731
+
+            checks.append(_Check((*order, pos), column, keyword, fails, message))
+
+        return checks
+
+    @staticmethod
+    def _type_fails(col: pl.Expr, kind: str, types: list[str]) -> pl.Expr:
+        null_fails = pl.lit("null" not in types)
+        if kind == "null":
+            return col.is_null() & null_fails
+
+        if kind == "string":
+            value_ok = pl.lit("string" in types)
+        elif kind == "integer":
+            value_ok = pl.lit("integer" in types or "number" in types)
+        elif kind == "float":
+            if "number" in types:
+                value_ok = pl.lit(True)
+            elif "integer" in types:
+                # Draft 7 accepts floats with an integral value as integers
+                value_ok = col.is_finite() & (col == col.floor())
+            else:
+                value_ok = pl.lit(False)
+        elif kind == "decimal":
+            value_ok = pl.lit("number" in types)
+        elif kind == _BOOLEAN:
+            value_ok = pl.lit("boolean" in types)
+        elif kind == "object":
+            value_ok = pl.lit("object" in types)
+        elif kind == "array":
+            value_ok = pl.lit("array" in types)
+        else:
+            value_ok = pl.lit(False)
+
+        return pl.when(col.is_null()).then(null_fails).otherwise(~value_ok)
+
+    @staticmethod
+    def _enum_fails(col: pl.Expr, kind: str, enums: list[Any]) -> pl.Expr | None:
+        null_fails = pl.lit(all(e is not None for e in enums))
+        if kind == "string":
+            candidates = [e for e in enums if isinstance(e, str)]
+        elif kind in ("integer", "float", "decimal"):
+            candidates = [e for e in enums if _is_number_value(e)]
+        elif kind == _BOOLEAN:
+            candidates = [e for e in enums if isinstance(e, bool)]
+        elif kind in ("null", "other"):
+            candidates = []
+        else:
+            # Structs/lists compare element-wise; leave them to Draft7
+            return None
+
+        if not candidates:
+            value_fails = pl.lit(True)
+        elif kind == "integer" and any(isinstance(e, float) for e in candidates):
+            value_fails = ~col.cast(pl.Float64).is_in(candidates)
+        else:
+            value_fails = ~col.is_in(candidates)
+        return pl.when(col.is_null()).then(null_fails).otherwise(value_fails)
+
+    @staticmethod
+    def _bound_check(
+        col: pl.Expr, number: pl.Expr, keyword: str, bound: float
+    ) -> tuple[pl.Expr, Callable[[Any], str]]:
+        if keyword == "minimum":
+            return number & (col < bound), (
+                lambda v: f"{v!r} is less than the minimum of {bound!r}"
+            )
+        if keyword == "maximum":
+            return number & (col > bound), (
+                lambda v: f"{v!r} is greater than the maximum of {bound!r}"
+            )
+        if keyword == "exclusiveMinimum":
+            return number & (col <= bound), (
+                lambda v: f"{v!r} is less than or equal to the minimum of {bound!r}"
+            )
+        return number & (col >= bound), (
+            lambda v: f"{v!r} is greater than or equal to the maximum of {bound!r}"
+        )
+
+    @staticmethod
+    def _pattern_supported(pattern: Any) -> bool:
+        """Check the pattern compiles with Polars' (Rust) regex engine."""
+        if not isinstance(pattern, str):
+            return False
+        try:
+            pl.select(pl.lit("").str.contains(pattern))
+        except Exception:
+            logger.debug("schema_pattern_not_compiled", pattern=pattern)
+            return False
+        return True
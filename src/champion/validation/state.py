@@ -0,0 +1,173 @@
+"""Per-instrument last known state for cross-partition rules.
+
+Price reasonableness and continuity compare a day's prices with the previous
+trading day, which used to require loading several days of history next to
+the day being validated. ``SymbolStateStore`` keeps one row per instrument in a
+small Parquet file instead:
+
+- ``symbol`` and ``series``: the instrument key; a bhavcopy day lists several
+  series of a symbol (EQ, BE, BL, ...) with their own prices. ``series`` is
+  empty for frames without a series column
+- ``last_close``: close of the latest written trade date
+- ``last_adjustment_factor``: corporate-action adjustment factor of that close
+- ``last_trade_date``
+
+Writers update the store after each successful write; validation joins the
+day's frame to it on the instrument key, which costs O(instruments) however
+long the history.
+
+Example:
+    >>> state = SymbolStateStore(Path("data/lake/state/normalized_equity_ohlc.parquet"))
+    >>> result = validator.validate_dataframe(df, "normalized_equity_ohlc", state=state)
+    >>> write_df(df, ...)
+    >>> state.update(df)
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import polars as pl
+import structlog
+
+logger = structlog.get_logger()
+
+STATE_SCHEMA = {
+    "symbol": pl.Utf8,
+    "series": pl.Utf8,
+    "last_close": pl.Float64,
+    "last_adjustment_factor": pl.Float64,
+    "last_trade_date": pl.Date,
+}
+
+SYMBOL_COLUMNS = ("symbol", "TckrSymb")
+SERIES_COLUMNS = ("series", "SctySrs")
+INSTRUMENT_KEY = ["symbol", "series"]
+TRADE_DATE_COLUMNS = ("trade_date", "TradDt")
+CLOSE_COLUMNS = ("close", "ClsPric")
+
+# Serializes read-merge-write cycles of stores in this process
+_UPDATE_LOCK = threading.Lock()
+
+
+def first_column(columns: list[str], candidates: tuple[str, ...]) -> str | None:
+    """Return the first candidate present in ``columns``."""
+    return next((col for col in candidates if col in columns), None)
+
+
+def trade_date_expr(column: str, dtype: pl.PolarsDataType) -> pl.Expr:
+    """Read a trade date column as ``pl.Date`` whatever its storage type.
+
+    Args:
+        column: Column name
+        dtype: Column dtype: Date, Datetime, days since epoch (integer) or
+            an ISO date string
+
+    Returns:
+        Date expression
+    """
+    if dtype == pl.Date:
+        return pl.col(column)
+    if isinstance(dtype, pl.Datetime):
+        return pl.col(column).dt.date()
+    if dtype.is_integer():
+        return pl.col(column).cast(pl.Int32).cast(pl.Date)
+    return pl.col(column).cast(pl.Utf8).str.to_date(strict=False)
+
+
+def instrument_key_exprs(columns: list[str], symbol_col: str) -> list[pl.Expr]:
+    """Build the ``symbol`` and ``series`` state key columns of a frame.
+
+    Args:
+        columns: Columns of the frame
+        symbol_col: Symbol column of the frame
+
+    Returns:
+        Expressions for the ``INSTRUMENT_KEY`` columns (series empty if the
+        frame has none)
+    """
+    series_col = first_column(columns, SERIES_COLUMNS)
+    series = pl.col(series_col).cast(pl.Utf8).fill_null("") if series_col else pl.lit("")
+    return [pl.col(symbol_col).cast(pl.Utf8).alias("symbol"), series.alias("series")]
+
+
+class SymbolStateStore:
+    """Parquet file with the last known close per instrument (symbol and series).
+
+    Attributes:
+        path: Parquet file holding the state
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the store.
+
+        Args:
+            path: Parquet file holding the state (created on first update)
+        """
+        self.path = Path(path)
+
+    def load(self) -> pl.DataFrame:
+        """Read the state, one row per instrument (empty if never written)."""
+        if not self.path.exists():
+            return pl.DataFrame(schema=STATE_SCHEMA)
+        state = pl.read_parquet(self.path)
+        if "series" not in state.columns:
+            # Written before the state was keyed by series
+            state = state.with_columns(pl.lit("").alias("series"))
+        return state.select(list(STATE_SCHEMA))
+
+    def update(self, df: pl.DataFrame) -> int:
+        """Merge the latest close per instrument of a written frame into the state.
+
+        An instrument's state is only replaced by a row with the same or a later
+        trade date, so backfilling older partitions leaves it unchanged.
+
+        Args:
+            df: Frame that was written (symbol, trade date and close columns;
+                series and ``adjustment_factor`` are optional)
+
+        Returns:
+            Number of instruments in the state after the update
+        """
+        symbol_col = first_column(df.columns, SYMBOL_COLUMNS)
+        date_col = first_column(df.columns, TRADE_DATE_COLUMNS)
+        close_col = first_column(df.columns, CLOSE_COLUMNS)
+        if not symbol_col or not date_col or not close_col:
+            logger.warning("symbol_state_columns_missing", path=str(self.path))
+            return 0
+
+        factor = (
+            pl.col("adjustment_factor").cast(pl.Float64).fill_null(1.0)
+            if "adjustment_factor" in df.columns
+            else pl.lit(1.0, dtype=pl.Float64)
+        )
+        latest = (
+            df.select(
+                *instrument_key_exprs(df.columns, symbol_col),
+                pl.col(close_col).cast(pl.Float64).alias("last_close"),
+                factor.alias("last_adjustment_factor"),
+                trade_date_expr(date_col, df.schema[date_col]).alias("last_trade_date"),
+            )
+            .drop_nulls()
+            .sort("last_trade_date", maintain_order=True)
+            .group_by(INSTRUMENT_KEY, maintain_order=True)
+            .last()
+        )
+
+        with _UPDATE_LOCK:
+            state = (
+                pl.concat([self.load(), latest.select(list(STATE_SCHEMA))])
+                .sort("last_trade_date", maintain_order=True)
+                .group_by(INSTRUMENT_KEY)
+                .last()
+                .sort(INSTRUMENT_KEY)
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_name(f".{self.path.name}.tmp")
+            state.write_parquet(temp_file)
+            os.replace(temp_file, self.path)
+
+        logger.info(
+            "updated_symbol_state", path=str(self.path), instruments=len(state), updated=len(latest)
+        )
+        return len(state)
@@ -0,0 +1,256 @@
+"""Bounded-memory validation of Parquet files by row group.
+
+``ParquetValidator.validate_file`` reads the whole file before validating it.
+``RowGroupValidator`` instead reads one row group at a time with
+``pyarrow.ParquetFile.read_row_group`` and validates row groups on a thread pool
+(Polars and PyArrow release the GIL), so peak memory tracks
+``max_workers * row group size`` rather than the file size.
+
+Row-local checks (JSON schema and "row" business rules) run per row group into
+an ``ErrorSummary`` per group, and the summaries are merged in file order.
+Cross-row rules keep merged state:
+
+- "column" rules (e.g. missing critical data) merge per-group violation counts
+- "group" rules (e.g. duplicate detection) spill their key columns, tagged with
+  the file row index, into hash partitions on disk; each partition is checked
+  on its own after all row groups are done, so no key can be split across
+  partitions and only one partition is in memory at a time
+
+The merged rule counts and violations are identical to validating the whole
+file in memory, except that custom validators only see one row group at a time.
+"""
+
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pyarrow.parquet as pq
+import structlog
+
+from champion.validation.rules import BusinessRule, RuleEngine
+from champion.validation.schema_compiler import CompiledSchema
+from champion.validation.summary import DEFAULT_MAX_SAMPLES_PER_RULE, ErrorSummary
+
+logger = structlog.get_logger()
+
+# Number of hash partitions for cross-row "group" rule state
+DEFAULT_PARTITIONS = 16
+
+_ROW_INDEX = "__row_index__"
+_PARTITION = "__partition__"
+
+
+@dataclass
+class StreamingValidation:
+    """Merged outcome of validating a file row group by row group.
+
+    Attributes:
+        total_rows: Rows in the file
+        row_groups: Row groups validated
+        summary: Merged violations and sampled errors
+        failed_custom_validators: Custom validators that raised on any row group
+    """
+
+    total_rows: int
+    row_groups: int
+    summary: ErrorSummary
+    failed_custom_validators: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _RowGroupResult:
+    """Errors and partial rule state of one row group."""
+
+    summary: ErrorSummary
+    column_counts: list[tuple[int, int] | None]
+    custom_summary: ErrorSummary
+    failed_custom_validators: set[str]
+
+
+class RowGroupValidator:
+    """Validates a Parquet file row group by row group on a thread pool."""
+
+    def __init__(
+        self,
+        compiled: CompiledSchema,
+        rules: list[BusinessRule],
+        custom_validators: dict[str, Callable[[pl.DataFrame], list[dict[str, Any]]]] | None = None,
+        max_workers: int | None = None,
+        num_partitions: int = DEFAULT_PARTITIONS,
+        batch_size: int = 10000,
+        max_error_samples: int | None = DEFAULT_MAX_SAMPLES_PER_RULE,
+    ):
+        """Initialize the validator.
+
+        Args:
+            compiled: Compiled JSON schema for the file's records
+            rules: Business rules declared for the file's columns
+            custom_validators: Custom validators, run on each row group
+            max_workers: Row groups validated concurrently (default: CPU count)
+            num_partitions: Hash partitions for "group" rule state
+            batch_size: Rows per schema validation batch within a row group
+            max_error_samples: Example errors (with records) kept per rule
+        """
+        self.compiled = compiled
+        self.rules = rules
+        self.custom_validators = custom_validators or {}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.num_partitions = num_partitions
+        self.batch_size = batch_size
+        self.max_error_samples = max_error_samples
+
+        self.row_rules = [r for r in rules if r.report == "row"]
+        self.column_rules = [r for r in rules if r.report == "column"]
+        self.group_rules = [r for r in rules if r.report == "group"]
+        self._row_engine = RuleEngine(self.row_rules)
+        self._column_engine = RuleEngine(self.column_rules)
+
+    def validate(self, file_path: Path) -> StreamingValidation:
+        """Validate every row group of a Parquet file and merge the results.
+
+        Args:
+            file_path: Parquet file to validate
+
+        Returns:
+            StreamingValidation with the merged error summary
+        """
+        metadata = pq.ParquetFile(file_path).metadata
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        offsets = [sum(sizes[:i]) for i in range(len(sizes))]
+
+        logger.info(
+            "validating_row_groups",
+            file_path=str(file_path),
+            row_groups=len(sizes),
+            total_rows=metadata.num_rows,
+            max_workers=self.max_workers,
+        )
+
+        with tempfile.TemporaryDirectory(prefix="champion-validate-") as spill:
+            spill_dir = Path(spill)
+
+            def run(index: int) -> _RowGroupResult:
+                return self._validate_row_group(file_path, index, offsets[index], spill_dir)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(run, range(len(sizes))))
+
+            group_errors = [
+                self._group_rule_errors(i, spill_dir) for i in range(len(self.group_rules))
+            ]
+
+        summary = ErrorSummary(self.max_error_samples)
+        for result in results:
+            summary.merge(result.summary)
+        self._merge_cross_row_errors(summary, results, group_errors)
+        for result in results:
+            summary.merge(result.custom_summary)
+
+        return StreamingValidation(
+            total_rows=metadata.num_rows,
+            row_groups=len(sizes),
+            summary=summary,
+            failed_custom_validators=set().union(
+                *(result.failed_custom_validators for result in results)
+            ),
+        )
+
+    def _validate_row_group(
+        self, file_path: Path, index: int, offset: int, spill_dir: Path
+    ) -> _RowGroupResult:
+        """Validate one row group and spill its "group" rule keys."""
+        # One ParquetFile handle per task; handles are not shared across threads
+        df = pl.from_arrow(pq.ParquetFile(file_path).read_row_group(index))
+        assert isinstance(df, pl.DataFrame)
+
+        summary = ErrorSummary(self.max_error_samples)
+        for batch_idx, batch in enumerate(df.iter_slices(self.batch_size)):
+            self.compiled.summarize(batch, summary, row_offset=offset + batch_idx * self.batch_size)
+        self._row_engine.summarize(df, summary, row_offset=offset)
+
+        for rule_id, rule in enumerate(self.group_rules):
+            self._spill_keys(df, rule, rule_id, index, offset, spill_dir)
+
+        custom_summary = ErrorSummary(self.max_error_samples)
+        failed_custom: set[str] = set()
+        for validator_name, validator_func in self.custom_validators.items():
+            try:
+                custom_summary.add_errors(
+                    f"custom_{validator_name}",
+                    (
+                        {**error, "row_index": offset + error["row_index"]}
+                        for error in validator_func(df) or []
+                    ),
+                )
+            except Exception as e:
+                logger.error(
+                    "custom_validator_failed",
+                    validator_name=validator_name,
+                    row_group=index,
+                    error=str(e),
+                )
+                failed_custom.add(validator_name)
+
+        return _RowGroupResult(
+            summary=summary,
+            column_counts=self._column_engine.violation_counts(df, row_offset=offset),
+            custom_summary=custom_summary,
+            failed_custom_validators=failed_custom,
+        )
+
+    def _spill_keys(
+        self,
+        df: pl.DataFrame,
+        rule: BusinessRule,
+        rule_id: int,
+        index: int,
+        offset: int,
+        spill_dir: Path,
+    ) -> None:
+        """Write a row group's keys for a "group" rule into hash partitions."""
+        keys = list(rule.group_by)
+        tagged = df.select(keys).with_columns(
+            pl.int_range(offset, offset + len(df), dtype=pl.Int64).alias(_ROW_INDEX),
+            (pl.struct(keys).hash(seed=0) % self.num_partitions).alias(_PARTITION),
+        )
+        for part in tagged.partition_by(_PARTITION):
+            partition = part[_PARTITION][0]
+            part.drop(_PARTITION).write_parquet(
+                spill_dir / f"rule{rule_id}-part{partition}-rg{index}.parquet"
+            )
+
+    def _group_rule_errors(self, rule_id: int, spill_dir: Path) -> list[dict[str, Any]]:
+        """Evaluate a "group" rule partition by partition over the spilled keys."""
+        engine = RuleEngine([self.group_rules[rule_id]])
+        errors: list[dict[str, Any]] = []
+        for partition in range(self.num_partitions):
+            files = sorted(spill_dir.glob(f"rule{rule_id}-part{partition}-rg*.parquet"))
+            if not files:
+                continue
+            keys = pl.concat([pl.read_parquet(f) for f in files]).sort(_ROW_INDEX)
+            errors.extend(engine.error_details(keys, index=keys[_ROW_INDEX]))
+        # Groups are reported in order of first occurrence, as in-memory
+        errors.sort(key=lambda e: e["row_index"])
+        return errors
+
+    def _merge_cross_row_errors(
+        self,
+        summary: ErrorSummary,
+        results: list[_RowGroupResult],
+        group_errors: list[list[dict[str, Any]]],
+    ) -> None:
+        """Add the errors of "column" and "group" rules from their merged state."""
+        for rule_id, rule in enumerate(self.column_rules):
+            counts = [c for result in results if (c := result.column_counts[rule_id])]
+            if counts:
+                first_row = min(first for first, _ in counts)
+                count = sum(n for _, n in counts)
+                summary.add_errors(rule.name, [RuleEngine.summary_error(rule, first_row, count)])
+
+        for rule, errors in zip(self.group_rules, group_errors, strict=True):
+            summary.add_errors(rule.name, errors)
@@ -0,0 +1,114 @@
+"""Compact accumulation of validation errors.
+
+Building an error dict with the full offending record for every violation makes
+a bad upstream file cost gigabytes. ``ErrorSummary`` instead keeps:
+
+- a violations table with one ``(row_index, rule, error_type)`` row per error,
+  which gives per-rule counts and the failing row indices
+- at most ``max_samples_per_rule`` complete error dicts (with records) per rule
+
+Producers ask ``remaining(rule)`` before materializing records, so rows beyond
+the sample limit are never converted to Python objects.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import polars as pl
+
+# Default number of example errors (with records) kept per rule
+DEFAULT_MAX_SAMPLES_PER_RULE = 100
+
+VIOLATIONS_SCHEMA = {"row_index": pl.Int64, "rule": pl.Utf8, "error_type": pl.Utf8}
+
+
+class ErrorSummary:
+    """Per-rule violation rows plus a bounded sample of error dicts."""
+
+    def __init__(self, max_samples_per_rule: int | None = DEFAULT_MAX_SAMPLES_PER_RULE):
+        """Initialize an empty summary.
+
+        Args:
+            max_samples_per_rule: Error dicts kept per rule (None keeps all)
+        """
+        self.max_samples_per_rule = max_samples_per_rule
+        self._samples: dict[str, list[dict[str, Any]]] = {}
+        self._chunks: list[pl.DataFrame] = []
+
+    def remaining(self, rule: str) -> int | None:
+        """Number of further samples wanted for a rule (None: unlimited)."""
+        if self.max_samples_per_rule is None:
+            return None
+        return max(0, self.max_samples_per_rule - len(self._samples.get(rule, [])))
+
+    def add(
+        self,
+        rule: str,
+        row_indices: pl.Series | Sequence[int],
+        samples: Sequence[dict[str, Any]] = (),
+        error_type: str = "critical",
+    ) -> None:
+        """Record the violations of one rule.
+
+        Args:
+            rule: Rule name
+            row_indices: Row index of every error (one entry per error)
+            samples: Error dicts for the first violations; trimmed to the limit
+            error_type: "critical" or "warning" for all of these errors
+        """
+        rows = pl.Series("row_index", row_indices, dtype=pl.Int64)
+        if len(rows):
+            self._chunks.append(
+                pl.DataFrame({"row_index": rows}).with_columns(
+                    pl.lit(rule).alias("rule"), pl.lit(error_type).alias("error_type")
+                )
+            )
+        kept = self._samples.setdefault(rule, [])
+        limit = self.remaining(rule)
+        kept.extend(samples if limit is None else samples[:limit])
+
+    def add_errors(self, rule: str, errors: Iterable[dict[str, Any]]) -> None:
+        """Record fully built error dicts of one rule (e.g. from custom validators).
+
+        Args:
+            rule: Rule name
+            errors: Error dicts with ``row_index`` and optionally ``error_type``
+        """
+        errors = list(errors)
+        if not errors:
+            return
+        self._chunks.append(
+            pl.DataFrame(
+                {
+                    "row_index": [e["row_index"] for e in errors],
+                    "rule": [rule] * len(errors),
+                    "error_type": [e.get("error_type", "critical") for e in errors],
+                },
+                schema=VIOLATIONS_SCHEMA,
+            )
+        )
+        self.add(rule, [], errors)
+
+    def merge(self, other: "ErrorSummary") -> None:
+        """Append another summary's violations and samples (in that order)."""
+        self._chunks.extend(other._chunks)
+        for rule, samples in other._samples.items():
+            self.add(rule, [], samples)
+
+    @property
+    def violations(self) -> pl.DataFrame:
+        """One ``(row_index, rule, error_type)`` row per error."""
+        if not self._chunks:
+            return pl.DataFrame(schema=VIOLATIONS_SCHEMA)
+        return pl.concat(self._chunks)
+
+    @property
+    def rule_counts(self) -> dict[str, int]:
+        """Number of errors per rule, in order of first violation."""
+        counts = self.violations.group_by("rule", maintain_order=True).len()
+        return dict(counts.iter_rows())
+
+    @property
+    def samples(self) -> list[dict[str, Any]]:
+        """Sampled error dicts, grouped by rule."""
+        return [error for samples in self._samples.values() for error in samples]
@@ -1,22 +1,67 @@
 """Core validation utilities for Parquet datasets."""
 
+import hashlib
 import json
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import polars as pl
+import pyarrow.parquet as pq
 import structlog
-from jsonschema import Draft7Validator
+
+from champion.parsers.parse_cache import file_digest
+from champion.validation.ledger import LedgerKey, ValidationLedger
+from champion.validation.quarantine import QuarantineStore
+from champion.validation.rules import BusinessRule, RuleEngine
+from champion.validation.schema_compiler import CompiledSchema
+from champion.validation.state import (
+    INSTRUMENT_KEY,
+    STATE_SCHEMA,
+    SYMBOL_COLUMNS,
+    TRADE_DATE_COLUMNS,
+    SymbolStateStore,
+    first_column,
+    instrument_key_exprs,
+    trade_date_expr,
+)
+from champion.validation.streaming import RowGroupValidator
+from champion.validation.summary import (
+    DEFAULT_MAX_SAMPLES_PER_RULE,
+    VIOLATIONS_SCHEMA,
+    ErrorSummary,
+)
 
 logger = structlog.get_logger()
 
+# Dtypes the non-negative price/volume rules apply to
+NUMERIC_RULE_DTYPES = (pl.Float32, pl.Float64, pl.Int32, pl.Int64)
+
+# Version of the business rule set; bump when a rule's logic changes so that
+# results recorded in a ValidationLedger are not reused
+RULES_VERSION = "1"
+
+# Column joined from a SymbolStateStore: the symbol's last known close (in the
+# frame's adjustment basis) when it predates the row's trade date
+STATE_PREV_CLOSE = "state_prev_close"
+
+# Allowed % difference between a row's prev_close and the last known close
+PREV_CLOSE_TOLERANCE_PCT = 1.0
+
 
 @dataclass
 class ValidationResult:
-    """Result of validation operation."""
+    """Result of validation operation.
+
+    ``error_details`` holds a bounded sample of errors per rule (see
+    ``ParquetValidator.max_error_samples``); ``critical_failures``,
+    ``warnings``, ``rule_counts`` and ``violations`` cover every error.
+    Errors of type ``"warning"`` count in ``warnings`` only: they neither fail
+    a write nor make a row invalid.
+    """
 
     total_rows: int
     valid_rows: int
@@ -25,6 +70,33 @@ class ValidationResult:
     error_details: list[dict[str, Any]]
     validation_rules_applied: list[str] = field(default_factory=list)
     validation_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    rule_counts: dict[str, int] = field(default_factory=dict)
+    violations: pl.DataFrame | None = None
+
+    def violation_table(self) -> pl.DataFrame:
+        """One ``(row_index, rule, error_type)`` row per error.
+
+        Falls back to ``error_details`` (keyed by ``validator``) for results
+        built without a violations table.
+        """
+        if self.violations is not None:
+            return self.violations
+        return pl.DataFrame(
+            {
+                "row_index": [e["row_index"] for e in self.error_details],
+                "rule": [str(e.get("validator", "unknown")) for e in self.error_details],
+                "error_type": [e.get("error_type", "unknown") for e in self.error_details],
+            },
+            schema=VIOLATIONS_SCHEMA,
+        )
+
+    def failed_row_indices(self) -> pl.Series:
+        """Sorted indices of the rows with at least one critical error.
+
+        Rows with only warnings are valid and not included.
+        """
+        violations = self.violation_table()
+        return violations.filter(pl.col("error_type") != "warning")["row_index"].unique().sort()
 
 
 class ParquetValidator:
@@ -44,6 +116,7 @@ class ParquetValidator:
         max_price_change_pct: float = 20.0,
         max_freshness_hours: int = 48,
         enable_all_rules: bool = True,
+        max_error_samples: int | None = DEFAULT_MAX_SAMPLES_PER_RULE,
     ):
         """Initialize validator with schema directory and configuration.
 
@@ -52,30 +125,60 @@ class ParquetValidator:
             max_price_change_pct: Maximum allowed price change percentage (default: 20%)
             max_freshness_hours: Maximum hours between event_time and ingest_time (default: 48)
             enable_all_rules: Enable all business logic rules by default (default: True)
+            max_error_samples: Example errors (with records) kept per rule in
+                ``ValidationResult.error_details`` (default: 100, None keeps all)
         """
         self.schema_dir = Path(schema_dir)
         self.schemas: dict[str, dict] = {}
         self.max_price_change_pct = max_price_change_pct
         self.max_freshness_hours = max_freshness_hours
         self.enable_all_rules = enable_all_rules
+        self.max_error_samples = max_error_samples
         self.custom_validators: dict[str, Callable] = {}
+        self._compiled_schemas: dict[str, CompiledSchema] = {}
+        self._schema_mtimes: dict[str, int] = {}
+        self._lock = threading.Lock()
         self._load_schemas()
 
     def _load_schemas(self) -> None:
         """Load all JSON schemas from schema directory."""
         if not self.schema_dir.exists():
             raise ValueError(f"Schema directory does not exist: {self.schema_dir}")
+        self.refresh_schemas()
 
-        for schema_file in self.schema_dir.glob("*.json"):
-            schema_name = schema_file.stem
-            with open(schema_file) as f:
-                self.schemas[schema_name] = json.load(f)
+    def refresh_schemas(self) -> list[str]:
+        """Reload schemas whose file changed since they were loaded.
 
-            logger.info(
-                "loaded_schema",
-                schema_name=schema_name,
-                schema_file=str(schema_file),
-            )
+        Schema files are only re-read when their modification time changed;
+        new files are loaded and schemas whose file was removed are dropped.
+        Compiled schemas are rebuilt lazily on next use.
+
+        Returns:
+            Names of the schemas (re)loaded
+        """
+        mtimes = {f.stem: f.stat().st_mtime_ns for f in self.schema_dir.glob("*.json")}
+        loaded = []
+        with self._lock:
+            for schema_name in set(self.schemas) - set(mtimes):
+                del self.schemas[schema_name]
+                self._compiled_schemas.pop(schema_name, None)
+                self._schema_mtimes.pop(schema_name, None)
+
+            for schema_name, mtime in mtimes.items():
+                if self._schema_mtimes.get(schema_name) == mtime:
+                    continue
+                schema_file = self.schema_dir / f"{schema_name}.json"
+                with open(schema_file) as f:
+                    self.schemas[schema_name] = json.load(f)
+                self._schema_mtimes[schema_name] = mtime
+                loaded.append(schema_name)
+
+                logger.info(
+                    "loaded_schema",
+                    schema_name=schema_name,
+                    schema_file=str(schema_file),
+                )
+        return loaded
 
     def register_custom_validator(
         self, name: str, validator_func: Callable[[pl.DataFrame], list[dict[str, Any]]]
@@ -95,6 +198,7 @@ class ParquetValidator:
         schema_name: str,
         strict: bool = True,
         batch_size: int = 10000,
+        state: SymbolStateStore | None = None,
     ) -> ValidationResult:
         """Validate a Polars DataFrame against a JSON schema.
 
@@ -103,6 +207,8 @@ class ParquetValidator:
             schema_name: Name of the schema to validate against
             strict: If True, fail on any validation error. If False, collect all errors.
             batch_size: Number of rows to process in each batch (default: 10000)
+            state: Last known close per symbol (optional); lets price rules
+                compare rows with earlier partitions
 
         Returns:
             ValidationResult with validation statistics and error details
@@ -112,11 +218,10 @@ class ParquetValidator:
                 f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas.keys())}"
             )
 
-        schema = self.schemas[schema_name]
-        validator = Draft7Validator(schema)
+        compiled = self._compiled_schema(schema_name)
 
         total_rows = len(df)
-        error_details = []
+        summary = ErrorSummary(self.max_error_samples)
         rules_applied = ["schema_validation"]
 
         logger.info(
@@ -127,49 +232,65 @@ class ParquetValidator:
             batch_size=batch_size,
         )
 
-        # Use streaming validation with iter_slices for memory efficiency
+        # Schema keywords run as vectorized Polars checks per batch; records are
+        # only materialized for sampled failing rows
         for batch_idx, batch in enumerate(df.iter_slices(batch_size)):
-            # Convert only current batch to dicts
-            records = batch.to_dicts()
-            for local_idx, record in enumerate(records):
-                row_idx = batch_idx * batch_size + local_idx
-                errors = list(validator.iter_errors(record))
-                if errors:
-                    for error in errors:
-                        error_detail = {
-                            "row_index": row_idx,
-                            "error_type": "critical",
-                            "field": ".".join(str(p) for p in error.path) or "root",
-                            "message": error.message,
-                            "validator": error.validator,
-                            "record": record,
-                        }
-                        error_details.append(error_detail)
-
-                        logger.warning(
-                            "validation_error",
-                            row_index=row_idx,
-                            field=error_detail["field"],
-                            message=error.message,
-                        )
+            compiled.summarize(batch, summary, row_offset=batch_idx * batch_size)
 
         # Perform additional business logic validations
-        # Note: Business logic uses Polars operations which are memory-efficient
-        # as they don't materialize data until needed (e.g., only violations)
-        business_errors, business_rules = self._validate_business_logic(df, schema_name)
-        error_details.extend(business_errors)
-        rules_applied.extend(business_rules)
+        rules_applied.extend(self._validate_business_logic(df, schema_name, summary, state))
 
-        critical_failures = len(error_details)
-        valid_rows = total_rows - len({e["row_index"] for e in error_details})
+        return self._build_result(schema_name, total_rows, summary, rules_applied)
+
+    def _build_result(
+        self,
+        schema_name: str,
+        total_rows: int,
+        summary: ErrorSummary,
+        rules_applied: list[str],
+    ) -> ValidationResult:
+        """Turn an error summary into a ValidationResult.
+
+        Logs one aggregated line per failing rule instead of one per error.
+
+        Args:
+            schema_name: Schema the data was validated against
+            total_rows: Number of rows validated
+            summary: Violations and sampled errors
+            rules_applied: Names of the rules applied
+
+        Returns:
+            ValidationResult with validation statistics and error details
+        """
+        violations = summary.violations
+        rule_counts = summary.rule_counts
+        is_warning = violations["error_type"] == "warning"
+        warnings = int(is_warning.sum())
+        critical_failures = len(violations) - warnings
+        valid_rows = total_rows - violations.filter(~is_warning)["row_index"].n_unique()
+
+        for rule, sample_rows in (
+            violations.group_by("rule", maintain_order=True)
+            .agg(pl.col("row_index").head(5))
+            .iter_rows()
+        ):
+            logger.warning(
+                "validation_rule_failed",
+                schema_name=schema_name,
+                rule=rule,
+                errors=rule_counts[rule],
+                sample_rows=sample_rows,
+            )
 
         result = ValidationResult(
             total_rows=total_rows,
             valid_rows=valid_rows,
             critical_failures=critical_failures,
-            warnings=0,
-            error_details=error_details,
+            warnings=warnings,
+            error_details=summary.samples,
             validation_rules_applied=rules_applied,
+            rule_counts=rule_counts,
+            violations=violations,
         )
 
         logger.info(
@@ -178,870 +299,759 @@ class ParquetValidator:
             total_rows=total_rows,
             valid_rows=valid_rows,
             critical_failures=critical_failures,
+            warnings=warnings,
             rules_applied=len(rules_applied),
         )
 
         return result
 
+    def _compiled_schema(self, schema_name: str) -> CompiledSchema:
+        """Return the compiled form of a loaded schema, compiling it on first use.
+
+        Args:
+            schema_name: Name of a loaded schema
+
+        Returns:
+            CompiledSchema for the schema
+        """
+        with self._lock:
+            schema = self.schemas[schema_name]
+            compiled = self._compiled_schemas.get(schema_name)
+            if compiled is None or compiled.schema is not schema:
+                compiled = CompiledSchema(schema)
+                self._compiled_schemas[schema_name] = compiled
+                if not compiled.fully_compiled:
+                    logger.info("schema_validated_per_row", schema_name=schema_name)
+        return compiled
+
+    def business_rule_violations(self, df: pl.DataFrame, schema_name: str) -> pl.DataFrame:
+        """Evaluate the business rules for a schema without materializing rows.
+
+        Args:
+            df: DataFrame to validate
+            schema_name: Schema name for determining which rules to apply
+
+        Returns:
+            DataFrame with ``row_index``, ``rule`` and ``field`` columns, one row
+            per violation (custom validators are not included)
+        """
+        rules = self._business_rules(df, schema_name)[0] if self.enable_all_rules else []
+        return RuleEngine(rules).violations(df)
+
     def _validate_business_logic(
-        self, df: pl.DataFrame, schema_name: str
-    ) -> tuple[list[dict[str, Any]], list[str]]:
+        self,
+        df: pl.DataFrame,
+        schema_name: str,
+        summary: ErrorSummary,
+        state: SymbolStateStore | None = None,
+    ) -> list[str]:
         """Apply business logic validations specific to schema type.
 
+        All declarative rules are evaluated in a single pass by ``RuleEngine``;
+        custom validators run afterwards.
+
         Args:
             df: DataFrame to validate
             schema_name: Schema name for determining which rules to apply
+            summary: Summary receiving the violations
+            state: Last known close per symbol (optional)
 
         Returns:
-            Tuple of (error_details, rules_applied)
+            Names of the rules applied
         """
-        errors: list[dict[str, Any]] = []
-        rules_applied: list[str] = []
-
         if not self.enable_all_rules:
-            return errors, rules_applied
+            return []
+
+        frame = self._with_symbol_state(df, state) if state is not None else df
+        rules, rules_applied = self._business_rules(frame, schema_name)
+        RuleEngine(rules).summarize(frame, summary)
+
+        # Rule 16: Apply custom validators
+        for validator_name, validator_func in self.custom_validators.items():
+            try:
+                summary.add_errors(f"custom_{validator_name}", validator_func(df) or [])
+                rules_applied.append(f"custom_{validator_name}")
+            except Exception as e:
+                logger.error(
+                    "custom_validator_failed",
+                    validator_name=validator_name,
+                    error=str(e),
+                )
+
+        return rules_applied
+
+    def _business_rules(
+        self, df: pl.DataFrame, schema_name: str
+    ) -> tuple[list[BusinessRule], list[str]]:
+        """Declare the business rules that apply to a frame.
+
+        Rules whose columns are missing from ``df`` are still listed as applied
+        but contribute no expressions.
+
+        Args:
+            df: DataFrame to validate (only its schema is inspected)
+            schema_name: Schema name for determining which rules to apply
+
+        Returns:
+            Tuple of (rules, rules_applied)
+        """
+        rules: list[BusinessRule] = []
+        rules_applied: list[str] = []
 
         # OHLC-specific validations
         if "ohlc" in schema_name:
             # Rule 1: OHLC consistency (high >= low)
-            rule_errors = self._validate_ohlc_consistency(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._ohlc_consistency_rules(df))
             rules_applied.append("ohlc_high_low_consistency")
 
             # Rule 2: OHLC extended (close within [low, high])
-            rule_errors = self._validate_ohlc_close_in_range(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._ohlc_in_range_rules(df, "close", "ohlc_close_in_range"))
             rules_applied.append("ohlc_close_in_range")
 
             # Rule 3: OHLC extended (open within [low, high])
-            rule_errors = self._validate_ohlc_open_in_range(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._ohlc_in_range_rules(df, "open", "ohlc_open_in_range"))
             rules_applied.append("ohlc_open_in_range")
 
             # Rule 4: Volume consistency (volume > 0 when trades > 0)
-            rule_errors = self._validate_volume_consistency(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._volume_consistency_rules(df))
             rules_applied.append("volume_consistency")
 
             # Rule 5: Turnover consistency (volume * avgprice ≈ turnover)
-            rule_errors = self._validate_turnover_consistency(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._turnover_consistency_rules(df))
             rules_applied.append("turnover_consistency")
 
             # Rule 6: Price reasonableness (% change from prev_close)
-            rule_errors = self._validate_price_reasonableness(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._price_reasonableness_rules(df))
             rules_applied.append("price_reasonableness")
 
+            # Rule 6b: prev_close matches the last known close of the symbol
+            if STATE_PREV_CLOSE in df.columns:
+                rules.extend(self._prev_close_continuity_rules(df))
+                rules_applied.append("prev_close_continuity")
+
             # Rule 7: Price continuity after corporate actions
             if "normalized" in schema_name:
-                rule_errors = self._validate_price_continuity(df)
-                if rule_errors:
-                    errors.extend(rule_errors)
+                rules.extend(self._price_continuity_rules(df))
                 rules_applied.append("price_continuity_post_ca")
 
         # Rule 8: Duplicate detection (symbol + date uniqueness)
-        rule_errors = self._validate_duplicates(df, schema_name)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._duplicate_rules(df))
         rules_applied.append("duplicate_detection")
 
         # Rule 9: Freshness checks (event_time vs ingest_time)
-        rule_errors = self._validate_freshness(df)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._freshness_rules(df))
         rules_applied.append("data_freshness")
 
         # Rule 10: Timestamp validations
-        rule_errors = self._validate_timestamps(df)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._timestamp_rules(df))
         rules_applied.append("timestamp_validation")
 
         # Rule 11: Missing critical data
-        rule_errors = self._validate_missing_critical_data(df, schema_name)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._missing_critical_data_rules(df, schema_name))
         rules_applied.append("missing_critical_data")
 
         # Rule 12: Non-negative price validation
-        rule_errors = self._validate_non_negative_prices(df)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._non_negative_price_rules(df))
         rules_applied.append("non_negative_prices")
 
         # Rule 13: Non-negative volume validation
-        rule_errors = self._validate_non_negative_volume(df)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._non_negative_volume_rules(df))
         rules_applied.append("non_negative_volume")
 
         # Rule 14: Date range validation
-        rule_errors = self._validate_date_range(df, schema_name)
-        if rule_errors:
-            errors.extend(rule_errors)
+        rules.extend(self._date_range_rules(df))
         rules_applied.append("date_range_validation")
 
         # Rule 15: Data completeness for trading days
         if "normalized" in schema_name and "is_trading_day" in df.columns:
-            rule_errors = self._validate_trading_day_completeness(df)
-            if rule_errors:
-                errors.extend(rule_errors)
+            rules.extend(self._trading_day_completeness_rules(df))
             rules_applied.append("trading_day_completeness")
 
-        # Rule 16: Apply custom validators
-        for validator_name, validator_func in self.custom_validators.items():
-            try:
-                rule_errors = validator_func(df)
-                if rule_errors:
-                    errors.extend(rule_errors)
-                rules_applied.append(f"custom_{validator_name}")
-            except Exception as e:
-                logger.error(
-                    "custom_validator_failed",
-                    validator_name=validator_name,
-                    error=str(e),
-                )
-
-        return errors, rules_applied
-
-    def _validate_ohlc_consistency(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate OHLC price consistency (high >= low).
-
-        Args:
-            df: DataFrame with OHLC data
-
-        Returns:
-            List of error details for OHLC violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Check if required columns exist
-        required_cols = ["high", "low"]
-        if not all(col in df.columns for col in required_cols):
-            return errors
-
-        # Find rows where high < low
-        violations = df.filter(
-            (pl.col("high").is_not_null())
-            & (pl.col("low").is_not_null())
-            & (pl.col("high") < pl.col("low"))
-        )
+        return rules, rules_applied
 
-        for _idx, row in enumerate(violations.iter_rows(named=True)):
-            # Find original index in the full dataframe
-            original_idx = (
-                df.with_row_index("__idx__")
-                .filter((pl.col("high") == row["high"]) & (pl.col("low") == row["low"]))
-                .select("__idx__")
-                .to_series()[0]
-            )
-
-            errors.append(
-                {
-                    "row_index": original_idx,
-                    "error_type": "critical",
-                    "field": "high,low",
-                    "message": f"OHLC violation: high ({row['high']}) < low ({row['low']})",
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
-            )
+    @staticmethod
+    def _first_column(df: pl.DataFrame, *candidates: str) -> str | None:
+        """Return the first candidate column present in the frame."""
+        return first_column(df.columns, candidates)
 
-            logger.warning(
-                "ohlc_violation",
-                row_index=original_idx,
-                high=row["high"],
-                low=row["low"],
-            )
+    @staticmethod
+    def _with_symbol_state(df: pl.DataFrame, state: SymbolStateStore) -> pl.DataFrame:
+        """Join the last known close of each instrument as ``STATE_PREV_CLOSE``.
 
-        return errors
+        Rows match the state on symbol and series (see ``SymbolStateStore``).
 
-    def _validate_ohlc_close_in_range(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate that close price is within [low, high] range.
+        The close is rescaled to the row's ``adjustment_factor`` and only used
+        when its trade date is before the row's, so revalidating a partition
+        that is already in the state does not compare it with itself.
 
         Args:
-            df: DataFrame with OHLC data
+            df: DataFrame to validate
+            state: Last known close per instrument
 
         Returns:
-            List of error details for violations
+            ``df`` with a ``STATE_PREV_CLOSE`` column (unchanged if it has no
+            symbol or trade date column)
         """
-        errors: list[dict[str, Any]] = []
-        required_cols = ["high", "low", "close"]
-        if not all(col in df.columns for col in required_cols):
-            return errors
-
-        violations = df.with_row_index("__idx__").filter(
-            (pl.col("close").is_not_null())
-            & (pl.col("high").is_not_null())
-            & (pl.col("low").is_not_null())
-            & ((pl.col("close") > pl.col("high")) | (pl.col("close") < pl.col("low")))
+        symbol_col = first_column(df.columns, SYMBOL_COLUMNS)
+        date_col = first_column(df.columns, TRADE_DATE_COLUMNS)
+        if not symbol_col or not date_col:
+            return df
+
+        state_cols = {col: f"__state_{col}" for col in STATE_SCHEMA}
+        last = state.load().rename(state_cols)
+        factor = (
+            pl.col("adjustment_factor").cast(pl.Float64).fill_null(1.0)
+            if "adjustment_factor" in df.columns
+            else pl.lit(1.0)
         )
-
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "critical",
-                    "field": "close,high,low",
-                    "message": (
-                        f"Close ({row['close']}) outside range "
-                        f"[low={row['low']}, high={row['high']}]"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+        keys = [state_cols[col] for col in INSTRUMENT_KEY]
+        return (
+            df.with_columns(
+                expr.alias(state_cols[col])
+                for col, expr in zip(
+                    INSTRUMENT_KEY, instrument_key_exprs(df.columns, symbol_col), strict=True
+                )
             )
-
-        return errors
-
-    def _validate_ohlc_open_in_range(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate that open price is within [low, high] range.
-
-        Args:
-            df: DataFrame with OHLC data
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-        required_cols = ["high", "low", "open"]
-        if not all(col in df.columns for col in required_cols):
-            return errors
-
-        violations = df.with_row_index("__idx__").filter(
-            (pl.col("open").is_not_null())
-            & (pl.col("high").is_not_null())
-            & (pl.col("low").is_not_null())
-            & ((pl.col("open") > pl.col("high")) | (pl.col("open") < pl.col("low")))
+            .join(last, on=keys, how="left")
+            .with_columns(
+                pl.when(
+                    pl.col(state_cols["last_trade_date"])
+                    < trade_date_expr(date_col, df.schema[date_col])
+                )
+                .then(
+                    pl.col(state_cols["last_close"])
+                    * pl.col(state_cols["last_adjustment_factor"]).fill_null(1.0)
+                    / factor
+                )
+                .alias(STATE_PREV_CLOSE)
+            )
+            .drop(list(state_cols.values()))
         )
 
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "critical",
-                    "field": "open,high,low",
-                    "message": (
-                        f"Open ({row['open']}) outside range "
-                        f"[low={row['low']}, high={row['high']}]"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+    def _ohlc_consistency_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """OHLC price consistency (high >= low)."""
+        if not all(col in df.columns for col in ["high", "low"]):
+            return []
+
+        return [
+            BusinessRule(
+                name="ohlc_high_low_consistency",
+                field="high,low",
+                fails=(
+                    pl.col("high").is_not_null()
+                    & pl.col("low").is_not_null()
+                    & (pl.col("high") < pl.col("low"))
+                ),
+                message=lambda r: f"OHLC violation: high ({r['high']}) < low ({r['low']})",
             )
+        ]
 
-        return errors
-
-    def _validate_volume_consistency(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate volume > 0 when trades > 0.
-
-        Args:
-            df: DataFrame with volume and trades data
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Check for volume field (could be 'volume' or 'TtlTradgVol')
-        volume_col = None
-        if "volume" in df.columns:
-            volume_col = "volume"
-        elif "TtlTradgVol" in df.columns:
-            volume_col = "TtlTradgVol"
-
-        # Check for trades field (could be 'trades' or 'TtlNbOfTxsExctd')
-        trades_col = None
-        if "trades" in df.columns:
-            trades_col = "trades"
-        elif "TtlNbOfTxsExctd" in df.columns:
-            trades_col = "TtlNbOfTxsExctd"
+    def _ohlc_in_range_rules(self, df: pl.DataFrame, price: str, name: str) -> list[BusinessRule]:
+        """Open or close price within the [low, high] range."""
+        if not all(col in df.columns for col in ["high", "low", price]):
+            return []
+
+        return [
+            BusinessRule(
+                name=name,
+                field=f"{price},high,low",
+                fails=(
+                    pl.col(price).is_not_null()
+                    & pl.col("high").is_not_null()
+                    & pl.col("low").is_not_null()
+                    & ((pl.col(price) > pl.col("high")) | (pl.col(price) < pl.col("low")))
+                ),
+                message=lambda r: (
+                    f"{price.capitalize()} ({r[price]}) outside range "
+                    f"[low={r['low']}, high={r['high']}]"
+                ),
+            )
+        ]
 
+    def _volume_consistency_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Volume > 0 when trades > 0."""
+        volume_col = self._first_column(df, "volume", "TtlTradgVol")
+        trades_col = self._first_column(df, "trades", "TtlNbOfTxsExctd")
         if not volume_col or not trades_col:
-            return errors
-
-        violations = df.with_row_index("__idx__").filter(
-            (pl.col(trades_col).is_not_null())
-            & (pl.col(volume_col).is_not_null())
-            & (pl.col(trades_col) > 0)
-            & (pl.col(volume_col) == 0)
-        )
-
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "critical",
-                    "field": f"{volume_col},{trades_col}",
-                    "message": f"Volume is 0 but trades is {row[trades_col]}",
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+            return []
+
+        return [
+            BusinessRule(
+                name="volume_consistency",
+                field=f"{volume_col},{trades_col}",
+                fails=(
+                    pl.col(trades_col).is_not_null()
+                    & pl.col(volume_col).is_not_null()
+                    & (pl.col(trades_col) > 0)
+                    & (pl.col(volume_col) == 0)
+                ),
+                message=lambda r: f"Volume is 0 but trades is {r[trades_col]}",
             )
+        ]
 
-        return errors
-
-    def _validate_turnover_consistency(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate turnover ≈ volume * average_price (within 5% tolerance).
-
-        Args:
-            df: DataFrame with volume and turnover data
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Map column names
-        volume_col = (
-            "volume"
-            if "volume" in df.columns
-            else "TtlTradgVol"
-            if "TtlTradgVol" in df.columns
-            else None
-        )
-        turnover_col = (
-            "turnover"
-            if "turnover" in df.columns
-            else "TtlTrfVal"
-            if "TtlTrfVal" in df.columns
-            else None
-        )
-        close_col = (
-            "close" if "close" in df.columns else "ClsPric" if "ClsPric" in df.columns else None
-        )
-
-        if not all([volume_col, turnover_col, close_col]):
-            return errors
-
-        # Type guard for mypy
-        assert isinstance(volume_col, str)
-        assert isinstance(turnover_col, str)
-        assert isinstance(close_col, str)
-
-        # Calculate expected turnover (volume * close as proxy for avg price)
-        # Allow 10% tolerance for approximation
-        violations = (
-            df.with_row_index("__idx__")
-            .filter(
-                (pl.col(volume_col).is_not_null())
-                & (pl.col(turnover_col).is_not_null())
-                & (pl.col(close_col).is_not_null())
-                & (pl.col(volume_col) > 0)
-                & (pl.col(turnover_col) > 0)
+    def _turnover_consistency_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Turnover ≈ volume * close (within 10% tolerance)."""
+        volume_col = self._first_column(df, "volume", "TtlTradgVol")
+        turnover_col = self._first_column(df, "turnover", "TtlTrfVal")
+        close_col = self._first_column(df, "close", "ClsPric")
+        if not volume_col or not turnover_col or not close_col:
+            return []
+
+        # Close is used as a proxy for the average traded price
+        expected = pl.col(volume_col) * pl.col(close_col)
+        deviation_pct = (pl.col(turnover_col) - expected).abs() / expected * 100
+
+        def message(r: dict[str, Any]) -> str:
+            expected_turnover = r[volume_col] * r[close_col]
+            deviation = (
+                abs(r[turnover_col] - expected_turnover) / expected_turnover * 100
+                if expected_turnover
+                else float("inf")
             )
-            .with_columns(
-                [
-                    (pl.col(volume_col) * pl.col(close_col)).alias("expected_turnover"),
-                    (
-                        (pl.col(turnover_col) - pl.col(volume_col) * pl.col(close_col)).abs()
-                        / (pl.col(volume_col) * pl.col(close_col))
-                        * 100
-                    ).alias("deviation_pct"),
-                ]
+            return (
+                f"Turnover deviation: {deviation:.1f}% "
+                f"(actual={r[turnover_col]}, "
+                f"expected≈{expected_turnover:.2f})"
             )
-            .filter(
-                pl.col("deviation_pct") > 10  # More than 10% deviation
-            )
-        )
 
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "warning",
-                    "field": f"{turnover_col},{volume_col}",
-                    "message": (
-                        f"Turnover deviation: {row['deviation_pct']:.1f}% "
-                        f"(actual={row[turnover_col]}, "  # type: ignore[index]
-                        f"expected≈{row['expected_turnover']:.2f})"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+        return [
+            BusinessRule(
+                name="turnover_consistency",
+                field=f"{turnover_col},{volume_col}",
+                fails=(
+                    pl.col(volume_col).is_not_null()
+                    & pl.col(turnover_col).is_not_null()
+                    & pl.col(close_col).is_not_null()
+                    & (pl.col(volume_col) > 0)
+                    & (pl.col(turnover_col) > 0)
+                    & (deviation_pct > 10)
+                ),
+                message=message,
+                error_type="warning",
             )
+        ]
 
-        return errors
-
-    def _validate_price_reasonableness(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate price change from prev_close is within reasonable limits.
-
-        Args:
-            df: DataFrame with price data
+    def _price_reasonableness_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Price change from prev_close within max_price_change_pct.
 
-        Returns:
-            List of error details for violations
+        Rows without a prev_close fall back to the last known close of the
+        symbol when the frame carries ``STATE_PREV_CLOSE``.
         """
-        errors: list[dict[str, Any]] = []
-
-        close_col = (
-            "close" if "close" in df.columns else "ClsPric" if "ClsPric" in df.columns else None
-        )
-        prev_close_col = (
-            "prev_close"
-            if "prev_close" in df.columns
-            else "PrvsClsgPric"
-            if "PrvsClsgPric" in df.columns
-            else None
-        )
-
-        if not all([close_col, prev_close_col]):
-            return errors
+        close_col = self._first_column(df, "close", "ClsPric")
+        reference_cols = [
+            col for col in ("prev_close", "PrvsClsgPric", STATE_PREV_CLOSE) if col in df.columns
+        ]
+        if not close_col or not reference_cols:
+            return []
+
+        threshold = self.max_price_change_pct
+        reference = pl.coalesce(reference_cols)
+
+        def message(r: dict[str, Any]) -> str:
+            prev_close = next(r[col] for col in reference_cols if r[col] is not None)
+            change_pct = abs(r[close_col] - prev_close) / prev_close * 100
+            return f"Price change {change_pct:.1f}% exceeds threshold {threshold}%"
+
+        return [
+            BusinessRule(
+                name="price_reasonableness",
+                field=close_col,
+                fails=(
+                    pl.col(close_col).is_not_null()
+                    & reference.is_not_null()
+                    & (reference > 0)
+                    & ((pl.col(close_col) - reference).abs() / reference * 100 > threshold)
+                ),
+                message=message,
+                error_type="warning",
+            )
+        ]
 
-        # Type guard for mypy
-        assert isinstance(close_col, str)
-        assert isinstance(prev_close_col, str)
+    def _prev_close_continuity_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """prev_close within PREV_CLOSE_TOLERANCE_PCT of the last known close."""
+        prev_close_col = self._first_column(df, "prev_close", "PrvsClsgPric")
+        if not prev_close_col:
+            return []
 
-        violations = (
-            df.with_row_index("__idx__")
-            .filter(
-                (pl.col(close_col).is_not_null())
-                & (pl.col(prev_close_col).is_not_null())
-                & (pl.col(prev_close_col) > 0)
-            )
-            .with_columns(
-                [
-                    (
-                        (pl.col(close_col) - pl.col(prev_close_col)).abs()
-                        / pl.col(prev_close_col)
-                        * 100
-                    ).alias("change_pct")
-                ]
+        def message(r: dict[str, Any]) -> str:
+            return (
+                f"prev_close {r[prev_close_col]} differs from last known close "
+                f"{r[STATE_PREV_CLOSE]:.4f} by more than {PREV_CLOSE_TOLERANCE_PCT}%"
             )
-            .filter(pl.col("change_pct") > self.max_price_change_pct)
-        )
 
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "warning",
-                    "field": close_col,
-                    "message": (
-                        f"Price change {row['change_pct']:.1f}% exceeds "
-                        f"threshold {self.max_price_change_pct}%"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+        last_close = pl.col(STATE_PREV_CLOSE)
+        return [
+            BusinessRule(
+                name="prev_close_continuity",
+                field=prev_close_col,
+                fails=(
+                    pl.col(prev_close_col).is_not_null()
+                    & last_close.is_not_null()
+                    & (last_close > 0)
+                    & (
+                        (pl.col(prev_close_col) - last_close).abs() / last_close * 100
+                        > PREV_CLOSE_TOLERANCE_PCT
+                    )
+                ),
+                message=message,
+                error_type="warning",
             )
+        ]
 
-        return errors
-
-    def _validate_price_continuity(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate price continuity after corporate actions.
-
-        Args:
-            df: DataFrame with adjustment factor data
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
+    def _price_continuity_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Positive adjustment factors after corporate actions."""
         if "adjustment_factor" not in df.columns or "adjustment_date" not in df.columns:
-            return errors
-
-        # Check for sudden changes in adjustment factor
-        violations = df.with_row_index("__idx__").filter(
-            (pl.col("adjustment_factor").is_not_null())
-            & (pl.col("adjustment_date").is_not_null())
-            & (pl.col("adjustment_factor") <= 0)
-        )
-
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "critical",
-                    "field": "adjustment_factor",
-                    "message": (
-                        f"Invalid adjustment factor: {row['adjustment_factor']} " f"(must be > 0)"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+            return []
+
+        return [
+            BusinessRule(
+                name="price_continuity_post_ca",
+                field="adjustment_factor",
+                fails=(
+                    pl.col("adjustment_factor").is_not_null()
+                    & pl.col("adjustment_date").is_not_null()
+                    & (pl.col("adjustment_factor") <= 0)
+                ),
+                message=lambda r: (
+                    f"Invalid adjustment factor: {r['adjustment_factor']} (must be > 0)"
+                ),
             )
+        ]
 
-        return errors
-
-    def _validate_duplicates(self, df: pl.DataFrame, schema_name: str) -> list[dict[str, Any]]:
-        """Validate uniqueness of records (no duplicates).
-
-        Args:
-            df: DataFrame to check
-            schema_name: Schema name for determining uniqueness keys
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Determine uniqueness keys based on schema
+    def _duplicate_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Uniqueness of records by instrument and trade date."""
         key_cols = []
         if "entity_id" in df.columns or "instrument_id" in df.columns:
             key_cols.append("entity_id" if "entity_id" in df.columns else "instrument_id")
         elif "symbol" in df.columns:
             key_cols.append("symbol")
 
-        if "trade_date" in df.columns:
-            key_cols.append("trade_date")
-        elif "TradDt" in df.columns:
-            key_cols.append("TradDt")
+        date_col = self._first_column(df, "trade_date", "TradDt")
+        if date_col:
+            key_cols.append(date_col)
 
         if not key_cols:
-            return errors
-
-        # Find duplicates
-        duplicates = df.with_row_index("__idx__").filter(pl.struct(key_cols).is_duplicated())
-
-        if len(duplicates) > 0:
-            # Group by key to show which keys are duplicated
-            dup_groups = duplicates.group_by(key_cols).agg(pl.col("__idx__").alias("indices"))
-
-            for row in dup_groups.iter_rows(named=True):
-                key_str = ", ".join([f"{k}={row[k]}" for k in key_cols])
-                indices = row["indices"]
-                errors.append(
-                    {
-                        "row_index": indices[0] if indices else 0,
-                        "error_type": "critical",
-                        "field": ",".join(key_cols),
-                        "message": f"Duplicate record: {key_str} (found at indices: {indices})",
-                        "validator": "business_logic",
-                        "record": dict(row),
-                    }
-                )
-
-        return errors
-
-    def _validate_freshness(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate data freshness (event_time vs ingest_time).
-
-        Args:
-            df: DataFrame with timestamp columns
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
+            return []
+
+        def message(group: dict[str, Any]) -> str:
+            key_str = ", ".join(f"{k}={group[k]}" for k in key_cols)
+            return f"Duplicate record: {key_str} (found at indices: {group['indices']})"
+
+        return [
+            BusinessRule(
+                name="duplicate_detection",
+                field=",".join(key_cols),
+                fails=pl.struct(key_cols).is_duplicated(),
+                message=message,
+                report="group",
+                group_by=tuple(key_cols),
+            )
+        ]
 
+    def _freshness_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Data freshness (event_time vs ingest_time)."""
         if "event_time" not in df.columns or "ingest_time" not in df.columns:
-            return errors
+            return []
 
         max_freshness_ms = self.max_freshness_hours * 3600 * 1000
-
-        violations = df.with_row_index("__idx__").filter(
-            (pl.col("event_time").is_not_null())
-            & (pl.col("ingest_time").is_not_null())
-            & ((pl.col("ingest_time") - pl.col("event_time")) > max_freshness_ms)
-        )
-
-        for row in violations.iter_rows(named=True):
-            delay_hours = (row["ingest_time"] - row["event_time"]) / (3600 * 1000)
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "warning",
-                    "field": "ingest_time,event_time",
-                    "message": (
-                        f"Data stale: {delay_hours:.1f} hours delay "
-                        f"(threshold: {self.max_freshness_hours}h)"
-                    ),
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+        threshold_hours = self.max_freshness_hours
+
+        def message(r: dict[str, Any]) -> str:
+            delay_hours = (r["ingest_time"] - r["event_time"]) / (3600 * 1000)
+            return f"Data stale: {delay_hours:.1f} hours delay (threshold: {threshold_hours}h)"
+
+        return [
+            BusinessRule(
+                name="data_freshness",
+                field="ingest_time,event_time",
+                fails=(
+                    pl.col("event_time").is_not_null()
+                    & pl.col("ingest_time").is_not_null()
+                    & ((pl.col("ingest_time") - pl.col("event_time")) > max_freshness_ms)
+                ),
+                message=message,
+                error_type="warning",
             )
+        ]
 
-        return errors
-
-    def _validate_timestamps(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate timestamp fields are reasonable.
-
-        Args:
-            df: DataFrame with timestamp columns
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Check event_time and ingest_time are positive and not in future
-        timestamp_cols = []
-        if "event_time" in df.columns:
-            timestamp_cols.append("event_time")
-        if "ingest_time" in df.columns:
-            timestamp_cols.append("ingest_time")
-
-        if not timestamp_cols:
-            return errors
-
+    def _timestamp_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Epoch-millisecond timestamps are positive and not in the future."""
         now_ms = int(datetime.now().timestamp() * 1000)
         # Allow 1 hour into future for clock skew
         future_threshold_ms = now_ms + (3600 * 1000)
 
-        for col in timestamp_cols:
-            violations = df.with_row_index("__idx__").filter(
-                (pl.col(col).is_not_null())
-                & ((pl.col(col) < 0) | (pl.col(col) > future_threshold_ms))
+        return [
+            BusinessRule(
+                name="timestamp_validation",
+                field=col,
+                fails=(
+                    pl.col(col).is_not_null()
+                    & ((pl.col(col) < 0) | (pl.col(col) > future_threshold_ms))
+                ),
+                message=lambda r, col=col: (
+                    f"Invalid timestamp: {r[col]} (negative or too far in future)"
+                ),
             )
+            for col in ("event_time", "ingest_time")
+            if col in df.columns
+        ]
 
-            for row in violations.iter_rows(named=True):
-                errors.append(
-                    {
-                        "row_index": row["__idx__"],
-                        "error_type": "critical",
-                        "field": col,
-                        "message": f"Invalid timestamp: {row[col]} (negative or too far in future)",
-                        "validator": "business_logic",
-                        "record": dict(row),
-                    }
-                )
-
-        return errors
-
-    def _validate_missing_critical_data(
+    def _missing_critical_data_rules(
         self, df: pl.DataFrame, schema_name: str
-    ) -> list[dict[str, Any]]:
-        """Validate that critical fields are not null when they should have values.
-
-        Args:
-            df: DataFrame to check
-            schema_name: Schema name for determining critical fields
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        # Define critical fields by schema type
+    ) -> list[BusinessRule]:
+        """Critical fields are not null (one error per field)."""
         critical_fields = []
         if "ohlc" in schema_name:
             critical_fields = ["open", "high", "low", "close"]
             if "normalized" in schema_name:
                 critical_fields.extend(["volume", "turnover"])
 
-        if not critical_fields:
-            return errors
-
-        for col_field in critical_fields:
-            if col_field not in df.columns:
-                continue
-
-            violations = df.with_row_index("__idx__").filter(pl.col(col_field).is_null())
-
-            if len(violations) > 0:
-                errors.append(
-                    {
-                        "row_index": violations["__idx__"][0],
-                        "error_type": "critical",
-                        "field": col_field,
-                        "message": f"Critical field '{col_field}' has {len(violations)} null values",
-                        "validator": "business_logic",
-                        "record": {},
-                    }
-                )
-
-        return errors
-
-    def _validate_non_negative_prices(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate all price fields are non-negative.
-
-        Args:
-            df: DataFrame with price columns
-
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        price_cols = [
-            col
-            for col in df.columns
-            if any(
-                price_term in col.lower()
-                for price_term in ["pric", "price", "open", "high", "low", "close"]
+        return [
+            BusinessRule(
+                name="missing_critical_data",
+                field=col_field,
+                fails=pl.col(col_field).is_null(),
+                message=lambda c, col_field=col_field: (
+                    f"Critical field '{col_field}' has {c['count']} null values"
+                ),
+                report="column",
             )
+            for col_field in critical_fields
+            if col_field in df.columns
         ]
 
-        for col in price_cols:
-            # Skip if not numeric
-            if df[col].dtype not in [pl.Float32, pl.Float64, pl.Int32, pl.Int64]:
-                continue
-
-            violations = df.with_row_index("__idx__").filter(
-                (pl.col(col).is_not_null()) & (pl.col(col) < 0)
+    def _non_negative_price_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """All numeric price fields are non-negative."""
+        price_terms = ["pric", "price", "open", "high", "low", "close"]
+        return [
+            BusinessRule(
+                name="non_negative_prices",
+                field=col,
+                fails=pl.col(col).is_not_null() & (pl.col(col) < 0),
+                message=lambda r, col=col: f"Negative price: {r[col]}",
             )
+            for col in df.columns
+            if any(term in col.lower() for term in price_terms)
+            and df.schema[col] in NUMERIC_RULE_DTYPES
+        ]
 
-            for row in violations.iter_rows(named=True):
-                errors.append(
-                    {
-                        "row_index": row["__idx__"],
-                        "error_type": "critical",
-                        "field": col,
-                        "message": f"Negative price: {row[col]}",
-                        "validator": "business_logic",
-                        "record": dict(row),
-                    }
-                )
-
-        return errors
-
-    def _validate_non_negative_volume(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate volume fields are non-negative.
+    def _non_negative_volume_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """All numeric volume fields are non-negative."""
+        volume_terms = ["vol", "volume", "qty"]
+        return [
+            BusinessRule(
+                name="non_negative_volume",
+                field=col,
+                fails=pl.col(col).is_not_null() & (pl.col(col) < 0),
+                message=lambda r, col=col: f"Negative volume: {r[col]}",
+            )
+            for col in df.columns
+            if any(term in col.lower() for term in volume_terms)
+            and df.schema[col] in NUMERIC_RULE_DTYPES
+        ]
 
-        Args:
-            df: DataFrame with volume columns
+    def _date_range_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Integer trade dates (days since epoch) within a reasonable range."""
+        date_col = self._first_column(df, "trade_date", "TradDt")
+        if not date_col or df.schema[date_col] not in (pl.Int32, pl.Int64):
+            return []
 
-        Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
+        # Stock market data: 1990-01-01 (7305 days) to today + 1 day
+        min_date = 7305  # ~1990-01-01
+        max_date = int(datetime.now().timestamp() / 86400) + 1  # Today + 1
 
-        volume_cols = [
-            col for col in df.columns if any(v in col.lower() for v in ["vol", "volume", "qty"])
+        return [
+            BusinessRule(
+                name="date_range_validation",
+                field=date_col,
+                fails=(
+                    pl.col(date_col).is_not_null()
+                    & ((pl.col(date_col) < min_date) | (pl.col(date_col) > max_date))
+                ),
+                message=lambda r: (
+                    f"Date out of range: {r[date_col]} (valid: {min_date}-{max_date})"
+                ),
+            )
         ]
 
-        for col in volume_cols:
-            # Skip if not numeric
-            if df[col].dtype not in [pl.Float32, pl.Float64, pl.Int32, pl.Int64]:
-                continue
-
-            violations = df.with_row_index("__idx__").filter(
-                (pl.col(col).is_not_null()) & (pl.col(col) < 0)
+    def _trading_day_completeness_rules(self, df: pl.DataFrame) -> list[BusinessRule]:
+        """Trading-day flag is not set on rows without volume."""
+        if "is_trading_day" not in df.columns or "volume" not in df.columns:
+            return []
+
+        return [
+            BusinessRule(
+                name="trading_day_completeness",
+                field="is_trading_day,volume",
+                fails=pl.col("is_trading_day") & (pl.col("volume") == 0),
+                message=lambda _: "Trading day flag set but volume is 0",
+                error_type="warning",
             )
+        ]
 
-            for row in violations.iter_rows(named=True):
-                errors.append(
-                    {
-                        "row_index": row["__idx__"],
-                        "error_type": "critical",
-                        "field": col,
-                        "message": f"Negative volume: {row[col]}",
-                        "validator": "business_logic",
-                        "record": dict(row),
-                    }
-                )
-
-        return errors
+    def validate_file(
+        self,
+        file_path: Path,
+        schema_name: str,
+        quarantine_dir: Path | None = None,
+        streaming: bool = False,
+        max_workers: int | None = None,
+        ledger: ValidationLedger | None = None,
+        force: bool = False,
+        since: datetime | None = None,
+    ) -> ValidationResult:
+        """Validate a Parquet file against a JSON schema.
 
-    def _validate_date_range(self, df: pl.DataFrame, schema_name: str) -> list[dict[str, Any]]:
-        """Validate dates are within reasonable range (not too old or in future).
+        With a ``ledger``, a file whose contents, schema, rule set and custom
+        validators are unchanged since it was last validated is skipped and
+        the recorded result is returned. When ``quarantine_dir`` is given, a
+        file with failures is only skipped if they were already quarantined
+        there; otherwise it is revalidated, since quarantine needs the full
+        violations table the ledger does not keep.
 
         Args:
-            df: DataFrame with date columns
-            schema_name: Schema name
+            file_path: Path to Parquet file to validate
+            schema_name: Name of the schema to validate against
+            quarantine_dir: Directory to write quarantined records (optional)
+            streaming: Validate row group by row group with bounded memory
+                (see ``validate_file_streaming``) instead of reading the whole file
+            max_workers: Row groups validated concurrently when streaming
+            ledger: Ledger of previous validations (optional)
+            force: Validate even if the ledger has a result for the file
+            since: Only reuse ledger results recorded at or after this time
 
         Returns:
-            List of error details for violations
+            ValidationResult with validation statistics
         """
-        errors: list[dict[str, Any]] = []
-
-        date_col = None
-        if "trade_date" in df.columns:
-            date_col = "trade_date"
-        elif "TradDt" in df.columns:
-            date_col = "TradDt"
+        key = None
+        if ledger is not None:
+            key = self.ledger_key(file_path, schema_name)
+            recorded = (
+                None if force else ledger.lookup(key, since=since, quarantine_dir=quarantine_dir)
+            )
+            if recorded is not None:
+                logger.info(
+                    "validation_skipped_unchanged",
+                    file_path=str(file_path),
+                    schema_name=schema_name,
+                    critical_failures=recorded.critical_failures,
+                )
+                return recorded
 
-        if not date_col:
-            return errors
+        logger.info(
+            "validating_file",
+            file_path=str(file_path),
+            schema_name=schema_name,
+            streaming=streaming,
+        )
 
-        # For integer dates (days since epoch), check reasonable range
-        # Stock market data: 1990-01-01 (7305 days) to today + 1 day
-        min_date = 7305  # ~1990-01-01
-        max_date = int(datetime.now().timestamp() / 86400) + 1  # Today + 1
+        if streaming:
+            result = self.validate_file_streaming(file_path, schema_name, max_workers=max_workers)
+            # Only the failed rows are read back for quarantine
+            source: pl.DataFrame | pl.LazyFrame = pl.scan_parquet(file_path)
+        else:
+            source = pl.read_parquet(file_path)
+            result = self.validate_dataframe(source, schema_name)
 
-        if df[date_col].dtype in [pl.Int32, pl.Int64]:
-            violations = df.with_row_index("__idx__").filter(
-                (pl.col(date_col).is_not_null())
-                & ((pl.col(date_col) < min_date) | (pl.col(date_col) > max_date))
-            )
+        # Quarantine failed records if requested
+        quarantined_to = None
+        if quarantine_dir and result.critical_failures > 0:
+            self._quarantine_failures(source, result, quarantine_dir, schema_name)
+            quarantined_to = quarantine_dir
 
-            for row in violations.iter_rows(named=True):
-                errors.append(
-                    {
-                        "row_index": row["__idx__"],
-                        "error_type": "critical",
-                        "field": date_col,
-                        "message": (
-                            f"Date out of range: {row[date_col]} " f"(valid: {min_date}-{max_date})"
-                        ),
-                        "validator": "business_logic",
-                        "record": dict(row),
-                    }
-                )
+        if ledger is not None and key is not None:
+            ledger.record(key, file_path, schema_name, result, quarantine_dir=quarantined_to)
 
-        return errors
+        return result
 
-    def _validate_trading_day_completeness(self, df: pl.DataFrame) -> list[dict[str, Any]]:
-        """Validate that is_trading_day flag is set correctly.
+    def ledger_key(self, file_path: Path, schema_name: str) -> LedgerKey:
+        """Build the ledger key for validating a file against a schema.
 
         Args:
-            df: DataFrame with is_trading_day column
+            file_path: Path to Parquet file
+            schema_name: Name of a loaded schema
 
         Returns:
-            List of error details for violations
-        """
-        errors: list[dict[str, Any]] = []
-
-        if "is_trading_day" not in df.columns or "volume" not in df.columns:
-            return errors
+            LedgerKey of the file contents, schema, rule set and custom validators
 
-        # If is_trading_day is True but volume is 0 (and close != prev_close), flag as warning
-        violations = df.with_row_index("__idx__").filter(
-            pl.col("is_trading_day") & (pl.col("volume") == 0)
-        )
-
-        for row in violations.iter_rows(named=True):
-            errors.append(
-                {
-                    "row_index": row["__idx__"],
-                    "error_type": "warning",
-                    "field": "is_trading_day,volume",
-                    "message": "Trading day flag set but volume is 0",
-                    "validator": "business_logic",
-                    "record": dict(row),
-                }
+        Raises:
+            ValueError: If the schema is not loaded
+        """
+        if schema_name not in self.schemas:
+            raise ValueError(
+                f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas.keys())}"
             )
+        canonical_schema = json.dumps(self.schemas[schema_name], sort_keys=True)
+        rule_settings = ":".join(
+            [
+                RULES_VERSION,
+                str(self.enable_all_rules),
+                str(self.max_price_change_pct),
+                str(self.max_freshness_hours),
+            ]
+        )
+        return LedgerKey(
+            file_hash=file_digest(Path(file_path)),
+            schema_hash=hashlib.sha256(canonical_schema.encode()).hexdigest(),
+            rules_version=rule_settings,
+            custom_validators=",".join(sorted(self.custom_validators)),
+        )
 
-        return errors
-
-    def validate_file(
+    def validate_file_streaming(
         self,
         file_path: Path,
         schema_name: str,
-        quarantine_dir: Path | None = None,
+        max_workers: int | None = None,
+        batch_size: int = 10000,
     ) -> ValidationResult:
-        """Validate a Parquet file against a JSON schema.
+        """Validate a Parquet file row group by row group with bounded memory.
+
+        Row groups are validated in parallel and their results merged, so peak
+        memory tracks the row-group size rather than the file size. Error details
+        match ``validate_dataframe`` on the whole file, except that custom
+        validators are run on each row group separately.
 
         Args:
             file_path: Path to Parquet file to validate
             schema_name: Name of the schema to validate against
-            quarantine_dir: Directory to write quarantined records (optional)
+            max_workers: Row groups validated concurrently (default: CPU count)
+            batch_size: Rows per schema validation batch within a row group
 
         Returns:
-            ValidationResult with validation statistics
+            ValidationResult with validation statistics and error details
         """
-        logger.info("validating_file", file_path=str(file_path), schema_name=schema_name)
-
-        # Read Parquet file
-        df = pl.read_parquet(file_path)
+        if schema_name not in self.schemas:
+            raise ValueError(
+                f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas.keys())}"
+            )
 
-        # Validate
-        result = self.validate_dataframe(df, schema_name)
+        # Rules only depend on the columns, so declare them from the file schema
+        empty = pl.from_arrow(pq.read_schema(file_path).empty_table())
+        assert isinstance(empty, pl.DataFrame)
+        rules_applied = ["schema_validation"]
+        rules: list[BusinessRule] = []
+        custom_validators: dict[str, Callable] = {}
+        if self.enable_all_rules:
+            rules, business_rules = self._business_rules(empty, schema_name)
+            rules_applied.extend(business_rules)
+            custom_validators = self.custom_validators
+
+        outcome = RowGroupValidator(
+            self._compiled_schema(schema_name),
+            rules,
+            custom_validators=custom_validators,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            max_error_samples=self.max_error_samples,
+        ).validate(Path(file_path))
 
-        # Quarantine failed records if requested
-        if quarantine_dir and result.critical_failures > 0:
-            self._quarantine_failures(df, result, quarantine_dir, schema_name)
+        rules_applied.extend(
+            f"custom_{name}"
+            for name in custom_validators
+            if name not in outcome.failed_custom_validators
+        )
 
-        return result
+        return self._build_result(schema_name, outcome.total_rows, outcome.summary, rules_applied)
 
     def quarantine_failures(
         self,
@@ -1064,7 +1074,7 @@ class ParquetValidator:
 
     def _quarantine_failures(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | pl.LazyFrame,
         result: ValidationResult,
         quarantine_dir: Path,
         schema_name: str,
@@ -1074,7 +1084,8 @@ class ParquetValidator:
         Private implementation of quarantine functionality.
 
         Args:
-            df: Original DataFrame
+            df: Original DataFrame, or a LazyFrame over it (only the failed rows
+                are collected)
             result: Validation result with error details
             quarantine_dir: Directory to write quarantined records
             schema_name: Schema name for organizing quarantine files
@@ -1083,36 +1094,56 @@ class ParquetValidator:
         quarantine_dir.mkdir(parents=True, exist_ok=True)
 
         # Get indices of failed rows
-        failed_indices = list({e["row_index"] for e in result.error_details})
+        failed_indices = result.failed_row_indices()
 
-        if not failed_indices:
+        if failed_indices.is_empty():
             return
 
-        # Extract failed rows
-        failed_df = df[failed_indices]
-
-        # Add error information and audit trail
-        error_map: dict[int, list[str]] = {}
-        error_types: dict[int, list[str]] = {}
-        for error in result.error_details:
-            idx = error["row_index"]
-            if idx not in error_map:
-                error_map[idx] = []
-                error_types[idx] = []
-            error_map[idx].append(f"{error['field']}: {error['message']}")
-            error_types[idx].append(error["error_type"])
-
-        error_messages = [
-            "; ".join(error_map.get(orig_idx, ["Unknown error"])) for orig_idx in failed_indices
-        ]
-        error_type_list = [
-            ",".join(set(error_types.get(orig_idx, ["unknown"]))) for orig_idx in failed_indices
-        ]
+        # Extract failed rows straight from the index array
+        if isinstance(df, pl.LazyFrame):
+            failed_df = (
+                df.with_row_index("__idx__")
+                .filter(pl.col("__idx__").is_in(failed_indices))
+                .drop("__idx__")
+                .collect()
+            )
+        else:
+            failed_df = df[failed_indices]
+
+        # Every row lists the rules it failed; sampled rows also keep the messages
+        sampled = (
+            pl.DataFrame(
+                {
+                    "row_index": [e["row_index"] for e in result.error_details],
+                    "message": [f"{e['field']}: {e['message']}" for e in result.error_details],
+                },
+                schema={"row_index": pl.Int64, "message": pl.Utf8},
+            )
+            .group_by("row_index", maintain_order=True)
+            .agg(pl.col("message").str.concat("; ").alias("sampled_errors"))
+        )
+        # Quarantined rows also list the warnings they got
+        per_row = (
+            result.violation_table()
+            .filter(pl.col("row_index").is_in(failed_indices))
+            .group_by("row_index")
+            .agg(
+                pl.col("rule").unique(maintain_order=True).str.concat("; "),
+                pl.col("error_type").unique(maintain_order=True).str.concat(","),
+            )
+            .join(sampled, on="row_index", how="left")
+            .sort("row_index")
+            .select(
+                pl.col("rule").alias("validation_errors"),
+                pl.col("error_type").alias("error_types"),
+                "sampled_errors",
+            )
+        )
 
-        failed_df = failed_df.with_columns(
+        # Re-quarantined rows get fresh error columns
+        failed_df = failed_df.drop([c for c in per_row.columns if c in failed_df.columns])
+        failed_df = pl.concat([failed_df, per_row], how="horizontal").with_columns(
             [
-                pl.lit(error_messages).alias("validation_errors"),
-                pl.lit(error_type_list).alias("error_types"),
                 pl.lit(schema_name).alias("schema_name"),
                 pl.lit(result.validation_timestamp).alias("quarantine_timestamp"),
                 pl.lit(",".join(result.validation_rules_applied)).alias("rules_applied"),
@@ -1120,29 +1151,23 @@ class ParquetValidator:
             ]
         )
 
-        # Write to quarantine with timestamp
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        quarantine_file = quarantine_dir / f"{schema_name}_failures_{timestamp_str}.parquet"
-        failed_df.write_parquet(quarantine_file)
-
-        # Also write/update audit log
-        audit_log_file = quarantine_dir / "audit_log.jsonl"
-        audit_entry = {
-            "timestamp": result.validation_timestamp,
-            "schema_name": schema_name,
-            "quarantine_file": str(quarantine_file.name),
-            "failed_rows": len(failed_indices),
-            "total_rows": result.total_rows,
-            "rules_applied": result.validation_rules_applied,
-            "failure_rate": len(failed_indices) / result.total_rows if result.total_rows > 0 else 0,
-        }
-
-        with open(audit_log_file, "a") as f:
-            f.write(json.dumps(audit_entry) + "\n")
+        store = QuarantineStore(quarantine_dir)
+        quarantine_file = store.write(
+            failed_df,
+            schema_name,
+            {
+                "failed_rows": len(failed_indices),
+                "total_rows": result.total_rows,
+                "rules_applied": result.validation_rules_applied,
+                "rule_counts": result.rule_counts,
+                "failure_rate": (
+                    len(failed_indices) / result.total_rows if result.total_rows > 0 else 0.0
+                ),
+            },
+        )
 
         logger.info(
             "quarantined_failures",
             quarantine_file=str(quarantine_file),
             failed_rows=len(failed_indices),
-            audit_log=str(audit_log_file),
         )
@@ -19,7 +19,8 @@ class TestFlowExceptionHandling:
     def test_scrape_bhavcopy_connection_error(self, mock_scraper_class, caplog):
         """Test that ConnectionError is handled as retryable."""
         mock_scraper = Mock()
-        mock_scraper.scrape.side_effect = ConnectionError("Network unavailable")
+        mock_scraper.local_file.return_value = None
+        mock_scraper.fetch.side_effect = ConnectionError("Network unavailable")
         mock_scraper_class.return_value = mock_scraper
 
         with pytest.raises(ConnectionError):
@@ -32,7 +33,8 @@ class TestFlowExceptionHandling:
     def test_scrape_bhavcopy_timeout_error(self, mock_scraper_class, caplog):
         """Test that TimeoutError is handled as retryable."""
         mock_scraper = Mock()
-        mock_scraper.scrape.side_effect = TimeoutError("Request timed out")
+        mock_scraper.local_file.return_value = None
+        mock_scraper.fetch.side_effect = TimeoutError("Request timed out")
         mock_scraper_class.return_value = mock_scraper
 
         with pytest.raises(TimeoutError):
@@ -45,7 +47,8 @@ class TestFlowExceptionHandling:
     def test_scrape_bhavcopy_file_error(self, mock_scraper_class, caplog):
         """Test that FileNotFoundError is handled as retryable."""
         mock_scraper = Mock()
-        mock_scraper.scrape.side_effect = FileNotFoundError("File not found")
+        mock_scraper.local_file.return_value = None
+        mock_scraper.fetch.side_effect = FileNotFoundError("File not found")
         mock_scraper_class.return_value = mock_scraper
 
         with pytest.raises(FileNotFoundError):
@@ -58,7 +61,8 @@ class TestFlowExceptionHandling:
     def test_scrape_bhavcopy_validation_error(self, mock_scraper_class, caplog):
         """Test that ValueError is handled as non-retryable."""
         mock_scraper = Mock()
-        mock_scraper.scrape.side_effect = ValueError("Invalid date format")
+        mock_scraper.local_file.return_value = None
+        mock_scraper.fetch.side_effect = ValueError("Invalid date format")
         mock_scraper_class.return_value = mock_scraper
 
         with pytest.raises(ValueError):
@@ -71,7 +75,8 @@ class TestFlowExceptionHandling:
     def test_scrape_bhavcopy_unexpected_error(self, mock_scraper_class, caplog):
         """Test that unexpected errors are converted to RuntimeError."""
         mock_scraper = Mock()
-        mock_scraper.scrape.side_effect = Exception("Unexpected error")
+        mock_scraper.local_file.return_value = None
+        mock_scraper.fetch.side_effect = Exception("Unexpected error")
         mock_scraper_class.return_value = mock_scraper
 
         with pytest.raises(RuntimeError) as exc_info:
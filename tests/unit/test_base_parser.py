@@ -5,7 +5,7 @@ from pathlib import Path
 
 import polars as pl
 import pytest
-from champion.parsers.base_parser import Parser
+from champion.parsers.base_parser import ENVELOPE_COLUMNS, Parser
 
 # Test constants
 TEST_TIMESTAMP = datetime(2024, 1, 15, 12, 30, 45)
@@ -168,3 +168,57 @@ class TestCustomValidation:
             parser.validate_schema(df)
 
         assert "Missing 'value' column" in str(exc_info.value)
+
+
+class TestColumnarEvents:
+    """Test the columnar event batch contract."""
+
+    @pytest.fixture
+    def flat_df(self):
+        """Flat frame with envelope and payload columns."""
+        return pl.DataFrame(
+            {
+                "event_id": ["e1", "e2"],
+                "event_time": [1, 2],
+                "ingest_time": [3, 4],
+                "source": ["test", "test"],
+                "schema_version": ["v1", "v1"],
+                "entity_id": ["A:NSE", "B:NSE"],
+                "symbol": ["A", "B"],
+                "close": [10.5, None],
+            }
+        )
+
+    def test_parse_events_not_implemented_by_default(self, tmp_path):
+        """Test that parse_events raises NotImplementedError by default."""
+        with pytest.raises(NotImplementedError, match="ConcreteParser"):
+            ConcreteParser().parse_events(tmp_path / "x.csv")
+
+    def test_to_event_frame_packs_payload_struct(self, flat_df):
+        """Test that non-envelope columns are packed into a payload struct."""
+        events = Parser.to_event_frame(flat_df)
+
+        assert events.columns == [*ENVELOPE_COLUMNS, "payload"]
+        assert isinstance(events.schema["payload"], pl.Struct)
+        assert [f.name for f in events.schema["payload"].fields] == ["symbol", "close"]
+
+    def test_iter_events_yields_nested_dicts(self, flat_df):
+        """Test that iter_events lazily yields envelope + payload dicts."""
+        iterator = Parser.iter_events(Parser.to_event_frame(flat_df), batch_size=1)
+
+        first = next(iterator)
+        assert first["event_id"] == "e1"
+        assert first["payload"] == {"symbol": "A", "close": 10.5}
+        assert next(iterator)["payload"] == {"symbol": "B", "close": None}
+
+    def test_events_from_dicts_round_trip(self, flat_df):
+        """Test that nested and flat event dicts both build the same batch."""
+        events = Parser.to_event_frame(flat_df)
+        nested = Parser.events_to_dicts(events)
+
+        assert Parser.events_from_dicts(nested).equals(events)
+        assert Parser.events_from_dicts(flat_df.to_dicts()).equals(events)
+
+    def test_events_from_dicts_empty(self):
+        """Test that an empty event list yields an empty frame."""
+        assert Parser.events_from_dicts([]).is_empty()
@@ -0,0 +1,165 @@
+"""Tests for columnar bulk/block deals parsing."""
+
+import json
+import uuid
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.orchestration.tasks.bulk_block_deals_tasks import parse_bulk_block_deals
+from champion.parsers.bulk_block_deals_parser import BulkBlockDealsParser
+
+DEAL_DATE = date(2026, 1, 10)
+
+EVENT_KEYS = [
+    "event_id",
+    "event_time",
+    "ingest_time",
+    "source",
+    "schema_version",
+    "entity_id",
+    "deal_date",
+    "symbol",
+    "client_name",
+    "quantity",
+    "avg_price",
+    "deal_type",
+    "transaction_type",
+    "exchange",
+    "year",
+    "month",
+    "day",
+]
+
+
+@pytest.fixture
+def deals_json(tmp_path):
+    path = tmp_path / "bulk.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "symbol": "tatasteel",
+                    "clientName": "ABC",
+                    "buyQty": 1000,
+                    "sellQty": 0,
+                    "buyAvgPrice": 120.5,
+                    "sellAvgPrice": 0,
+                },
+                {
+                    "symbol": "INFY",
+                    "clientName": " XYZ ",
+                    "buyQty": 500,
+                    "sellQty": 250.7,
+                    "buyAvgPrice": 1500.25,
+                    "sellAvgPrice": None,
+                },
+                {
+                    "symbol": "  ",
+                    "clientName": "SKIP",
+                    "buyQty": 10,
+                    "sellQty": 10,
+                    "buyAvgPrice": 1.0,
+                    "sellAvgPrice": 1.0,
+                },
+            ]
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def deals_csv(tmp_path):
+    path = tmp_path / "block.csv"
+    path.write_text(
+        "Symbol,SecurityName,ClientName,Buy/Sell,QuantityTraded,"
+        "TradePrice/Wght.Avg.Price,Remarks\n"
+        'TCS,Tata Consultancy,ABC LTD,buy,"1,200",3500.50,-\n'
+        "INFY,Infosys,XYZ,SELL,250,1500.25,\n"
+        "HDFC,HDFC Bank,Q,BUY,abc,10,\n"
+        "SBIN,SBI,Q,,500,10,\n"
+    )
+    return path
+
+
+class TestBulkBlockDealsParser:
+    """Tests for BulkBlockDealsParser."""
+
+    def test_expands_buy_and_sell_sides_in_row_order(self, deals_json):
+        """Test that each non-zero side becomes one event, BUY before SELL."""
+        events = BulkBlockDealsParser().parse(deals_json, DEAL_DATE, "BULK")
+
+        assert [(e["symbol"], e["transaction_type"]) for e in events] == [
+            ("TATASTEEL", "BUY"),
+            ("INFY", "BUY"),
+            ("INFY", "SELL"),
+        ]
+        assert list(events[0]) == EVENT_KEYS
+        assert events[0]["entity_id"] == "tatasteel:BULK:BUY:20260110"
+        assert events[1]["client_name"] == "XYZ"
+
+    def test_casts_quantity_and_price(self, deals_json):
+        """Test that quantities truncate to int and null prices become 0.0."""
+        sell = BulkBlockDealsParser().parse(deals_json, DEAL_DATE, "bulk")[2]
+
+        assert sell["quantity"] == 250
+        assert isinstance(sell["quantity"], int)
+        assert sell["avg_price"] == 0.0
+        assert sell["deal_type"] == "BULK"
+        assert (sell["year"], sell["month"], sell["day"]) == (2026, 1, 10)
+
+    def test_event_ids_are_unique_uuid4(self, deals_json):
+        """Test that every event gets its own random event ID."""
+        events = BulkBlockDealsParser().parse(deals_json, DEAL_DATE, "BULK")
+
+        ids = [uuid.UUID(e["event_id"]) for e in events]
+        assert len(set(ids)) == len(events)
+        assert all(u.version == 4 for u in ids)
+
+    def test_parse_events_is_columnar(self, deals_json):
+        """Test that parse_events packs the payload into a struct column."""
+        events = BulkBlockDealsParser().parse_events(deals_json, DEAL_DATE, "BULK")
+
+        assert events.columns[-1] == "payload"
+        assert isinstance(events.schema["payload"], pl.Struct)
+        assert len(events) == 3
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty deals list yields no events."""
+        path = tmp_path / "empty.json"
+        path.write_text("[]")
+        parser = BulkBlockDealsParser()
+
+        assert parser.parse(path, DEAL_DATE, "BULK") == []
+        assert parser.parse_events(path, DEAL_DATE, "BULK").is_empty()
+
+
+class TestParseBulkBlockDealsTask:
+    """Tests for the CSV-based parse_bulk_block_deals task."""
+
+    def test_parses_valid_rows(self, deals_csv):
+        """Test that rows without side or quantity are dropped."""
+        events = parse_bulk_block_deals(deals_csv, DEAL_DATE, "block")
+
+        assert [(e["symbol"], e["quantity"], e["avg_price"]) for e in events] == [
+            ("TCS", 1200, 3500.5),
+            ("INFY", 250, 1500.25),
+        ]
+        tcs = events[0]
+        assert tcs["transaction_type"] == "BUY"
+        assert tcs["raw_buy_sell"] == "buy"
+        assert tcs["remarks"] == "-"
+        assert tcs["entity_id"] == "TCS:BLOCK:BUY:20260110"
+        assert events[1]["remarks"] == ""
+        assert list(tcs)[-6:] == [
+            "security_name",
+            "remarks",
+            "raw_buy_sell",
+            "year",
+            "month",
+            "day",
+        ]
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file yields no events."""
+        assert parse_bulk_block_deals(tmp_path / "missing.csv", DEAL_DATE, "BULK") == []
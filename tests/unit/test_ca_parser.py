@@ -0,0 +1,110 @@
+"""Tests for the NSE corporate actions parser."""
+
+import polars as pl
+import pytest
+from champion.parsers.ca_parser import CorporateActionsParser, classify_purposes
+
+PURPOSES = [
+    "Stock Split From Rs 10/- to Rs 2/- Per Share",
+    "Bonus 1:2",
+    "Dividend - Rs 15 Per Share",
+    "Annual General Meeting",
+    "Something odd",
+    None,
+    "Sub-Division From Rs. 5/- to Rs. 1/-",
+    "Interim Dividend",
+    "Stock split",
+]
+
+
+@pytest.fixture
+def purposes() -> pl.DataFrame:
+    return pl.DataFrame({"PURPOSE": PURPOSES}, schema={"PURPOSE": pl.Utf8})
+
+
+class TestClassifyPurposes:
+    """Tests for the columnar purpose classifier."""
+
+    def test_matches_scalar_parser(self, purposes):
+        """Test that the columnar classifier agrees with the per-string methods."""
+        parser = CorporateActionsParser()
+
+        df = classify_purposes(purposes).df
+
+        for purpose, action_type, factor in df.select(
+            "PURPOSE", "action_type", "adjustment_factor"
+        ).iter_rows():
+            if purpose is None:
+                assert action_type is None
+                continue
+            assert action_type == parser.parse_action_type(purpose)
+            assert factor == parser.compute_adjustment_factor(action_type, purpose)
+
+    def test_ratios_and_amounts(self, purposes):
+        """Test extracted split/bonus ratios and dividend amounts."""
+        df = classify_purposes(purposes).df
+
+        assert df["adjustment_factor"].to_list()[:3] == [5.0, 1.5, 1.0]
+        assert df.row(0, named=True)["split_ratio"] == {"old_shares": 1, "new_shares": 5}
+        assert df.row(1, named=True)["bonus_ratio"] == {"new_shares": 1, "existing_shares": 2}
+        assert df["dividend_amount"][2] == 15.0
+        assert df["split_ratio"].is_null().sum() == len(PURPOSES) - 2
+
+    def test_default_factor(self, purposes):
+        """Test that rows without a computable factor use default_factor."""
+        df = classify_purposes(purposes, default_factor=None).df
+
+        assert df["adjustment_factor"].null_count() == len(PURPOSES) - 3
+
+    def test_reports_unparsed_purposes(self):
+        """Test that unparsed purposes are aggregated with a reason."""
+        df = pl.DataFrame({"PURPOSE": ["Stock split", "Stock split", "Something odd", "Bonus"]})
+
+        unparsed = classify_purposes(df).unparsed
+
+        assert unparsed.rows() == [
+            ("Stock split", "SPLIT", "NO_SPLIT_RATIO", 2),
+            ("Bonus", "BONUS", "NO_BONUS_RATIO", 1),
+            ("Something odd", "OTHER", "UNKNOWN_ACTION", 1),
+        ]
+
+    def test_zero_denominators_are_unparsed(self):
+        """Test that zero face values or zero existing shares do not divide by zero."""
+        df = pl.DataFrame({"PURPOSE": ["Split From Rs 10 to Rs 0", "Bonus 1:0"]})
+
+        result = classify_purposes(df)
+
+        assert result.df["adjustment_factor"].to_list() == [1.0, 1.0]
+        assert result.unparsed["reason"].to_list() == ["NO_BONUS_RATIO", "NO_SPLIT_RATIO"]
+
+    def test_replaces_existing_derived_columns(self):
+        """Test that existing derived columns are replaced rather than suffixed."""
+        df = pl.DataFrame({"PURPOSE": ["Bonus 1:1"], "action_type": [None]})
+
+        result = classify_purposes(df).df
+
+        assert "action_type_right" not in result.columns
+        assert result["action_type"].to_list() == ["BONUS"]
+        assert result["adjustment_factor"].to_list() == [2.0]
+
+
+class TestCorporateActionsParser:
+    """Tests for CorporateActionsParser.parse_to_dataframe."""
+
+    def test_parse_keeps_row_order_and_records_unparsed(self, tmp_path):
+        """Test that parsing classifies each row and exposes unparsed purposes."""
+        csv = tmp_path / "ca.csv"
+        csv.write_text(
+            "SYMBOL,PURPOSE,EX-DATE,RECORD DATE,BC START DATE,BC END DATE\n"
+            "AAA,Bonus 1:1,01-Jan-2024,02-Jan-2024,-,-\n"
+            "BBB,Something odd,05-Feb-2024,,-,-\n"
+            "CCC,Bonus 1:1,05-Mar-2024,,-,-\n"
+        )
+        parser = CorporateActionsParser()
+
+        df = parser.parse(csv)
+
+        assert df["SYMBOL"].to_list() == ["AAA", "BBB", "CCC"]
+        assert df["action_type"].to_list() == ["BONUS", "OTHER", "BONUS"]
+        assert df["adjustment_factor"].to_list() == [2.0, 1.0, 2.0]
+        assert parser.unparsed_purposes["purpose"].to_list() == ["Something odd"]
@@ -39,6 +39,7 @@ class TestCLIStructure:
         result = runner.invoke(app, ["validate", "--help"])
         assert result.exit_code == 0
         assert "file" in result.stdout
+        assert "parquet" in result.stdout
 
     def test_orchestrate_group_help(self):
         """Test that orchestrate group shows available commands."""
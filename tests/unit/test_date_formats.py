@@ -0,0 +1,90 @@
+"""Tests for vectorized date format inference."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.parsers.date_formats import DateFormatInferrer
+
+
+@pytest.fixture
+def inferrer():
+    """Fresh inferrer with an empty cache."""
+    return DateFormatInferrer()
+
+
+def test_infer_picks_majority_format(inferrer):
+    """Test that inference picks the format parsing most sampled values."""
+    values = pl.Series("TradDt", [None, "", "02-Jan-2024", "03-Jan-2024", "2024-01-04"])
+
+    assert inferrer.infer(values) == "%d-%b-%Y"
+
+
+def test_infer_returns_none_when_nothing_parses(inferrer):
+    """Test that unparseable or empty columns yield no format."""
+    assert inferrer.infer(pl.Series("x", ["foo", "bar"])) is None
+    assert inferrer.infer(pl.Series("x", [None, None], dtype=pl.Utf8)) is None
+
+
+def test_infer_caches_per_source_and_column(inferrer):
+    """Test that the inferred format is reused for later files of a source."""
+    first = pl.Series("TradDt", ["20240102"])
+    assert inferrer.infer(first, source="nse") == "%Y%m%d"
+
+    # A later file is not re-sampled for the same (source, column)
+    later = pl.Series("TradDt", ["2024-01-03"])
+    assert inferrer.infer(later, source="nse") == "%Y%m%d"
+    assert inferrer.infer(later, source="bse") == "%Y-%m-%d"
+
+    inferrer.clear_cache()
+    assert inferrer.infer(later, source="nse") == "%Y-%m-%d"
+
+
+def test_expr_falls_back_to_other_formats(inferrer):
+    """Test that values in other layouts still parse via the coalesce chain."""
+    df = pl.DataFrame({"d": ["20240102", "2024-01-03", " 04-Jan-2024 ", "-", None]})
+
+    result = df.select(inferrer.expr("d", fmt="%Y%m%d"))
+
+    assert result["d"].to_list() == [
+        date(2024, 1, 2),
+        date(2024, 1, 3),
+        date(2024, 1, 4),
+        None,
+        None,
+    ]
+
+
+def test_parse_columns_handles_dtypes_and_aliases(inferrer):
+    """Test parsing string, integer and date columns in one call."""
+    df = pl.DataFrame(
+        {
+            "a": ["02/01/2024", "03/01/2024"],
+            "b": [20240102, 20240103],
+            "c": [date(2024, 1, 2), date(2024, 1, 3)],
+        }
+    )
+
+    result = inferrer.parse_columns(df, ["a", "b", "c", "missing"], aliases={"a": "a_date"})
+
+    assert result["a_date"].to_list() == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert result["b"].to_list() == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert result["c"].dtype == pl.Date
+    assert result["a"].dtype == pl.Utf8
+
+
+def test_parse_columns_lazy(inferrer):
+    """Test that lazy frames are sampled from a bounded head and stay lazy."""
+    lf = pl.LazyFrame({"d": ["02-Jan-2024", "03-Jan-2024"]})
+
+    result = inferrer.parse_columns(lf, ["d"], source="lazy")
+
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect()["d"].to_list() == [date(2024, 1, 2), date(2024, 1, 3)]
+
+
+def test_parse_value(inferrer):
+    """Test scalar parsing with a restricted format list."""
+    assert inferrer.parse_value("26-Jan-2026") == date(2026, 1, 26)
+    assert inferrer.parse_value("2026-01-26", formats=["%d-%b-%Y"]) is None
+    assert inferrer.parse_value(None) is None
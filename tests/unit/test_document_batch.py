@@ -0,0 +1,104 @@
+"""Tests for process-pool batch parsing of documents."""
+
+import polars as pl
+import pytest
+from champion.parsers.document_batch import parse_documents
+from champion.parsers.parse_cache import ParseCache
+from champion.parsers.quarterly_financials_parser import QuarterlyFinancialsParser
+from champion.parsers.shareholding_parser import ShareholdingPatternParser
+
+
+def _shareholding_html(promoter: float) -> str:
+    return (
+        "<html><table>"
+        f"<tr><td>Promoter</td><td>{promoter}%</td></tr>"
+        f"<tr><td>Public</td><td>{100 - promoter}</td></tr>"
+        "</table></html>"
+    )
+
+
+@pytest.fixture
+def shareholding_files(tmp_path):
+    paths = []
+    for i, promoter in enumerate([55.0, 40.0, 72.5]):
+        path = tmp_path / f"sh_{i}.html"
+        path.write_text(_shareholding_html(promoter))
+        paths.append(path)
+    return paths
+
+
+class TestParseDocuments:
+    """Tests for parse_documents."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_output_order_is_deterministic(self, shareholding_files, workers):
+        """Test that rows follow input order regardless of worker count."""
+        jobs = [(p, ("SYM", str(i))) for i, p in enumerate(shareholding_files)]
+
+        result = parse_documents(ShareholdingPatternParser, jobs, workers=workers)
+
+        assert result.files_parsed == 3
+        assert result.df["promoter_shareholding_percent"].to_list() == [55.0, 40.0, 72.5]
+        assert result.df["public_shareholding_percent"].to_list() == [45.0, 60.0, 27.5]
+
+    def test_collects_errors_per_file(self, shareholding_files, tmp_path):
+        """Test that failing files are reported without aborting the batch."""
+        bad = tmp_path / "statement.pdf"
+        bad.write_text("not supported")
+        jobs = [
+            (shareholding_files[0], ("TCS", None)),
+            (tmp_path / "missing.html", ("INFY", None)),
+            (bad, ("WIPRO", None)),
+        ]
+
+        result = parse_documents(QuarterlyFinancialsParser, jobs, workers=2)
+
+        assert result.df["symbol"].to_list() == ["TCS"]
+        assert [f.path.name for f in result.failures] == ["missing.html", "statement.pdf"]
+        assert "Unsupported file type" in result.failures[1].error
+
+    def test_skips_files_already_parsed(self, shareholding_files, tmp_path):
+        """Test that cached and duplicate files are not parsed again."""
+        cache = ParseCache(tmp_path / "cache")
+        jobs = [(p, ("SYM", "1")) for p in shareholding_files]
+
+        first = parse_documents(ShareholdingPatternParser, jobs, workers=1, cache=cache)
+        second = parse_documents(
+            ShareholdingPatternParser, [*jobs, jobs[0]], workers=1, cache=cache
+        )
+
+        assert first.files_parsed == 3
+        assert second.files_parsed == 0
+        assert second.skipped == 4
+        assert second.df.head(3).drop("ingest_time").equals(first.df.drop("ingest_time"))
+        # Cache hits are stamped with this run's ingest_time
+        assert second.df["ingest_time"].min() > first.df["ingest_time"].max()
+
+    def test_duplicate_content_is_parsed_once(self, shareholding_files, tmp_path):
+        """Test that byte-identical files in one batch share a single parse."""
+        copy = tmp_path / "copy.html"
+        copy.write_bytes(shareholding_files[0].read_bytes())
+        jobs = [(shareholding_files[0], ("SYM", "1")), (copy, ("SYM", "1"))]
+
+        result = parse_documents(ShareholdingPatternParser, jobs, workers=1)
+
+        assert result.files_parsed == 1
+        assert result.skipped == 1
+        assert len(result.df) == 2
+
+
+class TestParserBatchMethods:
+    """Tests for the parsers' parse_batch wrappers."""
+
+    def test_shareholding_parse_batch(self, shareholding_files):
+        """Test that parse_batch returns the combined frame."""
+        df = ShareholdingPatternParser().parse_batch(
+            shareholding_files, ["A", "B", "C"], ["1", "2", "3"], workers=2
+        )
+
+        assert len(df) == 3
+        assert isinstance(df, pl.DataFrame)
+
+    def test_quarterly_parse_batch_empty(self):
+        """Test that an empty batch returns an empty frame."""
+        assert QuarterlyFinancialsParser().parse_batch([], []).is_empty()
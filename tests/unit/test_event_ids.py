@@ -0,0 +1,132 @@
+"""Tests for vectorized deterministic event ID generation."""
+
+import logging
+import time
+import uuid
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.parsers.event_ids import key_expr, uuid4_series, uuid5_series
+from champion.parsers.polars_bhavcopy_parser import PolarsBhavcopyParser
+from champion.parsers.polars_bse_parser import PolarsBseParser
+
+TRADE_DATE = date(2024, 1, 2)
+
+
+def _legacy_nse_ids(df: pl.DataFrame, trade_date: date) -> list[str]:
+    """Row-by-row implementation the parsers used before vectorization."""
+    return [
+        str(uuid.uuid5(uuid.NAMESPACE_DNS, f"nse_cm_bhavcopy:{trade_date}:{symbol}:{fin_id}"))
+        for symbol, fin_id in zip(
+            df["TckrSymb"].to_list(), df["FinInstrmId"].to_list(), strict=False
+        )
+    ]
+
+
+@pytest.fixture
+def bhavcopy_keys():
+    """Symbol / instrument id pairs including a null instrument id."""
+    return pl.DataFrame(
+        {
+            "TckrSymb": ["RELIANCE", "TCS", "INFY", "M&M", "BAJAJ-AUTO"],
+            "FinInstrmId": ["2885", "11536", None, "2031", "16669"],
+        }
+    )
+
+
+def test_uuid5_series_matches_uuid_module():
+    """Each generated ID equals uuid.uuid5 over prefix + key."""
+    keys = ["a", "RELIANCE:2885", "", "ünïcode:1"]
+
+    result = uuid5_series(pl.Series(keys), prefix="src:2024-01-02:")
+
+    expected = [str(uuid.uuid5(uuid.NAMESPACE_DNS, f"src:2024-01-02:{k}")) for k in keys]
+    assert result.to_list() == expected
+    assert result.dtype == pl.Utf8
+    assert result.name == "event_id"
+
+
+def test_uuid5_series_custom_namespace():
+    """A non-default namespace is honoured."""
+    result = uuid5_series(["x"], namespace=uuid.NAMESPACE_URL)
+    assert result[0] == str(uuid.uuid5(uuid.NAMESPACE_URL, "x"))
+
+
+def test_uuid4_series_is_random_v4():
+    """Random IDs parse as RFC 4122 version 4 UUIDs and are unique."""
+    result = uuid4_series(1000)
+
+    parsed = [uuid.UUID(v) for v in result]
+    assert {u.version for u in parsed} == {4}
+    assert {u.variant for u in parsed} == {uuid.RFC_4122}
+    assert result.n_unique() == 1000
+    assert result.name == "event_id"
+    assert len(uuid4_series(0)) == 0
+
+
+def test_uuid5_series_empty():
+    """Empty input yields an empty Utf8 Series."""
+    result = uuid5_series(pl.Series([], dtype=pl.Utf8))
+    assert len(result) == 0
+    assert result.dtype == pl.Utf8
+
+
+def test_nse_event_ids_identical_to_legacy(bhavcopy_keys):
+    """NSE parser IDs are byte-identical to the previous scheme, nulls included."""
+    df = PolarsBhavcopyParser()._add_event_metadata(bhavcopy_keys, TRADE_DATE)
+
+    assert df["event_id"].to_list() == _legacy_nse_ids(bhavcopy_keys, TRADE_DATE)
+
+
+def test_bse_event_ids_identical_to_legacy():
+    """BSE parser IDs are byte-identical to the previous scheme."""
+    df = pl.DataFrame({"SC_CODE": ["500325", "532540"], "SC_NAME": ["RELIANCE", "TCS"]})
+
+    result = PolarsBseParser()._add_event_metadata(df, TRADE_DATE)
+
+    expected = [
+        str(uuid.uuid5(uuid.NAMESPACE_DNS, f"bse_eq_bhavcopy:{TRADE_DATE}:{code}"))
+        for code in df["SC_CODE"].to_list()
+    ]
+    assert result["event_id"].to_list() == expected
+
+
+def test_key_expr_renders_nulls_as_none(bhavcopy_keys):
+    """Null values render as 'None' like the f-string formatting did."""
+    keys = bhavcopy_keys.select(key_expr("TckrSymb", "FinInstrmId")).to_series()
+    assert keys[2] == "INFY:None"
+
+
+def test_event_id_generation_benchmark():
+    """Benchmark: event_id generation for a full F&O + CM sized bhavcopy (~150k rows).
+
+    Timings are only logged; the assertion is on output equality so the test
+    does not depend on runner load.
+    """
+    num_rows = 150_000
+    df = pl.DataFrame(
+        {
+            "TckrSymb": [f"SYM{i % 5000}" for i in range(num_rows)],
+            "FinInstrmId": [str(100000 + i) for i in range(num_rows)],
+        }
+    )
+
+    start = time.perf_counter()
+    legacy = _legacy_nse_ids(df, TRADE_DATE)
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = PolarsBhavcopyParser()._add_event_metadata(df, TRADE_DATE)["event_id"]
+    vectorized_elapsed = time.perf_counter() - start
+
+    assert vectorized.to_list() == legacy
+
+    speedup = legacy_elapsed / vectorized_elapsed
+    logging.getLogger(__name__).info(
+        f"\nEvent ID Generation Benchmark:\n"
+        f"  - Rows: {num_rows:,}\n"
+        f"  - Per-row uuid.uuid5: {legacy_elapsed:.3f}s\n"
+        f"  - Vectorized: {vectorized_elapsed:.3f}s\n"
+        f"  - Speedup per file: {speedup:.1f}x"
+    )
@@ -0,0 +1,146 @@
+"""Tests for frame-native index constituent parsing."""
+
+import json
+import uuid
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.orchestration.tasks.index_constituent_tasks import (
+    parse_index_constituents,
+    write_index_constituents_parquet,
+)
+from champion.parsers.index_constituent_parser import IndexConstituentParser
+
+EFFECTIVE_DATE = date(2026, 1, 10)
+
+
+@pytest.fixture
+def constituents_json(tmp_path):
+    path = tmp_path / "nifty.json"
+    path.write_text(
+        json.dumps(
+            {
+                "data": [
+                    {"symbol": "NIFTY BANK", "series": "IDX", "indexWeight": 100},
+                    {
+                        "symbol": "HDFCBANK",
+                        "series": "EQ",
+                        "indexWeight": 28.5,
+                        "ffmc": 1234567.5,
+                        "sharesForIndex": 1000.9,
+                        "meta": {
+                            "isin": "INE040A01034",
+                            "companyName": "HDFC Bank",
+                            "industry": "Banks",
+                            "sector": None,
+                        },
+                        "sector": "Financial Services",
+                    },
+                    {
+                        "symbol": " SBIN ",
+                        "series": "BE",
+                        "indexWeight": 0,
+                        "ffmc": None,
+                        "sharesForIndex": 0,
+                        "meta": {
+                            "isin": "-",
+                            "companyName": "N/A",
+                            "industry": None,
+                            "sector": "Banks",
+                        },
+                        "isin": "INE062A01020",
+                    },
+                    {"symbol": "", "series": "EQ", "indexWeight": 1.0},
+                ]
+            }
+        )
+    )
+    return path
+
+
+class TestIndexConstituentParser:
+    """Tests for IndexConstituentParser."""
+
+    def test_parse_to_dataframe_casts_and_renames(self, constituents_json):
+        """Test that raw fields are normalized into typed payload columns."""
+        df = IndexConstituentParser().parse_to_dataframe(
+            constituents_json, "NIFTYBANK", EFFECTIVE_DATE
+        )
+
+        assert df["symbol"].to_list() == ["HDFCBANK", "SBIN"]
+        assert df["entity_id"].to_list() == ["NIFTYBANK:HDFCBANK", "NIFTYBANK:SBIN"]
+        assert df["isin"].to_list() == ["INE040A01034", "INE062A01020"]
+        assert df["company_name"].to_list() == ["HDFC Bank", None]
+        assert df["sector"].to_list() == ["Financial Services", "Banks"]
+        assert df["weight"].to_list() == [28.5, None]
+        assert df["shares_for_index"].to_list() == [1000, None]
+        assert df["effective_date"].to_list() == [20463, 20463]
+        assert df["index_category"].to_list() == ["Sectoral", "Sectoral"]
+        assert df.schema["event_time"] == pl.Int64
+
+    def test_event_ids_are_deterministic(self, constituents_json):
+        """Test that event IDs match the uuid5 scheme used for deduplication."""
+        df = IndexConstituentParser().parse_to_dataframe(
+            constituents_json, "NIFTYBANK", EFFECTIVE_DATE
+        )
+
+        expected = str(
+            uuid.uuid5(uuid.NAMESPACE_DNS, "nse_index_constituent:NIFTYBANK:SBIN:2026-01-10")
+        )
+        assert df["event_id"][1] == expected
+
+    def test_parse_returns_nested_events(self, constituents_json):
+        """Test that parse still yields envelope dicts with a payload dict."""
+        events = IndexConstituentParser().parse(
+            constituents_json, "NIFTY50", EFFECTIVE_DATE, action="REBALANCE"
+        )
+
+        assert len(events) == 2
+        assert list(events[0])[-1] == "payload"
+        assert events[0]["payload"]["action"] == "REBALANCE"
+        assert events[0]["payload"]["index_category"] == "Broad Market"
+
+    def test_write_parquet_from_frame_matches_events(self, constituents_json, tmp_path):
+        """Test that writing the frame and writing event dicts give the same file."""
+        parser = IndexConstituentParser()
+        df = parser.parse_to_dataframe(constituents_json, "NIFTYBANK", EFFECTIVE_DATE)
+        events = parser.events_to_dicts(parser.to_event_frame(df))
+
+        from_frame = parser.write_parquet(df, tmp_path / "a", "NIFTYBANK", EFFECTIVE_DATE)
+        from_events = parser.write_parquet(events, tmp_path / "b", "NIFTYBANK", EFFECTIVE_DATE)
+
+        a = pl.read_parquet(from_frame, hive_partitioning=False)
+        b = pl.read_parquet(from_events, hive_partitioning=False)
+        assert a.equals(b)
+        assert "index_name" not in a.columns
+
+    def test_write_parquet_rejects_empty(self, tmp_path):
+        """Test that an empty batch is rejected."""
+        with pytest.raises(ValueError, match="No events"):
+            IndexConstituentParser().write_parquet([], tmp_path, "NIFTY50", EFFECTIVE_DATE)
+
+    def test_missing_symbol_column_parses_empty(self, tmp_path):
+        """Test that rows without a symbol field yield an empty batch, not an error."""
+        path = tmp_path / "no_symbol.json"
+        path.write_text(json.dumps({"data": [{"series": "EQ", "indexWeight": 1.0}]}))
+
+        df = IndexConstituentParser().parse_to_dataframe(path, "NIFTY50", EFFECTIVE_DATE)
+
+        assert df.is_empty()
+        assert write_index_constituents_parquet(df, "NIFTY50", EFFECTIVE_DATE, tmp_path) == ""
+
+
+class TestIndexConstituentTasks:
+    """Tests for the index constituent orchestration tasks."""
+
+    def test_parse_and_write_use_flat_frame(self, constituents_json, tmp_path):
+        """Test that the task writes the parsed frame with epoch-ms timestamps as is."""
+        df = parse_index_constituents(constituents_json, "NIFTYBANK", "2026-01-10")
+
+        out = write_index_constituents_parquet(df, "NIFTYBANK", EFFECTIVE_DATE, tmp_path / "lake")
+
+        written = pl.read_parquet(out, hive_partitioning=False)
+        assert "index=NIFTYBANK" in out
+        assert written["symbol"].to_list() == ["HDFCBANK", "SBIN"]
+        assert written.equals(df)
@@ -6,6 +6,7 @@ import polars as pl
 import pyarrow.parquet as pq
 import pytest
 from champion.storage.parquet_io import (
+    ParquetDatasetWriter,
     coalesce_small_files,
     generate_dataset_metadata,
     write_df,
@@ -116,6 +117,112 @@ def test_write_df_compression_options(sample_df, temp_lake_dir):
         assert (dataset_path / "data.parquet").exists()
 
 
+def test_write_df_splits_files_by_rows(sample_df, temp_lake_dir):
+    """Test that max_rows_per_file and row_group_size shape the output files."""
+    df = sample_df.with_row_index()
+    dataset_path = write_df(
+        df=df,
+        dataset="raw",
+        base_path=temp_lake_dir,
+        max_rows_per_file=40,
+        row_group_size=16,
+    )
+
+    files = sorted(p.name for p in dataset_path.glob("*.parquet"))
+    assert files == ["data.parquet", "data_00001.parquet", "data_00002.parquet"]
+    metadata = pq.read_metadata(dataset_path / "data.parquet")
+    assert metadata.num_rows == 40
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+        16,
+        16,
+        8,
+    ]
+    assert pl.read_parquet(dataset_path / "*.parquet").equals(df)
+
+
+def test_write_df_streams_chunks(sample_df, temp_lake_dir):
+    """Test writing an iterable of frames and record batches per partition."""
+    chunks = [sample_df.head(50), *sample_df.tail(50).to_arrow().to_batches(max_chunksize=10)]
+
+    dataset_path = write_df(
+        df=iter(chunks),
+        dataset="raw",
+        base_path=temp_lake_dir,
+        partitions=["date"],
+        row_group_size=20,
+    )
+
+    for day in ["2024-01-01", "2024-01-02"]:
+        metadata = pq.read_metadata(dataset_path / f"date={day}" / "data.parquet")
+        assert metadata.num_rows == 50
+        # Small chunks are buffered into full row groups
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+            20,
+            20,
+            10,
+        ]
+    df_read = pl.read_parquet(dataset_path / "**/*.parquet")
+    assert len(df_read) == len(sample_df)
+
+
+def test_write_df_rerun_replaces_files(sample_df, temp_lake_dir):
+    """Test that re-running a write replaces its files instead of adding to them."""
+    write_df(sample_df, "raw", temp_lake_dir, partitions=["date"], max_rows_per_file=10)
+    dataset_path = write_df(sample_df.head(20), "raw", temp_lake_dir, partitions=["date"])
+
+    assert [p.name for p in (dataset_path / "date=2024-01-01").iterdir()] == ["data.parquet"]
+    assert len(pl.read_parquet(dataset_path / "**/*.parquet")) == 20
+
+
+def test_write_df_rerun_removes_other_parquet_files(sample_df, temp_lake_dir):
+    """Test that a rerun also replaces coalesced and uuid-named files of a partition."""
+    dataset_path = write_df(sample_df, "raw", temp_lake_dir, partitions=["date"])
+    partition = dataset_path / "date=2024-01-01"
+    (partition / "data.parquet").rename(partition / "coalesced_date=2024-01-01.parquet")
+    sample_df.drop("date").write_parquet(partition / "3f2a9c1e-0-0.parquet")
+
+    write_df(sample_df, "raw", temp_lake_dir, partitions=["date"])
+
+    assert [p.name for p in partition.iterdir()] == ["data.parquet"]
+    assert len(pl.read_parquet(dataset_path / "**/*.parquet")) == len(sample_df)
+
+
+def test_aborted_rerun_keeps_previous_files(sample_df, temp_lake_dir):
+    """Test that an aborted rerun leaves the previous run's files untouched."""
+    dataset_path = write_df(sample_df, "raw", temp_lake_dir, partitions=["date"])
+    before = pl.read_parquet(dataset_path / "**/*.parquet")
+
+    with pytest.raises(RuntimeError):
+        with ParquetDatasetWriter(
+            dataset_path, partitions=["date"], max_rows_per_file=10, row_group_size=10
+        ) as writer:
+            # Rolls over to several files before failing
+            writer.write(sample_df.with_columns(pl.lit(0.0).alias("price")))
+            raise RuntimeError("upstream failed")
+
+    partition = dataset_path / "date=2024-01-01"
+    assert [p.name for p in partition.iterdir()] == ["data.parquet"]
+    assert pl.read_parquet(dataset_path / "**/*.parquet").equals(before)
+
+
+def test_writer_partition_values_and_abort(temp_lake_dir):
+    """Test partition directory names and that an aborted write leaves no files."""
+    df = pl.DataFrame({"symbol": ["M&M", None], "price": [1.0, 2.0]})
+
+    with ParquetDatasetWriter(temp_lake_dir / "raw", partitions=["symbol"]) as writer:
+        writer.write(df)
+    assert sorted(p.name for p in (temp_lake_dir / "raw").iterdir()) == [
+        "symbol=M%26M",
+        "symbol=__HIVE_DEFAULT_PARTITION__",
+    ]
+
+    with pytest.raises(RuntimeError):
+        with ParquetDatasetWriter(temp_lake_dir / "aborted", row_group_size=1) as writer:
+            writer.write(df)
+            raise RuntimeError("upstream failed")
+    assert list((temp_lake_dir / "aborted").iterdir()) == []
+
+
 def test_coalesce_small_files(sample_df, temp_lake_dir):
     """Test coalescing small Parquet files."""
     dataset_path = temp_lake_dir / "raw"
@@ -0,0 +1,176 @@
+"""Tests for the content-addressed parse cache."""
+
+import hashlib
+import os
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+from champion.parsers.parse_cache import ParseCache, file_digest, restamp_ingest_time
+from champion.utils.metrics import parse_cache_hits, parse_cache_misses
+
+
+def _metric(counter, **labels) -> float:
+    return counter.labels(**labels)._value.get()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("a,b\n1,2\n")
+    return path
+
+
+@pytest.fixture
+def frame():
+    return pl.DataFrame({"symbol": ["TCS", "INFY"], "close": [3500.0, 1500.0]})
+
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    def test_key_depends_on_content_and_version(self, cache, csv_file):
+        """Test that the key changes with file content, schema version and extra parts."""
+        key = cache.key(csv_file, "v1.0")
+
+        assert cache.key(csv_file, "v1.0") == key
+        assert cache.key(csv_file, "v1.1") != key
+        assert cache.key(csv_file, "v1.0", "2024-01-02") != key
+
+        csv_file.write_text("a,b\n1,3\n")
+        assert cache.key(csv_file, "v1.0") != key
+
+    def test_file_digest_is_sha256(self, csv_file):
+        """Test that the digest matches hashlib for small files."""
+        assert file_digest(csv_file) == hashlib.sha256(csv_file.read_bytes()).hexdigest()
+
+    def test_put_then_get_round_trips(self, cache, csv_file, frame):
+        """Test that a stored frame is read back unchanged."""
+        key = cache.key(csv_file, "v1.0")
+        cache.put(key, frame)
+
+        assert cache.get(key).equals(frame)
+
+    def test_get_or_parse_records_hits_and_misses(self, cache, csv_file, frame):
+        """Test that the parse function only runs on a miss."""
+        key = cache.key(csv_file, "v1.0")
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return frame
+
+        misses = _metric(parse_cache_misses, parser="test")
+        hits = _metric(parse_cache_hits, parser="test")
+
+        first = cache.get_or_parse(key, parse, parser="test")
+        second = cache.get_or_parse(key, parse, parser="test")
+
+        assert len(calls) == 1
+        assert first.equals(second)
+        assert _metric(parse_cache_misses, parser="test") == misses + 1
+        assert _metric(parse_cache_hits, parser="test") == hits + 1
+
+    def test_evicts_least_recently_used(self, tmp_path, csv_file, frame):
+        """Test that the oldest entries are removed once over budget."""
+        cache = ParseCache(tmp_path / "cache")
+        keys = [cache.key(csv_file, "v1.0", i) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, frame)
+            os.utime(cache.path(key), (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so it becomes most recently used
+        cache.get(keys[0])
+        cache.max_bytes = cache.path(keys[0]).stat().st_size * 2
+
+        assert cache.evict() == 1
+        assert not cache.path(keys[1]).exists()
+        assert cache.path(keys[0]).exists()
+        assert cache.path(keys[2]).exists()
+
+    def test_clear(self, cache, csv_file, frame):
+        """Test that clear removes all entries."""
+        cache.put(cache.key(csv_file, "v1.0"), frame)
+        cache.clear()
+
+        assert cache.size_bytes() == 0
+
+
+class TestRestampIngestTime:
+    """Tests for restamp_ingest_time."""
+
+    def test_keeps_column_type(self):
+        """Test datetime, epoch-millisecond and missing ingest_time columns."""
+        stamp = datetime(2024, 6, 1, 12, 0)
+        old = pl.DataFrame({"ingest_time": [datetime(2024, 1, 1)] * 2, "close": [1.0, 2.0]})
+
+        restamped = restamp_ingest_time(old, stamp)
+        assert restamped["ingest_time"].to_list() == [stamp, stamp]
+        assert restamped.schema == old.schema
+
+        epoch_ms = restamp_ingest_time(pl.DataFrame({"ingest_time": [0]}))
+        assert epoch_ms["ingest_time"][0] > 0
+
+        assert restamp_ingest_time(pl.DataFrame({"close": [1.0]})).columns == ["close"]
+
+    def test_normalize_polars_cache_hit_takes_new_ingest_time(self, tmp_path, monkeypatch):
+        """Test that a re-run of normalize_polars reads the cache with this run's stamp."""
+        from champion.orchestration.flows import flows
+
+        cache = ParseCache(tmp_path / "cache")
+        monkeypatch.setattr(flows, "_parse_cache", lambda: cache)
+        csv_file = tmp_path / "bhavcopy.csv"
+        csv_file.write_text("TckrSymb,ClsPric\nTCS,3500\n")
+
+        def raw(ingest_time):
+            row = dict.fromkeys(
+                [
+                    "event_id",
+                    "event_time",
+                    "source",
+                    "schema_version",
+                    "entity_id",
+                    "ISIN",
+                    "FinInstrmTp",
+                    "SctySrs",
+                    "TtlTradgVol",
+                    "TtlNbOfTxsExctd",
+                ],
+                ["x"],
+            )
+            row.update(
+                {
+                    col: [3500.0]
+                    for col in [
+                        "ClsPric",
+                        "PrvsClsgPric",
+                        "OpnPric",
+                        "HghPric",
+                        "LwPric",
+                        "LastPric",
+                        "SttlmPric",
+                        "TtlTrfVal",
+                    ]
+                }
+            )
+            return pl.DataFrame(
+                {
+                    "ingest_time": [ingest_time],
+                    "TckrSymb": ["TCS"],
+                    "TradDt": ["2024-01-02"],
+                    **row,
+                }
+            )
+
+        first = flows.normalize_polars(raw(datetime(2024, 1, 2)), str(csv_file), date(2024, 1, 2))
+        rerun = raw(datetime(2024, 2, 1))
+        monkeypatch.setattr(flows, "_normalize_bhavcopy", lambda df: pytest.fail("not cached"))
+        second = flows.normalize_polars(rerun, str(csv_file), date(2024, 1, 2))
+
+        assert second["ingest_time"].to_list() == [datetime(2024, 2, 1)]
+        assert second.drop("ingest_time").equals(first.drop("ingest_time"))
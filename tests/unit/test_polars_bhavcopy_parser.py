@@ -0,0 +1,366 @@
+"""Tests for PolarsBhavcopyParser."""
+
+import io
+import zipfile
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.parsers.base_parser import ENVELOPE_COLUMNS
+from champion.parsers.parse_cache import ParseCache
+from champion.parsers.polars_bhavcopy_parser import BHAVCOPY_SCHEMA, PolarsBhavcopyParser
+
+TRADE_DATE = date(2024, 1, 2)
+
+
+def _row(symbol: str, fin_id: str, series: str, close: float, **overrides: str) -> dict:
+    """Build one CSV row with every bhavcopy column populated."""
+    row = dict.fromkeys(BHAVCOPY_SCHEMA, "")
+    row.update(
+        {
+            "TradDt": "2024-01-02",
+            "BizDt": "2024-01-02",
+            "Sgmt": "CM",
+            "Src": "NSE",
+            "FinInstrmTp": "STK",
+            "FinInstrmId": fin_id,
+            "ISIN": f"INE{fin_id:0>6}01",
+            "TckrSymb": symbol,
+            "SctySrs": series,
+            "FinInstrmNm": f"{symbol} LTD",
+            "OpnPric": str(close - 1),
+            "HghPric": str(close + 5),
+            "LwPric": str(close - 5),
+            "ClsPric": str(close),
+            "LastPric": str(close),
+            "PrvsClsgPric": str(close - 2),
+            "SttlmPric": str(close),
+            "TtlTradgVol": "1000",
+            "TtlTrfVal": str(close * 1000),
+            "TtlNbOfTxsExctd": "50",
+            "SsnId": "F1",
+            "NewBrdLotQty": "1",
+        }
+    )
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def bhavcopy_csv(tmp_path):
+    """Small bhavcopy CSV with an EQ, a BE and a blank-symbol row."""
+    rows = [
+        _row("RELIANCE", "2885", "EQ", 2750.0),
+        _row("TCS", "11536", "EQ", 3500.0),
+        _row("SUZLON", "12018", "BE", 40.0),
+        _row("", "99999", "EQ", 1.0),
+    ]
+    path = tmp_path / "BhavCopy_NSE_CM_20240102.csv"
+    pl.DataFrame(rows).write_csv(path)
+    return path
+
+
+class TestParseEvents:
+    """Test the columnar event API."""
+
+    def test_parse_events_returns_envelope_and_payload(self, bhavcopy_csv):
+        """Test that parse_events returns envelope columns and a payload struct."""
+        events = PolarsBhavcopyParser().parse_events(bhavcopy_csv, TRADE_DATE)
+
+        assert events.columns == [*ENVELOPE_COLUMNS, "payload"]
+        assert len(events) == 3
+        payload_fields = [f.name for f in events.schema["payload"].fields]
+        assert payload_fields == list(BHAVCOPY_SCHEMA.keys())
+
+    def test_parse_matches_parse_events(self, bhavcopy_csv):
+        """Test that the list-of-dicts adapter matches the columnar batch."""
+        parser = PolarsBhavcopyParser()
+
+        events = parser.parse(bhavcopy_csv, TRADE_DATE)
+        batch = parser.parse_events(bhavcopy_csv, TRADE_DATE)
+
+        assert [e["event_id"] for e in events] == batch["event_id"].to_list()
+        assert events[0]["payload"]["TckrSymb"] == "RELIANCE"
+        # The dict API keeps ISO date strings; the columnar batch has pl.Date
+        assert events[0]["payload"]["TradDt"] == "2024-01-02"
+        assert batch.schema["payload"].to_schema()["TradDt"] == pl.Date
+        assert set(events[0]) == {*ENVELOPE_COLUMNS, "payload"}
+
+    def test_parsed_frame_normalizes(self, bhavcopy_csv):
+        """Test that the parsed frame (TradDt as pl.Date) feeds the normalize step."""
+        from champion.orchestration.flows.flows import _normalize_bhavcopy
+
+        df = PolarsBhavcopyParser().parse_to_dataframe(bhavcopy_csv, TRADE_DATE)
+        assert df.schema["TradDt"] == pl.Date
+
+        normalized = _normalize_bhavcopy(df)
+
+        assert normalized["trade_date"].to_list() == [20240102] * 3
+        assert normalized["symbol"].to_list() == ["RELIANCE", "TCS", "SUZLON"]
+
+
+class TestLazyScan:
+    """Test the streaming LazyFrame parse mode."""
+
+    def test_scan_filters_empty_symbols(self, bhavcopy_csv):
+        """Test that scan applies the schema and drops blank symbols."""
+        lf = PolarsBhavcopyParser().scan(bhavcopy_csv)
+
+        assert isinstance(lf, pl.LazyFrame)
+        df = lf.collect()
+        assert df["TckrSymb"].to_list() == ["RELIANCE", "TCS", "SUZLON"]
+        assert df.schema["ClsPric"] == pl.Float64
+
+    def test_scan_pushdown_filter_and_projection(self, bhavcopy_csv):
+        """Test that callers can filter and project before materializing."""
+        df = (
+            PolarsBhavcopyParser()
+            .scan(bhavcopy_csv)
+            .filter(pl.col("SctySrs") == "EQ")
+            .select(["TckrSymb", "ClsPric"])
+            .collect()
+        )
+
+        assert df.columns == ["TckrSymb", "ClsPric"]
+        assert df["TckrSymb"].to_list() == ["RELIANCE", "TCS"]
+
+    def test_scan_normalized_matches_eager(self, bhavcopy_csv):
+        """Test that the lazy plan yields the same frame as parse_to_dataframe."""
+        parser = PolarsBhavcopyParser()
+
+        eager = parser.parse_to_dataframe(bhavcopy_csv, TRADE_DATE).drop("ingest_time")
+        lazy = parser.scan_normalized(bhavcopy_csv, TRADE_DATE).collect().drop("ingest_time")
+
+        assert lazy.equals(eager)
+        assert lazy.schema["TradDt"] == pl.Date
+
+    def test_scan_normalized_with_predicate(self, bhavcopy_csv):
+        """Test that a series predicate is applied before metadata is added."""
+        df = (
+            PolarsBhavcopyParser()
+            .scan_normalized(bhavcopy_csv, TRADE_DATE, predicate=pl.col("SctySrs") == "BE")
+            .collect()
+        )
+
+        assert df["TckrSymb"].to_list() == ["SUZLON"]
+
+    def test_sink_parquet_streams_partition(self, bhavcopy_csv, tmp_path):
+        """Test that sink_parquet writes the normalized frame to the lake layout."""
+        parser = PolarsBhavcopyParser()
+
+        output = parser.sink_parquet(
+            bhavcopy_csv,
+            TRADE_DATE,
+            base_path=tmp_path / "lake",
+            predicate=pl.col("SctySrs") == "EQ",
+        )
+
+        assert output == (
+            tmp_path
+            / "lake/normalized/equity_ohlc/year=2024/month=01/day=02/bhavcopy_20240102.parquet"
+        )
+        written = pl.read_parquet(output, hive_partitioning=False)
+        expected = parser.scan_normalized(
+            bhavcopy_csv, TRADE_DATE, predicate=pl.col("SctySrs") == "EQ"
+        ).collect()
+        assert written.drop("ingest_time").equals(expected.drop("ingest_time"))
+
+
+class TestParseCache:
+    """Test parsing through a ParseCache."""
+
+    def test_parse_to_dataframe_reuses_cached_frame(self, bhavcopy_csv, tmp_path, monkeypatch):
+        """Test that a second parse of the same file does not read the CSV."""
+        parser = PolarsBhavcopyParser(cache=ParseCache(tmp_path / "cache"))
+        first = parser.parse_to_dataframe(bhavcopy_csv, TRADE_DATE)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("CSV re-read on cache hit")
+
+        monkeypatch.setattr(pl, "read_csv", fail)
+        second = parser.parse_to_dataframe(bhavcopy_csv, TRADE_DATE)
+
+        assert second.drop("ingest_time").equals(first.drop("ingest_time"))
+
+    def test_cache_hit_stamps_new_ingest_time(self, bhavcopy_csv, tmp_path):
+        """Test that a reprocessed day gets a newer ingest_time than the cached run."""
+        parser = PolarsBhavcopyParser(cache=ParseCache(tmp_path / "cache"))
+        first = parser.parse_to_dataframe(bhavcopy_csv, TRADE_DATE)
+        second = parser.parse_to_dataframe(bhavcopy_csv, TRADE_DATE)
+
+        assert second["ingest_time"][0] > first["ingest_time"][0]
+
+    def test_cached_payload_is_shared_across_trade_dates(self, bhavcopy_csv, tmp_path):
+        """Test that the envelope is rebuilt for the requested trade date."""
+        cache = ParseCache(tmp_path / "cache")
+        parser = PolarsBhavcopyParser(cache=cache)
+        first = parser.parse_events(bhavcopy_csv, TRADE_DATE)
+        events = parser.parse_events(bhavcopy_csv, date(2024, 1, 3))
+
+        assert len(list(cache.cache_dir.glob("*.arrow"))) == 1
+        assert events["event_time"].dt.date().unique().to_list() == [date(2024, 1, 3)]
+        assert set(events["event_id"]).isdisjoint(first["event_id"])
+
+
+class TestParseMany:
+    """Test concurrent multi-file parsing."""
+
+    @pytest.fixture
+    def daily_files(self, tmp_path):
+        """Three daily files with one EQ row each."""
+        files = {}
+        for day in (2, 3, 4):
+            trade_date = date(2024, 1, day)
+            path = tmp_path / f"BhavCopy_NSE_CM_202401{day:02d}.csv"
+            pl.DataFrame(
+                [_row("TCS", "11536", "EQ", 3500.0 + day, TradDt=trade_date.isoformat())]
+            ).write_csv(path)
+            files[trade_date] = path
+        return files
+
+    def test_parse_many_concatenates_with_trade_date(self, daily_files):
+        """Test that all files are parsed into one frame sorted by trade date."""
+        dates = list(daily_files)[::-1]
+        result = PolarsBhavcopyParser().parse_many(
+            [daily_files[d] for d in dates], dates, max_workers=2
+        )
+
+        assert result.files_parsed == 3
+        assert result.failures == []
+        assert result.df["trade_date"].to_list() == sorted(dates)
+        assert result.df["ClsPric"].to_list() == [3502.0, 3503.0, 3504.0]
+
+    def test_failures_do_not_abort_batch(self, daily_files, tmp_path):
+        """Test that a missing file is reported while the rest are parsed."""
+        missing = tmp_path / "missing.csv"
+        dates = [*daily_files, date(2024, 1, 5)]
+        result = PolarsBhavcopyParser().parse_many([*daily_files.values(), missing], dates)
+
+        assert result.files_parsed == 3
+        assert len(result.failures) == 1
+        failure = result.failures[0]
+        assert failure.path == missing
+        assert failure.trade_date == date(2024, 1, 5)
+        assert not failure.ok
+
+    def test_iter_parse_many_yields_per_file(self, daily_files):
+        """Test that the streaming API yields one frame per day."""
+        results = list(
+            PolarsBhavcopyParser().iter_parse_many(
+                list(daily_files.values()), list(daily_files), max_workers=1
+            )
+        )
+
+        assert sorted(r.trade_date for r in results) == list(daily_files)
+        assert all(r.ok and len(r.df) == 1 for r in results)
+
+    def test_length_mismatch_raises(self, daily_files):
+        """Test that paths and trade dates must line up."""
+        with pytest.raises(ValueError, match="differ in length"):
+            PolarsBhavcopyParser().parse_many(list(daily_files.values()), [TRADE_DATE])
+
+
+class TestZipInput:
+    """Test parsing bhavcopy archives without extracting them to disk."""
+
+    @pytest.fixture
+    def zip_bytes(self, bhavcopy_csv):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.write(bhavcopy_csv, "BhavCopy_NSE_CM_0_0_0_20240102_F_0000.csv")
+        return buffer.getvalue()
+
+    def test_parse_zip_path_matches_csv(self, bhavcopy_csv, zip_bytes, tmp_path):
+        """Test that a .csv.zip parses to the same frame as the extracted CSV."""
+        zip_path = tmp_path / "BhavCopy_NSE_CM_20240102.csv.zip"
+        zip_path.write_bytes(zip_bytes)
+        parser = PolarsBhavcopyParser()
+
+        from_zip = parser.parse_raw_csv(zip_path)
+
+        assert from_zip.equals(parser.parse_raw_csv(bhavcopy_csv))
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [bhavcopy_csv.name, zip_path.name]
+        )
+
+    def test_parse_misnamed_zip(self, zip_bytes, tmp_path):
+        """Test that ZIP content saved under a .csv name is detected by signature."""
+        misnamed = tmp_path / "BhavCopy_NSE_CM_20240102.csv"
+        misnamed.write_bytes(zip_bytes)
+
+        df = PolarsBhavcopyParser().parse_to_dataframe(misnamed, TRADE_DATE)
+
+        assert df["TckrSymb"].to_list() == ["RELIANCE", "TCS", "SUZLON"]
+
+    def test_parse_events_from_bytes(self, zip_bytes, tmp_path):
+        """Test that raw archive bytes parse (and cache) without any file."""
+        parser = PolarsBhavcopyParser(cache=ParseCache(tmp_path / "cache"))
+
+        events = parser.parse_events(zip_bytes, TRADE_DATE)
+        cached = parser.parse_events(zip_bytes, TRADE_DATE)
+
+        assert len(events) == 3
+        assert cached.drop("ingest_time").equals(events.drop("ingest_time"))
+
+    def test_zip_without_csv_raises(self, tmp_path):
+        """Test that an archive without a CSV member is rejected."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("readme.txt", "no data")
+
+        with pytest.raises(ValueError, match="No .csv member"):
+            PolarsBhavcopyParser().parse_raw_csv(buffer.getvalue())
+
+    @pytest.mark.parametrize("archive", [False, True])
+    def test_flow_parses_fetched_bytes(self, zip_bytes, tmp_path, monkeypatch, archive):
+        """Test that the flow parses the fetched archive and only stores it on request."""
+        from champion.orchestration.flows import flows
+        from champion.scrapers.nse.bhavcopy import BhavcopyScraper
+
+        monkeypatch.setattr(flows.config.storage, "data_dir", tmp_path)
+        monkeypatch.setattr(flows.config.storage, "archive_raw_bhavcopy", archive)
+        monkeypatch.setattr(BhavcopyScraper, "fetch", lambda self, target_date: zip_bytes)
+
+        source = flows.scrape_bhavcopy(TRADE_DATE)
+        df = flows.parse_polars_raw(source, TRADE_DATE)
+
+        assert source == zip_bytes
+        assert df["TckrSymb"].to_list() == ["RELIANCE", "TCS", "SUZLON"]
+        archived = tmp_path / "BhavCopy_NSE_CM_20240102.csv.zip"
+        assert archived.exists() is archive
+        assert not list(tmp_path.rglob("*_extracted.csv"))
+
+
+class TestFlowWriteParquet:
+    """Test the bhavcopy flow's Parquet write task."""
+
+    @pytest.fixture
+    def normalized(self, tmp_path):
+        """Normalized one-row bhavcopy frame with a valid ISIN."""
+        from champion.orchestration.flows.flows import _normalize_bhavcopy
+
+        path = tmp_path / "BhavCopy_NSE_CM_20240102.csv"
+        pl.DataFrame([_row("TCS", "11536", "EQ", 3500.0, ISIN="INE467B01029")]).write_csv(path)
+        return _normalize_bhavcopy(PolarsBhavcopyParser().parse_to_dataframe(path, TRADE_DATE))
+
+    def test_write_updates_configured_symbol_state(self, normalized, tmp_path):
+        """Test that the flow write records closes in the lake's symbol state."""
+        from champion.orchestration.flows import flows
+        from champion.validation.state import SymbolStateStore
+
+        flows.write_parquet(normalized, TRADE_DATE, base_path=str(tmp_path / "lake"))
+
+        state = SymbolStateStore(tmp_path / "lake" / "state" / "normalized_equity_ohlc.parquet")
+        assert state.load().select("symbol", "series", "last_close").rows() == [
+            ("TCS", "EQ", 3500.0)
+        ]
+
+    def test_symbol_state_can_be_disabled(self, normalized, tmp_path, monkeypatch):
+        """Test that no state file is kept when the config turns it off."""
+        from champion.orchestration.flows import flows
+
+        monkeypatch.setattr(flows.config.storage, "symbol_state_enabled", False)
+
+        flows.write_parquet(normalized, TRADE_DATE, base_path=str(tmp_path / "lake"))
+
+        assert not (tmp_path / "lake" / "state").exists()
@@ -0,0 +1,168 @@
+"""Tests for the date-partitioned quarantine store."""
+
+import json
+from datetime import date, datetime, timedelta
+
+import polars as pl
+import pytest
+from champion.validation.quarantine import QuarantineStore
+from champion.validation.reporting import ValidationReporter
+
+
+def audit_entry(failed_rows, total_rows=100):
+    """Build the audit fields of one quarantine run."""
+    return {
+        "failed_rows": failed_rows,
+        "total_rows": total_rows,
+        "rules_applied": ["schema_validation"],
+        "rule_counts": {"schema_minimum": failed_rows},
+        "failure_rate": failed_rows / total_rows,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store with runs on three consecutive days."""
+    store = QuarantineStore(tmp_path / "quarantine")
+    for day in range(1, 4):
+        for run in range(2):
+            store.write(
+                pl.DataFrame(
+                    {
+                        "symbol": [f"D{day}R{run}"],
+                        "validation_errors": ["bad"],
+                        "schema_name": ["prices"],
+                    }
+                ),
+                "prices",
+                audit_entry(failed_rows=day),
+                timestamp=datetime(2024, 1, day, 10, run),
+            )
+    return store
+
+
+def test_write_partitions_by_schema_and_day(store):
+    """Test the partition layout of records and audit entries."""
+    records = sorted(
+        p.relative_to(store.root).parent.as_posix() for p in store.root.rglob("*.parquet")
+    )
+    assert records[:2] == ["audit/date=2024-01-01"] * 2
+    assert "records/schema_name=prices/date=2024-01-03" in records
+
+    audit = store.scan_audit().collect()
+    assert len(audit) == 6
+    assert json.loads(audit["rule_counts"][0]) == {"schema_minimum": 1}
+    assert audit["quarantine_file"][0].startswith("records/schema_name=prices/date=2024-01-01/")
+
+
+def test_records_read_as_hive_dataset(store):
+    """Test that record files do not repeat the partition key directories."""
+    records = pl.scan_parquet(store.root / "records" / "**" / "*.parquet").collect()
+
+    assert len(records) == 6
+    assert records["schema_name"].unique().to_list() == ["prices"]
+    assert store.scan_records("prices").collect()["schema_name"].to_list() == ["prices"] * 6
+
+
+def test_scans_only_selected_days(store):
+    """Test that date bounds select partitions."""
+    audit = store.scan_audit(start=date(2024, 1, 2), end=date(2024, 1, 2)).collect()
+    assert audit["failed_rows"].to_list() == [2, 2]
+
+    records = store.scan_records("prices", start=date(2024, 1, 3)).collect()
+    assert sorted(records["symbol"].to_list()) == ["D3R0", "D3R1"]
+    assert store.scan_records("volumes").collect().is_empty()
+
+
+def test_compact_merges_partitions(store):
+    """Test that compaction leaves one file per partition and keeps all rows."""
+    before = store.scan_audit().collect().sort("timestamp")
+
+    assert store.compact() == 12
+
+    for partition in {p.parent for p in store.root.rglob("*.parquet")}:
+        assert len(list(partition.glob("*.parquet"))) == 1
+    after = store.scan_audit().collect().sort("timestamp")
+    assert after.drop("quarantine_file").equals(before.drop("quarantine_file"))
+    # Audit entries point at the compacted records files
+    assert all((store.root / path).exists() for path in after["quarantine_file"])
+    assert after["quarantine_file"].n_unique() == 3
+    assert len(store.scan_records("prices").collect()) == 6
+    assert store.compact() == 0
+
+
+def test_compact_repoints_audit_of_small_partitions(tmp_path):
+    """Test that audit partitions below min_files still follow compacted records."""
+    store = QuarantineStore(tmp_path / "quarantine")
+
+    def write(schema_name, hour):
+        store.write(
+            pl.DataFrame({"symbol": [f"{schema_name}{hour}"]}),
+            schema_name,
+            audit_entry(failed_rows=1),
+            timestamp=datetime(2024, 1, 5, hour),
+        )
+
+    write("prices", 1)
+    write("prices", 2)
+    write("volumes", 3)
+    # Compacts the day's audit (3 files) but not its records (2 and 1 files)
+    assert store.compact(min_files=3) == 3
+    write("prices", 4)
+
+    # Records of prices reach min_files; the audit partition has only 2 files
+    assert store.compact(min_files=3) == 5
+
+    audit = store.scan_audit().collect()
+    assert all((store.root / path).exists() for path in audit["quarantine_file"])
+    assert len(store.scan_records("prices").collect()) == 3
+
+
+def test_compact_migrates_legacy_audit_log(tmp_path):
+    """Test that a legacy JSON-lines audit log moves into the audit dataset."""
+    store = QuarantineStore(tmp_path / "quarantine")
+    store.root.mkdir()
+    today = datetime.now()
+    with open(store.legacy_audit_log, "w") as f:
+        for ts in (today, today - timedelta(days=1)):
+            entry = {"timestamp": ts.isoformat(), "schema_name": "prices", **audit_entry(5)}
+            f.write(json.dumps(entry) + "\n")
+        f.write("not json\n")
+
+    reporter = ValidationReporter(quarantine_dir=store.root)
+    assert len(reporter.load_audit_log(days=7)) == 2
+
+    store.compact()
+
+    assert not store.legacy_audit_log.exists()
+    assert sorted(p.name for p in (store.root / "audit").iterdir()) == [
+        f"date={(today - timedelta(days=1)):%Y-%m-%d}",
+        f"date={today:%Y-%m-%d}",
+    ]
+    entries = reporter.load_audit_log(days=7)
+    assert len(entries) == 2
+    assert entries[0]["rule_counts"] == {"schema_minimum": 5}
+
+
+def test_reporter_reads_store(tmp_path):
+    """Test reports over audit entries written by the store."""
+    store = QuarantineStore(tmp_path / "quarantine")
+    now = datetime.now()
+    store.write(pl.DataFrame({"a": [1]}), "prices", audit_entry(10), timestamp=now)
+    store.write(
+        pl.DataFrame({"a": [1]}), "prices", audit_entry(5), timestamp=now - timedelta(days=1)
+    )
+    store.write(
+        pl.DataFrame({"a": [1]}), "prices", audit_entry(50), timestamp=now - timedelta(days=90)
+    )
+
+    reporter = ValidationReporter(quarantine_dir=store.root)
+    report = reporter.generate_daily_report(date=now.strftime("%Y-%m-%d"))
+
+    assert report.total_validations == 1
+    assert report.total_failures == 10
+    assert {t.metric_name: t.previous_value for t in report.trends}["failure_rate"] == 0.05
+
+    chart = reporter.generate_trend_chart_data(days=30)
+    assert chart["volumes"] == [100, 100]
+    assert chart["failure_rates"] == [0.05, 0.1]
@@ -0,0 +1,98 @@
+"""Tests for the single-pass business-rule engine."""
+
+import json
+
+import polars as pl
+import pytest
+from champion.validation.rules import BusinessRule, RuleEngine
+from champion.validation.validator import ParquetValidator
+
+RULES = [
+    BusinessRule(
+        name="high_low",
+        field="high,low",
+        fails=pl.col("high") < pl.col("low"),
+        message=lambda r: f"high {r['high']} < low {r['low']}",
+    ),
+    BusinessRule(
+        name="missing_close",
+        field="close",
+        fails=pl.col("close").is_null(),
+        message=lambda c: f"{c['count']} nulls",
+        report="column",
+    ),
+    BusinessRule(
+        name="duplicates",
+        field="symbol",
+        fails=pl.col("symbol").is_duplicated(),
+        message=lambda g: f"{g['symbol']} at {g['indices']}",
+        report="group",
+        group_by=("symbol",),
+    ),
+]
+
+
+@pytest.fixture
+def df():
+    return pl.DataFrame(
+        {
+            "symbol": ["A", "B", "A", "C"],
+            "high": [10.0, 5.0, 10.0, 5.0],
+            "low": [9.0, 6.0, 9.0, 6.0],
+            "close": [9.5, None, None, 5.5],
+        }
+    )
+
+
+def test_violations_table(df):
+    """Test that violations are one row per (row, rule), ordered by rule then row."""
+    violations = RuleEngine(RULES).violations(df)
+
+    assert violations.columns == ["row_index", "rule", "field"]
+    assert violations.rows() == [
+        (1, "high_low", "high,low"),
+        (3, "high_low", "high,low"),
+        (1, "missing_close", "close"),
+        (2, "missing_close", "close"),
+        (0, "duplicates", "symbol"),
+        (2, "duplicates", "symbol"),
+    ]
+
+
+def test_error_details_by_report_mode(df):
+    """Test row, column and group reporting of violations."""
+    errors = RuleEngine(RULES).error_details(df)
+
+    assert [(e["row_index"], e["field"], e["message"]) for e in errors] == [
+        (1, "high,low", "high 5.0 < low 6.0"),
+        (3, "high,low", "high 5.0 < low 6.0"),
+        (1, "close", "2 nulls"),
+        (0, "symbol", "A at [0, 2]"),
+    ]
+    assert errors[0]["record"] == {"symbol": "B", "high": 5.0, "low": 6.0, "close": None}
+    assert errors[2]["record"] == {}
+    assert all(e["validator"] == "business_logic" for e in errors)
+
+
+def test_no_rules_or_rows():
+    """Test that empty inputs produce an empty violations table."""
+    df = pl.DataFrame({"high": [1.0], "low": [2.0], "close": [1.0], "symbol": ["A"]})
+
+    assert RuleEngine([]).violations(df).is_empty()
+    assert RuleEngine(RULES).error_details(df.clear()) == []
+
+
+def test_ohlc_violation_row_index_with_repeated_values(tmp_path):
+    """Test that OHLC violations report their own row, not the first equal row."""
+    (tmp_path / "test_ohlc.json").write_text(json.dumps({"type": "object"}))
+    validator = ParquetValidator(schema_dir=tmp_path)
+    df = pl.DataFrame({"high": [90.0, 100.0, 90.0], "low": [95.0, 95.0, 95.0]})
+
+    result = validator.validate_dataframe(df, schema_name="test_ohlc")
+    violations = validator.business_rule_violations(df, "test_ohlc")
+
+    ohlc_errors = [e for e in result.error_details if "OHLC violation" in e["message"]]
+    assert [e["row_index"] for e in ohlc_errors] == [0, 2]
+    assert violations.filter(pl.col("rule") == "ohlc_high_low_consistency")[
+        "row_index"
+    ].to_list() == [0, 2]
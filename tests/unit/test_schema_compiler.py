@@ -0,0 +1,113 @@
+"""Tests for the JSON-schema-to-Polars compiler."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+from champion.validation.schema_compiler import CompiledSchema
+from jsonschema import Draft7Validator
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["event_id", "price", "volume"],
+    "properties": {
+        "event_id": {"type": "string", "minLength": 1, "pattern": "^uuid-"},
+        "price": {"type": "number", "minimum": 0},
+        "volume": {"type": "integer", "exclusiveMinimum": 0, "maximum": 10_000},
+        "side": {"type": ["string", "null"], "enum": ["BUY", "SELL", None]},
+        "ratio": {"type": ["object", "null"], "properties": {"n": {"type": "integer"}}},
+    },
+    "additionalProperties": False,
+}
+
+
+def draft7_errors(schema: dict, df: pl.DataFrame) -> list[tuple]:
+    """Errors of per-row Draft7 validation, as comparable tuples."""
+    validator = Draft7Validator(schema)
+    return [
+        (row, ".".join(str(p) for p in e.path) or "root", e.message, e.validator)
+        for row, record in enumerate(df.to_dicts())
+        for e in validator.iter_errors(record)
+    ]
+
+
+def compiled_errors(schema: dict, df: pl.DataFrame) -> list[tuple]:
+    return [
+        (e["row_index"], e["field"], e["message"], e["validator"])
+        for e in CompiledSchema(schema).validate(df)
+    ]
+
+
+class TestCompiledSchema:
+    """Tests for CompiledSchema."""
+
+    def test_matches_draft7_on_invalid_rows(self):
+        """Test that errors, messages and order match per-row Draft7 validation."""
+        df = pl.DataFrame(
+            {
+                "event_id": ["uuid-1", "", "x-3", None],
+                "price": [1.5, -1.0, float("nan"), None],
+                "volume": [10.0, 0.0, 2.5, 20_000.0],
+                "side": ["BUY", "HOLD", None, "SELL"],
+                "ratio": [{"n": 1}, None, {"n": None}, {"n": 2}],
+                "extra": [1, 2, 3, 4],
+            }
+        )
+
+        expected = draft7_errors(SCHEMA, df)
+
+        assert len(expected) > 8
+        assert compiled_errors(SCHEMA, df) == expected
+
+    def test_matches_draft7_on_wrong_dtypes(self):
+        """Test type errors for columns whose dtype is no JSON type at all."""
+        df = pl.DataFrame(
+            {
+                "event_id": [date(2024, 1, 1), None],
+                "price": [True, False],
+                "side": pl.Series(["BUY", "X"], dtype=pl.Categorical),
+            }
+        )
+
+        assert compiled_errors(SCHEMA, df) == draft7_errors(SCHEMA, df)
+
+    def test_error_shape_and_row_offset(self):
+        """Test that errors carry the full record and the offset row index."""
+        df = pl.DataFrame({"event_id": ["uuid-1"], "price": [-1.0], "volume": [5]})
+
+        (error,) = CompiledSchema(SCHEMA).validate(df, row_offset=100)
+
+        assert error == {
+            "row_index": 100,
+            "error_type": "critical",
+            "field": "price",
+            "message": "-1.0 is less than the minimum of 0",
+            "validator": "minimum",
+            "record": {"event_id": "uuid-1", "price": -1.0, "volume": 5},
+        }
+
+    def test_non_object_schema_falls_back_to_per_row(self):
+        """Test that schemas with an uncompilable top level are validated per row."""
+        schema = {"type": "object", "minProperties": 3, "properties": {"a": {"type": "integer"}}}
+        df = pl.DataFrame({"a": [1, None]})
+
+        compiled = CompiledSchema(schema)
+
+        assert not compiled.fully_compiled
+        assert compiled_errors(schema, df) == draft7_errors(schema, df)
+
+    @pytest.mark.parametrize(
+        "schema_file",
+        sorted(Path("schemas/parquet").glob("*.json")),
+        ids=lambda p: p.stem,
+    )
+    def test_repo_schemas_compile(self, schema_file):
+        """Test that every JSON Schema shipped with the repo compiles fully."""
+        schema = json.loads(schema_file.read_text())
+        if schema.get("type") != "object":
+            pytest.skip("Avro schema")
+
+        assert CompiledSchema(schema).fully_compiled
@@ -0,0 +1,116 @@
+"""Tests for row-group streaming validation of Parquet files."""
+
+import json
+
+import polars as pl
+import pytest
+from champion.validation.quarantine import QuarantineStore
+from champion.validation.validator import ParquetValidator
+
+
+@pytest.fixture
+def validator(tmp_path):
+    """Create validator with an OHLC schema."""
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["symbol", "trade_date", "open", "high", "low", "close", "volume"],
+        "properties": {
+            "symbol": {"type": "string"},
+            "trade_date": {"type": "integer"},
+            "open": {"type": ["number", "null"], "minimum": 0},
+            "high": {"type": "number", "minimum": 0},
+            "low": {"type": "number", "minimum": 0},
+            "close": {"type": "number", "minimum": 0},
+            "volume": {"type": "integer", "minimum": 0},
+        },
+    }
+    (schema_dir / "test_ohlc.json").write_text(json.dumps(schema))
+    return ParquetValidator(schema_dir=schema_dir)
+
+
+@pytest.fixture
+def ohlc_file(tmp_path):
+    """Write a Parquet file with 4 row groups and violations spanning them."""
+    n = 40
+    df = pl.DataFrame(
+        {
+            "symbol": [f"S{i % 15}" for i in range(n)],
+            "trade_date": [19000 + i // 15 for i in range(n)],
+            "open": [None if i in (3, 27) else 100.0 for i in range(n)],
+            "high": [90.0 if i in (5, 33) else 110.0 for i in range(n)],
+            "low": [95.0] * n,
+            "close": [-1.0 if i == 12 else 100.0 for i in range(n)],
+            "volume": [1000] * n,
+        }
+    )
+    # Same symbol and date in the first and last row groups
+    df = df.with_columns(
+        pl.when(pl.int_range(pl.len()) == 38)
+        .then(pl.lit("S0"))
+        .otherwise(pl.col("symbol"))
+        .alias("symbol"),
+        pl.when(pl.int_range(pl.len()) == 38)
+        .then(pl.lit(19000, dtype=pl.Int64))
+        .otherwise(pl.col("trade_date"))
+        .alias("trade_date"),
+    )
+    path = tmp_path / "ohlc.parquet"
+    df.write_parquet(path, row_group_size=10)
+    return path
+
+
+def test_streaming_matches_in_memory(validator, ohlc_file):
+    """Test that merged row-group results equal whole-file validation."""
+    expected = validator.validate_dataframe(pl.read_parquet(ohlc_file), "test_ohlc")
+
+    result = validator.validate_file_streaming(ohlc_file, "test_ohlc", max_workers=3)
+
+    def key(error):
+        return error["row_index"], error["message"]
+
+    assert result.total_rows == expected.total_rows == 40
+    assert result.valid_rows == expected.valid_rows
+    assert result.critical_failures == expected.critical_failures
+    assert result.validation_rules_applied == expected.validation_rules_applied
+    assert sorted(result.rule_counts.items()) == sorted(expected.rule_counts.items())
+    assert sorted(result.error_details, key=key) == sorted(expected.error_details, key=key)
+
+
+def test_streaming_cross_row_rules(validator, ohlc_file):
+    """Test duplicates and null counts across row groups."""
+    result = validator.validate_file_streaming(ohlc_file, "test_ohlc", max_workers=2)
+
+    messages = [e["message"] for e in result.error_details]
+    assert "Duplicate record: symbol=S0, trade_date=19000 (found at indices: [0, 38])" in messages
+    assert "Critical field 'open' has 2 null values" in messages
+
+
+def test_validate_file_streaming_quarantine(validator, ohlc_file, tmp_path):
+    """Test that streaming validation quarantines only the failed rows."""
+    quarantine_dir = tmp_path / "quarantine"
+
+    result = validator.validate_file(
+        ohlc_file, "test_ohlc", quarantine_dir=quarantine_dir, streaming=True
+    )
+
+    quarantined = QuarantineStore(quarantine_dir).scan_records("test_ohlc").collect()
+    assert len(quarantined) == result.total_rows - result.valid_rows
+    assert quarantined["close"].to_list().count(-1.0) == 1
+
+
+def test_streaming_custom_validator_row_offsets(validator, ohlc_file):
+    """Test that custom validator errors carry file row indices."""
+
+    def flag_last_row(df: pl.DataFrame) -> list[dict]:
+        return [{"row_index": len(df) - 1, "field": "symbol", "message": "last"}]
+
+    validator.register_custom_validator("last_row", flag_last_row)
+
+    result = validator.validate_file_streaming(ohlc_file, "test_ohlc")
+
+    custom = [e["row_index"] for e in result.error_details if e["message"] == "last"]
+    assert custom == [9, 19, 29, 39]
+    assert "custom_last_row" in result.validation_rules_applied
@@ -0,0 +1,166 @@
+"""Tests for the vectorized symbol master parser."""
+
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+import polars as pl
+import pytest
+from champion.parsers.symbol_master_parser import (
+    SYMBOL_MASTER_SCHEMA,
+    SymbolMasterParser,
+    load_master,
+)
+
+HEADER = ",".join(SYMBOL_MASTER_SCHEMA)
+EQUITY_L = f"""{HEADER}
+20MICRONS,20 Microns Limited,EQ,06-OCT-2008,5,1,INE144J01027,5
+RELIANCE, Reliance Industries ,EQ,29-NOV-1995,10,1,INE002A01018,10
+ TCS ,Tata Consultancy,BE,bad-date,0,0,INE467B01029,0
+SYMBOL,NAME OF COMPANY,SERIES,DATE OF LISTING,,,ISIN NUMBER,
+INFY,-,N/A,,,,,
+"""
+
+
+def _legacy_payload(row: dict[str, Any], exchange: str) -> dict[str, Any] | None:
+    """Row-by-row payload the parser built before vectorization."""
+    symbol = row["SYMBOL"].strip() if row["SYMBOL"] else ""
+    if not symbol:
+        return None
+
+    def safe_str(value: Any) -> str | None:
+        val = str(value).strip() if value else None
+        return val if val and val != "-" else None
+
+    def safe_num(value: Any, cast: type) -> Any:
+        return cast(value) if value else None
+
+    listing = row["listing_date_parsed"]
+    return {
+        "instrument_id": f"{symbol}:{exchange}",
+        "symbol": symbol,
+        "exchange": exchange,
+        "company_name": safe_str(row["NAME OF COMPANY"]),
+        "isin": safe_str(row["ISIN NUMBER"]),
+        "series": safe_str(row["SERIES"]),
+        "listing_date": (listing - date(1970, 1, 1)).days if listing else None,
+        "face_value": safe_num(row["FACE VALUE"], float),
+        "paid_up_value": safe_num(row["PAID UP VALUE"], float),
+        "lot_size": safe_num(row["MARKET LOT"], int),
+        "sector": None,
+        "industry": None,
+        "market_cap_category": None,
+        "tick_size": None,
+        "is_index_constituent": None,
+        "indices": None,
+        "status": "ACTIVE",
+        "delisting_date": None,
+        "metadata": None,
+        "valid_from": (date.today() - date(1970, 1, 1)).days,
+        "valid_to": None,
+    }
+
+
+@pytest.fixture
+def equity_l(tmp_path):
+    path = tmp_path / "EQUITY_L.csv"
+    path.write_text(EQUITY_L)
+    return path
+
+
+class TestSymbolMasterParser:
+    """Tests for SymbolMasterParser."""
+
+    @pytest.mark.parametrize("exchange", ["NSE", "BSE"])
+    def test_matches_row_by_row_payloads(self, equity_l, exchange):
+        """Test that vectorized payloads equal the legacy per-row conversion."""
+        parser = SymbolMasterParser()
+        master = parser.read_master(equity_l).with_columns(
+            pl.col("DATE OF LISTING")
+            .str.strptime(pl.Date, "%d-%b-%Y", strict=False)
+            .alias("listing_date_parsed")
+        )
+        expected = [
+            payload
+            for row in master.iter_rows(named=True)
+            if (payload := _legacy_payload(row, exchange)) is not None
+        ]
+
+        events = parser.parse(equity_l, exchange=exchange)
+
+        assert [e["payload"] for e in events] == expected
+        assert [e["entity_id"] for e in events] == [p["instrument_id"] for p in expected]
+
+    def test_event_ids_are_deterministic(self, equity_l):
+        """Test that event IDs follow the uuid5 instrument scheme."""
+        events = SymbolMasterParser().parse(equity_l)
+
+        assert events[2]["event_id"] == str(
+            uuid.uuid5(uuid.NAMESPACE_DNS, "nse_symbol_master:TCS:NSE")
+        )
+        assert events[0]["event_time"] <= int(datetime.now().timestamp() * 1000)
+
+    def test_parse_events_payload_is_typed_struct(self, equity_l):
+        """Test that the payload struct has typed columns, not nulls."""
+        events = SymbolMasterParser().parse_events(equity_l)
+        payload = events.schema["payload"]
+        fields = {f.name: f.dtype for f in payload.fields}
+
+        assert fields["listing_date"] == pl.Int64
+        assert fields["lot_size"] == pl.Int64
+        assert fields["sector"] == pl.Utf8
+        assert fields["indices"] == pl.List(pl.Utf8)
+
+    def test_master_round_trips_through_arrow(self, equity_l, tmp_path):
+        """Test that the written master loads back unchanged via mmap."""
+        parser = SymbolMasterParser()
+        master = parser.read_master(equity_l)
+
+        path = parser.write_master(master, tmp_path / "master" / "EQUITY_L.arrow")
+
+        assert load_master(path).equals(master)
+        assert not list(path.parent.glob(".*.tmp"))
+
+    def test_read_master_rejects_wrong_columns(self, tmp_path):
+        """Test that a CSV with unexpected columns fails schema validation."""
+        path = tmp_path / "bad.csv"
+        path.write_text("SYMBOL,OTHER\nTCS,1\n")
+
+        with pytest.raises(ValueError, match="Schema mismatch"):
+            SymbolMasterParser().read_master(path)
+
+
+class TestSymbolMasterTasks:
+    """Tests for the symbol master orchestration tasks."""
+
+    def test_enrichment_loads_the_written_master(self, equity_l, tmp_path):
+        """Test that enrichment reads the master the write task kept."""
+        from champion.orchestration.tasks.symbol_master_tasks import (
+            enrich_symbol_master,
+            write_symbol_master,
+        )
+
+        bhavcopy = tmp_path / "bhavcopy.parquet"
+        pl.DataFrame(
+            {
+                "TckrSymb": ["RELIANCE"],
+                "SctySrs": ["EQ"],
+                "FinInstrmId": [2885],
+                "ISIN": ["INE002A01018"],
+                "FinInstrmNm": ["RELIANCE INDUSTRIES LTD"],
+                "FinInstrmTp": ["STK"],
+            }
+        ).write_parquet(bhavcopy)
+
+        master_path = write_symbol_master(equity_l, tmp_path / "master" / "EQUITY_L.arrow")
+        enriched = enrich_symbol_master([bhavcopy], master_path)
+
+        assert master_path.exists()
+        assert enriched["CompanyName"].to_list() == [" Reliance Industries "]
+
+    def test_enrichment_without_master_raises(self, tmp_path):
+        """Test that enrichment fails clearly before a master has been written."""
+        from champion.orchestration.tasks.symbol_master_tasks import enrich_symbol_master
+
+        with pytest.raises(FileNotFoundError):
+            enrich_symbol_master([], tmp_path / "missing.arrow")
@@ -0,0 +1,228 @@
+"""Tests for the per-symbol last known state store."""
+
+import json
+from datetime import date
+
+import polars as pl
+import pytest
+from champion.storage.parquet_io import write_df_safe
+from champion.validation.state import SymbolStateStore
+from champion.validation.validator import ParquetValidator
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Create a schema directory with a permissive normalized OHLC schema."""
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["symbol", "close"],
+        "properties": {"symbol": {"type": "string"}, "close": {"type": "number"}},
+    }
+    (schema_dir / "normalized_equity_ohlc.json").write_text(json.dumps(schema))
+    return schema_dir
+
+
+@pytest.fixture
+def state(tmp_path):
+    """Create a state holding closes of 2024-01-01 for two symbols."""
+    state = SymbolStateStore(tmp_path / "state" / "equity.parquet")
+    state.update(
+        pl.DataFrame(
+            {
+                "symbol": ["AAA", "BBB"],
+                "close": [100.0, 50.0],
+                "trade_date": [date(2024, 1, 1)] * 2,
+            }
+        )
+    )
+    return state
+
+
+def test_update_keeps_latest_close_per_symbol(state):
+    """Test that newer trade dates replace the state and older ones do not."""
+    state.update(
+        pl.DataFrame(
+            {
+                "TckrSymb": ["AAA", "AAA", "CCC"],
+                "ClsPric": [101.0, 102.0, 10.0],
+                # Days since epoch, as written to the warehouse
+                "TradDt": [19724, 19725, 19700],
+                "adjustment_factor": [1.0, 2.0, None],
+            }
+        )
+    )
+    state.update(pl.DataFrame({"symbol": ["BBB"], "close": [1.0], "trade_date": ["2023-12-01"]}))
+
+    rows = {r["symbol"]: r for r in state.load().to_dicts()}
+    assert rows["AAA"] == {
+        "symbol": "AAA",
+        "series": "",
+        "last_close": 102.0,
+        "last_adjustment_factor": 2.0,
+        "last_trade_date": date(2024, 1, 3),
+    }
+    assert rows["BBB"]["last_close"] == 50.0
+    assert rows["CCC"]["last_adjustment_factor"] == 1.0
+    assert state.load().columns == [
+        "symbol",
+        "series",
+        "last_close",
+        "last_adjustment_factor",
+        "last_trade_date",
+    ]
+
+
+def test_state_is_keyed_by_series(schema_dir, tmp_path):
+    """Test that each series of a symbol keeps and is checked against its own close."""
+    state = SymbolStateStore(tmp_path / "state.parquet")
+    state.update(
+        pl.DataFrame(
+            {
+                "TckrSymb": ["AAA", "AAA"],
+                "SctySrs": ["EQ", "BE"],
+                "ClsPric": [100.0, 10.0],
+                "TradDt": [date(2024, 1, 1)] * 2,
+            }
+        )
+    )
+    closes = {(r["symbol"], r["series"]): r["last_close"] for r in state.load().to_dicts()}
+    assert closes == {("AAA", "BE"): 10.0, ("AAA", "EQ"): 100.0}
+
+    df = pl.DataFrame(
+        {
+            "symbol": ["AAA", "AAA"],
+            "series": ["BE", "EQ"],
+            "close": [10.5, 101.0],
+            "prev_close": [10.0, 100.0],
+            "trade_date": [date(2024, 1, 2)] * 2,
+        }
+    )
+    result = ParquetValidator(schema_dir=schema_dir).validate_dataframe(
+        df, "normalized_equity_ohlc", state=state
+    )
+    assert "price_reasonableness" not in result.rule_counts
+    assert "prev_close_continuity" not in result.rule_counts
+
+
+def test_state_without_series_column_loads(tmp_path):
+    """Test that a state file written before series keys loads with empty series."""
+    path = tmp_path / "state.parquet"
+    pl.DataFrame(
+        {
+            "symbol": ["AAA"],
+            "last_close": [1.0],
+            "last_adjustment_factor": [1.0],
+            "last_trade_date": [date(2024, 1, 1)],
+        }
+    ).write_parquet(path)
+
+    assert SymbolStateStore(path).load().row(0) == ("AAA", "", 1.0, 1.0, date(2024, 1, 1))
+
+
+def test_missing_state_is_empty(tmp_path):
+    """Test that a store that was never written loads as an empty frame."""
+    assert SymbolStateStore(tmp_path / "missing.parquet").load().is_empty()
+
+
+def test_price_rules_use_state_across_partitions(schema_dir, state):
+    """Test price reasonableness and prev_close continuity against the state."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    df = pl.DataFrame(
+        {
+            "symbol": ["AAA", "BBB", "NEW"],
+            "close": [150.0, 45.0, 10.0],
+            "prev_close": [None, 40.0, None],
+            "trade_date": [date(2024, 1, 2)] * 3,
+        }
+    )
+
+    without_state = validator.validate_dataframe(df, "normalized_equity_ohlc")
+    assert without_state.rule_counts == {}
+    assert "prev_close_continuity" not in without_state.validation_rules_applied
+
+    result = validator.validate_dataframe(df, "normalized_equity_ohlc", state=state)
+
+    assert result.rule_counts == {"price_reasonableness": 1, "prev_close_continuity": 1}
+    reasonableness = next(e for e in result.error_details if e["field"] == "close")
+    assert reasonableness["row_index"] == 0
+    assert reasonableness["message"] == "Price change 50.0% exceeds threshold 20.0%"
+    continuity = next(e for e in result.error_details if e["field"] == "prev_close")
+    assert continuity["row_index"] == 1
+    assert "last known close 50.0000" in continuity["message"]
+
+
+def test_state_rescaled_by_adjustment_factor(schema_dir, state):
+    """Test that the last close is compared in the row's adjustment basis."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    df = pl.DataFrame(
+        {
+            "symbol": ["AAA"],
+            "close": [50.0],
+            "prev_close": [50.0],
+            "trade_date": [date(2024, 1, 2)],
+            "adjustment_factor": [2.0],
+        }
+    )
+
+    result = validator.validate_dataframe(df, "normalized_equity_ohlc", state=state)
+
+    assert result.rule_counts == {}
+
+
+def test_state_ignored_for_same_or_later_dates(schema_dir, state):
+    """Test that revalidating a partition already in the state is unaffected."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    df = pl.DataFrame({"symbol": ["AAA"], "close": [500.0], "trade_date": [date(2024, 1, 1)]})
+
+    result = validator.validate_dataframe(df, "normalized_equity_ohlc", state=state)
+
+    assert result.rule_counts == {}
+
+
+def test_write_df_safe_updates_state(schema_dir, tmp_path):
+    """Test that a validated write records the written closes."""
+    state_path = tmp_path / "state.parquet"
+    df = pl.DataFrame({"symbol": ["AAA"], "close": [100.0], "trade_date": [date(2024, 1, 1)]})
+
+    write_df_safe(
+        df,
+        "normalized",
+        tmp_path / "lake",
+        "normalized_equity_ohlc",
+        schema_dir=schema_dir,
+        state_path=state_path,
+    )
+
+    assert SymbolStateStore(state_path).load()["last_close"].to_list() == [100.0]
+
+
+def test_write_df_safe_with_state_across_split(schema_dir, state, tmp_path):
+    """Test that a split ex-date only warns and still writes and updates the state."""
+    # 1:2 split: prev_close is already adjusted, the state close of AAA is not
+    df = pl.DataFrame(
+        {
+            "symbol": ["AAA"],
+            "close": [51.0],
+            "prev_close": [50.0],
+            "trade_date": [date(2024, 1, 2)],
+        }
+    )
+    validator = ParquetValidator(schema_dir=schema_dir)
+    result = validator.validate_dataframe(df, "normalized_equity_ohlc", state=state)
+    assert result.rule_counts == {"prev_close_continuity": 1}
+    assert (result.critical_failures, result.warnings, result.valid_rows) == (0, 1, 1)
+
+    write_df_safe(
+        df,
+        "normalized",
+        tmp_path / "lake",
+        "normalized_equity_ohlc",
+        schema_dir=schema_dir,
+        state_path=state.path,
+    )
+
+    rows = {r["symbol"]: r["last_close"] for r in state.load().to_dicts()}
+    assert rows["AAA"] == 51.0
@@ -0,0 +1,197 @@
+"""Tests for native temporal conversion to warehouse primitives."""
+
+import time
+from datetime import UTC, date, datetime
+
+import polars as pl
+import pytest
+from champion.storage.temporal import (
+    days_since_epoch_expr,
+    epoch_ms_expr,
+    to_warehouse_primitives,
+)
+
+
+def _udf_epoch_ms(val):
+    """Row-wise conversion previously used by PolarsBhavcopyParser.write_parquet."""
+    if val is None:
+        return None
+    if isinstance(val, int | float):
+        return int(val)
+    try:
+        if isinstance(val, date) and not isinstance(val, datetime):
+            dt = datetime.combine(val, datetime.min.time())
+        else:
+            dt = val
+        return int(dt.timestamp() * 1000)
+    except Exception:
+        return None
+
+
+def _udf_days_since_epoch(val):
+    """Row-wise conversion previously used by PolarsBhavcopyParser.write_parquet."""
+    if val is None:
+        return None
+    try:
+        if isinstance(val, int):
+            if val > 10000000:
+                d = datetime.strptime(str(val), "%Y%m%d").date()
+                return (d - date(1970, 1, 1)).days
+            return int(val)
+        if isinstance(val, str):
+            try:
+                d = datetime.strptime(val, "%Y%m%d").date()
+            except Exception:
+                try:
+                    d = datetime.strptime(val, "%Y-%m-%d").date()
+                except Exception:
+                    return None
+            return (d - date(1970, 1, 1)).days
+        if isinstance(val, date):
+            return (val - date(1970, 1, 1)).days
+    except Exception:
+        return None
+
+
+@pytest.fixture
+def utc_local_time(monkeypatch):
+    """Run with a UTC local timezone (the old UDF read naive datetimes as local time)."""
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _assert_parity(series: pl.Series, native, udf):
+    expected = [udf(v) for v in series.to_list()]
+    actual = pl.DataFrame([series]).select(native(series.name, series.dtype)).to_series()
+    assert actual.dtype == pl.Int64
+    assert actual.to_list() == expected
+
+
+class TestEpochMs:
+    """Parity of epoch_ms_expr with the old row-wise UDF."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [datetime(2024, 1, 2), datetime(2024, 1, 2, 15, 30, 12, 345000), None],
+            [date(2024, 1, 2), date(1999, 12, 31), None],
+            [1704153600000, None, 0],
+            [1704153600000.0, None],
+        ],
+    )
+    def test_matches_udf(self, values, utc_local_time):
+        """Test that native conversion equals the UDF for each input dtype."""
+        _assert_parity(pl.Series("event_time", values), epoch_ms_expr, _udf_epoch_ms)
+
+    def test_aware_datetime_uses_instant(self):
+        """Test that timezone-aware values convert by their UTC instant."""
+        values = [datetime(2024, 1, 2, 5, 30, tzinfo=UTC)]
+        _assert_parity(pl.Series("ingest_time", values), epoch_ms_expr, _udf_epoch_ms)
+
+
+class TestDaysSinceEpoch:
+    """Parity of days_since_epoch_expr with the old row-wise UDF."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [date(2024, 1, 2), date(1970, 1, 1), None],
+            [20240102, 19724, None, 20241399],
+            ["20240102", "2024-01-02", "02-Jan-2024", None],
+        ],
+    )
+    def test_matches_udf(self, values):
+        """Test that native conversion equals the UDF for each input dtype."""
+        _assert_parity(
+            pl.Series("trade_date", values), days_since_epoch_expr, _udf_days_since_epoch
+        )
+
+    def test_datetime_truncates_to_day(self):
+        """Test that datetimes map to the day they fall on."""
+        df = pl.DataFrame({"trade_date": [datetime(2024, 1, 2, 23, 59)]})
+        assert df.select(days_since_epoch_expr("trade_date", pl.Datetime)).item() == 19724
+
+
+class TestToWarehousePrimitives:
+    """Tests for the frame-level transform."""
+
+    @pytest.fixture
+    def frame(self):
+        return pl.DataFrame(
+            {
+                "event_time": [datetime(2024, 1, 2)],
+                "ingest_time": [datetime(2024, 1, 2, 10, 0)],
+                "TradDt": [date(2024, 1, 2)],
+                "adjustment_date": pl.Series([None], dtype=pl.Date),
+                "close": [100.5],
+            }
+        )
+
+    def test_converts_known_columns(self, frame):
+        """Test that envelope timestamps and date columns become integers."""
+        result = to_warehouse_primitives(frame)
+
+        assert result.row(0) == (1704153600000, 1704189600000, 19724, None, 100.5)
+        assert result.schema["adjustment_date"] == pl.Int64
+
+    def test_lazy_frame(self, frame):
+        """Test that a LazyFrame stays lazy and yields the same result."""
+        result = to_warehouse_primitives(frame.lazy())
+
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect().equals(to_warehouse_primitives(frame))
+
+    def test_column_selection(self, frame):
+        """Test that only the requested columns are converted."""
+        result = to_warehouse_primitives(
+            frame, epoch_ms_columns=("event_time",), epoch_day_columns=()
+        )
+
+        assert result.schema["event_time"] == pl.Int64
+        assert result.schema["ingest_time"] == frame.schema["ingest_time"]
+        assert result.schema["TradDt"] == pl.Date
+
+    def test_no_temporal_columns(self):
+        """Test that frames without temporal columns pass through unchanged."""
+        df = pl.DataFrame({"symbol": ["TCS"]})
+        assert to_warehouse_primitives(df) is df
+
+
+class TestWriters:
+    """Tests that lake writers store the warehouse encodings."""
+
+    def test_bse_write_matches_nse_encoding(self, tmp_path):
+        """Test that BSE rows of normalized_equity_ohlc get day-number TradDt."""
+        from champion.parsers.polars_bse_parser import PolarsBseParser
+
+        df = pl.DataFrame(
+            {"event_time": [1704153600000], "TradDt": ["2024-01-02"], "BizDt": ["2024-01-02"]}
+        )
+
+        path = PolarsBseParser().write_parquet(df, date(2024, 1, 2), tmp_path)
+
+        written = pl.read_parquet(path, hive_partitioning=False)
+        assert written.row(0) == (1704153600000, 19724, "2024-01-02")
+
+    def test_ca_write_stores_epoch_ms(self, tmp_path):
+        """Test that CA envelope timestamps are written as epoch ms, dates kept."""
+        from champion.parsers.ca_parser import CorporateActionsParser
+
+        df = pl.DataFrame(
+            {
+                "event_time": [datetime(2024, 1, 2)],
+                "ingest_time": [datetime(2024, 1, 2)],
+                "ex_date": [date(2024, 1, 2)],
+            }
+        )
+
+        CorporateActionsParser().write_parquet(df, tmp_path)
+
+        written = pl.read_parquet(
+            tmp_path / "raw" / "corporate_actions" / "year=2024" / "data.parquet",
+            hive_partitioning=False,
+        )
+        assert written.row(0) == (1704153600000, 1704153600000, date(2024, 1, 2))
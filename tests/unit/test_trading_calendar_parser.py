@@ -0,0 +1,125 @@
+"""Tests for the NSE trading calendar parser."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+from champion.parsers.trading_calendar_parser import TradingCalendarParser
+from champion.validation.validator import ParquetValidator
+
+
+@pytest.fixture
+def holiday_json(tmp_path):
+    data = {
+        "CM": [
+            {"tradingDate": "25-Dec-2025", "description": "Christmas"},
+            {"tradingDate": "26-Jan-2026", "description": "Republic Day"},
+            {"tradingDate": "03-Mar-2026", "description": "Holi"},
+        ],
+        "FO": [
+            {"tradingDate": "26-Jan-2026", "description": "Republic Day"},
+            {"tradingDate": "04-Mar-2026", "description": "Settlement Holiday"},
+        ],
+        "CD": [],
+    }
+    path = tmp_path / "holidays.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def _row(df: pl.DataFrame, day: date) -> dict:
+    return df.filter(pl.col("trade_date") == day).row(0, named=True)
+
+
+class TestTradingCalendarParser:
+    """Tests for TradingCalendarParser."""
+
+    def test_single_year_calendar(self, holiday_json):
+        """Test day types, names and weekday for one year."""
+        df = TradingCalendarParser().parse(holiday_json, 2026)
+
+        assert len(df) == 365
+        assert df["trade_date"].min() == date(2026, 1, 1)
+        assert df["trade_date"].is_sorted()
+
+        holiday = _row(df, date(2026, 1, 26))
+        assert holiday["day_type"] == "MARKET_HOLIDAY"
+        assert holiday["holiday_name"] == "Republic Day"
+        assert holiday["is_trading_day"] is False
+
+        weekend = _row(df, date(2026, 1, 3))
+        assert weekend["day_type"] == "WEEKEND"
+        assert weekend["weekday"] == 6
+        assert weekend["holiday_name"] is None
+
+        # FO-only holiday does not close the primary (CM) calendar
+        assert _row(df, date(2026, 3, 4))["day_type"] == "NORMAL_TRADING"
+
+    def test_multi_year_calendar(self, holiday_json):
+        """Test that several years produce one continuous calendar."""
+        df = TradingCalendarParser().parse(holiday_json, [2026, 2025])
+
+        assert len(df) == 730
+        assert df["trade_date"].min() == date(2025, 1, 1)
+        assert df["trade_date"].max() == date(2026, 12, 31)
+        assert _row(df, date(2025, 12, 25))["holiday_name"] == "Christmas"
+
+    def test_trading_day_ordinal(self, holiday_json):
+        """Test that ordinal differences count trading days between dates."""
+        df = TradingCalendarParser().parse(holiday_json, 2026)
+
+        assert df["trading_day_ordinal"].dtype == pl.Int32
+        # 1 Jan 2026 is a trading day, so each trading day has its own ordinal
+        assert df["trading_day_ordinal"].n_unique() == df["is_trading_day"].sum()
+
+        # Fri 23 Jan -> Tue 27 Jan skips the weekend and Republic Day
+        friday = _row(df, date(2026, 1, 23))["trading_day_ordinal"]
+        tuesday = _row(df, date(2026, 1, 27))["trading_day_ordinal"]
+        assert tuesday - friday == 1
+        # Non-trading days carry the previous trading day's ordinal
+        assert _row(df, date(2026, 1, 26))["trading_day_ordinal"] == friday
+
+    def test_ordinal_continues_across_single_year_calls(self, holiday_json):
+        """Test that per-year calendars share one ordinal sequence."""
+        parser = TradingCalendarParser()
+        df_2025 = parser.parse(holiday_json, 2025)
+        df_2026 = parser.parse(holiday_json, 2026)
+        combined = parser.parse(holiday_json, [2025, 2026])
+
+        # Wed 31 Dec 2025 -> Thu 1 Jan 2026 are consecutive trading days
+        last_2025 = _row(df_2025, date(2025, 12, 31))["trading_day_ordinal"]
+        assert _row(df_2026, date(2026, 1, 1))["trading_day_ordinal"] == last_2025 + 1
+        assert (
+            pl.concat([df_2025, df_2026])["trading_day_ordinal"].to_list()
+            == combined["trading_day_ordinal"].to_list()
+        )
+
+    def test_ordinal_before_epoch(self, holiday_json, tmp_path):
+        """Test that calendars before 2000 continue into it and pass validation."""
+        parser = TradingCalendarParser()
+        df_1999 = parser.parse(holiday_json, 1999)
+        df_2000 = parser.parse(holiday_json, 2000)
+
+        # Fri 31 Dec 1999 precedes Mon 3 Jan 2000, the first trading day since the epoch
+        assert _row(df_1999, date(1999, 12, 31))["trading_day_ordinal"] == 0
+        assert _row(df_2000, date(2000, 1, 3))["trading_day_ordinal"] == 1
+        assert df_1999["trading_day_ordinal"].min() < 0
+
+        validator = ParquetValidator(schema_dir=Path(__file__).parents[2] / "schemas" / "parquet")
+        frame = df_1999.with_columns(pl.col("trade_date").dt.strftime("%Y-%m-%d"))
+        assert validator.validate_dataframe(frame, "trading_calendar").critical_failures == 0
+
+    def test_segment_calendars(self, holiday_json):
+        """Test that each segment applies its own holidays."""
+        parser = TradingCalendarParser()
+        holidays = parser._extract_holidays(json.loads(holiday_json.read_text()), 2026)
+
+        df = parser.generate_segment_calendars(2026, holidays)
+
+        assert df["segment"].unique().sort().to_list() == ["CD", "CM", "FO"]
+        fo = df.filter(pl.col("segment") == "FO")
+        cd = df.filter(pl.col("segment") == "CD")
+        assert _row(fo, date(2026, 3, 4))["is_trading_day"] is False
+        assert _row(cd, date(2026, 1, 26))["is_trading_day"] is True
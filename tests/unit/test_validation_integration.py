@@ -178,12 +178,12 @@ def test_write_df_safe_continue_on_errors(schema_dir, tmp_path):
     assert output_path.exists()
 
 
-@patch("champion.storage.parquet_io.ParquetValidator")
-def test_write_df_safe_logs_validation_metrics(mock_validator_class, sample_df, tmp_path):
+@patch("champion.storage.parquet_io.validator_registry")
+def test_write_df_safe_logs_validation_metrics(mock_registry, sample_df, tmp_path):
     """Test that write_df_safe logs validation metrics."""
     # Setup mock
     mock_validator = MagicMock()
-    mock_validator_class.return_value = mock_validator
+    mock_registry.get.return_value = mock_validator
     mock_result = ValidationResult(
         total_rows=2, valid_rows=2, critical_failures=0, warnings=0, error_details=[]
     )
@@ -0,0 +1,146 @@
+"""Tests for the validation ledger and incremental file validation."""
+
+import json
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+from champion.cli import app
+from champion.validation.ledger import ValidationLedger
+from champion.validation.quarantine import QuarantineStore
+from champion.validation.validator import ParquetValidator
+from typer.testing import CliRunner
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Create a schema directory with a price schema."""
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["symbol", "price"],
+        "properties": {
+            "symbol": {"type": "string"},
+            "price": {"type": "number", "minimum": 0},
+        },
+    }
+    (schema_dir / "prices.json").write_text(json.dumps(schema))
+    return schema_dir
+
+
+@pytest.fixture
+def prices_file(tmp_path):
+    """Write a Parquet file with one invalid price."""
+    path = tmp_path / "prices.parquet"
+    pl.DataFrame({"symbol": ["A", "B", "C"], "price": [1.0, -2.0, 3.0]}).write_parquet(path)
+    return path
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """Create an empty ledger."""
+    return ValidationLedger(tmp_path / "ledger" / "ledger.sqlite")
+
+
+def test_unchanged_file_is_skipped(schema_dir, prices_file, ledger, monkeypatch):
+    """Test that a second validation reuses the recorded result."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    first = validator.validate_file(prices_file, "prices", ledger=ledger)
+
+    monkeypatch.setattr(
+        validator, "validate_dataframe", lambda *a, **k: pytest.fail("file was revalidated")
+    )
+    second = validator.validate_file(prices_file, "prices", ledger=ledger)
+
+    assert second.total_rows == first.total_rows == 3
+    assert second.critical_failures == first.critical_failures
+    assert second.rule_counts == first.rule_counts
+    assert second.validation_rules_applied == first.validation_rules_applied
+    assert [e["message"] for e in second.error_details] == [
+        e["message"] for e in first.error_details
+    ]
+    assert second.failed_row_indices().to_list() == [1]
+
+
+def test_hit_quarantines_when_not_done_before(schema_dir, prices_file, ledger, tmp_path):
+    """Test that a ledger hit only skips quarantine already done in that directory."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    quarantine_dir = tmp_path / "quarantine"
+    validator.validate_file(prices_file, "prices", ledger=ledger)
+
+    # Recorded without quarantine: quarantine now runs instead of the skip
+    validator.validate_file(prices_file, "prices", quarantine_dir=quarantine_dir, ledger=ledger)
+    records = QuarantineStore(quarantine_dir).scan_records("prices").collect()
+    assert records["symbol"].to_list() == ["B"]
+
+    # Already quarantined there: skipped, nothing quarantined twice
+    key = validator.ledger_key(prices_file, "prices")
+    assert ledger.lookup(key, quarantine_dir=quarantine_dir) is not None
+    validator.validate_file(prices_file, "prices", quarantine_dir=quarantine_dir, ledger=ledger)
+    assert QuarantineStore(quarantine_dir).scan_records("prices").collect().height == 1
+    assert ledger.lookup(key, quarantine_dir=tmp_path / "other") is None
+
+
+@pytest.mark.parametrize("change", ["file", "schema", "rules", "custom_validator"])
+def test_changed_inputs_are_revalidated(schema_dir, prices_file, ledger, change):
+    """Test that changing any part of the key invalidates the ledger entry."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    validator.validate_file(prices_file, "prices", ledger=ledger)
+
+    if change == "file":
+        pl.DataFrame({"symbol": ["A"], "price": [1.0]}).write_parquet(prices_file)
+    elif change == "schema":
+        validator.schemas["prices"] = {**validator.schemas["prices"], "required": ["symbol"]}
+    elif change == "rules":
+        validator.max_price_change_pct = 5.0
+    else:
+        validator.register_custom_validator("noop", lambda df: [])
+
+    assert ledger.lookup(validator.ledger_key(prices_file, "prices")) is None
+
+
+def test_force_and_since_bypass_ledger(schema_dir, prices_file, ledger, monkeypatch):
+    """Test that force and a later since revalidate the file."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    validator.validate_file(prices_file, "prices", ledger=ledger)
+    key = validator.ledger_key(prices_file, "prices")
+
+    assert ledger.lookup(key, since=datetime.now() - timedelta(hours=1)) is not None
+    assert ledger.lookup(key, since=datetime.now() + timedelta(hours=1)) is None
+
+    calls = []
+    validate = validator.validate_dataframe
+    monkeypatch.setattr(
+        validator, "validate_dataframe", lambda *a, **k: calls.append(1) or validate(*a, **k)
+    )
+    validator.validate_file(prices_file, "prices", ledger=ledger, force=True)
+    validator.validate_file(
+        prices_file, "prices", ledger=ledger, since=datetime.now() + timedelta(hours=1)
+    )
+    assert len(calls) == 2
+
+
+def test_cli_validate_parquet_uses_ledger(schema_dir, prices_file, tmp_path):
+    """Test the validate parquet command against the ledger."""
+    runner = CliRunner()
+    args = [
+        "validate",
+        "parquet",
+        str(prices_file),
+        "--schema",
+        "prices",
+        "--schema-dir",
+        str(schema_dir),
+        "--ledger",
+        str(tmp_path / "ledger.sqlite"),
+    ]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 1
+    assert "1 of 1 files failed validation" in result.stdout
+
+    pl.DataFrame({"symbol": ["A"], "price": [1.0]}).write_parquet(prices_file)
+    result = runner.invoke(app, [*args, "--force"])
+    assert result.exit_code == 0
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import polars as pl
 import pytest
+from champion.validation.quarantine import QuarantineStore
 from champion.validation.validator import ParquetValidator
 
 
@@ -252,6 +253,85 @@ def test_validate_file_with_quarantine(validator, tmp_path):
     assert "schema_name" in quarantined_df.columns
 
 
+def test_validate_dataframe_samples_errors_per_rule(schema_dir):
+    """Test that error details are sampled per rule while counts cover every error."""
+    validator = ParquetValidator(schema_dir=schema_dir, max_error_samples=3)
+    num_rows = 1000
+    df = pl.DataFrame(
+        {
+            "event_id": [f"uuid-{i}" for i in range(num_rows)],
+            "price": [-1.0 if i % 2 else 100.0 for i in range(num_rows)],
+            "volume": [1000] * num_rows,
+        }
+    )
+
+    result = validator.validate_dataframe(df, schema_name="test_schema", batch_size=100)
+
+    assert result.critical_failures == 1000
+    assert result.valid_rows == 500
+    assert result.rule_counts == {"schema_minimum": 500, "non_negative_prices": 500}
+    assert [e["row_index"] for e in result.error_details] == [1, 3, 5, 1, 3, 5]
+    assert result.failed_row_indices().to_list() == list(range(1, num_rows, 2))
+
+
+def test_quarantine_uses_all_failed_rows(schema_dir, tmp_path):
+    """Test that quarantine takes every failed row, not only the sampled ones."""
+    validator = ParquetValidator(schema_dir=schema_dir, max_error_samples=1)
+    df = pl.DataFrame(
+        {
+            "event_id": ["uuid-1", "uuid-2", "uuid-3"],
+            "price": [-1.0, 100.0, -2.0],
+            "volume": [1000, 2000, 3000],
+        }
+    )
+    quarantine_dir = tmp_path / "quarantine"
+
+    result = validator.validate_dataframe(df, schema_name="test_schema")
+    validator.quarantine_failures(df, result, quarantine_dir, "test_schema")
+
+    quarantined = QuarantineStore(quarantine_dir).scan_records("test_schema").collect()
+    assert quarantined["event_id"].to_list() == ["uuid-1", "uuid-3"]
+    # Every failed rule is listed, sampled rows add their messages separately
+    assert quarantined["validation_errors"].to_list() == ["schema_minimum; non_negative_prices"] * 2
+    assert "minimum" in quarantined["sampled_errors"][0]
+    assert quarantined["sampled_errors"][1] is None
+
+
+def test_warning_only_rows_are_not_quarantined(schema_dir, tmp_path):
+    """Test that rows with only warnings are valid and stay out of quarantine."""
+    validator = ParquetValidator(schema_dir=schema_dir)
+    validator.register_custom_validator(
+        "stale",
+        lambda df: [
+            {
+                "row_index": 1,
+                "error_type": "warning",
+                "field": "volume",
+                "message": "stale",
+                "validator": "stale",
+            }
+        ],
+    )
+    df = pl.DataFrame(
+        {
+            "event_id": ["uuid-1", "uuid-2", "uuid-3"],
+            "price": [-1.0, 100.0, 100.0],
+            "volume": [1000, 2000, 3000],
+        }
+    )
+    quarantine_dir = tmp_path / "quarantine"
+
+    result = validator.validate_dataframe(df, schema_name="test_schema")
+    validator.quarantine_failures(df, result, quarantine_dir, "test_schema")
+
+    assert (result.valid_rows, result.warnings) == (2, 1)
+    assert result.failed_row_indices().to_list() == [0]
+    quarantined = QuarantineStore(quarantine_dir).scan_records("test_schema").collect()
+    assert quarantined["event_id"].to_list() == ["uuid-1"]
+    audit = QuarantineStore(quarantine_dir).scan_audit().collect()
+    assert audit["failed_rows"].to_list() == [1]
+
+
 def test_validate_unknown_schema(validator):
     """Test validation fails for unknown schema."""
     df = pl.DataFrame(
@@ -0,0 +1,92 @@
+"""Tests for the process-wide validator registry."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import pytest
+from champion.validation.registry import ValidatorRegistry
+
+
+def write_schema(path, minimum, mtime_ns=None):
+    """Write a schema with a minimum price and optionally pin its mtime."""
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["price"],
+        "properties": {"price": {"type": "number", "minimum": minimum}},
+    }
+    path.write_text(json.dumps(schema))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Create a schema directory with one schema."""
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    write_schema(schema_dir / "prices.json", 0, mtime_ns=1_000_000_000)
+    return schema_dir
+
+
+def test_registry_shares_validator_across_threads(schema_dir):
+    """Test that concurrent borrows get one validator and one compiled schema."""
+    registry = ValidatorRegistry()
+    df = pl.DataFrame({"price": [1.0, 2.0]})
+
+    def borrow(_):
+        validator = registry.get(schema_dir)
+        validator.validate_dataframe(df, "prices")
+        return validator, validator._compiled_schema("prices")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        borrowed = list(executor.map(borrow, range(8)))
+
+    assert len({id(v) for v, _ in borrowed}) == 1
+    assert len({id(c) for _, c in borrowed}) == 1
+    # Relative and absolute spellings of the same directory share the entry
+    assert registry.get(schema_dir / ".." / "schemas") is borrowed[0][0]
+
+
+def test_registry_reloads_schema_when_mtime_changes(schema_dir):
+    """Test that only changed schema files are reloaded and recompiled."""
+    registry = ValidatorRegistry()
+    df = pl.DataFrame({"price": [5.0]})
+
+    validator = registry.get(schema_dir)
+    assert validator.validate_dataframe(df, "prices").critical_failures == 0
+    compiled = validator._compiled_schema("prices")
+
+    # Unchanged mtime: no reload
+    assert registry.get(schema_dir)._compiled_schema("prices") is compiled
+
+    write_schema(schema_dir / "prices.json", 10, mtime_ns=2_000_000_000)
+    write_schema(schema_dir / "volumes.json", 0)
+
+    assert registry.get(schema_dir) is validator
+    assert set(validator.schemas) == {"prices", "volumes"}
+    assert validator._compiled_schema("prices") is not compiled
+    assert validator.validate_dataframe(df, "prices").critical_failures == 1
+
+    (schema_dir / "volumes.json").unlink()
+    registry.get(schema_dir)
+    assert set(validator.schemas) == {"prices"}
+
+
+def test_registry_keys_on_rule_configuration(schema_dir):
+    """Test that different rule settings get separate validators."""
+    registry = ValidatorRegistry()
+
+    default = registry.get(schema_dir)
+    strict = registry.get(schema_dir, max_price_change_pct=5.0)
+
+    assert default is not strict
+    assert strict.max_price_change_pct == 5.0
+
+
+def test_registry_missing_schema_dir(tmp_path):
+    """Test that a missing schema directory raises."""
+    with pytest.raises(ValueError, match="does not exist"):
+        ValidatorRegistry().get(tmp_path / "missing")
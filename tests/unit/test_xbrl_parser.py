@@ -0,0 +1,119 @@
+"""Tests for the streaming XBRL parser."""
+
+import polars as pl
+import pytest
+from champion.parsers.xbrl_parser import (
+    FACTS_SCHEMA,
+    parse_xbrl_batch,
+    parse_xbrl_facts,
+    parse_xbrl_file,
+    scan_xbrl,
+)
+
+FILING = """<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:fin="urn:fin">
+  <fin:RevenueFromOperations contextRef="D" unitRef="INR"
+    decimals="-5">123450000</fin:RevenueFromOperations>
+  <xbrli:context id="D">
+    <xbrli:entity><xbrli:identifier scheme="s">http://nse/{symbol}</xbrli:identifier></xbrli:entity>
+    <xbrli:period>
+      <xbrli:startDate>2024-04-01</xbrli:startDate><xbrli:endDate>2024-06-30</xbrli:endDate>
+    </xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="I">
+    <xbrli:entity><xbrli:identifier scheme="s">{symbol}</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:instant>2024-06-30</xbrli:instant></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="INR"><xbrli:measure>iso4217:INR</xbrli:measure></xbrli:unit>
+  <xbrli:unit id="shares"><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unit>
+  <fin:LevelOfRoundingUsedInFinancialStatements
+    contextRef="D">Crores</fin:LevelOfRoundingUsedInFinancialStatements>
+  <fin:ProfitLossForPeriod contextRef="D" unitRef="INR">1,500,000,000</fin:ProfitLossForPeriod>
+  <fin:NumberOfShares contextRef="I" unitRef="shares" decimals="0">1000000</fin:NumberOfShares>
+  <fin:Note contextRef="I">first</fin:Note>
+  <fin:Note contextRef="I">second</fin:Note>
+  <fin:Wrapper><fin:Revenue contextRef="D">999</fin:Revenue></fin:Wrapper>
+</xbrli:xbrl>
+"""
+
+
+def _write_filing(tmp_path, symbol: str):
+    path = tmp_path / f"{symbol}.xml"
+    path.write_text(FILING.format(symbol=symbol))
+    return path
+
+
+class TestParseXbrlFile:
+    """Tests for parse_xbrl_file."""
+
+    def test_resolves_contexts_defined_after_facts(self, tmp_path):
+        """Test that facts before their context still get period and entity."""
+        record = parse_xbrl_file(_write_filing(tmp_path, "TCS"))
+
+        assert record["entity_id"] == "http://nse/TCS"
+        assert record["symbol"] == "TCS"
+        assert str(record["period_end_date"]) == "2024-06-30"
+
+    def test_scales_values(self, tmp_path):
+        """Test decimals-based and rounding-level scaling."""
+        record = parse_xbrl_file(_write_filing(tmp_path, "TCS"))
+
+        assert record["revenue"] == pytest.approx(1234.5)
+        assert record["net_profit"] == pytest.approx(150.0)
+        assert record["_xbrl_raw_values"]["NumberOfShares"] == 1000000.0
+
+    def test_unmapped_facts_go_to_metadata(self, tmp_path):
+        """Test that duplicate unmapped facts get suffixed keys."""
+        metadata = parse_xbrl_file(_write_filing(tmp_path, "TCS"))["metadata"]
+
+        assert metadata["Note"] == "first"
+        assert metadata["Note_1"] == "second"
+        assert metadata["NumberOfShares"] == "1000000"
+
+    def test_nested_facts_are_ignored(self, tmp_path):
+        """Test that only top-level facts are collected."""
+        doc = scan_xbrl(_write_filing(tmp_path, "TCS"))
+
+        assert "Revenue" not in [f.concept for f in doc.facts]
+        assert set(doc.contexts) == {"D", "I"}
+        assert doc.units == {"INR": "iso4217:INR", "shares": "xbrli:shares"}
+
+
+class TestXbrlFacts:
+    """Tests for the columnar facts table."""
+
+    def test_parse_xbrl_facts(self, tmp_path):
+        """Test that numeric facts become typed rows."""
+        facts = parse_xbrl_facts(_write_filing(tmp_path, "TCS"))
+
+        assert dict(facts.schema) == FACTS_SCHEMA
+        assert facts["concept"].to_list() == [
+            "RevenueFromOperations",
+            "ProfitLossForPeriod",
+            "NumberOfShares",
+        ]
+        assert facts["unit"].to_list() == ["iso4217:INR", "iso4217:INR", "xbrli:shares"]
+        assert facts["value"][2] == 1000000.0
+        assert facts["symbol"].unique().to_list() == ["TCS"]
+
+    def test_parse_xbrl_batch(self, tmp_path):
+        """Test that the batch keeps input order, skips failures and writes Parquet."""
+        paths = [
+            _write_filing(tmp_path, "TCS"),
+            tmp_path / "missing.xml",
+            _write_filing(tmp_path, "INFY"),
+        ]
+        output = tmp_path / "out" / "facts.parquet"
+
+        facts = parse_xbrl_batch(paths, workers=2, output_path=output)
+
+        assert facts["symbol"].unique(maintain_order=True).to_list() == ["TCS", "INFY"]
+        assert len(facts) == 6
+        assert pl.read_parquet(output, hive_partitioning=False).equals(facts)
+
+    def test_parse_xbrl_batch_empty(self):
+        """Test that an empty batch returns an empty typed table."""
+        facts = parse_xbrl_batch([], workers=1)
+
+        assert facts.is_empty()
+        assert dict(facts.schema) == FACTS_SCHEMA
@@ -459,6 +459,7 @@ CREATE TABLE IF NOT EXISTS default.trading_calendar
     month               Int64 DEFAULT toMonth(trade_date),
     day                 Int64 DEFAULT toDayOfMonth(trade_date),
     weekday             Int8 DEFAULT toDayOfWeek(trade_date),
+    trading_day_ordinal Int32,                   -- trading days since 2000-01-01
     
     -- Timestamp
     ingest_time         DateTime DEFAULT now()
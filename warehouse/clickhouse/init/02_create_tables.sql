@@ -478,7 +478,8 @@ CREATE TABLE IF NOT EXISTS default.trading_calendar
     is_trading_day      Nullable(UInt8) COMMENT '1=trading, 0=non-trading, NULL=unknown',
     day_type            LowCardinality(Nullable(String)) COMMENT 'TRADING/WEEKEND/HOLIDAY/etc',
     holiday_name        Nullable(String),
-    weekday             Nullable(UInt8) COMMENT '1-7 (Mon-Sun)'
+    weekday             Nullable(UInt8) COMMENT '1-7 (Mon-Sun)',
+    trading_day_ordinal Nullable(Int32) COMMENT 'Trading days since 2000-01-01'
 )
 ENGINE = ReplacingMergeTree(ingest_time)
 PARTITION BY (toYear(trade_date), exchange)